@@ -21,6 +21,7 @@ from api.routers import (
     items_router,
     sales_router,
     stats_router,
+    metrics_router,
 )
 from api.middleware import setup_error_handlers
 
@@ -91,6 +92,7 @@ app.include_router(price_check_router, prefix="/api/v1", tags=["Price Check"])
 app.include_router(items_router, prefix="/api/v1", tags=["Items"])
 app.include_router(sales_router, prefix="/api/v1", tags=["Sales"])
 app.include_router(stats_router, prefix="/api/v1", tags=["Statistics"])
+app.include_router(metrics_router, tags=["Metrics"])
 
 
 @app.get("/", include_in_schema=False)
@@ -100,6 +102,7 @@ async def root():
         "message": "PoE Price Checker API",
         "docs": "/docs",
         "health": "/health",
+        "metrics": "/metrics",
     }
 
 
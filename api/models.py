@@ -152,9 +152,15 @@ class ItemsListResponse(BaseModel):
     """Response model for list of checked items."""
 
     items: list[CheckedItemResponse] = Field(..., description="List of checked items")
-    total: int = Field(..., description="Total number of items matching filters")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of items matching filters (first page or include_total=true only)",
+    )
     limit: int = Field(..., description="Maximum items returned")
     offset: int = Field(..., description="Offset for pagination")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (keyset pagination)"
+    )
 
 
 # ==============================================================================
@@ -200,9 +206,14 @@ class SalesListResponse(BaseModel):
     """Response model for list of sales."""
 
     sales: list[SaleResponse] = Field(..., description="List of sales")
-    total: int = Field(..., description="Total sales matching filters")
+    total: Optional[int] = Field(
+        None, description="Total sales matching filters (first page or include_total=true only)"
+    )
     limit: int = Field(..., description="Maximum items returned")
     offset: int = Field(..., description="Offset for pagination")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (keyset pagination)"
+    )
 
 
 # ==============================================================================
@@ -270,3 +281,37 @@ class ConfigResponse(BaseModel):
     league: str = Field(..., description="Current league")
     auto_detect_league: bool = Field(..., description="Auto-detect league setting")
     cache_ttl_seconds: int = Field(..., description="Cache TTL in seconds")
+
+
+# ==============================================================================
+# Metrics Models
+# ==============================================================================
+
+
+class StageTiming(BaseModel):
+    """Rolling latency statistics for one traced stage."""
+
+    count: int = Field(..., description="Spans recorded since start/reset")
+    errors: int = Field(0, description="Spans that raised")
+    mean_ms: float = Field(..., description="Mean duration over all spans")
+    p50_ms: float = Field(..., description="Median over the rolling window")
+    p95_ms: float = Field(..., description="95th percentile over the rolling window")
+    p99_ms: float = Field(..., description="99th percentile over the rolling window")
+    max_ms: float = Field(..., description="Slowest span since start/reset")
+    window: int = Field(..., description="Samples in the rolling window")
+
+
+class MetricsResponse(BaseModel):
+    """Response model for per-stage timing metrics."""
+
+    stages: dict[str, StageTiming] = Field(
+        default_factory=dict,
+        description="Stage name (e.g. pricing.parse, http.poe.ninja) -> timing",
+    )
+    cache: dict[str, Any] = Field(
+        default_factory=dict, description="Price result cache statistics"
+    )
+    profiling: bool = Field(False, description="Whether cProfile capture is active")
+    traces: list[dict[str, Any]] = Field(
+        default_factory=list, description="Recent span trees (when requested)"
+    )
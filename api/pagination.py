@@ -0,0 +1,44 @@
+"""
+api.pagination - Opaque keyset (cursor) pagination helpers.
+
+A cursor encodes the sort key and ID of the last row on a page. Passing it
+back as ``cursor`` fetches the next page with an indexed range scan, so deep
+pages cost the same as the first one.
+"""
+
+from __future__ import annotations
+
+import base64
+from typing import Any, Mapping, Optional, Tuple
+
+
+def encode_cursor(sort_value: str, row_id: int) -> str:
+    """Encode a (sort value, id) keyset position as a URL-safe token."""
+    raw = f"{sort_value}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        sort_value, _, row_id = raw.rpartition("|")
+        return sort_value, int(row_id)
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def next_cursor(
+    rows: list[Mapping[str, Any]], limit: int, sort_field: str
+) -> Optional[str]:
+    """Cursor for the page after ``rows``, or None when this is the last page."""
+    if len(rows) < limit or not rows:
+        return None
+    last = rows[-1]
+    return encode_cursor(str(last[sort_field]), int(last["id"]))
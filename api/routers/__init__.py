@@ -5,6 +5,7 @@ from api.routers.price_check import router as price_check_router
 from api.routers.items import router as items_router
 from api.routers.sales import router as sales_router
 from api.routers.stats import router as stats_router
+from api.routers.metrics import router as metrics_router
 
 __all__ = [
     "health_router",
@@ -12,4 +13,5 @@ __all__ = [
     "items_router",
     "sales_router",
     "stats_router",
+    "metrics_router",
 ]
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
@@ -18,6 +18,8 @@ from api.models import (
     GameVersion,
 )
 from api.dependencies import get_app_context
+from api.pagination import decode_cursor, next_cursor
+from core.database.utils import parse_db_timestamp
 
 if TYPE_CHECKING:
     from core.interfaces import IAppContext
@@ -26,6 +28,20 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _to_response(row: dict[str, Any]) -> CheckedItemResponse:
+    """Convert a checked_items row to its response model."""
+    return CheckedItemResponse(
+        id=row["id"],
+        game_version=str(row.get("game_version") or "poe1"),
+        league=row.get("league") or "Standard",
+        item_name=row.get("item_name") or "Unknown",
+        chaos_value=row.get("chaos_value"),
+        divine_value=row.get("divine_value"),
+        rarity=row.get("rarity"),
+        checked_at=parse_db_timestamp(row.get("checked_at")) or datetime.utcnow(),
+    )
+
+
 @router.get("/items", response_model=ItemsListResponse)
 async def list_items(
     ctx: "IAppContext" = Depends(get_app_context),
@@ -37,85 +53,51 @@ async def list_items(
     search: Optional[str] = Query(None, description="Search item names"),
     limit: int = Query(50, ge=1, le=500, description="Maximum items to return"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page (overrides offset)"
+    ),
+    include_total: bool = Query(
+        False, description="Count all matches on every page, not just the first"
+    ),
 ) -> ItemsListResponse:
     """
     List checked items from history.
 
     Returns items ordered by most recently checked first.
     Supports filtering by game version, league, rarity, and item name search.
+    Filtering and paging run in SQL; follow ``next_cursor`` for deep pages.
+    ``total`` is only counted for the first page unless ``include_total``
+    is set.
     """
     try:
-        # Get items from database
-        from core.game_version import GameVersion as CoreGameVersion
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        # Convert game version if provided (for future filtering)
-        _core_game_version = None
-        if game_version:
-            _core_game_version = CoreGameVersion(game_version.value)
+    filters = {
+        "game_version": game_version.value if game_version else None,
+        "league": league,
+        "rarity": rarity,
+        "search": search,
+    }
 
-        # Get items - database may have different signature
-        all_items = ctx.database.get_checked_items(
-            limit=limit + offset + 100,  # Get extra for filtering
+    try:
+        rows = ctx.database.query_checked_items(
+            **filters, limit=limit, offset=offset, after=after
+        )
+        # COUNT(*) scans every match, so only the first page pays for it
+        total = (
+            ctx.database.count_checked_items(**filters)
+            if include_total or (after is None and offset == 0)
+            else None
         )
-
-        # Apply filters
-        filtered_items = []
-        for item in all_items:
-            # Skip if game version doesn't match
-            if game_version and getattr(item, 'game_version', None) != game_version.value:
-                continue
-
-            # Skip if league doesn't match
-            if league and getattr(item, 'league', None) != league:
-                continue
-
-            # Skip if rarity doesn't match
-            if rarity and getattr(item, 'rarity', None) != rarity:
-                continue
-
-            # Skip if search doesn't match
-            if search:
-                item_name = getattr(item, 'item_name', '') or getattr(item, 'name', '') or ''
-                if search.lower() not in item_name.lower():
-                    continue
-
-            filtered_items.append(item)
-
-        # Apply pagination
-        total = len(filtered_items)
-        paginated = filtered_items[offset : offset + limit]
-
-        # Convert to response models
-        response_items = []
-        for item in paginated:
-            # Handle different item formats
-            item_id = getattr(item, 'id', 0)
-            item_name = getattr(item, 'item_name', None) or getattr(item, 'name', 'Unknown')
-            item_game_version = getattr(item, 'game_version', 'poe1')
-            item_league = getattr(item, 'league', 'Standard')
-            item_chaos = getattr(item, 'chaos_value', None)
-            item_divine = getattr(item, 'divine_value', None)
-            item_rarity = getattr(item, 'rarity', None)
-            checked_at = getattr(item, 'checked_at', None) or datetime.utcnow()
-
-            response_items.append(
-                CheckedItemResponse(
-                    id=item_id,
-                    game_version=str(item_game_version),
-                    league=item_league,
-                    item_name=item_name,
-                    chaos_value=item_chaos,
-                    divine_value=item_divine,
-                    rarity=item_rarity,
-                    checked_at=checked_at,
-                )
-            )
 
         return ItemsListResponse(
-            items=response_items,
+            items=[_to_response(row) for row in rows],
             total=total,
             limit=limit,
             offset=offset,
+            next_cursor=next_cursor(rows, limit, "checked_at"),
         )
 
     except Exception as e:
@@ -136,23 +118,10 @@ async def get_item(
     """
     Get a specific checked item by ID.
     """
-    # Try to find item in history
-    items = ctx.database.get_checked_items(limit=1000)
-
-    for item in items:
-        if getattr(item, 'id', None) == item_id:
-            return CheckedItemResponse(
-                id=item_id,
-                game_version=str(getattr(item, 'game_version', 'poe1')),
-                league=getattr(item, 'league', 'Standard'),
-                item_name=getattr(item, 'item_name', None) or getattr(item, 'name', 'Unknown'),
-                chaos_value=getattr(item, 'chaos_value', None),
-                divine_value=getattr(item, 'divine_value', None),
-                rarity=getattr(item, 'rarity', None),
-                checked_at=getattr(item, 'checked_at', datetime.utcnow()),
-            )
-
-    raise HTTPException(status_code=404, detail=f"Item with ID {item_id} not found")
+    row = ctx.database.get_checked_item(item_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"Item with ID {item_id} not found")
+    return _to_response(row)
 
 
 @router.delete("/items/{item_id}")
@@ -0,0 +1,83 @@
+"""
+api.routers.metrics - Timing and profiling endpoints.
+
+Exposes the rolling per-stage latency collected by core.tracing and lets an
+operator capture a cProfile of live price checks.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+
+from api.dependencies import get_app_context
+from api.models import MetricsResponse
+from core.tracing import get_tracer
+
+if TYPE_CHECKING:
+    from core.interfaces import IAppContext
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+def _cache_stats(ctx: "IAppContext") -> dict[str, Any]:
+    service = getattr(ctx, "price_service", None)
+    try:
+        stats = service.get_cache_stats() if service is not None else {}
+    except Exception as e:
+        logger.debug(f"Cache stats unavailable: {e}")
+        return {}
+    return stats if isinstance(stats, dict) else {}
+
+
+@router.get("/metrics", response_model=MetricsResponse)
+async def get_metrics(
+    prefix: str = Query("", description="Only stages whose name starts with this"),
+    traces: int = Query(0, ge=0, le=50, description="Include this many recent traces"),
+    slowest: bool = Query(False, description="Return the slowest traces instead of the latest"),
+    ctx: "IAppContext" = Depends(get_app_context),
+) -> MetricsResponse:
+    """
+    Per-stage latency metrics.
+
+    Stages cover parsing, each pricing source, trade search/fetch, HTTP calls
+    per host and database queries per repository, with p50/p95/p99 over a
+    rolling window.
+    """
+    tracer = get_tracer()
+    return MetricsResponse(
+        stages=tracer.stage_stats(prefix),
+        cache=_cache_stats(ctx),
+        profiling=tracer.profiling,
+        traces=tracer.recent_traces(traces, slowest=slowest) if traces else [],
+    )
+
+
+@router.delete("/metrics")
+async def reset_metrics() -> dict[str, str]:
+    """Clear collected timings, traces and profile data."""
+    get_tracer().reset()
+    return {"status": "reset"}
+
+
+@router.post("/metrics/profile")
+async def set_profiling(
+    enabled: bool = Query(..., description="Start (true) or stop (false) cProfile capture"),
+) -> dict[str, bool]:
+    """Toggle cProfile capture of price checks."""
+    get_tracer().set_profiling(enabled)
+    logger.info("Profiling %s via API", "enabled" if enabled else "disabled")
+    return {"profiling": enabled}
+
+
+@router.get("/metrics/profile", response_class=PlainTextResponse)
+async def get_profile(
+    limit: int = Query(30, ge=1, le=500, description="Functions to list"),
+    sort: str = Query("cumulative", pattern="^(cumulative|tottime|calls|ncalls)$"),
+) -> str:
+    """Captured profile as pstats text (empty if profiling never ran)."""
+    return get_tracer().profile_report(limit=limit, sort=sort)
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
@@ -19,6 +19,8 @@ from api.models import (
     SalesListResponse,
 )
 from api.dependencies import get_app_context
+from api.pagination import decode_cursor, next_cursor
+from core.database.utils import parse_db_timestamp
 
 if TYPE_CHECKING:
     from core.interfaces import IAppContext
@@ -27,6 +29,20 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _to_response(row: dict[str, Any]) -> SaleResponse:
+    """Convert a sales row to its response model."""
+    return SaleResponse(
+        id=row["id"],
+        item_name=row.get("item_name") or "Unknown",
+        listed_price_chaos=row.get("listed_price_chaos") or 0,
+        actual_price_chaos=row.get("actual_price_chaos"),
+        listed_at=parse_db_timestamp(row.get("listed_at")) or datetime.utcnow(),
+        sold_at=parse_db_timestamp(row.get("sold_at")),
+        time_to_sale_hours=row.get("time_to_sale_hours"),
+        notes=row.get("notes"),
+    )
+
+
 @router.get("/sales", response_model=SalesListResponse)
 async def list_sales(
     ctx: "IAppContext" = Depends(get_app_context),
@@ -37,55 +53,44 @@ async def list_sales(
     ),
     limit: int = Query(50, ge=1, le=500, description="Maximum sales to return"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page (overrides offset)"
+    ),
+    include_total: bool = Query(
+        False, description="Count all matches on every page, not just the first"
+    ),
 ) -> SalesListResponse:
     """
     List sales records.
 
     Returns sales ordered by most recent first.
     Filter by status to see pending (listed) or completed sales.
+    Filtering and paging run in SQL; follow ``next_cursor`` for deep pages.
+    ``total`` is only counted for the first page unless ``include_total``
+    is set.
     """
     try:
-        # Get sales from database
-        all_sales = ctx.database.get_sales(limit=limit + offset + 100)
-
-        # Apply status filter
-        filtered_sales = []
-        for sale in all_sales:
-            sold_at = getattr(sale, 'sold_at', None)
-            is_completed = sold_at is not None
-
-            if status == "pending" and is_completed:
-                continue
-            if status == "completed" and not is_completed:
-                continue
-
-            filtered_sales.append(sale)
-
-        # Apply pagination
-        total = len(filtered_sales)
-        paginated = filtered_sales[offset : offset + limit]
-
-        # Convert to response models
-        response_sales = []
-        for sale in paginated:
-            response_sales.append(
-                SaleResponse(
-                    id=getattr(sale, 'id', 0),
-                    item_name=getattr(sale, 'item_name', 'Unknown'),
-                    listed_price_chaos=getattr(sale, 'listed_price_chaos', 0),
-                    actual_price_chaos=getattr(sale, 'actual_price_chaos', None),
-                    listed_at=getattr(sale, 'listed_at', datetime.utcnow()),
-                    sold_at=getattr(sale, 'sold_at', None),
-                    time_to_sale_hours=getattr(sale, 'time_to_sale_hours', None),
-                    notes=getattr(sale, 'notes', None),
-                )
-            )
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        rows = ctx.database.query_sales(
+            status=status, limit=limit, offset=offset, after=after
+        )
+        # COUNT(*) scans every match, so only the first page pays for it
+        total = (
+            ctx.database.count_sales(status=status)
+            if include_total or (after is None and offset == 0)
+            else None
+        )
 
         return SalesListResponse(
-            sales=response_sales,
+            sales=[_to_response(row) for row in rows],
             total=total,
             limit=limit,
             offset=offset,
+            next_cursor=next_cursor(rows, limit, "listed_at"),
         )
 
     except Exception as e:
@@ -140,21 +145,9 @@ async def get_sale(
     """
     Get a specific sale by ID.
     """
-    # Find the sale
-    sales = ctx.database.get_sales(limit=1000)
-
-    for sale in sales:
-        if getattr(sale, 'id', None) == sale_id:
-            return SaleResponse(
-                id=sale_id,
-                item_name=getattr(sale, 'item_name', 'Unknown'),
-                listed_price_chaos=getattr(sale, 'listed_price_chaos', 0),
-                actual_price_chaos=getattr(sale, 'actual_price_chaos', None),
-                listed_at=getattr(sale, 'listed_at', datetime.utcnow()),
-                sold_at=getattr(sale, 'sold_at', None),
-                time_to_sale_hours=getattr(sale, 'time_to_sale_hours', None),
-                notes=getattr(sale, 'notes', None),
-            )
+    row = ctx.database.get_sale(sale_id)
+    if row is not None:
+        return _to_response(row)
 
     raise HTTPException(status_code=404, detail=f"Sale with ID {sale_id} not found")
 
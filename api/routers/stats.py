@@ -7,7 +7,7 @@ Provides endpoints for aggregated statistics and analytics.
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, TYPE_CHECKING
 
 from fastapi import APIRouter, Depends, Query
@@ -31,92 +31,38 @@ async def get_stats(
     Get aggregated statistics for the specified period.
 
     Returns totals, averages, and daily breakdowns for price checks and sales.
+    All aggregation runs in SQL, bucketed by date.
     """
     try:
-        # Get stats from database if available
         db = ctx.database
 
-        # Get basic stats (reserved for future use)
-        _stats = {}
-        if hasattr(db, 'get_stats'):
-            _stats = db.get_stats(days=days) or {}
-
-        # Get daily summary if available
-        daily_data: list[DailySummary] = []
-        if hasattr(db, 'get_daily_sales_summary'):
-            daily_raw = db.get_daily_sales_summary(days=days) or []
-            for day in daily_raw:
-                if isinstance(day, dict):
-                    daily_data.append(DailySummary(
-                        date=day.get('date', ''),
-                        total_sales=day.get('total_sales', 0),
-                        total_chaos=day.get('total_chaos', 0),
-                        avg_time_to_sale=day.get('avg_time_to_sale'),
-                    ))
-                else:
-                    daily_data.append(DailySummary(
-                        date=getattr(day, 'date', ''),
-                        total_sales=getattr(day, 'total_sales', 0),
-                        total_chaos=getattr(day, 'total_chaos', 0),
-                        avg_time_to_sale=getattr(day, 'avg_time_to_sale', None),
-                    ))
-
-        # Calculate checked items count
+        # Count checked items in the period
         total_checked = 0
         try:
-            items = db.get_checked_items(limit=10000)
-            # Filter by date
-            cutoff = datetime.utcnow() - timedelta(days=days)
-            for item in items:
-                checked_at = getattr(item, 'checked_at', None)
-                if checked_at and checked_at >= cutoff:
-                    total_checked += 1
+            total_checked = sum(
+                int(day["count"]) for day in db.get_checked_items_by_day(days=days)
+            )
         except Exception as e:
             logger.debug(f"Failed to count checked items: {e}")
 
-        # Calculate sales stats
-        total_sales = 0
-        total_chaos = 0.0
-        top_items: list[dict[str, Any]] = []
-
+        # Sales totals, daily buckets and top items
+        sales_stats: dict[str, Any] = {}
         try:
-            sales = db.get_sales(limit=10000)
-            cutoff = datetime.utcnow() - timedelta(days=days)
-
-            sale_items = []
-            for sale in sales:
-                sold_at = getattr(sale, 'sold_at', None)
-                if sold_at and sold_at >= cutoff:
-                    total_sales += 1
-                    actual_price = getattr(sale, 'actual_price_chaos', None) or 0
-                    total_chaos += actual_price
-                    sale_items.append({
-                        'item_name': getattr(sale, 'item_name', 'Unknown'),
-                        'price': actual_price,
-                    })
-
-            # Get top items by price
-            sale_items.sort(key=lambda x: x['price'], reverse=True)
-            top_items = sale_items[:10]
+            sales_stats = db.get_sales_period_stats(days=days, top_limit=10)
         except Exception as e:
             logger.debug(f"Failed to calculate sales stats: {e}")
 
-        # Calculate averages
-        avg_price = total_chaos / total_sales if total_sales > 0 else None
-
-        # Calculate average time to sale
-        avg_time: float | None = None
-        try:
-            sales = db.get_sales(limit=10000)
-            times = []
-            for sale in sales:
-                time_to_sale = getattr(sale, 'time_to_sale_hours', None)
-                if time_to_sale is not None:
-                    times.append(time_to_sale)
-            if times:
-                avg_time = sum(times) / len(times)
-        except Exception as e:
-            logger.debug(f"Failed to calculate average time to sale: {e}")
+        total_sales = int(sales_stats.get("total_sales", 0))
+        total_chaos = float(sales_stats.get("total_chaos", 0.0))
+        daily_data = [
+            DailySummary(
+                date=day["date"],
+                total_sales=day["total_sales"],
+                total_chaos=day["total_chaos"],
+                avg_time_to_sale=day.get("avg_time_to_sale"),
+            )
+            for day in sales_stats.get("daily", [])
+        ]
 
         # Get divine equivalent if we have exchange rate
         divine_equivalent: float | None = None
@@ -134,10 +80,10 @@ async def get_stats(
             total_sales=total_sales,
             total_chaos_earned=total_chaos,
             total_divine_equivalent=divine_equivalent,
-            avg_price_per_sale=avg_price,
-            avg_time_to_sale_hours=avg_time,
+            avg_price_per_sale=sales_stats.get("avg_price"),
+            avg_time_to_sale_hours=sales_stats.get("avg_time_to_sale"),
             daily_summary=daily_data,
-            top_items=top_items,
+            top_items=sales_stats.get("top_items", []),
         )
 
     except Exception as e:
@@ -169,25 +115,16 @@ async def get_quick_summary(
         sales_today = 0
         pending_sales = 0
 
-        today = datetime.utcnow().date()
-
         try:
-            items = db.get_checked_items(limit=1000)
-            for item in items:
-                checked_at = getattr(item, 'checked_at', None)
-                if checked_at and checked_at.date() == today:
-                    items_today += 1
+            today_counts = db.get_checked_items_by_day(days=0)
+            items_today = sum(int(day["count"]) for day in today_counts)
         except Exception as e:
             logger.debug(f"Failed to count today's items: {e}")
 
         try:
-            sales = db.get_sales(limit=1000)
-            for sale in sales:
-                sold_at = getattr(sale, 'sold_at', None)
-                if sold_at is None:
-                    pending_sales += 1
-                elif sold_at.date() == today:
-                    sales_today += 1
+            activity = db.get_sales_activity_today()
+            sales_today = activity["sold_today"]
+            pending_sales = activity["pending"]
         except Exception as e:
             logger.debug(f"Failed to count today's sales: {e}")
 
@@ -13,11 +13,60 @@ from unittest.mock import MagicMock
 import pytest
 from fastapi.testclient import TestClient
 
+from core.database import Database
+
+
+# Read-side query methods that the routers call; served from a real SQLite
+# database so filtering/paging SQL is exercised.
+_SQL_QUERY_METHODS = (
+    "query_checked_items",
+    "count_checked_items",
+    "get_checked_item",
+    "get_checked_items_by_day",
+    "query_sales",
+    "count_sales",
+    "get_sale",
+    "get_sales_period_stats",
+    "get_sales_activity_today",
+)
+
+
+@pytest.fixture
+def sql_database(tmp_path) -> Generator[Database, None, None]:
+    """A real database seeded with the same rows as mock_database."""
+    database = Database(tmp_path / "api_test.db")
+    database.conn.executemany(
+        """
+        INSERT INTO checked_items (id, game_version, league, item_name, chaos_value, rarity, checked_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (1, "poe1", "Standard", "Headhunter", 15000.0, "unique", "2025-11-30 12:00:00"),
+            (2, "poe1", "Standard", "Chaos Orb", 1.0, "currency", "2025-11-30 11:00:00"),
+        ],
+    )
+    database.conn.executemany(
+        """
+        INSERT INTO sales (id, item_name, listed_price_chaos, actual_price_chaos,
+                           listed_at, sold_at, time_to_sale_hours, notes)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (1, "Tabula Rasa", 10.0, 12.0, "2025-11-29 10:00:00", "2025-11-29 12:00:00", 2.0, "Quick sale"),
+            (2, "Goldrim", 5.0, None, "2025-11-30 10:00:00", None, None, None),
+        ],
+    )
+    database.conn.commit()
+    yield database
+    database.close()
+
 
 @pytest.fixture
-def mock_database() -> MagicMock:
+def mock_database(sql_database: Database) -> MagicMock:
     """Create a mock database with standard test data."""
     db = MagicMock()
+    for name in _SQL_QUERY_METHODS:
+        getattr(db, name).side_effect = getattr(sql_database, name)
 
     # Mock checked items
     mock_items = [
@@ -65,3 +65,42 @@ class TestItemDetailEndpoint:
         """Get item returns 404 for unknown ID."""
         response = client.get("/api/v1/items/9999")
         assert response.status_code == 404
+
+
+class TestItemsSqlPaging:
+    """Filtering and keyset paging run in SQL."""
+
+    def test_filters_by_rarity_case_insensitively(self, client: TestClient):
+        data = client.get("/api/v1/items?rarity=UNIQUE").json()
+        assert data["total"] == 1
+        assert [i["item_name"] for i in data["items"]] == ["Headhunter"]
+
+    def test_cursor_walks_pages_without_overlap(self, client: TestClient):
+        first = client.get("/api/v1/items?limit=1").json()
+        assert first["next_cursor"]
+
+        second = client.get(f"/api/v1/items?limit=1&cursor={first['next_cursor']}").json()
+
+        assert [i["id"] for i in first["items"]] == [1]
+        assert [i["id"] for i in second["items"]] == [2]
+        assert second["next_cursor"]
+        last = client.get(f"/api/v1/items?limit=1&cursor={second['next_cursor']}").json()
+        assert last["items"] == [] and last["next_cursor"] is None
+
+    def test_total_counted_on_first_page_only(self, client: TestClient, mock_database):
+        first = client.get("/api/v1/items?limit=1").json()
+        assert first["total"] == 2
+
+        mock_database.count_checked_items.reset_mock()
+        second = client.get(f"/api/v1/items?limit=1&cursor={first['next_cursor']}").json()
+        assert second["total"] is None
+        mock_database.count_checked_items.assert_not_called()
+
+        forced = client.get(
+            f"/api/v1/items?limit=1&cursor={first['next_cursor']}&include_total=true"
+        ).json()
+        assert forced["total"] == 2
+
+    def test_invalid_cursor_is_rejected(self, client: TestClient):
+        response = client.get("/api/v1/items?cursor=!!!")
+        assert response.status_code == 400
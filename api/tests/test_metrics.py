@@ -0,0 +1,65 @@
+"""Tests for metrics endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from core.tracing import get_tracer
+
+
+@pytest.fixture(autouse=True)
+def reset_tracer():
+    """Start each test with empty timings."""
+    get_tracer().reset()
+    yield
+    get_tracer().set_profiling(False)
+    get_tracer().reset()
+
+
+class TestMetricsEndpoints:
+    """Tests for /metrics endpoints."""
+
+    def test_metrics_reports_stage_percentiles(self, client: TestClient):
+        """Recorded spans are reported per stage."""
+        tracer = get_tracer()
+        with tracer.span("pricing.check_item"):
+            with tracer.span("pricing.parse"):
+                pass
+
+        response = client.get("/metrics", params={"prefix": "pricing.", "traces": 1})
+        assert response.status_code == 200
+
+        data = response.json()
+        assert set(data["stages"]) == {"pricing.check_item", "pricing.parse"}
+        assert data["stages"]["pricing.parse"]["count"] == 1
+        assert {"p50_ms", "p95_ms", "p99_ms"} <= set(data["stages"]["pricing.parse"])
+        assert data["traces"][0]["name"] == "pricing.check_item"
+        assert data["profiling"] is False
+
+    def test_metrics_includes_cache_stats(self, client: TestClient, mock_price_service):
+        """Price cache stats are included when the service provides them."""
+        mock_price_service.get_cache_stats.return_value = {"hits": 3, "misses": 1}
+
+        data = client.get("/metrics").json()
+
+        assert data["cache"] == {"hits": 3, "misses": 1}
+
+    def test_reset_clears_stages(self, client: TestClient):
+        """DELETE /metrics drops collected timings."""
+        with get_tracer().span("pricing.parse"):
+            pass
+
+        assert client.delete("/metrics").status_code == 200
+        assert client.get("/metrics").json()["stages"] == {}
+
+    def test_profile_toggle_and_report(self, client: TestClient):
+        """Profiling can be switched on, captured and read back as text."""
+        assert client.post("/metrics/profile", params={"enabled": True}).json() == {"profiling": True}
+        with get_tracer().span("pricing.check_item"):
+            sum(range(100))
+
+        report = client.get("/metrics/profile", params={"limit": 5})
+        client.post("/metrics/profile", params={"enabled": False})
+
+        assert report.status_code == 200
+        assert "function calls" in report.text
+        assert client.get("/metrics").json()["profiling"] is False
@@ -127,3 +127,31 @@ class TestInstantSaleEndpoint:
         assert data["item_name"] == "Divine Orb"
         assert data["sold_at"] is not None
         assert data["time_to_sale_hours"] == 0
+
+
+class TestSalesSqlPaging:
+    """Status filtering and keyset paging run in SQL."""
+
+    def test_status_filter_counts_in_sql(self, client: TestClient):
+        data = client.get("/api/v1/sales?status=completed").json()
+        assert data["total"] == 1
+        assert data["sales"][0]["item_name"] == "Tabula Rasa"
+
+    def test_total_counted_on_first_page_only(self, client: TestClient, mock_database):
+        first = client.get("/api/v1/sales?limit=1").json()
+        assert first["total"] == 2
+
+        mock_database.count_sales.reset_mock()
+        second = client.get(f"/api/v1/sales?limit=1&cursor={first['next_cursor']}").json()
+        assert second["total"] is None
+        mock_database.count_sales.assert_not_called()
+
+        by_offset = client.get("/api/v1/sales?limit=1&offset=1&include_total=true").json()
+        assert by_offset["total"] == 2
+
+    def test_cursor_pagination(self, client: TestClient):
+        first = client.get("/api/v1/sales?limit=1").json()
+        second = client.get(f"/api/v1/sales?limit=1&cursor={first['next_cursor']}").json()
+
+        assert first["sales"][0]["item_name"] == "Goldrim"
+        assert second["sales"][0]["item_name"] == "Tabula Rasa"
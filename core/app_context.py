@@ -3,6 +3,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
+import threading
+from typing import Any, Iterable
 
 import requests
 
@@ -19,6 +21,7 @@ from core.price_multi import (
     MultiSourcePriceService,
     ExistingServiceAdapter,
     PriceSource,
+    SourceLimits,
 )
 from core.derived_sources import UndercutPriceSource
 from data_sources.pricing.trade_api import PoeTradeClient, TradeApiSource
@@ -42,6 +45,10 @@ class AppContext:
        PriceSource implementations going forward).
 
     Call close() when the application exits to release resources.
+
+    When created with ``defer_startup=True``, league auto-detection and the
+    pricing warm-up run on ``startup_thread``; use wait_for_startup() when
+    something needs them finished.
     """
     config: Config
     parser: ItemParser
@@ -50,18 +57,41 @@ class AppContext:
     poe2_ninja: Poe2NinjaAPI | None  # None when current game is PoE1
     poe_watch: PoeWatchAPI | None  # None when disabled or PoE2
     price_service: MultiSourcePriceService
+    startup_thread: threading.Thread | None = None  # deferred network startup
+
+    def wait_for_startup(self, timeout: float | None = None) -> bool:
+        """
+        Block until deferred startup tasks finish.
+
+        Returns:
+            True if nothing is pending, False if the timeout expired first.
+        """
+        if self.startup_thread is None:
+            return True
+        self.startup_thread.join(timeout)
+        return not self.startup_thread.is_alive()
 
     def close(self) -> None:
         """
         Clean up all resources held by the application context.
 
         Call this when the application exits to properly close:
+        - The price service worker pool
         - Database connections
         - HTTP sessions (API clients)
         """
         logger = logging.getLogger(__name__)
         logger.info("Closing AppContext resources...")
 
+        # Stop the price source pool first so no source call outlives the
+        # connections it uses. Older test doubles may lack close().
+        if self.price_service is not None and hasattr(self.price_service, "close"):
+            try:
+                self.price_service.close()
+                logger.debug("Price service pool shut down")
+            except Exception as e:
+                logger.error(f"Error closing price service: {e}")
+
         # Close database connection
         if self.db:
             try:
@@ -95,7 +125,114 @@ class AppContext:
         logger.info("AppContext resources closed")
 
 
-def create_app_context() -> AppContext:
+def _source_limits_from_config(config: Config) -> tuple[dict[str, SourceLimits], SourceLimits | None]:
+    """
+    Build MultiSourcePriceService limits from config.pricing.source_limits.
+
+    Returns:
+        (per-source overrides, default limits or None if not configured)
+    """
+    configured = getattr(config, "price_source_limits", None)
+    if not isinstance(configured, dict):
+        return {}, None
+    limits = {
+        name: SourceLimits(
+            max_concurrent=entry.get("max_concurrent"),
+            deadline_s=entry.get("deadline_s"),
+        )
+        for name, entry in configured.items()
+    }
+    return limits, limits.pop("default", None)
+
+
+def _detect_league(config: Config, game_cfg: GameConfig, poe_ninja: PoeNinjaAPI) -> bool:
+    """
+    Ask poe.ninja for the current temp league and persist it if it changed.
+
+    Returns:
+        True if game_cfg.league was updated.
+    """
+    logger = logging.getLogger(__name__)
+    try:
+        detected = poe_ninja.detect_current_league()
+    except (requests.RequestException, ValueError, OSError) as exc:
+        logger.warning(
+            "Failed to auto-detect league from poe.ninja; "
+            "using configured league %s. Error: %s",
+            game_cfg.league,
+            exc,
+        )
+        return False
+
+    if not detected or detected == game_cfg.league:
+        return False
+
+    logger.info(
+        "Auto-detected current league '%s' (was '%s'); updating config.",
+        detected,
+        game_cfg.league,
+    )
+    # Update the game config + persist
+    game_cfg.league = detected
+    config.set_game_config(game_cfg)
+    return True
+
+
+def _run_startup_tasks(
+    config: Config,
+    game_cfg: GameConfig,
+    poe_ninja: PoeNinjaAPI | None,
+    poe2_ninja: Poe2NinjaAPI | None,
+    league_holders: Iterable[Any],
+    price_service: PriceService | None = None,
+) -> None:
+    """
+    Network work deferred off the startup path.
+
+    Detects the current league (PoE1, when enabled) and re-points every
+    client in ``league_holders`` at it, then warms the active ninja client's
+    currency data so the first price check doesn't pay for it.
+
+    A price check may already have run against the configured league, so a
+    switch goes through each client's ``set_league()`` (which drops caches
+    built for the old league) and clears ``price_service``'s item cache.
+    """
+    logger = logging.getLogger(__name__)
+
+    if poe_ninja is not None and config.auto_detect_league:
+        if _detect_league(config, game_cfg, poe_ninja):
+            for holder in league_holders:
+                if holder is None:
+                    continue
+                set_league = getattr(holder, "set_league", None)
+                if callable(set_league):
+                    set_league(game_cfg.league)
+                else:
+                    holder.league = game_cfg.league
+            if price_service is not None:
+                price_service.clear_cache()
+
+    ninja = poe_ninja if poe_ninja is not None else poe2_ninja
+    if ninja is None:
+        return
+    try:
+        ninja.ensure_divine_rate()
+    except (requests.RequestException, ValueError, OSError) as exc:
+        logger.warning("Pricing warm-up failed; prices will load on first check. Error: %s", exc)
+    else:
+        logger.info("Pricing warm-up complete for league %s", game_cfg.league)
+
+
+def create_app_context(defer_startup: bool = False) -> AppContext:
+    """
+    Build the application's services.
+
+    Args:
+        defer_startup: Skip the blocking league auto-detection and instead
+            run it, plus a pricing warm-up, on a background thread. Clients
+            start on the configured league and are switched once detection
+            completes. Used by the GUI to get a window on screen sooner.
+    """
     config = Config()
     # Apply pricing display policy from config at startup (runtime-tunable)
     try:
@@ -129,30 +266,12 @@ def create_app_context() -> AppContext:
         except (ValueError, TypeError, AttributeError):
             pass  # Defensive: invalid timeout/TTL config, use API defaults
 
-        # Optionally auto-detect the active temp league via poe.ninja
-        if config.auto_detect_league:
-            try:
-                detected = poe_ninja.detect_current_league()
-            except (requests.RequestException, ValueError, OSError) as exc:
-                logger.warning(
-                    "Failed to auto-detect league from poe.ninja; "
-                    "using configured league %s. Error: %s",
-                    game_cfg.league,
-                    exc,
-                )
-            else:
-                if detected and detected != game_cfg.league:
-                    logger.info(
-                        "Auto-detected current league '%s' (was '%s'); updating config.",
-                        detected,
-                        game_cfg.league,
-                    )
-                    # Update the game config + persist
-                    game_cfg.league = detected
-                    config.set_game_config(game_cfg)
-
-                    # Keep the API client in sync
-                    poe_ninja.league = detected
+        # Optionally auto-detect the active temp league via poe.ninja.
+        # Deferred startup does this in the background instead (see below).
+        if config.auto_detect_league and not defer_startup:
+            if _detect_league(config, game_cfg, poe_ninja):
+                # Keep the API client in sync
+                poe_ninja.league = game_cfg.league
 
         # Initialize poe.watch as secondary pricing source
         try:
@@ -203,6 +322,7 @@ def create_app_context() -> AppContext:
     # Trade API source – wired into PriceService
     # ------------------------------------------------------------------
     trade_source: TradeApiSource | None = None
+    trade_client: PoeTradeClient | None = None
     if game == GameVersion.POE1:
         trade_logger = logging.getLogger("poe_price_checker.trade_api")
         trade_client = PoeTradeClient(
@@ -310,6 +430,9 @@ def create_app_context() -> AppContext:
 
     # Construct multi-source service with backward-compatible fallback for
     # older test doubles that don't accept new keyword arguments.
+    # Bound how many checks may wait on each source and for how long; the
+    # main source includes rate-limited trade lookups.
+    source_limits, default_limits = _source_limits_from_config(config)
     try:
         multi_price_service = MultiSourcePriceService(
             sources=sources,
@@ -319,6 +442,8 @@ def create_app_context() -> AppContext:
                 "league": game_cfg.league,
             },
             use_arbitration=use_arbitration_flag,
+            source_limits=source_limits,
+            default_limits=default_limits,
         )
     except TypeError:
         # Fallback to minimal constructor signature
@@ -334,6 +459,23 @@ def create_app_context() -> AppContext:
     except (AttributeError, TypeError, ValueError):
         pass  # Defensive: ignore invalid enabled_sources config
 
+    startup_thread: threading.Thread | None = None
+    if defer_startup:
+        startup_thread = threading.Thread(
+            target=_run_startup_tasks,
+            args=(
+                config,
+                game_cfg,
+                poe_ninja,
+                poe2_ninja,
+                (poe_ninja, poe_watch, trade_client, trade_source),
+                base_price_service,
+            ),
+            name="app-startup",
+            daemon=True,
+        )
+        startup_thread.start()
+
     return AppContext(
         config=config,
         parser=parser,
@@ -342,4 +484,5 @@ def create_app_context() -> AppContext:
         poe2_ninja=poe2_ninja,
         poe_watch=poe_watch,
         price_service=multi_price_service,
+        startup_thread=startup_thread,
     )
@@ -10,6 +10,10 @@ Follows the ClipboardMonitor pattern:
 - Callback system for events
 - Start/stop lifecycle methods
 
+The log is tailed through a persistent file handle in bounded chunks. On Linux
+the thread sleeps on inotify events for the log directory; elsewhere (or when
+inotify is unavailable) it falls back to polling every ``poll_interval``.
+
 Usage:
     monitor = ClientTxtMonitor(
         on_zone_change=handle_zone_change,
@@ -21,18 +25,30 @@ Usage:
 """
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
 import logging
+import os
 import re
+import select
+import struct
+import sys
 import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Optional
+from typing import BinaryIO, Callable, Optional
 
 logger = logging.getLogger(__name__)
 
+# Read size for tailing; bounds memory use when a large burst is appended
+READ_CHUNK_SIZE = 64 * 1024
+
+# Longest partial line kept between reads; anything longer is garbage
+MAX_LINE_BYTES = 64 * 1024
+
 
 class ZoneType(Enum):
     """Classification of zone types in Path of Exile."""
@@ -59,6 +75,112 @@ class ZoneChangeEvent:
         return f"{self.zone_name}{level_str} [{self.zone_type.value}]"
 
 
+class _InotifyWatcher:
+    """
+    Minimal inotify wrapper (Linux only) used to wake the tail loop.
+
+    Watches the log's parent directory rather than the file itself so that
+    rotation (rename/delete + create) is observed as well as appends.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (
+        IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    )
+
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, fd: int, filename: str):
+        self._fd = fd
+        self._filename = filename.encode("utf-8", errors="replace")
+
+    @classmethod
+    def create(cls, log_path: Path) -> Optional["_InotifyWatcher"]:
+        """
+        Create a watcher for log_path's directory.
+
+        Returns:
+            Watcher instance, or None if inotify is unavailable.
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+        directory = log_path.parent
+        if not directory.is_dir():
+            return None
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+            fd = libc.inotify_init1(cls.IN_NONBLOCK | cls.IN_CLOEXEC)
+            if fd < 0:
+                return None
+            wd = libc.inotify_add_watch(
+                fd, os.fsencode(str(directory)), cls.WATCH_MASK
+            )
+            if wd < 0:
+                os.close(fd)
+                return None
+        except (OSError, AttributeError) as e:
+            logger.debug(f"inotify unavailable: {e}")
+            return None
+
+        return cls(fd, log_path.name)
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Block until the log file changes or timeout expires.
+
+        Returns:
+            True if an event for the log file was received.
+        """
+        try:
+            readable, _, _ = select.select([self._fd], [], [], timeout)
+        except (OSError, ValueError):
+            return False
+        if not readable:
+            return False
+        return self._drain()
+
+    def _drain(self) -> bool:
+        """Consume queued events; True if any refer to the log file."""
+        matched = False
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                break
+            except OSError:
+                break
+            if not data:
+                break
+
+            offset = 0
+            header_size = self._EVENT_HEADER.size
+            while offset + header_size <= len(data):
+                _, _, _, name_len = self._EVENT_HEADER.unpack_from(data, offset)
+                name = data[offset + header_size:offset + header_size + name_len]
+                if name.rstrip(b"\0") == self._filename:
+                    matched = True
+                offset += header_size + name_len
+        return matched
+
+    def close(self) -> None:
+        """Release the inotify file descriptor."""
+        if self._fd >= 0:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = -1
+
+
 class ClientTxtMonitor:
     """
     Monitors Path of Exile's Client.txt log file for zone change events.
@@ -72,8 +194,14 @@ class ClientTxtMonitor:
     Pattern matching for PoE1/PoE2:
     - Zone entry: "You have entered [zone name]."
     - Area level: "Generating level N area..."
+
+    Lines are only handed to the regexes when they contain one of the
+    literal LINE_MARKERS, which skips the vast majority of log traffic.
     """
 
+    # Literal prefilter applied to raw bytes before decoding/regex matching
+    LINE_MARKERS = (b"You have entered", b"Generating level")
+
     # Regex patterns for zone detection
     # Format: "2024/01/15 12:34:56 ... You have entered The Hideout."
     ZONE_ENTRY_PATTERN = re.compile(
@@ -142,6 +270,7 @@ class ClientTxtMonitor:
         log_path: Optional[Path] = None,
         on_zone_change: Optional[Callable[[ZoneChangeEvent], None]] = None,
         poll_interval: float = 1.0,
+        use_inotify: bool = True,
     ):
         """
         Initialize the Client.txt monitor.
@@ -149,11 +278,14 @@ class ClientTxtMonitor:
         Args:
             log_path: Path to Client.txt. If None, auto-detect.
             on_zone_change: Callback when zone change is detected.
-            poll_interval: Seconds between file checks (default 1.0).
+            poll_interval: Seconds between file checks (default 1.0). With
+                inotify this is only the fallback re-check interval.
+            use_inotify: Wait on inotify events when available (Linux).
         """
         self.log_path = log_path or self._detect_log_path()
         self.on_zone_change = on_zone_change
         self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
 
         self._running = False
         self._monitor_thread: Optional[threading.Thread] = None
@@ -161,6 +293,10 @@ class ClientTxtMonitor:
         self._last_position = 0
         self._last_zone: Optional[str] = None
         self._pending_area_level: Optional[int] = None
+        self._file: Optional[BinaryIO] = None
+        self._file_id: Optional[tuple] = None
+        self._partial = b""
+        self._watcher: Optional[_InotifyWatcher] = None
 
         # Statistics
         self.zones_detected = 0
@@ -278,8 +414,13 @@ class ClientTxtMonitor:
             raw_line=line.strip(),
         )
 
+    @property
+    def tail_mode(self) -> str:
+        """Current wake-up strategy: "inotify" or "polling"."""
+        return "inotify" if self._watcher else "polling"
+
     def _poll_loop(self):
-        """Background thread loop that polls the log file for changes."""
+        """Background thread loop that tails the log file for changes."""
         logger.info(f"Client.txt monitor started: {self.log_path}")
 
         # Start from end of file to avoid processing old entries
@@ -290,53 +431,136 @@ class ClientTxtMonitor:
         except OSError as e:
             logger.warning(f"Could not get initial file size: {e}")
 
-        while self._running:
-            try:
-                self._check_for_new_lines()
-                time.sleep(self.poll_interval)
-            except Exception as e:
-                logger.error(f"Client.txt poll error: {e}")
-                time.sleep(5.0)  # Longer delay on error
+        if self.use_inotify:
+            self._watcher = _InotifyWatcher.create(self.log_path)
+        logger.debug(f"Client.txt tail mode: {self.tail_mode}")
+
+        try:
+            while self._running:
+                try:
+                    self._check_for_new_lines()
+                    self._wait_for_change()
+                except Exception as e:
+                    logger.error(f"Client.txt poll error: {e}")
+                    time.sleep(5.0)  # Longer delay on error
+        finally:
+            self._close_file()
+            if self._watcher:
+                self._watcher.close()
+                self._watcher = None
 
         logger.info("Client.txt monitor stopped")
 
+    def _wait_for_change(self) -> None:
+        """Sleep until the log changes (inotify) or poll_interval elapses."""
+        if self._watcher:
+            self._watcher.wait(self.poll_interval)
+        else:
+            time.sleep(self.poll_interval)
+
+    def _open_file(self) -> bool:
+        """
+        Open (or reopen) the log file, keeping the handle for later reads.
+
+        Returns:
+            True if a handle is available.
+        """
+        try:
+            self._file = open(self.log_path, "rb")
+            st = os.fstat(self._file.fileno())
+            self._file_id = (st.st_dev, st.st_ino)
+            self._partial = b""
+        except OSError as e:
+            logger.debug(f"Could not open log file: {e}")
+            self._file = None
+            self._file_id = None
+            return False
+        return True
+
+    def _close_file(self) -> None:
+        """Close the persistent log file handle."""
+        if self._file:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+        self._file = None
+        self._file_id = None
+        self._partial = b""
+
     def _check_for_new_lines(self):
-        """Check for new lines in the log file."""
-        if not self.log_path.exists():
+        """Read and process any bytes appended since the last check."""
+        try:
+            st = self.log_path.stat()
+        except OSError:
+            # File missing (not started yet, or mid-rotation)
+            self._close_file()
             return
 
         try:
-            current_size = self.log_path.stat().st_size
+            # Handle rotation: the path now points at a different file
+            if self._file and self._file_id != (st.st_dev, st.st_ino):
+                logger.info("Client.txt was rotated, reopening from beginning")
+                self._close_file()
+                self._last_position = 0
 
-            # Handle file truncation/rotation
-            if current_size < self._last_position:
+            # Handle file truncation
+            if st.st_size < self._last_position:
                 logger.info("Client.txt was truncated, starting from beginning")
                 self._last_position = 0
+                self._partial = b""
 
             # No new content
-            if current_size <= self._last_position:
+            if st.st_size <= self._last_position:
                 return
 
-            # Read new lines
-            with open(
-                self.log_path, "r", encoding="utf-8", errors="replace"
-            ) as f:
-                f.seek(self._last_position)
-                new_lines = f.readlines()
-                self._last_position = f.tell()
-
-            # Process each line
-            for line in new_lines:
-                self.lines_processed += 1
-                event = self._parse_log_line(line)
+            if not self._file and not self._open_file():
+                return
 
-                # Only emit if zone actually changed
-                if event and event.zone_name != self._last_zone:
-                    self._last_zone = event.zone_name
-                    self._handle_zone_change(event)
+            self._file.seek(self._last_position)
+            while True:
+                chunk = self._file.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self._last_position += len(chunk)
+                self._process_chunk(chunk)
+                if len(chunk) < READ_CHUNK_SIZE:
+                    break
 
         except OSError as e:
             logger.debug(f"Error reading log file: {e}")
+            self._close_file()
+
+    def _process_chunk(self, chunk: bytes) -> None:
+        """
+        Split a chunk into complete lines and process them.
+
+        An unterminated trailing line is carried over to the next chunk.
+        """
+        data = self._partial + chunk if self._partial else chunk
+        lines = data.split(b"\n")
+        self._partial = lines.pop()
+        if len(self._partial) > MAX_LINE_BYTES:
+            self._partial = b""
+
+        for raw in lines:
+            self._process_raw_line(raw.rstrip(b"\r"))
+
+    def _process_raw_line(self, raw: bytes) -> None:
+        """Prefilter a raw log line and emit a zone change if it has one."""
+        self.lines_processed += 1
+
+        # Cheap literal check before decoding and regex matching
+        if not any(marker in raw for marker in self.LINE_MARKERS):
+            return
+
+        line = raw.decode("utf-8", errors="replace")
+        event = self._parse_log_line(line)
+
+        # Only emit if zone actually changed
+        if event and event.zone_name != self._last_zone:
+            self._last_zone = event.zone_name
+            self._handle_zone_change(event)
 
     def _handle_zone_change(self, event: ZoneChangeEvent):
         """
@@ -412,6 +636,7 @@ class ClientTxtMonitor:
             "hideout_entries": self.hideout_entries,
             "lines_processed": self.lines_processed,
             "last_zone": self._last_zone,
+            "tail_mode": self.tail_mode,
         }
 
     def get_last_zone(self) -> Optional[str]:
@@ -421,6 +646,7 @@ class ClientTxtMonitor:
     def cleanup(self):
         """Clean up resources."""
         self.stop_monitoring()
+        self._close_file()
 
 
 def detect_client_txt_path() -> Optional[Path]:
@@ -5,7 +5,8 @@ Provides background monitoring of clipboard changes and hotkey-triggered
 item price checking for seamless PoE integration.
 
 Supports:
-- Automatic clipboard change detection
+- Automatic clipboard change detection (polling, or push-based via a
+  ClipboardSource such as QClipboard.dataChanged / X11 selection events)
 - Global hotkey bindings (e.g., Ctrl+Shift+C for price check)
 - Thread-safe operation with main GUI
 """
@@ -17,6 +18,8 @@ import time
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional
 
+from core.clipboard_sources import ClipboardSource
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,7 +52,8 @@ class ClipboardMonitor:
     Monitors clipboard for item text and provides hotkey support.
 
     Features:
-    - Background thread monitors clipboard changes
+    - Background thread monitors clipboard changes, or an optional
+      push-based ClipboardSource notifies on change
     - Global hotkey bindings for quick price checks
     - Callbacks for item detection
     - PoE item text detection (filters non-item text)
@@ -68,6 +72,7 @@ class ClipboardMonitor:
         on_item_detected: Optional[Callable[[str], None]] = None,
         poll_interval: float = 0.5,
         tk_root=None,
+        source: Optional[ClipboardSource] = None,
     ):
         """
         Initialize the clipboard monitor.
@@ -76,10 +81,13 @@ class ClipboardMonitor:
             on_item_detected: Callback when PoE item is detected in clipboard
             poll_interval: Seconds between clipboard checks (default 0.5)
             tk_root: Tkinter root window (for clipboard access fallback)
+            source: Optional clipboard source. When given, it delivers
+                changes (and serves reads) instead of the built-in poll loop.
         """
         self.on_item_detected = on_item_detected
         self.poll_interval = poll_interval
         self.tk_root = tk_root
+        self.source = source
 
         self._running = False
         self._monitor_thread: Optional[threading.Thread] = None
@@ -95,6 +103,13 @@ class ClipboardMonitor:
         """Get current clipboard text using available method."""
         self.clipboard_reads += 1
 
+        if self.source is not None:
+            try:
+                return str(self.source.read() or "")
+            except Exception as e:
+                logger.debug(f"{self.source.name} clipboard read failed: {e}")
+                return ""
+
         if PYPERCLIP_AVAILABLE:
             try:
                 val = pyperclip.paste()
@@ -139,6 +154,43 @@ class ClipboardMonitor:
         # Need at least 2 indicators for confidence
         return matches >= 2
 
+    def _handle_clipboard_text(self, current: str) -> None:
+        """
+        Process clipboard text from the poll loop or a clipboard source.
+
+        Ignores unchanged content and invokes on_item_detected for new
+        PoE item text.
+        """
+        # Keep critical section minimal: compute whether to notify and update state
+        should_notify = False
+        notify_payload = None
+        with self._lock:
+            if current and current != self._last_clipboard:
+                self._last_clipboard = current
+
+                # Check if it's PoE item data
+                if self._is_poe_item(current):
+                    self.items_detected += 1
+                    should_notify = True
+                    notify_payload = current
+
+        # Perform logging and callbacks outside the lock to avoid deadlocks
+        if should_notify and notify_payload is not None:
+            logger.info(f"PoE item detected in clipboard ({len(current)} chars)")
+            if self.on_item_detected:
+                try:
+                    self.on_item_detected(notify_payload)
+                except Exception as e:
+                    logger.error(f"Item callback error: {e}")
+
+    def _on_source_change(self, text: str) -> None:
+        """Callback for clipboard sources; counts the read and processes it."""
+        self.clipboard_reads += 1
+        try:
+            self._handle_clipboard_text(str(text or ""))
+        except Exception as e:
+            logger.error(f"Clipboard change error: {e}")
+
     def _clipboard_poll_loop(self) -> None:
         """Background thread loop that polls clipboard for changes."""
         logger.info("Clipboard monitor started")
@@ -146,29 +198,7 @@ class ClipboardMonitor:
         while self._running:
             try:
                 current = self._get_clipboard()
-
-                # Keep critical section minimal: compute whether to notify and update state
-                should_notify = False
-                notify_payload = None
-                with self._lock:
-                    if current and current != self._last_clipboard:
-                        self._last_clipboard = current
-
-                        # Check if it's PoE item data
-                        if self._is_poe_item(current):
-                            self.items_detected += 1
-                            should_notify = True
-                            notify_payload = current
-
-                # Perform logging and callbacks outside the lock to avoid deadlocks
-                if should_notify and notify_payload is not None:
-                    logger.info(f"PoE item detected in clipboard ({len(current)} chars)")
-                    if self.on_item_detected:
-                        try:
-                            self.on_item_detected(notify_payload)
-                        except Exception as e:
-                            logger.error(f"Item callback error: {e}")
-
+                self._handle_clipboard_text(current)
                 time.sleep(self.poll_interval)
 
             except Exception as e:
@@ -188,6 +218,14 @@ class ClipboardMonitor:
             logger.warning("Clipboard monitor already running")
             return False
 
+        if self.source is not None:
+            if not self.source.start(self._on_source_change):
+                logger.error(f"Failed to start {self.source.name} clipboard source")
+                return False
+            self._running = True
+            logger.info(f"Clipboard monitor started ({self.source.name} source)")
+            return True
+
         self._running = True
         self._monitor_thread = threading.Thread(
             target=self._clipboard_poll_loop,
@@ -199,7 +237,10 @@ class ClipboardMonitor:
 
     def stop_monitoring(self) -> None:
         """Stop background clipboard monitoring."""
+        was_running = self._running
         self._running = False
+        if self.source is not None and was_running:
+            self.source.stop()
         if self._monitor_thread:
             self._monitor_thread.join(timeout=2.0)
             self._monitor_thread = None
@@ -285,6 +326,7 @@ class ClipboardMonitor:
         """Get monitoring statistics."""
         return {
             "running": self._running,
+            "source": self.source.name if self.source is not None else "polling",
             "items_detected": self.items_detected,
             "clipboard_reads": self.clipboard_reads,
             "hotkeys_registered": len(self._hotkeys),
@@ -318,6 +360,7 @@ class PriceCheckHotkeyManager:
         self,
         price_check_callback: Callable[[str], None],
         tk_root=None,
+        source: Optional[ClipboardSource] = None,
     ):
         """
         Initialize the hotkey manager.
@@ -325,11 +368,13 @@ class PriceCheckHotkeyManager:
         Args:
             price_check_callback: Function to call with item text for pricing
             tk_root: Tkinter root for clipboard access
+            source: Optional push-based clipboard source for auto detection
         """
         self.price_check_callback = price_check_callback
         self.monitor = ClipboardMonitor(
             on_item_detected=None,  # Manual trigger only
             tk_root=tk_root,
+            source=source,
         )
 
     def setup_default_hotkeys(self) -> dict:
@@ -0,0 +1,312 @@
+"""
+Clipboard Sources for ClipboardMonitor.
+
+A clipboard source delivers clipboard text to the monitor. Push-based sources
+notify on change instead of being polled, which avoids waking up (and, on
+Linux, spawning an xclip/xsel subprocess via pyperclip) every poll interval.
+
+Backends:
+- PollingClipboardSource: fixed-interval reads (portable fallback)
+- X11SelectionClipboardSource: XFixes selection-owner events (Linux/X11)
+- QtClipboardSource (gui_qt.services.clipboard_service): QClipboard.dataChanged
+
+Usage:
+    source = create_clipboard_source(read_text=pyperclip.paste)
+    monitor = ClipboardMonitor(on_item_detected=handle, source=source)
+    monitor.start_monitoring()
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import sys
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+ClipboardCallback = Callable[[str], None]
+
+
+class ClipboardSource(ABC):
+    """
+    Abstract clipboard source.
+
+    Subclasses call the callback passed to start() with the current clipboard
+    text whenever it may have changed. Duplicate suppression and item
+    detection remain the monitor's job.
+    """
+
+    #: Human-readable backend name (shown in monitor stats)
+    name: str = "abstract"
+
+    #: True if the source notifies on change rather than polling
+    push_based: bool = False
+
+    @abstractmethod
+    def start(self, on_change: ClipboardCallback) -> bool:
+        """
+        Begin delivering clipboard changes.
+
+        Args:
+            on_change: Called with clipboard text on each change.
+
+        Returns:
+            True if the source started successfully.
+        """
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stop delivering clipboard changes."""
+
+    @abstractmethod
+    def read(self) -> str:
+        """Read the current clipboard text synchronously."""
+
+
+class PollingClipboardSource(ClipboardSource):
+    """Reads the clipboard every ``poll_interval`` seconds on a thread."""
+
+    name = "polling"
+    push_based = False
+
+    def __init__(self, read_text: Callable[[], str], poll_interval: float = 0.5):
+        """
+        Args:
+            read_text: Function returning the current clipboard text.
+            poll_interval: Seconds between reads.
+        """
+        self._read_text = read_text
+        self.poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def read(self) -> str:
+        return self._read_text()
+
+    def start(self, on_change: ClipboardCallback) -> bool:
+        if self._thread and self._thread.is_alive():
+            return False
+
+        self._stop_event.clear()
+
+        def run() -> None:
+            while not self._stop_event.is_set():
+                try:
+                    on_change(self.read())
+                except Exception as e:
+                    logger.error(f"Clipboard poll error: {e}")
+                self._stop_event.wait(self.poll_interval)
+
+        self._thread = threading.Thread(
+            target=run, daemon=True, name="ClipboardPollingSource"
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+
+class _XEvent(ctypes.Union):
+    """Opaque XEvent (the C union is 24 longs); only ``type`` is inspected."""
+
+    _fields_ = [("type", ctypes.c_int), ("pad", ctypes.c_long * 24)]
+
+
+class X11SelectionClipboardSource(ClipboardSource):
+    """
+    Watches CLIPBOARD ownership changes via the XFixes extension.
+
+    The X server sends an event whenever an application takes ownership of
+    the clipboard (i.e. copies something). The thread sleeps in select() on
+    the X connection between events, so an idle clipboard costs nothing.
+    Text is only read (via ``read_text``) after a change notification.
+    """
+
+    name = "x11"
+    push_based = True
+
+    # From X11/extensions/Xfixes.h
+    XFIXES_SELECTION_NOTIFY = 0
+    XFIXES_SET_SELECTION_OWNER_NOTIFY_MASK = 1 << 0
+
+    def __init__(self, read_text: Callable[[], str]):
+        """
+        Args:
+            read_text: Function returning the current clipboard text.
+        """
+        self._read_text = read_text
+        self._thread: Optional[threading.Thread] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        self._running = False
+
+    @staticmethod
+    def _load_libraries() -> Optional[tuple[Any, Any]]:
+        """Load libX11 and libXfixes, or return None if unavailable."""
+        x11_name = ctypes.util.find_library("X11")
+        xfixes_name = ctypes.util.find_library("Xfixes")
+        if not x11_name or not xfixes_name:
+            return None
+        try:
+            x11 = ctypes.CDLL(x11_name)
+            xfixes = ctypes.CDLL(xfixes_name)
+        except OSError:
+            return None
+
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XDefaultRootWindow.restype = ctypes.c_ulong
+        x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        x11.XInternAtom.restype = ctypes.c_ulong
+        x11.XInternAtom.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+        x11.XConnectionNumber.argtypes = [ctypes.c_void_p]
+        x11.XPending.argtypes = [ctypes.c_void_p]
+        x11.XNextEvent.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XEvent)]
+        x11.XFlush.argtypes = [ctypes.c_void_p]
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        xfixes.XFixesQueryExtension.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_int),
+        ]
+        xfixes.XFixesSelectSelectionInput.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong,
+        ]
+        return x11, xfixes
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Check for an X11 display and the required client libraries."""
+        if not sys.platform.startswith("linux"):
+            return False
+        if not os.environ.get("DISPLAY"):
+            return False
+        return cls._load_libraries() is not None
+
+    def read(self) -> str:
+        return self._read_text()
+
+    def start(self, on_change: ClipboardCallback) -> bool:
+        if self._running:
+            return False
+
+        libs = self._load_libraries()
+        if libs is None:
+            logger.warning("X11 clipboard source unavailable (libX11/libXfixes not found)")
+            return False
+        x11, xfixes = libs
+
+        display = x11.XOpenDisplay(None)
+        if not display:
+            logger.warning("X11 clipboard source could not open display")
+            return False
+
+        event_base = ctypes.c_int()
+        error_base = ctypes.c_int()
+        if not xfixes.XFixesQueryExtension(
+            display, ctypes.byref(event_base), ctypes.byref(error_base)
+        ):
+            logger.warning("X server lacks XFixes; cannot watch clipboard owner")
+            x11.XCloseDisplay(display)
+            return False
+
+        root = x11.XDefaultRootWindow(display)
+        clipboard_atom = x11.XInternAtom(display, b"CLIPBOARD", 0)
+        xfixes.XFixesSelectSelectionInput(
+            display, root, clipboard_atom, self.XFIXES_SET_SELECTION_OWNER_NOTIFY_MASK
+        )
+        x11.XFlush(display)
+
+        self._wake_r, self._wake_w = os.pipe()
+        self._running = True
+        notify_type = event_base.value + self.XFIXES_SELECTION_NOTIFY
+
+        self._thread = threading.Thread(
+            target=self._event_loop,
+            args=(x11, display, notify_type, on_change),
+            daemon=True,
+            name="ClipboardX11Source",
+        )
+        self._thread.start()
+        return True
+
+    def _event_loop(
+        self,
+        x11: Any,
+        display: int,
+        notify_type: int,
+        on_change: ClipboardCallback,
+    ) -> None:
+        """Wait for selection-owner events and forward clipboard text."""
+        x_fd = x11.XConnectionNumber(display)
+        event = _XEvent()
+        try:
+            while self._running:
+                readable, _, _ = select.select([x_fd, self._wake_r], [], [])
+                if self._wake_r in readable:
+                    break
+
+                changed = False
+                while x11.XPending(display):
+                    x11.XNextEvent(display, ctypes.byref(event))
+                    if event.type == notify_type:
+                        changed = True
+
+                if changed:
+                    try:
+                        on_change(self.read())
+                    except Exception as e:
+                        logger.error(f"Clipboard change handler error: {e}")
+        except Exception as e:
+            logger.error(f"X11 clipboard source error: {e}")
+        finally:
+            x11.XCloseDisplay(display)
+
+    def stop(self) -> None:
+        self._running = False
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b"\0")
+            except OSError:
+                pass
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._wake_r = self._wake_w = None
+
+
+def create_clipboard_source(
+    read_text: Callable[[], str],
+    poll_interval: float = 0.5,
+    prefer_push: bool = True,
+) -> ClipboardSource:
+    """
+    Pick the best clipboard source for this platform.
+
+    Args:
+        read_text: Function returning the current clipboard text.
+        poll_interval: Interval for the polling fallback.
+        prefer_push: Use a change-notification backend when available.
+
+    Returns:
+        An X11 source on Linux/X11, otherwise a polling source. (The Qt
+        backend needs a QApplication and is created by the GUI layer.)
+    """
+    if prefer_push and X11SelectionClipboardSource.is_available():
+        return X11SelectionClipboardSource(read_text)
+    return PollingClipboardSource(read_text, poll_interval)
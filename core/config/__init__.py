@@ -10,6 +10,8 @@ For new code, import directly from this package:
 import json
 import logging
 import copy
+import os
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any, List, TypeVar
 from datetime import datetime
@@ -38,6 +40,8 @@ class Config:
     - Settings are stored per game version (PoE1 / PoE2) under the "games" key.
     - A single "current_game" string selects which game is "active" for league/UI.
     - The backing store is a JSON file on disk (user config file).
+    - Saves are serialized by a lock, so background threads (e.g. startup
+      league detection) can persist changes while the GUI does too.
     """
 
     # Reference to the default config (imported from defaults module)
@@ -55,6 +59,9 @@ class Config:
         self.config_file: Path = self._resolve_config_path(config_file)
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Guards multi-step updates and file writes across threads
+        self._lock = threading.RLock()
+
         # Load data from disk (or defaults)
         self.data: Dict[str, Any] = self._load()
         logger.info(f"Config loaded from {self.config_file}")
@@ -126,13 +133,21 @@ class Config:
     # ------------------------------------------------------------------
 
     def save(self) -> None:
-        """Persist the current configuration to the config file."""
-        try:
-            with self.config_file.open("w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
-            logger.info("Configuration saved")
-        except Exception as exc:  # defensive
-            logger.error(f"Failed to save config: {exc}")
+        """
+        Persist the current configuration to the config file.
+
+        Thread-safe: saves run one at a time, and each replaces the file
+        atomically with the complete current settings.
+        """
+        with self._lock:
+            try:
+                text = json.dumps(self.data, indent=2, ensure_ascii=False)
+                tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+                tmp_file.write_text(text, encoding="utf-8")
+                os.replace(tmp_file, self.config_file)
+                logger.info("Configuration saved")
+            except Exception as exc:  # defensive
+                logger.error(f"Failed to save config: {exc}")
 
     # ------------------------------------------------------------------
     # Typed accessor helpers (for mypy compliance)
@@ -276,15 +291,17 @@ class Config:
         """
         game_key = game_config.game_version.value
 
-        if game_key not in self.data["games"]:
-            self.data["games"][game_key] = {}
+        # May run on the startup thread (league auto-detection)
+        with self._lock:
+            if game_key not in self.data["games"]:
+                self.data["games"][game_key] = {}
 
-        self.data["games"][game_key]["league"] = game_config.league
-        self.data["games"][game_key]["divine_chaos_rate"] = game_config.divine_chaos_rate
-        # NOTE: last_price_update is maintained as a "last update timestamp"
-        self.data["games"][game_key]["last_price_update"] = datetime.now().isoformat()
+            self.data["games"][game_key]["league"] = game_config.league
+            self.data["games"][game_key]["divine_chaos_rate"] = game_config.divine_chaos_rate
+            # NOTE: last_price_update is maintained as a "last update timestamp"
+            self.data["games"][game_key]["last_price_update"] = datetime.now().isoformat()
 
-        self.save()
+            self.save()
 
     # ------------------------------------------------------------------
     # Pricing policy configuration
@@ -355,6 +372,36 @@ class Config:
         self.data["pricing"]["enabled_sources"] = coerced
         self.save()
 
+    @property
+    def price_source_limits(self) -> Dict[str, Dict[str, Any]]:
+        """Per-source {"max_concurrent", "deadline_s"} by source name.
+
+        The "default" entry applies to sources without their own. Values are
+        clamped to the guardrails (max_concurrent 1..16, deadline_s 1..120s);
+        None means unlimited.
+        """
+        pricing = self.data.get("pricing", {}) or {}
+        configured = pricing.get("source_limits", {}) or {}
+        merged: Dict[str, Any] = dict(self.DEFAULT_CONFIG["pricing"]["source_limits"])
+        if isinstance(configured, dict):
+            merged.update(configured)
+
+        limits: Dict[str, Dict[str, Any]] = {}
+        for name, entry in merged.items():
+            if not isinstance(entry, dict):
+                continue
+            max_concurrent = entry.get("max_concurrent")
+            deadline_s = entry.get("deadline_s")
+            try:
+                if max_concurrent is not None:
+                    max_concurrent = max(1, min(16, int(max_concurrent)))
+                if deadline_s is not None:
+                    deadline_s = max(1.0, min(120.0, float(deadline_s)))
+            except (TypeError, ValueError):
+                continue
+            limits[str(name)] = {"max_concurrent": max_concurrent, "deadline_s": deadline_s}
+        return limits
+
     # ------------------------------------------------------------------
     # League Management
     # ------------------------------------------------------------------
@@ -870,6 +917,27 @@ class Config:
         self.data.setdefault("ai", {})["timeout_seconds"] = max(10, min(300, int(value)))
         self.save()
 
+    @property
+    def ai_response_cache_enabled(self) -> bool:
+        """Whether repeated AI prompts are answered from the response cache."""
+        return bool(self.data.get("ai", {}).get("response_cache_enabled", True))
+
+    @ai_response_cache_enabled.setter
+    def ai_response_cache_enabled(self, value: bool) -> None:
+        self.data.setdefault("ai", {})["response_cache_enabled"] = bool(value)
+        self.save()
+
+    @property
+    def ai_response_cache_ttl_hours(self) -> int:
+        """Hours a cached AI response stays valid (1-720)."""
+        return self._get_ai_int("response_cache_ttl_hours", 168)
+
+    @ai_response_cache_ttl_hours.setter
+    def ai_response_cache_ttl_hours(self, value: int) -> None:
+        """Set cached AI response lifetime with guardrails (1-720h)."""
+        self.data.setdefault("ai", {})["response_cache_ttl_hours"] = max(1, min(720, int(value)))
+        self.save()
+
     def has_ai_configured(self) -> bool:
         """Check if AI is configured (provider set and has API key or is local)."""
         provider = self.ai_provider
@@ -123,6 +123,15 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         # Persist enabled/disabled state of price sources by name
         # Example: {"poe.ninja": true, "poe.watch": false}
         "enabled_sources": {},
+        # Per-source limits for multi-source price checks, by source name;
+        # "default" covers sources without their own entry. max_concurrent caps
+        # calls in flight, deadline_s is how long a check waits for the source.
+        # The poe.ninja/poe2.ninja source includes trade API lookups, which are
+        # rate limited to ~1 request per 3s.
+        # GUARDRAIL: max_concurrent 1..16, deadline_s 1..120 (null = no limit)
+        "source_limits": {
+            "default": {"max_concurrent": 2, "deadline_s": 20.0},
+        },
     },
     "verdict": {
         # Quick Verdict thresholds for keep/vendor decisions
@@ -144,6 +153,9 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         # Response settings
         "max_response_tokens": 500,  # Max tokens in AI response
         "timeout_seconds": 30,  # Request timeout
+        # Reuse stored answers for repeated prompts (same item/build)
+        "response_cache_enabled": True,
+        "response_cache_ttl_hours": 168,
     },
     "loot_tracking": {
         # Path to Client.txt (empty = auto-detect)
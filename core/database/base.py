@@ -22,13 +22,14 @@ import threading
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, cast
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
 
 from core.game_version import GameVersion
 
 from core.database.migrations import MigrationRunner
 from core.database.repositories.checked_items_repository import CheckedItemsRepository
 from core.database.repositories.currency_repository import CurrencyRepository
+from core.database.repositories.loot_repository import LootRepository
 from core.database.repositories.plugin_repository import PluginRepository
 from core.database.repositories.price_alert_repository import PriceAlertRepository
 from core.database.repositories.price_repository import PriceRepository
@@ -88,6 +89,7 @@ class Database:
         # Initialize repositories
         self._checked_items_repo = CheckedItemsRepository(self.conn, self._lock)
         self._currency_repo = CurrencyRepository(self.conn, self._lock)
+        self._loot_repo = LootRepository(self.conn, self._lock)
         self._plugin_repo = PluginRepository(self.conn, self._lock)
         self._price_alert_repo = PriceAlertRepository(self.conn, self._lock)
         self._price_repo = PriceRepository(self.conn, self._lock)
@@ -219,6 +221,39 @@ class Database:
         """Return recent checked items, newest-first."""
         return self._checked_items_repo.get_checked_items(game_version, league, limit)
 
+    def query_checked_items(
+        self,
+        game_version: Optional[str] = None,
+        league: Optional[str] = None,
+        rarity: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[str, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return a filtered page of checked items (SQL-side, keyset capable)."""
+        return self._checked_items_repo.query_checked_items(
+            game_version, league, rarity, search, limit, offset, after
+        )
+
+    def count_checked_items(
+        self,
+        game_version: Optional[str] = None,
+        league: Optional[str] = None,
+        rarity: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> int:
+        """Count checked items matching filters."""
+        return self._checked_items_repo.count_checked_items(game_version, league, rarity, search)
+
+    def get_checked_item(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """Return a checked item by ID, or None."""
+        return self._checked_items_repo.get_checked_item(item_id)
+
+    def get_checked_items_by_day(self, days: int = 30) -> List[Dict[str, Any]]:
+        """Return checked item counts per day for the last N days."""
+        return self._checked_items_repo.get_checked_items_by_day(days)
+
     # ----------------------------------------------------------------------
     # Sales
     # ----------------------------------------------------------------------
@@ -275,6 +310,32 @@ class Database:
         """Return sales entries, newest-first by listed_at DESC."""
         return self._sales_repo.get_sales(sold_only, limit)
 
+    def query_sales(
+        self,
+        status: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[str, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return a page of sales filtered by status (SQL-side, keyset capable)."""
+        return self._sales_repo.query_sales(status, limit, offset, after)
+
+    def count_sales(self, status: Optional[str] = None) -> int:
+        """Count sales matching a status filter."""
+        return self._sales_repo.count_sales(status)
+
+    def get_sale(self, sale_id: int) -> Optional[Dict[str, Any]]:
+        """Return a sale by ID, or None."""
+        return self._sales_repo.get_sale(sale_id)
+
+    def get_sales_period_stats(self, days: int = 30, top_limit: int = 10) -> Dict[str, Any]:
+        """Aggregate completed sales over the last N days."""
+        return self._sales_repo.get_sales_period_stats(days, top_limit)
+
+    def get_sales_activity_today(self) -> Dict[str, int]:
+        """Return today's completed and currently pending sale counts."""
+        return self._sales_repo.get_sales_activity_today()
+
     # ----------------------------------------------------------------------
     # Price History + Price Checks / Quotes (delegated to PriceRepository)
     # ----------------------------------------------------------------------
@@ -676,6 +737,44 @@ class Database:
         """Get aggregate statistics for alerts."""
         return self._price_alert_repo.get_alert_statistics(league, game_version)
 
+    # ----------------------------------------------------------------------
+    # Loot Tracking (delegated to LootRepository)
+    # ----------------------------------------------------------------------
+
+    def save_loot_batch(
+        self,
+        sessions: List[tuple],
+        map_runs: List[tuple],
+        drops: List[tuple],
+    ) -> None:
+        """Write loot sessions, map runs and drops in one transaction."""
+        self._loot_repo.save_loot_batch(sessions, map_runs, drops)
+
+    def get_loot_session_history(
+        self,
+        league: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Get one page of loot session summaries, newest first."""
+        return self._loot_repo.get_session_history(league, limit, offset)
+
+    def get_loot_session_totals(self, league: Optional[str] = None) -> Dict[str, Any]:
+        """Get totals across all stored loot sessions."""
+        return self._loot_repo.get_session_totals(league)
+
+    def get_loot_session_details(
+        self,
+        session_id: str,
+        top_drops_limit: int = 20,
+    ) -> Optional[Dict[str, Any]]:
+        """Get a loot session with map runs, top drops and rarity breakdown."""
+        return self._loot_repo.get_session_details(session_id, top_drops_limit)
+
+    def delete_loot_session(self, session_id: str) -> bool:
+        """Delete a loot session with its map runs and drops."""
+        return self._loot_repo.delete_session(session_id)
+
     def close(self) -> None:
         """Close the underlying SQLite connection."""
         try:
@@ -25,6 +25,9 @@ from core.database.schema import (
     MIGRATION_V11_SQL,
     MIGRATION_V12_SQL,
     MIGRATION_V13_SQL,
+    MIGRATION_V14_SQL,
+    MIGRATION_V15_SQL,
+    MIGRATION_V16_SQL,
     SCHEMA_VERSION,
 )
 
@@ -149,6 +152,12 @@ class MigrationRunner:
             - Tracks item alerts with above/below thresholds and cooldowns.
         v12 -> v13:
             - Add `ml_listings` and `ml_collection_runs` for ML data collection.
+        v13 -> v14:
+            - Add indexes on `checked_items` and `sales` for API paging/aggregates.
+        v14 -> v15:
+            - Index `price_history` by item, league and time for chart series.
+        v15 -> v16:
+            - Index `price_checks` by time and `price_quotes` by check for exports.
 
         Args:
             old: Current schema version
@@ -193,6 +202,15 @@ class MigrationRunner:
             if old < 13 <= new:
                 self._migrate_v13(conn)
 
+            if old < 14 <= new:
+                self._migrate_v14(conn)
+
+            if old < 15 <= new:
+                self._migrate_v15(conn)
+
+            if old < 16 <= new:
+                self._migrate_v16(conn)
+
         self._set_schema_version(new)
         logger.info(f"Schema migration complete. Now at v{new}.")
 
@@ -299,3 +317,18 @@ class MigrationRunner:
             "Applying v13 migration: creating ml_listings and ml_collection_runs tables."
         )
         conn.executescript(MIGRATION_V13_SQL)
+
+    def _migrate_v14(self, conn: sqlite3.Connection) -> None:
+        """v13 -> v14: Index checked_items and sales for API queries."""
+        logger.info("Applying v14 migration: indexing checked_items and sales.")
+        conn.executescript(MIGRATION_V14_SQL)
+
+    def _migrate_v15(self, conn: sqlite3.Connection) -> None:
+        """v14 -> v15: Index price_history for chart series."""
+        logger.info("Applying v15 migration: indexing price_history.")
+        conn.executescript(MIGRATION_V15_SQL)
+
+    def _migrate_v16(self, conn: sqlite3.Connection) -> None:
+        """v15 -> v16: Index price_checks and price_quotes for exports."""
+        logger.info("Applying v16 migration: indexing price_checks and price_quotes.")
+        conn.executescript(MIGRATION_V16_SQL)
@@ -12,6 +12,7 @@ Public API:
 - CheckedItemsRepository: Checked item tracking
 - PluginRepository: Plugin state management
 - CurrencyRepository: Currency rate tracking
+- LootRepository: Loot session persistence
 - UpgradeAdviceRepository: Upgrade advice cache and history
 - VerdictRepository: Verdict statistics
 - PriceAlertRepository: Price alert monitoring
@@ -20,6 +21,7 @@ Public API:
 from core.database.repositories.base_repository import BaseRepository
 from core.database.repositories.checked_items_repository import CheckedItemsRepository
 from core.database.repositories.currency_repository import CurrencyRepository
+from core.database.repositories.loot_repository import LootRepository
 from core.database.repositories.plugin_repository import PluginRepository
 from core.database.repositories.price_alert_repository import PriceAlertRepository
 from core.database.repositories.price_repository import PriceRepository
@@ -32,6 +34,7 @@ __all__ = [
     "BaseRepository",
     "CheckedItemsRepository",
     "CurrencyRepository",
+    "LootRepository",
     "PluginRepository",
     "PriceAlertRepository",
     "PriceRepository",
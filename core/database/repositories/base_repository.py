@@ -11,6 +11,8 @@ import threading
 from contextlib import contextmanager
 from typing import Iterator, List, Optional, Tuple, Union, cast
 
+from core.tracing import span
+
 logger = logging.getLogger(__name__)
 
 # Type alias for SQL parameters
@@ -36,6 +38,8 @@ class BaseRepository:
         """
         self._conn = conn
         self._lock = lock
+        # Stage name for query timing, e.g. "db.PriceQuotesRepository"
+        self._trace_stage = f"db.{type(self).__name__}"
 
     @contextmanager
     def transaction(self) -> Iterator[sqlite3.Connection]:
@@ -51,7 +55,7 @@ class BaseRepository:
         Yields:
             The SQLite connection within the transaction
         """
-        with self._lock:
+        with span(self._trace_stage), self._lock:
             try:
                 yield self._conn
                 self._conn.commit()
@@ -74,7 +78,7 @@ class BaseRepository:
         Returns:
             The cursor from the execute call
         """
-        with self._lock:
+        with span(self._trace_stage), self._lock:
             cursor = self._conn.execute(sql, params)
             if commit:
                 self._conn.commit()
@@ -93,7 +97,7 @@ class BaseRepository:
         Returns:
             Single row result, or None if no rows
         """
-        with self._lock:
+        with span(self._trace_stage), self._lock:
             cursor = self._conn.execute(sql, params)
             result = cursor.fetchone()
             return cast(Optional[sqlite3.Row], result)
@@ -111,6 +115,6 @@ class BaseRepository:
         Returns:
             List of all matching rows
         """
-        with self._lock:
+        with span(self._trace_stage), self._lock:
             cursor = self._conn.execute(sql, params)
             return cursor.fetchall()
@@ -6,7 +6,7 @@ for pricing information.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.database.repositories.base_repository import BaseRepository
 from core.game_version import GameVersion
@@ -83,3 +83,118 @@ class CheckedItemsRepository(BaseRepository):
 
         rows = self._execute_fetchall(query, tuple(params))
         return [dict(row) for row in rows]
+
+    @staticmethod
+    def _filter_clause(
+        game_version: Optional[str],
+        league: Optional[str],
+        rarity: Optional[str],
+        search: Optional[str],
+    ) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause shared by query/count."""
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        if game_version:
+            clauses.append("game_version = ?")
+            params.append(game_version)
+        if league:
+            clauses.append("league = ?")
+            params.append(league)
+        if rarity:
+            clauses.append("rarity = ? COLLATE NOCASE")
+            params.append(rarity)
+        if search:
+            escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("item_name LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, params
+
+    def query_checked_items(
+        self,
+        game_version: Optional[str] = None,
+        league: Optional[str] = None,
+        rarity: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[str, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return a filtered page of checked items, newest-first.
+
+        Filtering and pagination happen in SQL. Pass ``after`` (the
+        ``(checked_at, id)`` of the last row of the previous page) for keyset
+        pagination, which stays fast regardless of how deep the page is;
+        ``offset`` is still supported for simple clients.
+
+        Args:
+            game_version: Optional game version value ("poe1"/"poe2")
+            league: Optional exact league
+            rarity: Optional rarity (case-insensitive)
+            search: Optional case-insensitive substring of item_name
+            limit: Maximum rows to return
+            offset: Rows to skip (ignored when ``after`` is given)
+            after: Keyset cursor ``(checked_at, id)``
+
+        Returns:
+            List of checked item dictionaries
+        """
+        where, params = self._filter_clause(game_version, league, rarity, search)
+
+        if after is not None:
+            keyset = "(checked_at < ? OR (checked_at = ? AND id < ?))"
+            where = f"{where} AND {keyset}" if where else f" WHERE {keyset}"
+            params.extend([after[0], after[0], after[1]])
+            offset = 0
+
+        query = (
+            f"SELECT * FROM checked_items{where} "
+            "ORDER BY checked_at DESC, id DESC LIMIT ? OFFSET ?"
+        )
+        params.extend([limit, offset])
+
+        rows = self._execute_fetchall(query, tuple(params))
+        return [dict(row) for row in rows]
+
+    def count_checked_items(
+        self,
+        game_version: Optional[str] = None,
+        league: Optional[str] = None,
+        rarity: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> int:
+        """Count checked items matching the same filters as query_checked_items."""
+        where, params = self._filter_clause(game_version, league, rarity, search)
+        row = self._execute_fetchone(
+            f"SELECT COUNT(*) FROM checked_items{where}", tuple(params)
+        )
+        return int(row[0]) if row else 0
+
+    def get_checked_item(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """Return a single checked item by ID, or None."""
+        row = self._execute_fetchone(
+            "SELECT * FROM checked_items WHERE id = ?", (item_id,)
+        )
+        return dict(row) if row else None
+
+    def get_checked_items_by_day(self, days: int = 30) -> List[Dict[str, Any]]:
+        """
+        Return checked item counts per day for the last N days (including today).
+
+        Returns:
+            List of {"date": "YYYY-MM-DD", "count": int}, newest first
+        """
+        rows = self._execute_fetchall(
+            """
+            SELECT DATE(checked_at) AS date, COUNT(*) AS count
+            FROM checked_items
+            WHERE checked_at >= DATE('now', ?)
+            GROUP BY DATE(checked_at)
+            ORDER BY date DESC
+            """,
+            (f"-{int(days)} days",),
+        )
+        return [dict(row) for row in rows]
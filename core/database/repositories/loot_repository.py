@@ -0,0 +1,229 @@
+"""
+Loot tracking repository for session persistence.
+
+Handles database operations for:
+- Loot sessions, map runs and drops (batched, idempotent writes)
+- Paged session history with computed chaos/hour
+- Aggregated session details (map runs, top drops, rarity breakdown)
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from core.database.repositories.base_repository import BaseRepository
+
+# Row tuples in column order of the INSERT statements below
+SessionRow = Tuple[Any, ...]
+MapRunRow = Tuple[Any, ...]
+DropRow = Tuple[Any, ...]
+
+# chaos/hour for sessions of at least one minute (mirrors LootSession.chaos_per_hour)
+_CHAOS_PER_HOUR_SQL = """
+    CASE
+        WHEN ended_at IS NOT NULL
+             AND (julianday(ended_at) - julianday(started_at)) * 86400 >= 60
+        THEN total_chaos_value / ((julianday(ended_at) - julianday(started_at)) * 24)
+        ELSE 0.0
+    END
+"""
+
+
+class LootRepository(BaseRepository):
+    """Repository for loot tracking database operations."""
+
+    def save_loot_batch(
+        self,
+        sessions: Sequence[SessionRow],
+        map_runs: Sequence[MapRunRow],
+        drops: Sequence[DropRow],
+    ) -> None:
+        """
+        Write sessions, map runs and drops in a single transaction.
+
+        Sessions and map runs are upserted (their totals change as drops
+        arrive); drops are insert-only, so re-sending a drop is harmless.
+
+        Args:
+            sessions: (id, name, league, game_version, started_at, ended_at,
+                state, auto_detected, notes, total_maps, total_drops,
+                total_chaos_value) tuples.
+            map_runs: (id, session_id, map_name, area_level, started_at,
+                ended_at, drop_count, total_chaos_value) tuples.
+            drops: (id, map_run_id, session_id, item_name, item_base_type,
+                stack_size, chaos_value, divine_value, rarity, item_class,
+                detected_at, source_tab, item_data_json) tuples.
+        """
+        with self.transaction() as conn:
+            if sessions:
+                conn.executemany(
+                    """
+                    INSERT INTO loot_sessions (
+                        id, name, league, game_version, started_at, ended_at,
+                        state, auto_detected, notes,
+                        total_maps, total_drops, total_chaos_value
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        name = excluded.name,
+                        ended_at = excluded.ended_at,
+                        state = excluded.state,
+                        notes = excluded.notes,
+                        total_maps = excluded.total_maps,
+                        total_drops = excluded.total_drops,
+                        total_chaos_value = excluded.total_chaos_value
+                    """,
+                    sessions,
+                )
+            if map_runs:
+                conn.executemany(
+                    """
+                    INSERT INTO loot_map_runs (
+                        id, session_id, map_name, area_level,
+                        started_at, ended_at, drop_count, total_chaos_value
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        ended_at = excluded.ended_at,
+                        drop_count = excluded.drop_count,
+                        total_chaos_value = excluded.total_chaos_value
+                    """,
+                    map_runs,
+                )
+            if drops:
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO loot_drops (
+                        id, map_run_id, session_id, item_name,
+                        item_base_type, stack_size, chaos_value,
+                        divine_value, rarity, item_class, detected_at,
+                        source_tab, item_data_json
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    drops,
+                )
+
+    def get_session_history(
+        self,
+        league: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get one page of session summaries, newest first.
+
+        Only the session table is read; drops are never loaded.
+
+        Args:
+            league: Optional league filter.
+            limit: Page size.
+            offset: Number of sessions to skip.
+
+        Returns:
+            List of session summary dicts.
+        """
+        rows = self._execute_fetchall(
+            f"""
+            SELECT id, name, league, started_at, ended_at,
+                   total_maps, total_drops, total_chaos_value,
+                   {_CHAOS_PER_HOUR_SQL} AS chaos_per_hour
+            FROM loot_sessions
+            WHERE (? IS NULL OR league = ?)
+            ORDER BY started_at DESC
+            LIMIT ? OFFSET ?
+            """,
+            (league, league, limit, offset),
+        )
+        return [dict(row) for row in rows]
+
+    def get_session_totals(self, league: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get totals across all stored sessions.
+
+        Args:
+            league: Optional league filter.
+
+        Returns:
+            Dict with session_count, total_maps, total_drops, total_chaos_value.
+        """
+        row = self._execute_fetchone(
+            """
+            SELECT COUNT(*) AS session_count,
+                   COALESCE(SUM(total_maps), 0) AS total_maps,
+                   COALESCE(SUM(total_drops), 0) AS total_drops,
+                   COALESCE(SUM(total_chaos_value), 0.0) AS total_chaos_value
+            FROM loot_sessions
+            WHERE (? IS NULL OR league = ?)
+            """,
+            (league, league),
+        )
+        return dict(row) if row else {}
+
+    def get_session_details(
+        self,
+        session_id: str,
+        top_drops_limit: int = 20,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a session with its map runs, top drops and rarity breakdown.
+
+        Args:
+            session_id: Session ID.
+            top_drops_limit: Number of most valuable drops to include.
+
+        Returns:
+            Dict with session, map_runs, top_drops and drops_by_rarity,
+            or None if the session does not exist.
+        """
+        session = self._execute_fetchone(
+            f"""
+            SELECT *, {_CHAOS_PER_HOUR_SQL} AS chaos_per_hour
+            FROM loot_sessions WHERE id = ?
+            """,
+            (session_id,),
+        )
+        if not session:
+            return None
+
+        map_runs = self._execute_fetchall(
+            "SELECT * FROM loot_map_runs WHERE session_id = ? ORDER BY started_at",
+            (session_id,),
+        )
+        top_drops = self._execute_fetchall(
+            """
+            SELECT id, map_run_id, item_name, item_base_type, stack_size,
+                   chaos_value, divine_value, rarity, item_class,
+                   detected_at, source_tab
+            FROM loot_drops
+            WHERE session_id = ?
+            ORDER BY chaos_value * stack_size DESC
+            LIMIT ?
+            """,
+            (session_id, top_drops_limit),
+        )
+        rarity_rows = self._execute_fetchall(
+            """
+            SELECT rarity, COUNT(*) AS count
+            FROM loot_drops
+            WHERE session_id = ?
+            GROUP BY rarity
+            """,
+            (session_id,),
+        )
+
+        return {
+            "session": dict(session),
+            "map_runs": [dict(r) for r in map_runs],
+            "top_drops": [dict(d) for d in top_drops],
+            "drops_by_rarity": {r["rarity"]: r["count"] for r in rarity_rows},
+        }
+
+    def delete_session(self, session_id: str) -> bool:
+        """
+        Delete a session with its map runs and drops.
+
+        Returns:
+            True if a session was deleted.
+        """
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM loot_drops WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM loot_map_runs WHERE session_id = ?", (session_id,))
+            cursor = conn.execute("DELETE FROM loot_sessions WHERE id = ?", (session_id,))
+            return cursor.rowcount > 0
@@ -12,7 +12,7 @@ from __future__ import annotations
 import logging
 import sqlite3
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.database.repositories.base_repository import BaseRepository
 from core.database.utils import ensure_utc, parse_db_timestamp
@@ -391,3 +391,139 @@ class SalesRepository(BaseRepository):
             """,
             (f"-{int(days)} days",),
         )
+
+    # ------------------------------------------------------------------
+    # API queries (SQL-side filtering, keyset pagination, aggregates)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _status_clause(status: Optional[str]) -> str:
+        """WHERE clause for 'pending' / 'completed' / None."""
+        if status == "pending":
+            return " WHERE sold_at IS NULL"
+        if status == "completed":
+            return " WHERE sold_at IS NOT NULL"
+        return ""
+
+    def query_sales(
+        self,
+        status: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[str, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return a page of sales, newest-first by listed_at.
+
+        Args:
+            status: 'pending', 'completed' or None for all
+            limit: Maximum rows to return
+            offset: Rows to skip (ignored when ``after`` is given)
+            after: Keyset cursor ``(listed_at, id)`` of the previous page's
+                last row
+
+        Returns:
+            List of sale dictionaries
+        """
+        where = self._status_clause(status)
+        params: List[Any] = []
+
+        if after is not None:
+            keyset = "(listed_at < ? OR (listed_at = ? AND id < ?))"
+            where = f"{where} AND {keyset}" if where else f" WHERE {keyset}"
+            params.extend([after[0], after[0], after[1]])
+            offset = 0
+
+        query = f"SELECT * FROM sales{where} ORDER BY listed_at DESC, id DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        rows = self._execute_fetchall(query, tuple(params))
+        return [dict(row) for row in rows]
+
+    def count_sales(self, status: Optional[str] = None) -> int:
+        """Count sales matching a status filter."""
+        row = self._execute_fetchone(
+            f"SELECT COUNT(*) FROM sales{self._status_clause(status)}"
+        )
+        return int(row[0]) if row else 0
+
+    def get_sale(self, sale_id: int) -> Optional[Dict[str, Any]]:
+        """Return a single sale by ID, or None."""
+        row = self._execute_fetchone("SELECT * FROM sales WHERE id = ?", (sale_id,))
+        return dict(row) if row else None
+
+    def get_sales_period_stats(self, days: int = 30, top_limit: int = 10) -> Dict[str, Any]:
+        """
+        Aggregate completed sales over the last N days (including today).
+
+        Returns:
+            Dictionary with:
+                - total_sales, total_chaos, avg_price
+                - avg_time_to_sale: over every sale with a recorded time to
+                  sale, not just the period
+                - daily: [{date, total_sales, total_chaos, avg_time_to_sale}], newest first
+                - top_items: [{item_name, price}] by actual price, highest first
+        """
+        window = (f"-{int(days)} days",)
+        totals = self._execute_fetchone(
+            """
+            SELECT
+                COUNT(*) AS total_sales,
+                COALESCE(SUM(COALESCE(actual_price_chaos, 0)), 0) AS total_chaos
+            FROM sales
+            WHERE sold_at IS NOT NULL AND sold_at >= DATE('now', ?)
+            """,
+            window,
+        )
+        all_time = self._execute_fetchone(
+            "SELECT AVG(time_to_sale_hours) AS avg_time_to_sale FROM sales"
+        )
+        daily = self._execute_fetchall(
+            """
+            SELECT
+                DATE(sold_at) AS date,
+                COUNT(*) AS total_sales,
+                COALESCE(SUM(COALESCE(actual_price_chaos, 0)), 0) AS total_chaos,
+                AVG(time_to_sale_hours) AS avg_time_to_sale
+            FROM sales
+            WHERE sold_at IS NOT NULL AND sold_at >= DATE('now', ?)
+            GROUP BY DATE(sold_at)
+            ORDER BY date DESC
+            """,
+            window,
+        )
+        top = self._execute_fetchall(
+            """
+            SELECT item_name, COALESCE(actual_price_chaos, 0) AS price
+            FROM sales
+            WHERE sold_at IS NOT NULL AND sold_at >= DATE('now', ?)
+            ORDER BY price DESC, id DESC
+            LIMIT ?
+            """,
+            (*window, top_limit),
+        )
+
+        total_sales = int(totals["total_sales"]) if totals else 0
+        total_chaos = float(totals["total_chaos"] or 0.0) if totals else 0.0
+        return {
+            "total_sales": total_sales,
+            "total_chaos": total_chaos,
+            "avg_price": total_chaos / total_sales if total_sales else None,
+            "avg_time_to_sale": all_time["avg_time_to_sale"] if all_time else None,
+            "daily": [dict(row) for row in daily],
+            "top_items": [dict(row) for row in top],
+        }
+
+    def get_sales_activity_today(self) -> Dict[str, int]:
+        """Return counts of sales completed today and sales still pending."""
+        row = self._execute_fetchone(
+            """
+            SELECT
+                COALESCE(SUM(CASE WHEN sold_at >= DATE('now') THEN 1 ELSE 0 END), 0) AS sold_today,
+                COALESCE(SUM(CASE WHEN sold_at IS NULL THEN 1 ELSE 0 END), 0) AS pending
+            FROM sales
+            """
+        )
+        if row is None:
+            return {"sold_today": 0, "pending": 0}
+        return {"sold_today": int(row["sold_today"]), "pending": int(row["pending"])}
@@ -6,7 +6,7 @@ Separated from the main Database class for better maintainability.
 """
 
 # Current schema version. Increment if schema structure changes.
-SCHEMA_VERSION = 13
+SCHEMA_VERSION = 16
 
 # Full schema creation SQL for fresh databases
 CREATE_SCHEMA_SQL = """
@@ -386,6 +386,27 @@ CREATE TABLE IF NOT EXISTS ml_collection_runs (
     errors INTEGER DEFAULT 0,
     error_details TEXT  -- JSON array of error messages
 );
+
+CREATE INDEX IF NOT EXISTS idx_checked_items_recent
+ON checked_items (checked_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_checked_items_league_recent
+ON checked_items (league, checked_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_sales_listed
+ON sales (listed_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_sales_sold
+ON sales (sold_at);
+
+CREATE INDEX IF NOT EXISTS idx_price_history_item_time
+ON price_history (item_name, league, recorded_at, chaos_value, divine_value);
+
+CREATE INDEX IF NOT EXISTS idx_price_checks_recent
+ON price_checks (checked_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_price_quotes_check
+ON price_quotes (price_check_id);
 """
 
 # Migration SQL for each version upgrade
@@ -727,6 +748,33 @@ CREATE TABLE IF NOT EXISTS ml_collection_runs (
 );
 """
 
+MIGRATION_V14_SQL = """
+CREATE INDEX IF NOT EXISTS idx_checked_items_recent
+ON checked_items (checked_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_checked_items_league_recent
+ON checked_items (league, checked_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_sales_listed
+ON sales (listed_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_sales_sold
+ON sales (sold_at);
+"""
+
+MIGRATION_V15_SQL = """
+CREATE INDEX IF NOT EXISTS idx_price_history_item_time
+ON price_history (item_name, league, recorded_at, chaos_value, divine_value);
+"""
+
+MIGRATION_V16_SQL = """
+CREATE INDEX IF NOT EXISTS idx_price_checks_recent
+ON price_checks (checked_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_price_quotes_check
+ON price_quotes (price_check_id);
+"""
+
 # Whitelist of allowed column names and types for v4 migration security
 ALLOWED_MIGRATION_COLUMNS = {
     "league": "TEXT",
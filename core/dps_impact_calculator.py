@@ -6,11 +6,14 @@ Uses build-specific multipliers to show how much an item affects damage output.
 """
 from __future__ import annotations
 
-import re
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.upgrade_calculator import ModPatternMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -237,6 +240,20 @@ class DPSImpactCalculator:
         "projectile_dmg": (r"(\d+)%? increased Projectile Damage", "projectile_damage"),
     }
 
+    # Distinct categories in DAMAGE_PATTERNS order (columns of batch matrices)
+    CATEGORIES: Tuple[str, ...] = tuple(dict.fromkeys(c for _, c in DAMAGE_PATTERNS.values()))
+
+    _matcher: Optional[ModPatternMatcher] = None
+
+    @classmethod
+    def _get_matcher(cls) -> ModPatternMatcher:
+        """Shared compiled matcher for DAMAGE_PATTERNS."""
+        if cls._matcher is None:
+            cls._matcher = ModPatternMatcher(
+                {name: pattern for name, (pattern, _) in cls.DAMAGE_PATTERNS.items()}
+            )
+        return cls._matcher
+
     def __init__(self, dps_stats: Optional[DPSStats] = None):
         """
         Initialize calculator with DPS stats.
@@ -282,29 +299,69 @@ class DPSImpactCalculator:
 
         return result
 
+    def calculate_dps_percent_batch(self, mod_lists: Sequence[Sequence[str]]) -> np.ndarray:
+        """
+        Estimate total DPS % change for many items at once.
+
+        Each item's damage mods are summed per category into a
+        (items x CATEGORIES) matrix, which is multiplied by the build's
+        per-point DPS coefficient for each category. Equivalent to
+        calculate_impact(mods).total_dps_percent for every item.
+
+        Args:
+            mod_lists: One list of mods per item
+
+        Returns:
+            Array of shape (len(mod_lists),) with estimated DPS % changes
+        """
+        if self.dps_stats.combined_dps <= 0:
+            return np.zeros(len(mod_lists), dtype=float)
+
+        columns = {category: i for i, category in enumerate(self.CATEGORIES)}
+        pattern_columns = {
+            name: columns[category] for name, (_, category) in self.DAMAGE_PATTERNS.items()
+        }
+        matcher = self._get_matcher()
+
+        raw = np.zeros((len(mod_lists), len(self.CATEGORIES)), dtype=float)
+        for row, mods in enumerate(mod_lists):
+            for mod in mods:
+                found = matcher.match(mod)
+                if found:
+                    pattern_name, value = found
+                    raw[row, pattern_columns[pattern_name]] += value
+
+        # Every estimate is linear in the mod value, so one unit per category
+        # gives the coefficient vector for the current build.
+        coefficients = np.array(
+            [self._estimate_dps_percent(category, 1.0)[0] for category in self.CATEGORIES],
+            dtype=float,
+        )
+        return raw @ coefficients
+
     def _calculate_mod_impact(self, mod: str) -> Optional[DPSModImpact]:
         """Calculate DPS impact for a single mod."""
-        for pattern_name, (pattern, category) in self.DAMAGE_PATTERNS.items():
-            match = re.search(pattern, mod, re.IGNORECASE)
-            if match:
-                raw_value = float(match.group(1))
-                dps_percent, relevance, explanation = self._estimate_dps_percent(
-                    category, raw_value
-                )
-
-                dps_change = self.dps_stats.combined_dps * (dps_percent / 100)
-
-                return DPSModImpact(
-                    mod_text=mod,
-                    mod_category=category,
-                    raw_value=raw_value,
-                    estimated_dps_change=dps_change,
-                    estimated_dps_percent=dps_percent,
-                    relevance=relevance,
-                    explanation=explanation,
-                )
-
-        return None
+        found = self._get_matcher().match(mod)
+        if not found:
+            return None
+
+        pattern_name, raw_value = found
+        category = self.DAMAGE_PATTERNS[pattern_name][1]
+        dps_percent, relevance, explanation = self._estimate_dps_percent(
+            category, raw_value
+        )
+
+        dps_change = self.dps_stats.combined_dps * (dps_percent / 100)
+
+        return DPSModImpact(
+            mod_text=mod,
+            mod_category=category,
+            raw_value=raw_value,
+            estimated_dps_change=dps_change,
+            estimated_dps_percent=dps_percent,
+            relevance=relevance,
+            explanation=explanation,
+        )
 
     def _estimate_dps_percent(
         self,
@@ -11,6 +11,7 @@ from core.economy.models import (
     CurrencySnapshot,
     UniqueSnapshot,
     LeagueEconomySnapshot,
+    LeagueEconomyOverview,
 )
 from core.economy.service import (
     LeagueEconomyService,
@@ -24,6 +25,7 @@ __all__ = [
     "CurrencySnapshot",
     "UniqueSnapshot",
     "LeagueEconomySnapshot",
+    "LeagueEconomyOverview",
     # Service
     "LeagueEconomyService",
     "get_league_economy_service",
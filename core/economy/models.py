@@ -8,7 +8,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
 class LeagueMilestone(Enum):
@@ -66,3 +66,13 @@ class LeagueEconomySnapshot:
             LeagueMilestone.LEAGUE_END: "End of League",
         }
         return names.get(self.milestone, self.milestone.value)
+
+
+@dataclass
+class LeagueEconomyOverview:
+    """Aggregated league statistics as shown in the price history window."""
+
+    league: str
+    currencies: List[Dict[str, Any]] = field(default_factory=list)
+    top_items: List[Dict[str, Any]] = field(default_factory=list)
+    summary: Optional[Dict[str, Any]] = None  # league_economy_summary row
@@ -21,6 +21,7 @@ from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 
 from core.economy.models import (
     LeagueMilestone,
+    LeagueEconomyOverview,
     LeagueEconomySnapshot,
     UniqueSnapshot,
 )
@@ -839,8 +840,8 @@ class LeagueEconomyService:
         Pre-aggregate all economy data for a league into summary tables.
 
         This computes currency stats, top items, and overall league summary
-        and stores them for fast retrieval. Call this once per league after
-        importing historical data.
+        and stores them for fast retrieval. get_league_overview() does this
+        automatically on first access and after new data is imported.
 
         Args:
             league: League name to aggregate
@@ -870,96 +871,56 @@ class LeagueEconomyService:
             return False
 
     def _aggregate_currency_summary(self, league: str) -> int:
-        """Aggregate currency statistics for a league."""
+        """Aggregate currency statistics for a league (all currencies in one query)."""
         # Delete existing summary for this league
         self._db._execute(
             "DELETE FROM league_currency_summary WHERE league = ?",
             (league,),
         )
 
-        # Get distinct currencies for this league
-        currencies = self._db._execute_fetchall(
+        # Window functions give every row its currency's first/last value by
+        # date and the date of its highest value; GROUP BY then folds each
+        # currency into one summary row.
+        cursor = self._db._execute(
             """
-            SELECT DISTINCT currency_name FROM league_economy_rates
-            WHERE league = ?
-            """,
-            (league,),
-        )
-
-        count = 0
-        for row in currencies:
-            currency = row["currency_name"]
-
-            # Get aggregated stats
-            stats = self._db._execute_fetchone(
-                """
+            INSERT INTO league_currency_summary
+                (league, currency_name, min_value, max_value, avg_value,
+                 start_value, end_value, peak_date, data_points)
+            SELECT
+                league,
+                currency_name,
+                MIN(chaos_value),
+                MAX(chaos_value),
+                AVG(chaos_value),
+                MAX(start_value),
+                MAX(end_value),
+                MAX(peak_date),
+                COUNT(*)
+            FROM (
                 SELECT
-                    MIN(chaos_value) as min_val,
-                    MAX(chaos_value) as max_val,
-                    AVG(chaos_value) as avg_val,
-                    COUNT(*) as data_points
-                FROM league_economy_rates
-                WHERE league = ? AND currency_name = ?
-                """,
-                (league, currency),
-            )
-
-            # Get start value (first date)
-            start = self._db._execute_fetchone(
-                """
-                SELECT chaos_value FROM league_economy_rates
-                WHERE league = ? AND currency_name = ?
-                ORDER BY rate_date ASC LIMIT 1
-                """,
-                (league, currency),
-            )
-
-            # Get end value (last date)
-            end = self._db._execute_fetchone(
-                """
-                SELECT chaos_value FROM league_economy_rates
-                WHERE league = ? AND currency_name = ?
-                ORDER BY rate_date DESC LIMIT 1
-                """,
-                (league, currency),
-            )
-
-            # Get peak date (date of max value)
-            peak = self._db._execute_fetchone(
-                """
-                SELECT rate_date FROM league_economy_rates
-                WHERE league = ? AND currency_name = ?
-                ORDER BY chaos_value DESC LIMIT 1
-                """,
-                (league, currency),
-            )
-
-            # Skip if no stats available
-            if stats is None:
-                continue
-
-            # Insert summary
-            self._db._execute(
-                """
-                INSERT INTO league_currency_summary
-                    (league, currency_name, min_value, max_value, avg_value,
-                     start_value, end_value, peak_date, data_points)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
                     league,
-                    currency,
-                    stats["min_val"],
-                    stats["max_val"],
-                    stats["avg_val"],
-                    start["chaos_value"] if start else None,
-                    end["chaos_value"] if end else None,
-                    peak["rate_date"] if peak else None,
-                    stats["data_points"],
-                ),
+                    currency_name,
+                    chaos_value,
+                    FIRST_VALUE(chaos_value) OVER by_date AS start_value,
+                    LAST_VALUE(chaos_value) OVER by_date AS end_value,
+                    FIRST_VALUE(rate_date) OVER by_value AS peak_date
+                FROM league_economy_rates
+                WHERE league = ?
+                WINDOW
+                    by_date AS (
+                        PARTITION BY currency_name ORDER BY rate_date, id
+                        ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+                    ),
+                    by_value AS (
+                        PARTITION BY currency_name ORDER BY chaos_value DESC, rate_date
+                    )
             )
-            count += 1
+            GROUP BY currency_name
+            """,
+            (league,),
+        )
 
+        count = max(cursor.rowcount, 0)
         logger.info(f"Aggregated {count} currency summaries for {league}")
         return count
 
@@ -971,48 +932,41 @@ class LeagueEconomyService:
             (league,),
         )
 
-        # Get top items by average value (with minimum 10 data points)
-        items = self._db._execute_fetchall(
+        # Top items by average value (with minimum 10 data points), ranked in SQL
+        cursor = self._db._execute(
             """
+            INSERT INTO league_top_items_summary
+                (league, item_name, base_type, avg_value, min_value,
+                 max_value, data_points, rank)
             SELECT
+                ?,
                 item_name,
                 base_type,
-                AVG(chaos_value) as avg_val,
-                MIN(chaos_value) as min_val,
-                MAX(chaos_value) as max_val,
-                COUNT(*) as data_points
-            FROM league_economy_items
-            WHERE league = ?
-            GROUP BY item_name
-            HAVING COUNT(*) >= 10
-            ORDER BY avg_val DESC
-            LIMIT ?
+                avg_val,
+                min_val,
+                max_val,
+                data_points,
+                ROW_NUMBER() OVER (ORDER BY avg_val DESC)
+            FROM (
+                SELECT
+                    item_name,
+                    base_type,
+                    AVG(chaos_value) as avg_val,
+                    MIN(chaos_value) as min_val,
+                    MAX(chaos_value) as max_val,
+                    COUNT(*) as data_points
+                FROM league_economy_items
+                WHERE league = ?
+                GROUP BY item_name
+                HAVING COUNT(*) >= 10
+                ORDER BY avg_val DESC
+                LIMIT ?
+            )
             """,
-            (league, limit),
+            (league, league, limit),
         )
 
-        count = 0
-        for idx, row in enumerate(items):
-            self._db._execute(
-                """
-                INSERT INTO league_top_items_summary
-                    (league, item_name, base_type, avg_value, min_value,
-                     max_value, data_points, rank)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    league,
-                    row["item_name"],
-                    row["base_type"],
-                    row["avg_val"],
-                    row["min_val"],
-                    row["max_val"],
-                    row["data_points"],
-                    idx + 1,
-                ),
-            )
-            count += 1
-
+        count = max(cursor.rowcount, 0)
         logger.info(f"Aggregated {count} top items for {league}")
         return count
 
@@ -1088,10 +1042,10 @@ class LeagueEconomyService:
             List of currency summary dictionaries
         """
         if currencies:
-            # placeholders are constructed from list length, all values parameterized
+            # nosec B608 - placeholders are constructed from list length, all values parameterized
             placeholders = ",".join("?" * len(currencies))
             rows = self._db._execute_fetchall(
-                f"""  # nosec
+                f"""
                 SELECT * FROM league_currency_summary
                 WHERE league = ? AND currency_name IN ({placeholders})
                 ORDER BY avg_value DESC
@@ -1165,6 +1119,69 @@ class LeagueEconomyService:
         )
         return row is not None
 
+    def ensure_league_aggregated(self, league: str) -> bool:
+        """
+        Materialise the summary tables for a league if missing or stale.
+
+        The summary is recomputed when the league's raw row counts no
+        longer match the ones recorded at aggregation time (e.g. after an
+        import). Both counts are index-only lookups.
+
+        Returns:
+            True if summaries are available for the league
+        """
+        summary = self.get_league_summary(league)
+        counts = self._db._execute_fetchone(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM league_economy_rates WHERE league = ?) AS currency_rows,
+                (SELECT COUNT(*) FROM league_economy_items WHERE league = ?) AS item_rows
+            """,
+            (league, league),
+        )
+        if not counts or not counts["currency_rows"]:
+            return False
+
+        if (
+            summary is not None
+            and summary["total_currency_snapshots"] == counts["currency_rows"]
+            and summary["total_item_snapshots"] == counts["item_rows"]
+        ):
+            return True
+
+        is_finalized = bool(summary["is_finalized"]) if summary else False
+        return self.aggregate_league(league, is_finalized=is_finalized)
+
+    def get_league_overview(
+        self,
+        league: str,
+        currencies: Optional[List[str]] = None,
+        top_items_limit: int = 10,
+    ) -> LeagueEconomyOverview:
+        """
+        Currency statistics, top items and date range for a league.
+
+        Aggregates the league first if needed (see ensure_league_aggregated),
+        so callers never read raw rows. Safe to call off the UI thread.
+
+        Args:
+            league: League name
+            currencies: Optional list of currencies to include
+            top_items_limit: Number of top items to return
+
+        Returns:
+            LeagueEconomyOverview (empty lists if the league has no data)
+        """
+        if not self.ensure_league_aggregated(league):
+            return LeagueEconomyOverview(league=league)
+
+        return LeagueEconomyOverview(
+            league=league,
+            currencies=self.get_currency_summary(league, currencies),
+            top_items=self.get_top_items_summary(league, limit=top_items_limit),
+            summary=self.get_league_summary(league),
+        )
+
     def get_aggregated_leagues(self) -> List[str]:
         """Get list of leagues with pre-aggregated data."""
         rows = self._db._execute_fetchall(
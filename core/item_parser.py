@@ -14,12 +14,15 @@ Supports:
 - Influences (Shaper, Elder, Exarch, Eater, etc.)
 - Corrupted, Fractured, Synthesised, Mirrored
 - Stack size (currency)
+
+ParsedItem.from_stash_item() fills the same structure from stash API JSON.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Optional, List
 
@@ -33,11 +36,23 @@ RARITY_RE = re.compile(r"^Rarity:\s*(\w+)")
 STACK_RE = re.compile(r"Stack Size:\s*(\d+)/(\d+)")
 ITEM_LEVEL_RE = re.compile(r"Item Level:\s*(\d+)")
 QUALITY_SEARCH_RE = re.compile(r"Quality:\s*\+?(\d+)%")
+# Leading number of a stash API property value ("+20%", "20 (Max)", "7/20")
+API_NUMBER_RE = re.compile(r"(\d+)")
+
+# Body lines starting with one of these need the full per-line checks;
+# anything else is a mod line unless it contains a special keyword.
+PROPERTY_PREFIXES = ("--", "Item Level:", "Spirit:", "Sockets:", "Level:", "Quality:", "Requirements:")
+MOD_SKIP_RE = re.compile(r"Requirements:|Level:|Str:|Dex:|Int:")
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedItem:
-    """Data structure representing a parsed PoE item."""
+    """
+    Data structure representing a parsed PoE item.
+
+    Slotted, so instances carry no per-item ``__dict__``; call ``compact()``
+    on items that are kept around in bulk.
+    """
 
     raw_text: str
 
@@ -96,6 +111,24 @@ class ParsedItem:
     _rare_evaluation: Optional[Any] = None
     _unique_evaluation: Optional[Any] = None  # UniqueItemEvaluation for uniques
 
+    # Mod/keyword lists frozen to tuples by compact()
+    COMPACT_FIELDS = (
+        "explicits", "implicits", "enchants", "influences", "rune_mods", "cluster_jewel_notables",
+    )
+
+    def compact(self) -> "ParsedItem":
+        """
+        Freeze mod lists into tuples of interned strings, in place.
+
+        Identical mod lines across thousands of items then share one string,
+        and tuples drop the list over-allocation. Use for items held in bulk
+        (stash scans, pasted dumps); a compacted item's mod fields can no
+        longer be appended to. Returns self.
+        """
+        for name in self.COMPACT_FIELDS:
+            setattr(self, name, tuple(map(sys.intern, getattr(self, name))))
+        return self
+
     def get_display_name(self) -> str:
         """
         Human-friendly name for UI/DB rows.
@@ -154,8 +187,12 @@ class ParsedItem:
         """
         Create a ParsedItem from a stash API item dictionary.
 
-        This allows RareItemEvaluator to work with items fetched from the stash API
-        without needing clipboard text.
+        Fills the same fields ItemParser.parse() would from the item's
+        clipboard text, so stash items can be priced and evaluated without
+        building and re-parsing text. Crafted and fractured mods are kept
+        with their clipboard "(crafted)"/"(fractured)" suffix, and items
+        without a name of their own (currency, gems, cards, magic and
+        normal items) are named by their typeLine, like the clipboard.
 
         Args:
             item: Dictionary from PoE stash API (with keys like typeLine, explicitMods, etc.)
@@ -182,19 +219,22 @@ class ParsedItem:
         type_line = item.get("typeLine", "")
         base_type = item.get("baseType", type_line)
 
-        # Build socket string and count links
+        # Build the clipboard socket string ("R-G-B R-R": linked sockets
+        # joined by "-", groups by spaces); PoE2 rune sockets show as "S S"
         sockets = item.get("sockets", [])
         socket_str = ""
         max_links = 0
+        rune_sockets = 0
         if sockets:
-            groups: dict = {}
-            for s in sockets:
-                g = s.get("group", 0)
-                if g not in groups:
-                    groups[g] = []
-                groups[g].append(s.get("sColour", "?")[0])
-            socket_str = "-".join("".join(g) for g in groups.values())
-            max_links = max(len(g) for g in groups.values()) if groups else 0
+            if all("sColour" not in s for s in sockets):
+                rune_sockets = len(sockets)
+                socket_str = " ".join("S" * rune_sockets)
+            else:
+                groups: dict = {}
+                for s in sockets:
+                    groups.setdefault(s.get("group", 0), []).append(s.get("sColour", "?")[0])
+                socket_str = " ".join("-".join(g) for g in groups.values())
+                max_links = max(len(g) for g in groups.values())
 
         # Extract influences from the influences object
         influences = []
@@ -212,26 +252,85 @@ class ParsedItem:
             for key, display_name in influence_names.items():
                 if inf_obj.get(key):
                     influences.append(display_name)
-
-        return cls(
+        # Eldritch influences are top-level flags, not in the influences object
+        if item.get("searing"):
+            influences.append("Exarch")
+        if item.get("tangled"):
+            influences.append("Eater")
+
+        # Properties ("Level" and "Quality" of gems, "Quality" and "Spirit" of gear)
+        properties = _api_property_numbers(item.get("properties", []))
+        quality = properties.get("quality", item.get("quality"))
+        is_gem = rarity == "Gem"
+
+        requirements = {}
+        for key, value in _api_property_numbers(item.get("requirements", [])).items():
+            # "Strength"/"Str" etc. map to the clipboard's str/dex/int keys
+            key = key[:3] if key[:3] in ("str", "dex", "int") else key
+            if key in ("level", "str", "dex", "int"):
+                requirements[key] = value
+
+        explicits = [f"{mod} (fractured)" for mod in item.get("fracturedMods", [])]
+        explicits.extend(item.get("explicitMods", []))
+        explicits.extend(f"{mod} (crafted)" for mod in item.get("craftedMods", []))
+
+        parsed = cls(
             raw_text=raw_text or f"{name} {type_line}".strip(),
             rarity=rarity,
-            name=name if name else None,
+            name=name or type_line or None,
             base_type=base_type if base_type else None,
-            item_level=item.get("ilvl"),
-            quality=item.get("quality"),
+            # ilvl 0 (gems, currency) has no Item Level line on the clipboard
+            item_level=item.get("ilvl") or None,
+            gem_level=properties.get("level") if is_gem else None,
+            gem_quality=quality if is_gem else None,
+            quality=quality,
             sockets=socket_str if socket_str else None,
             links=max_links,
-            explicits=item.get("explicitMods", []),
-            implicits=item.get("implicitMods", []),
-            enchants=item.get("enchantMods", []),
+            stack_size=item.get("stackSize", 1),
+            max_stack_size=item.get("maxStackSize", item.get("stackSize", 1)),
+            rune_sockets=rune_sockets,
+            spirit=properties.get("spirit"),
+            requirements=requirements,
+            explicits=explicits,
+            implicits=list(item.get("implicitMods", [])),
+            enchants=list(item.get("enchantMods", [])),
             influences=influences,
             is_corrupted=item.get("corrupted", False),
             is_fractured=item.get("fractured", False),
             is_synthesised=item.get("synthesised", False),
-            is_mirrored=item.get("mirrored", False),
+            # The API calls mirrored items "duplicated"
+            is_mirrored=item.get("mirrored", False) or item.get("duplicated", False),
+            is_unmodifiable=item.get("unmodifiable", False),
+            is_sanctified=item.get("sanctified", False),
+            rune_mods=list(item.get("runeMods", [])),
         )
 
+        if base_type and "Cluster Jewel" in base_type:
+            ItemParser()._parse_cluster_jewel(parsed)
+
+        return parsed
+
+
+def _api_property_numbers(entries: list) -> dict:
+    """
+    Leading numbers of stash API property/requirement entries, by name.
+
+    Entries look like {"name": "Quality", "values": [["+20%", 1]]}; names
+    are lower-cased with PoE2 markup removed ("[Quality]" -> "quality",
+    "[Strength|Str]" -> "str"). Entries without a number are skipped.
+    """
+    numbers = {}
+    for entry in entries:
+        values = entry.get("values") or []
+        if not values or not values[0]:
+            continue
+        m = API_NUMBER_RE.search(str(values[0][0]))
+        if not m:
+            continue
+        name = entry.get("name", "").strip("[]").split("|")[-1].strip().lower()
+        numbers[name] = int(m.group(1))
+    return numbers
+
 
 # ----------------------------------------------------------------------
 # Parser Implementation
@@ -271,40 +370,63 @@ class ItemParser:
         "Eater of Worlds": "Eater",
     }
 
+    # Substrings that make a line a property, flag or influence rather than
+    # a mod; one search replaces a dozen ``in`` checks on every mod line.
+    SPECIAL_KEYWORDS_RE = re.compile("|".join(map(re.escape, (
+        "Quality:", "Stack Size:", "Corrupted", "Fractured Item", "Synthesised Item",
+        "Mirrored", "Unmodifiable", "Sanctified", *INFLUENCE_KEYWORDS,
+    ))))
+
     def parse(self, text: str) -> Optional[ParsedItem]:
         """
         Parse a single item from raw clipboard text.
 
         Returns ParsedItem or None if parsing fails or text is malformed.
         """
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        if not lines:
-            return None
+        lines = [line for line in map(str.strip, text.splitlines()) if line]
 
         # Skip "Item Class:" line(s) if present (PoE includes this in clipboard)
-        # Also skip any blank lines between Item Class and Rarity
-        while lines and (lines[0].startswith("Item Class:") or not lines[0]):
-            lines = lines[1:]
+        start = 0
+        while start < len(lines) and lines[start].startswith("Item Class:"):
+            start += 1
 
         # Must begin with Rarity (after skipping Item Class and blanks)
-        if not lines or not RARITY_RE.match(lines[0]):
+        if start >= len(lines) or not RARITY_RE.match(lines[start]):
             return None
 
-        item = ParsedItem(raw_text=text)
+        return self._parse_lines(lines, start, len(lines), ParsedItem(raw_text=text))
 
-        try:
-            lines = self._parse_header(lines, item)
-            self._parse_body(lines, item)
-        except Exception as e:
-            # Fail closed - better to return None than misparse
-            logger.debug(f"Item parse failed: {e}")
-            return None
+    def parse_batch(self, bulk_text: str, compact: bool = False) -> List[ParsedItem]:
+        """
+        Parse every item in a large buffer (pasted dumps, stash exports).
 
-        # Final validation check: ensure useful minimum structure
-        if not item.rarity or not (item.name or item.base_type):
-            return None
+        The buffer is split into stripped lines once and each item is parsed
+        in place by index range, so no per-item text or line lists are
+        rebuilt. An item starts at its "Rarity:" line; "Item Class:" lines
+        directly before it belong to it. Blocks that don't parse are skipped.
 
-        return item
+        ``raw_text`` of each item is its stripped, non-blank lines. With
+        ``compact`` each item is returned via ``ParsedItem.compact()``.
+        """
+        lines = [line for line in map(str.strip, bulk_text.splitlines()) if line]
+        starts = [i for i, line in enumerate(lines) if line.startswith("Rarity:")]
+
+        items: List[ParsedItem] = []
+        for n, start in enumerate(starts):
+            end = starts[n + 1] if n + 1 < len(starts) else len(lines)
+            while end > start + 1 and lines[end - 1].startswith("Item Class:"):
+                end -= 1
+            first = start
+            while first > 0 and lines[first - 1].startswith("Item Class:"):
+                first -= 1
+
+            parsed = self._parse_lines(
+                lines, start, end, ParsedItem(raw_text="\n".join(lines[first:end]))
+            )
+            if parsed is not None:
+                items.append(parsed.compact() if compact else parsed)
+
+        return items
 
     def parse_multiple(self, bulk_text: str) -> List[ParsedItem]:
         """
@@ -314,53 +436,52 @@ class ItemParser:
         - blank lines, or
         - repeated "Rarity:" markers
         """
-        blocks: List[str] = []
-        current: List[str] = []
-
-        for line in bulk_text.splitlines():
-            if line.strip().startswith("Rarity:"):
-                if current:
-                    blocks.append("\n".join(current))
-                current = [line]
-            else:
-                current.append(line)
+        return self.parse_batch(bulk_text)
 
-        if current:
-            blocks.append("\n".join(current))
+    def _parse_lines(
+        self, lines: List[str], start: int, end: int, item: ParsedItem
+    ) -> Optional[ParsedItem]:
+        """Parse ``lines[start:end]`` (beginning at the Rarity line) into ``item``."""
+        try:
+            body_start = self._parse_header(lines, item, start, end)
+            self._parse_body(lines, item, body_start, end)
+        except Exception as e:
+            # Fail closed - better to return None than misparse
+            logger.debug(f"Item parse failed: {e}")
+            return None
 
-        items = []
-        for blk in blocks:
-            parsed = self.parse(blk)
-            if parsed:
-                items.append(parsed)
+        # Final validation check: ensure useful minimum structure
+        if not item.rarity or not (item.name or item.base_type):
+            return None
 
-        return items
+        return item
 
     # ------------------------------------------------------------------
     # Header Parsing
     # ------------------------------------------------------------------
 
-    def _parse_header(self, lines: List[str], item: ParsedItem) -> List[str]:
+    def _parse_header(
+        self, lines: List[str], item: ParsedItem, start: int = 0, end: Optional[int] = None
+    ) -> int:
         """
         Parse the header section of the item:
         - Rarity
         - Name
         - Base type (for rare/magic/unique, when present)
-        Returns remaining lines after the header.
+        Returns the index of the first line after the header.
         """
+        if end is None:
+            end = len(lines)
+        count = end - start
 
         # Rarity: Rare / Magic / Unique / etc.
-        match = RARITY_RE.match(lines[0])
+        match = RARITY_RE.match(lines[start])
         if match:
             item.rarity = match.group(1).upper()
 
         # Next line is item name (if present)
-        if len(lines) > 1:
-            item.name = lines[1]
-
-        # Helper: is a given line a section separator ("--------")?
-        def is_separator(idx: int) -> bool:
-            return 0 <= idx < len(lines) and SEPARATOR_RE.match(lines[idx]) is not None
+        if count > 1:
+            item.name = lines[start + 1]
 
         # Non-unique items normally have a base type line after the name,
         # e.g.:
@@ -371,32 +492,28 @@ class ItemParser:
         # But in some cases (like belts, jewels, or tests), the next line
         # is already the separator. In that case there is no separate
         # base_type line in the header.
-        if item.rarity not in ("UNIQUE", "NORMAL") and len(lines) > 2:
-            if is_separator(2):
-                # No base_type line; header ends before the separator
-                return lines[2:]
-            item.base_type = lines[2]
-            return lines[3:]
-
+        #
         # Unique items typically have:
         #   Rarity: UNIQUE
         #   Shavronne's Wrappings
         #   Occultist's Vestment
-        if item.rarity == "UNIQUE" and len(lines) > 2:
-            if is_separator(2):
-                # No explicit base_type line before separator
-                return lines[2:]
-            item.base_type = lines[2]
-            return lines[3:]
+        if item.rarity != "NORMAL" and count > 2:
+            if SEPARATOR_RE.match(lines[start + 2]):
+                # No base_type line; header ends before the separator
+                return start + 2
+            item.base_type = lines[start + 2]
+            return start + 3
 
         # Fallback: just name + no base_type
-        return lines[2:]
+        return min(start + 2, end)
 
     # ------------------------------------------------------------------
     # Body Parsing
     # ------------------------------------------------------------------
 
-    def _parse_body(self, lines: List[str], item: ParsedItem) -> None:
+    def _parse_body(
+        self, lines: List[str], item: ParsedItem, start: int = 0, end: Optional[int] = None
+    ) -> None:
         """
         Parse the body sections of the item, which include:
         - Properties
@@ -407,14 +524,27 @@ class ItemParser:
         """
         current_section = 0
         in_requirements = False
+        special = self.SPECIAL_KEYWORDS_RE.search
+
+        for line in lines[start:end]:
+            # Fast path: most body lines are mods, which would otherwise run
+            # every property/flag check below before falling through.
+            if not in_requirements and not line.startswith(PROPERTY_PREFIXES) and not special(line):
+                if current_section >= 1:
+                    self._add_mod_line(line, item)
+                continue
 
-        for line in lines:
             # Section break
             if SEPARATOR_RE.match(line):
                 current_section += 1
                 in_requirements = False
                 continue
 
+            # Requirement lines ("Level: 68") before the gem Level property
+            if in_requirements:
+                self._parse_requirement_line(line, item)
+                continue
+
             # ───────────────────────────────────────────────
             # Item Properties
             # ───────────────────────────────────────────────
@@ -435,6 +565,9 @@ class ItemParser:
             # Quality
             if m := QUALITY_SEARCH_RE.search(line):
                 item.quality = int(m.group(1))
+                # Mirror quality to gem_quality for gems
+                if (item.rarity or "").lower() == "gem":
+                    item.gem_quality = item.quality
                 continue
 
             # Sockets (handles both PoE1 gem sockets and PoE2 rune sockets)
@@ -495,10 +628,6 @@ class ItemParser:
                 in_requirements = True
                 continue
 
-            if in_requirements:
-                self._parse_requirement_line(line, item)
-                continue
-
             # ───────────────────────────────────────────────
             # Influences / Flags
             # ───────────────────────────────────────────────
@@ -546,38 +675,43 @@ class ItemParser:
             # ───────────────────────────────────────────────
 
             if current_section >= 1 and line:
-                # Ignore lines belonging to other sections
-                if any(kw in line for kw in ("Requirements:", "Level:", "Str:", "Dex:", "Int:")):
-                    continue
-
-                lower = line.lower()
-
-                if "(enchant)" in lower:
-                    clean = self._strip_tag(line, "enchant")
-                    if clean:
-                        item.enchants.append(clean)
-                    continue
-
-                if "(implicit)" in lower:
-                    clean = self._strip_tag(line, "implicit")
-                    if clean:
-                        item.implicits.append(clean)
-                    continue
-
-                # PoE2: Rune mods (added rune)
-                if "(rune)" in lower:
-                    clean = self._strip_tag(line, "rune")
-                    if clean:
-                        item.rune_mods.append(clean)
-                    continue
-
-                # Otherwise it's a normal explicit mod
-                item.explicits.append(line)
+                self._add_mod_line(line, item)
 
         # Post-processing: Cluster jewel detection
         if item.base_type and "Cluster Jewel" in item.base_type:
             self._parse_cluster_jewel(item)
 
+    def _add_mod_line(self, line: str, item: ParsedItem) -> None:
+        """File a mod-section line as enchant, implicit, rune or explicit mod."""
+        # Ignore lines belonging to other sections
+        if MOD_SKIP_RE.search(line):
+            return
+
+        if "(" in line:
+            lower = line.lower()
+
+            if "(enchant)" in lower:
+                clean = self._strip_tag(line, "enchant")
+                if clean:
+                    item.enchants.append(clean)
+                return
+
+            if "(implicit)" in lower:
+                clean = self._strip_tag(line, "implicit")
+                if clean:
+                    item.implicits.append(clean)
+                return
+
+            # PoE2: Rune mods (added rune)
+            if "(rune)" in lower:
+                clean = self._strip_tag(line, "rune")
+                if clean:
+                    item.rune_mods.append(clean)
+                return
+
+        # Otherwise it's a normal explicit mod
+        item.explicits.append(line)
+
     # ----------------------------------------------------------------------
     # Helpers
     # ----------------------------------------------------------------------
@@ -1,17 +1,105 @@
 # core/logging_setup.py
+"""
+Application logging configuration.
+
+Two modes:
+
+- Synchronous (default): file and console handlers attached to the root
+  logger, so every record is written on the calling thread.
+- Queued (``use_queue=True``): the root logger gets a single QueueHandler and
+  a QueueListener thread owns the file/console handlers, so file I/O never
+  blocks the price-check path.
+
+Per-subsystem levels can be overridden with ``level_overrides`` or the
+``POE_LOG_LEVELS`` environment variable (``"core.pricing=DEBUG,urllib3=WARNING"``).
+
+Hot paths should use HotPathLogger, which collects a check's detail into one
+structured record and only emits a sample of them at INFO.
+
+Usage:
+    setup_logging(use_queue=True, level_overrides={"data_sources": "WARNING"})
+
+    hot = HotPathLogger("core.pricing.checks", sample_rate=0.1)
+    trace = hot.trace("price_lookup", item="Goldrim")
+    trace.add(ninja_price=12.0)
+    trace.emit()
+"""
 from __future__ import annotations
 
+import atexit
+import itertools
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+
+LevelSpec = Union[int, str]
+
+LEVEL_OVERRIDES_ENV = "POE_LOG_LEVELS"
+
+# Chatty third-party loggers that drown out application output at INFO/DEBUG
+DEFAULT_LEVEL_OVERRIDES: Dict[str, LevelSpec] = {
+    "urllib3": logging.WARNING,
+}
+
+_queue_listener: Optional[QueueListener] = None
+
+
+def parse_level_overrides(spec: str) -> Dict[str, str]:
+    """
+    Parse ``"name=LEVEL,name2=LEVEL"`` into a logger -> level mapping.
+
+    Malformed entries are ignored.
+    """
+    overrides: Dict[str, str] = {}
+    for entry in spec.split(","):
+        name, sep, level = entry.partition("=")
+        name, level = name.strip(), level.strip().upper()
+        if sep and name and level:
+            overrides[name] = level
+    return overrides
+
+
+def apply_level_overrides(overrides: Mapping[str, LevelSpec]) -> None:
+    """Set levels on named loggers, skipping unknown level names."""
+    for name, level in overrides.items():
+        if isinstance(level, str):
+            resolved = logging.getLevelName(level.upper())
+            if not isinstance(resolved, int):
+                continue
+            level = resolved
+        logging.getLogger(name).setLevel(level)
 
 
-def setup_logging(debug: bool = False) -> None:
+def shutdown_logging() -> None:
+    """Stop the queue listener (flushing pending records), if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+def setup_logging(
+    debug: bool = False,
+    use_queue: bool = False,
+    level_overrides: Optional[Mapping[str, LevelSpec]] = None,
+) -> None:
     """
     Configure application-wide logging.
 
     - Logs to ~/.poe_price_checker/app.log (rotating, max ~1 MB, 3 backups)
     - Also logs to console (stderr) for interactive runs
+
+    Args:
+        debug: Log at DEBUG instead of INFO.
+        use_queue: Write records on a background QueueListener thread.
+        level_overrides: Per-logger levels, applied after the defaults and
+            before ``POE_LOG_LEVELS``.
     """
     log_dir = Path.home() / ".poe_price_checker"
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -24,6 +112,7 @@ def setup_logging(debug: bool = False) -> None:
     root_logger.setLevel(level)
 
     # Clear existing handlers (useful if re-running in dev/REPL)
+    shutdown_logging()
     for handler in list(root_logger.handlers):
         root_logger.removeHandler(handler)
 
@@ -39,14 +128,125 @@ def setup_logging(debug: bool = False) -> None:
     )
     file_handler.setFormatter(file_fmt)
     file_handler.setLevel(level)
-    root_logger.addHandler(file_handler)
 
     # Console handler (simple readable format)
     console_handler = logging.StreamHandler()
     console_fmt = logging.Formatter("[%(levelname)s] %(name)s - %(message)s")
     console_handler.setFormatter(console_fmt)
     console_handler.setLevel(level)
-    root_logger.addHandler(console_handler)
+
+    if use_queue:
+        global _queue_listener
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        _queue_listener = QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+    else:
+        root_logger.addHandler(file_handler)
+        root_logger.addHandler(console_handler)
+
+    apply_level_overrides(DEFAULT_LEVEL_OVERRIDES)
+    if level_overrides:
+        apply_level_overrides(level_overrides)
+    env_spec = os.environ.get(LEVEL_OVERRIDES_ENV)
+    if env_spec:
+        apply_level_overrides(parse_level_overrides(env_spec))
 
     root_logger.info("Logging initialized")
-    root_logger.info(f"Log file: {log_file}")
+    root_logger.info("Log file: %s", log_file)
+
+
+atexit.register(shutdown_logging)
+
+
+# ---------------------------------------------------------------------------
+# Hot-path logging
+# ---------------------------------------------------------------------------
+
+
+class _FieldsMessage:
+    """Formats trace fields as ``k=v`` only when a handler renders the record."""
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return " ".join(f"{key}={value!r}" for key, value in self.fields.items())
+
+
+class HotPathTrace:
+    """Collects one check's detail and emits it as a single record."""
+
+    __slots__ = ("_logger", "_level", "event", "fields", "_started")
+
+    def __init__(self, logger: logging.Logger, level: int, event: str, fields: Dict[str, Any]):
+        self._logger = logger
+        self._level = level
+        self.event = event
+        self.fields = fields
+        self._started = time.perf_counter()
+
+    def add(self, **fields: Any) -> None:
+        """Record detail fields for this check."""
+        self.fields.update(fields)
+
+    def emit(self, **fields: Any) -> None:
+        """Emit the collected detail as one structured record."""
+        self.fields.update(fields)
+        self.fields["elapsed_ms"] = round((time.perf_counter() - self._started) * 1000, 3)
+        self._logger.log(
+            self._level,
+            "%s %s",
+            self.event,
+            _FieldsMessage(self.fields),
+            extra={"event": self.event, "fields": self.fields},
+        )
+
+
+class _NullTrace:
+    """Trace returned when a check is not sampled; every call is a no-op."""
+
+    __slots__ = ()
+    event = ""
+    fields: Dict[str, Any] = {}
+
+    def add(self, **fields: Any) -> None:
+        pass
+
+    def emit(self, **fields: Any) -> None:
+        pass
+
+
+_NULL_TRACE = _NullTrace()
+
+
+class HotPathLogger:
+    """
+    Sampled logger for per-check detail on hot paths.
+
+    Every ``1 / sample_rate``-th trace is emitted at INFO. Unsampled traces
+    are emitted at DEBUG when that is enabled and otherwise cost nothing
+    beyond the call itself.
+    """
+
+    def __init__(self, name: str, sample_rate: float = 0.1):
+        """
+        Args:
+            name: Logger name (subject to per-subsystem level overrides).
+            sample_rate: Fraction of traces emitted at INFO (0 disables).
+        """
+        self.logger = logging.getLogger(name)
+        self.sample_every = max(1, round(1 / sample_rate)) if sample_rate > 0 else 0
+        self._counter = itertools.count()
+
+    def trace(self, event: str, **fields: Any) -> Union[HotPathTrace, _NullTrace]:
+        """Start a trace for one check."""
+        sampled = bool(self.sample_every) and next(self._counter) % self.sample_every == 0
+        level = logging.INFO if sampled else logging.DEBUG
+        if not self.logger.isEnabledFor(level):
+            return _NULL_TRACE
+        return HotPathTrace(self.logger, level, event, fields)
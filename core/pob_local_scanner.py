@@ -3,20 +3,226 @@ Local Path of Building build scanner.
 
 Scans the local PoB installation for saved builds and provides
 access to build data for AI context integration.
+
+Build headers (class, ascendancy, level, main skill) are kept in a SQLite
+index keyed by path and (mtime, size), so a rescan only reads files that
+changed, and the GUI can filter builds with query_builds() without touching
+the filesystem.
 """
 from __future__ import annotations
 
 import logging
 import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any, Tuple, Union
 from datetime import datetime
 
 import defusedxml.ElementTree as ET
 
 logger = logging.getLogger(__name__)
 
+# Persistent index used by the app-wide scanner (see get_pob_scanner)
+DEFAULT_INDEX_PATH = Path.home() / ".poe_price_checker" / "pob_build_index.db"
+
+# Header reads are mostly file I/O; a small pool keeps large folders fast
+MAX_SCAN_WORKERS = min(8, (os.cpu_count() or 2) * 2)
+
+
+def read_build_header(file_path: Path) -> Dict[str, Any]:
+    """
+    Read the build header of a PoB XML file without parsing the whole file.
+
+    Stops at the ``<Build>`` element, which PoB writes first, so large
+    builds (items, tree, calcs) are never fully read.
+
+    Returns:
+        Dict with build_name, class_name, ascendancy, level, main_skill.
+
+    Raises:
+        OSError, ET.ParseError, ValueError: If the file can't be read or the
+        header is malformed.
+    """
+    header: Dict[str, Any] = {
+        "build_name": "",
+        "class_name": None,
+        "ascendancy": None,
+        "level": None,
+        "main_skill": None,
+    }
+    with open(file_path, "rb") as fh:
+        for depth, (_event, elem) in enumerate(ET.iterparse(fh, events=("start",))):
+            if depth == 0:
+                # Some builds have a buildName attribute on the root
+                header["build_name"] = elem.get("buildName", "")
+            elif elem.tag == "Build":
+                header["class_name"] = elem.get("className", "")
+                header["ascendancy"] = elem.get("ascendClassName", "")
+                header["level"] = int(elem.get("level", 1))
+                header["main_skill"] = elem.get("mainSocketGroup", "")
+                break
+    return header
+
+
+def _read_header_or_none(file_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return read_build_header(file_path)
+    except Exception as e:
+        logger.debug(f"Could not load build metadata from {file_path}: {e}")
+        return None
+
+
+class LocalBuildIndex:
+    """
+    SQLite index of PoB build headers.
+
+    One row per build file, scoped by the builds folder it was found in.
+    Thread-safe; the scanner updates it from a worker thread while the GUI
+    queries it.
+    """
+
+    def __init__(self, db_path: Union[Path, str, None] = None):
+        """
+        Args:
+            db_path: SQLite file, or ":memory:". Defaults to DEFAULT_INDEX_PATH.
+        """
+        if db_path is None:
+            db_path = DEFAULT_INDEX_PATH
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._initialize_schema()
+
+    def _initialize_schema(self) -> None:
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS builds (
+                path TEXT PRIMARY KEY,
+                root TEXT NOT NULL,
+                file_name TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                parsed INTEGER NOT NULL DEFAULT 0,
+                build_name TEXT,
+                class_name TEXT,
+                ascendancy TEXT,
+                level INTEGER,
+                main_skill TEXT
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_builds_root_mtime ON builds(root, mtime);
+            CREATE INDEX IF NOT EXISTS idx_builds_class ON builds(class_name);
+            CREATE INDEX IF NOT EXISTS idx_builds_ascendancy ON builds(ascendancy);
+            CREATE INDEX IF NOT EXISTS idx_builds_level ON builds(level);
+        """)
+        self.conn.commit()
+
+    def stamps(self, root: str) -> Dict[str, Tuple[float, int]]:
+        """(mtime, size) of every indexed file under ``root``."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT path, mtime, size FROM builds WHERE root = ?", (root,)
+            ).fetchall()
+        return {row["path"]: (row["mtime"], row["size"]) for row in rows}
+
+    def update(
+        self,
+        root: str,
+        upserts: Iterable[Tuple[str, float, int, Optional[Dict[str, Any]]]],
+        removed: Iterable[str] = (),
+    ) -> None:
+        """
+        Store re-read files and drop deleted ones in one transaction.
+
+        Args:
+            root: Builds folder the files belong to.
+            upserts: (path, mtime, size, header or None if unreadable).
+            removed: Paths no longer on disk.
+        """
+        rows = []
+        for path, mtime, size, header in upserts:
+            header = header or {}
+            rows.append((
+                path, root, os.path.basename(path), mtime, size,
+                1 if header else 0,
+                header.get("build_name"), header.get("class_name"),
+                header.get("ascendancy"), header.get("level"), header.get("main_skill"),
+            ))
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO builds (path, root, file_name, mtime, size, parsed,"
+                " build_name, class_name, ascendancy, level, main_skill)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.executemany("DELETE FROM builds WHERE path = ?", [(p,) for p in removed])
+
+    def query(
+        self,
+        root: str,
+        class_name: Optional[str] = None,
+        ascendancy: Optional[str] = None,
+        min_level: Optional[int] = None,
+        max_level: Optional[int] = None,
+        main_skill: Optional[str] = None,
+        text: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[sqlite3.Row]:
+        """
+        Indexed builds under ``root``, newest first.
+
+        class_name, ascendancy and main_skill match case-insensitively;
+        ``text`` is a substring match on display name, class, ascendancy
+        or main skill.
+        """
+        clauses = ["root = ?"]
+        params: List[Any] = [root]
+        for column, value in (
+            ("class_name", class_name),
+            ("ascendancy", ascendancy),
+            ("main_skill", main_skill),
+        ):
+            if value:
+                clauses.append(f"{column} = ? COLLATE NOCASE")
+                params.append(value)
+        if min_level is not None:
+            clauses.append("level >= ?")
+            params.append(min_level)
+        if max_level is not None:
+            clauses.append("level <= ?")
+            params.append(max_level)
+        if text:
+            clauses.append(
+                "(instr(lower(COALESCE(NULLIF(build_name, ''), replace(file_name, '.xml', ''))), ?) > 0"
+                " OR instr(lower(COALESCE(class_name, '')), ?) > 0"
+                " OR instr(lower(COALESCE(ascendancy, '')), ?) > 0"
+                " OR instr(lower(COALESCE(main_skill, '')), ?) > 0)"
+            )
+            params.extend([text.lower()] * 4)
+
+        sql = f"SELECT * FROM builds WHERE {' AND '.join(clauses)} ORDER BY mtime DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def count(self, root: Optional[str] = None) -> int:
+        with self._lock:
+            if root is None:
+                return self.conn.execute("SELECT COUNT(*) FROM builds").fetchone()[0]
+            return self.conn.execute("SELECT COUNT(*) FROM builds WHERE root = ?", (root,)).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
 
 @dataclass
 class LocalBuildInfo:
@@ -60,12 +266,36 @@ class LocalBuildInfo:
 
         return " ".join(parts) if parts else self.display_name
 
+    def _apply_header(self, header: Dict[str, Any]) -> None:
+        self._build_name = header.get("build_name")
+        self._class_name = header.get("class_name")
+        self._ascendancy = header.get("ascendancy")
+        self._level = header.get("level")
+        self._main_skill = header.get("main_skill")
+        self._is_loaded = True
+
+    @classmethod
+    def _from_index_row(cls, row: sqlite3.Row) -> "LocalBuildInfo":
+        info = cls(
+            file_path=Path(row["path"]),
+            file_name=row["file_name"],
+            last_modified=datetime.fromtimestamp(row["mtime"]),
+            size_bytes=row["size"],
+        )
+        if row["parsed"]:
+            info._apply_header(dict(row))
+        return info
+
 
 class PoBLocalScanner:
     """
     Scans local Path of Building installation for saved builds.
 
     Default location: %UserProfile%/Documents/Path of Building/Builds/
+
+    Headers are cached in a LocalBuildIndex. Without ``index_path`` the index
+    lives in memory for the scanner's lifetime; the app-wide scanner from
+    get_pob_scanner() persists it to DEFAULT_INDEX_PATH.
     """
 
     # Common PoB installation paths
@@ -75,18 +305,28 @@ class PoBLocalScanner:
         Path(os.environ.get("APPDATA", "")) / "Path of Building" / "Builds",
     ]
 
-    def __init__(self, custom_path: Optional[Path] = None):
+    def __init__(self, custom_path: Optional[Path] = None, index_path: Union[Path, str, None] = None):
         """
         Initialize the scanner.
 
         Args:
             custom_path: Custom path to PoB builds folder.
+            index_path: SQLite file for the persistent build index.
         """
         self._custom_path = custom_path
+        self._index_path = index_path
+        self._index: Optional[LocalBuildIndex] = None
         self._builds_path: Optional[Path] = None
         self._cached_builds: List[LocalBuildInfo] = []
         self._last_scan: Optional[datetime] = None
 
+    @property
+    def index(self) -> LocalBuildIndex:
+        """The build header index (opened on first use)."""
+        if self._index is None:
+            self._index = LocalBuildIndex(self._index_path or ":memory:")
+        return self._index
+
     @property
     def builds_path(self) -> Optional[Path]:
         """Get the detected PoB builds folder path."""
@@ -130,24 +370,27 @@ class PoBLocalScanner:
             return builds
 
         try:
-            # Scan for XML files recursively
-            for xml_file in path.rglob("*.xml"):
-                try:
-                    stat = xml_file.stat()
-                    build_info = LocalBuildInfo(
-                        file_path=xml_file,
-                        file_name=xml_file.name,
-                        last_modified=datetime.fromtimestamp(stat.st_mtime),
-                        size_bytes=stat.st_size,
-                    )
-                    builds.append(build_info)
-                except OSError as e:
-                    logger.debug(f"Could not stat {xml_file}: {e}")
-
-            # Sort by last modified (newest first)
-            builds.sort(key=lambda b: b.last_modified, reverse=True)
-
-            logger.info(f"Found {len(builds)} local PoB builds")
+            root = str(path)
+            on_disk = self._stat_xml_files(path)
+            known = self.index.stamps(root)
+
+            changed = [p for p, stamp in on_disk.items() if known.get(p) != stamp]
+            removed = [p for p in known if p not in on_disk]
+            if changed or removed:
+                headers = self._read_headers(changed)
+                self.index.update(
+                    root,
+                    ((p, *on_disk[p], headers[p]) for p in changed),
+                    removed,
+                )
+
+            # Index returns builds sorted by last modified (newest first)
+            builds = [LocalBuildInfo._from_index_row(row) for row in self.index.query(root)]
+
+            logger.info(
+                f"Found {len(builds)} local PoB builds "
+                f"({len(changed)} read, {len(removed)} removed)"
+            )
             self._cached_builds = builds
             self._last_scan = datetime.now()
 
@@ -156,6 +399,70 @@ class PoBLocalScanner:
 
         return builds
 
+    @staticmethod
+    def _stat_xml_files(path: Path) -> Dict[str, Tuple[float, int]]:
+        """(mtime, size) of every .xml file under ``path``, recursively."""
+        found: Dict[str, Tuple[float, int]] = {}
+        stack = [str(path)]
+        while stack:
+            folder = stack.pop()
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                stack.append(entry.path)
+                            elif entry.name.endswith(".xml"):
+                                stat = entry.stat()
+                                found[entry.path] = (stat.st_mtime, stat.st_size)
+                        except OSError as e:
+                            logger.debug(f"Could not stat {entry.path}: {e}")
+            except OSError as e:
+                logger.debug(f"Could not scan {folder}: {e}")
+        return found
+
+    @staticmethod
+    def _read_headers(paths: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Read build headers for ``paths`` in a worker pool."""
+        if len(paths) < 2:
+            return {p: _read_header_or_none(Path(p)) for p in paths}
+        with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS, thread_name_prefix="pob-scan") as pool:
+            return dict(zip(paths, pool.map(lambda p: _read_header_or_none(Path(p)), paths)))
+
+    def query_builds(
+        self,
+        class_name: Optional[str] = None,
+        ascendancy: Optional[str] = None,
+        min_level: Optional[int] = None,
+        max_level: Optional[int] = None,
+        main_skill: Optional[str] = None,
+        text: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[LocalBuildInfo]:
+        """
+        Filter indexed builds without touching the filesystem.
+
+        Reflects the last scan_builds(); call that first (or refresh it) to
+        pick up changes on disk.
+
+        Returns:
+            Matching builds, newest first.
+        """
+        path = self.builds_path
+        if not path:
+            return []
+        rows = self.index.query(
+            str(path),
+            class_name=class_name,
+            ascendancy=ascendancy,
+            min_level=min_level,
+            max_level=max_level,
+            main_skill=main_skill,
+            text=text,
+            limit=limit,
+        )
+        return [LocalBuildInfo._from_index_row(row) for row in rows]
+
     def load_build_metadata(self, build_info: LocalBuildInfo) -> bool:
         """
         Load basic metadata from a build file without full parsing.
@@ -169,31 +476,11 @@ class PoBLocalScanner:
         if build_info._is_loaded:
             return True
 
-        try:
-            # Parse just enough to get build metadata
-            tree = ET.parse(str(build_info.file_path))
-            root = tree.getroot()
-
-            # Get build element
-            build_elem = root.find("Build")
-            if build_elem is not None:
-                build_info._class_name = build_elem.get("className", "")
-                build_info._ascendancy = build_elem.get("ascendClassName", "")
-                build_info._level = int(build_elem.get("level", 1))
-                build_info._main_skill = build_elem.get("mainSocketGroup", "")
-
-            # Try to get build name from PathOfBuilding element
-            pob_elem = root.find(".")
-            if pob_elem is not None:
-                # Some builds have a buildName attribute
-                build_info._build_name = pob_elem.get("buildName", "")
-
-            build_info._is_loaded = True
-            return True
-
-        except Exception as e:
-            logger.debug(f"Could not load build metadata from {build_info.file_path}: {e}")
+        header = _read_header_or_none(build_info.file_path)
+        if header is None:
             return False
+        build_info._apply_header(header)
+        return True
 
     def load_all_metadata(self) -> int:
         """
@@ -203,13 +490,15 @@ class PoBLocalScanner:
             Number of builds successfully loaded.
         """
         builds = self.scan_builds()
-        loaded = 0
+        pending = [b for b in builds if not b._is_loaded]
+        headers = self._read_headers([str(b.file_path) for b in pending])
 
-        for build in builds:
-            if self.load_build_metadata(build):
-                loaded += 1
+        for build in pending:
+            header = headers[str(build.file_path)]
+            if header is not None:
+                build._apply_header(header)
 
-        return loaded
+        return sum(1 for b in builds if b._is_loaded)
 
     def get_build_xml(self, build_info: LocalBuildInfo) -> Optional[str]:
         """
@@ -250,24 +539,8 @@ class PoBLocalScanner:
         Returns:
             Matching builds.
         """
-        query_lower = query.lower()
-        builds = self.scan_builds()
-        results = []
-
-        for build in builds:
-            # Load metadata if not already loaded
-            self.load_build_metadata(build)
-
-            # Search in various fields
-            if (
-                query_lower in build.display_name.lower()
-                or (build._class_name and query_lower in build._class_name.lower())
-                or (build._ascendancy and query_lower in build._ascendancy.lower())
-                or (build._main_skill and query_lower in build._main_skill.lower())
-            ):
-                results.append(build)
-
-        return results
+        self.scan_builds()
+        return self.query_builds(text=query)
 
     def import_to_app(self, build_info: LocalBuildInfo) -> Optional[Dict[str, Any]]:
         """
@@ -306,10 +579,10 @@ _scanner: Optional[PoBLocalScanner] = None
 
 
 def get_pob_scanner(custom_path: Optional[Path] = None) -> PoBLocalScanner:
-    """Get the singleton PoB scanner instance."""
+    """Get the singleton PoB scanner instance (with the persistent index)."""
     global _scanner
     if _scanner is None or custom_path:
-        _scanner = PoBLocalScanner(custom_path)
+        _scanner = PoBLocalScanner(custom_path, index_path=DEFAULT_INDEX_PATH)
     return _scanner
 
 
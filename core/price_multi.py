@@ -1,11 +1,15 @@
+import contextvars
 import logging
+import math
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
-from typing import Any, Iterable, Protocol, runtime_checkable, Mapping, Union, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Protocol, runtime_checkable, Mapping, Union, Callable
 
 from core.price_arbitration import arbitrate_rows
 from core.price_row import PriceRow, validate_and_normalize_row
+from core.tracing import get_tracer, span
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +23,11 @@ RESULT_COLUMNS: tuple[str, ...] = (
     "source",
 )
 
+# Default size of the shared source pool
+DEFAULT_MAX_WORKERS = 16
+# How often a check retries a source that is waiting for a free slot
+SLOT_POLL_S = 0.02
+
 
 @runtime_checkable
 class PriceSource(Protocol):
@@ -45,13 +54,47 @@ class ExistingServiceAdapter(PriceSource):
         return rows
 
 
+@dataclass(frozen=True)
+class SourceLimits:
+    """
+    Per-source bulkhead settings.
+
+    max_concurrent: calls to the source that may run at once, across all
+        checks (None = unlimited); further checks wait for a free slot.
+    deadline_s: seconds a check waits for the source, including any wait
+        for a slot, before reporting it as timed out (None = wait for it).
+    """
+    max_concurrent: int | None = None
+    deadline_s: float | None = None
+
+
+@dataclass
+class SourceResult:
+    """One source's outcome for a check, as yielded by iter_check_item()."""
+    source: str
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    error: Exception | None = None
+    duration_ms: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class MultiSourcePriceService:
     """
     Aggregates multiple PriceSource implementations.
 
-    - Runs sources in parallel using ThreadPoolExecutor.
-    - Flattens all results into one list.
+    - Runs sources in parallel on a long-lived, bounded thread pool.
+    - Limits each source's concurrent calls and how long a check waits
+      for it (see SourceLimits), so a slow source cannot hold the pool
+      or the caller.
+    - Flattens all results into one list, or streams each source's rows
+      as it finishes (iter_check_item / on_source_done).
     - Allows enabling/disabling sources by name (for GUI toggling).
+
+    Call close() to shut the pool down (AppContext.close() does).
     """
 
     def __init__(
@@ -61,11 +104,32 @@ class MultiSourcePriceService:
         on_change_enabled_state: Callable[[dict[str, bool]], None] | None = None,
         base_log_context: Mapping[str, Any] | None = None,
         use_arbitration: bool = False,
+        source_limits: Mapping[str, SourceLimits] | None = None,
+        default_limits: SourceLimits | None = None,
     ) -> None:
         if not sources:
             raise ValueError("MultiSourcePriceService requires at least one PriceSource.")
         self._sources: list[PriceSource] = list(sources)
-        self._max_workers = max_workers or min(8, len(self._sources))
+
+        # Per-source bulkheads (only for limited sources); a slot is held
+        # for as long as a call runs
+        default = default_limits or SourceLimits()
+        overrides = dict(source_limits or {})
+        self._limits: dict[str, SourceLimits] = {
+            s.name: overrides.get(s.name, default) for s in self._sources
+        }
+        self._slots: dict[str, threading.BoundedSemaphore] = {
+            name: threading.BoundedSemaphore(max(1, limits.max_concurrent))
+            for name, limits in self._limits.items()
+            if limits.max_concurrent is not None
+        }
+        # Sources currently making checks wait for a slot (logged once)
+        self._saturated: set[str] = set()
+        self._max_workers = max_workers or DEFAULT_MAX_WORKERS
+        # Created on first check, reused until close()
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._closed = False
 
         # Track enabled source names; default = all enabled
         self._enabled_names: set[str] = {s.name for s in self._sources}
@@ -108,64 +172,243 @@ class MultiSourcePriceService:
             except (OSError, TypeError, ValueError):  # defensive: do not let persistence errors bubble
                 logger.exception("Failed to persist enabled sources state")
 
+    def get_timing_stats(self) -> dict[str, dict[str, Any]]:
+        """Rolling per-source latency (p50/p95/p99) across recent checks."""
+        return get_tracer().stage_stats("price_source.")
+
     # ---------------------------------------------------------------------
 
-    def check_item(self, item_text: str) -> list[dict[str, Any]]:
+    def get_source_limits(self) -> dict[str, SourceLimits]:
+        """Return source_name -> SourceLimits."""
+        return dict(self._limits)
+
+    # ----- Worker pool ----------------------------------------------------
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._closed:
+                raise RuntimeError("MultiSourcePriceService is closed")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="price-source"
+                )
+            return self._executor
+
+    def close(self, wait: bool = False) -> None:
+        """
+        Shut the worker pool down. Queued source calls are cancelled;
+        running ones finish in the background unless wait is True.
+        """
+        with self._executor_lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            logger.debug("Multi-source price pool shut down")
+
+    def __enter__(self) -> "MultiSourcePriceService":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    # ---------------------------------------------------------------------
+
+    @staticmethod
+    def _run_source(
+        source: PriceSource,
+        item_text: str,
+        slot: threading.BoundedSemaphore | None = None,
+    ) -> tuple[Any, Exception | None, float]:
+        """Run one source, returning (rows, error, duration_ms) instead of raising."""
+        start = time.perf_counter()
+        try:
+            with span(f"price_source.{source.name}"):
+                rows = list(source.check_item(item_text))
+            return rows, None, (time.perf_counter() - start) * 1000.0
+        except Exception as exc:
+            return [], exc, (time.perf_counter() - start) * 1000.0
+        finally:
+            if slot is not None:
+                slot.release()
+
+    def _source_result(
+        self,
+        source: PriceSource,
+        rows: Any,
+        error: Exception | None,
+        dur_ms: float,
+        timed_out: bool = False,
+    ) -> SourceResult:
+        """Log one source's outcome and normalize its rows."""
+        ok = error is None
+        if timed_out:
+            logger.warning(f"Price source '{source.name}' timed out after {dur_ms:.0f} ms")
+        elif error is not None:
+            logger.warning(
+                f"Price source '{source.name}' failed: {error}",
+                exc_info=error
+            )
+        extra_fields = {
+            "source": source.name,
+            "duration_ms": round(dur_ms, 2),
+            "ok": ok,
+            "row_count": len(rows) if isinstance(rows, list) else 0,
+            "timed_out": timed_out,
+        }
+        extra_fields.update(self._base_log_context)
+        logger.debug(
+            "price_source_done",
+            extra=extra_fields,
+        )
+
+        normalized: list[dict[str, Any]] = []
+        for row in rows:
+            data = validate_and_normalize_row(row)
+            if not data.get("source"):
+                data["source"] = source.name
+            normalized.append(data)
+        return SourceResult(source.name, normalized, error, dur_ms, timed_out)
+
+    def _active_sources(self) -> list[PriceSource]:
+        return [s for s in self._sources if s.name in self._enabled_names]
+
+    def iter_check_item(self, item_text: str, deadline_s: float | None = None) -> Iterator[SourceResult]:
+        """
+        Run a price check against all *enabled* sources, yielding each
+        source's SourceResult as soon as it completes.
+
+        Args:
+            item_text: Raw item text.
+            deadline_s: Overall time budget for the check; each source
+                gets the smaller of this and its own SourceLimits.deadline_s.
+
+        A source already running its max_concurrent calls is started as
+        soon as a slot frees. Sources that miss their deadline (slot wait
+        included) are yielded as timed out, with no rows.
+        """
+        if not item_text.strip():
+            return
+        active_sources = self._active_sources()
+        if active_sources:
+            yield from self._iter_results(item_text, active_sources, deadline_s)
+
+    def _try_acquire(self, source: PriceSource) -> bool:
+        """Take a slot for source without blocking (always succeeds if unlimited)."""
+        slot = self._slots.get(source.name)
+        if slot is None:
+            return True
+        if slot.acquire(blocking=False):
+            self._saturated.discard(source.name)
+            return True
+        if source.name not in self._saturated:
+            self._saturated.add(source.name)
+            logger.warning(
+                f"Price source '{source.name}' is at its limit of "
+                f"{self._limits[source.name].max_concurrent} calls; checks wait for a free slot"
+            )
+        return False
+
+    def _iter_results(
+        self,
+        item_text: str,
+        active_sources: list[PriceSource],
+        deadline_s: float | None,
+    ) -> Iterator[SourceResult]:
+        executor = self._get_executor()
+        start = time.monotonic()
+        deadlines: dict[str, float] = {}
+        for source in active_sources:
+            limit = self._limits[source.name].deadline_s
+            if deadline_s is not None:
+                limit = deadline_s if limit is None else min(limit, deadline_s)
+            deadlines[source.name] = start + limit if limit is not None else math.inf
+
+        pending: dict[Future, PriceSource] = {}
+        waiting: list[PriceSource] = list(active_sources)
+
+        while pending or waiting:
+            # Start every source that can get a slot; the rest keep waiting
+            for source in list(waiting):
+                if not self._try_acquire(source):
+                    continue
+                waiting.remove(source)
+                try:
+                    # Each source runs in a copy of this context so its spans
+                    # nest under the caller's span.
+                    future = executor.submit(
+                        contextvars.copy_context().run,
+                        self._run_source, source, item_text, self._slots.get(source.name),
+                    )
+                except RuntimeError:  # pool shut down meanwhile
+                    if source.name in self._slots:
+                        self._slots[source.name].release()
+                    raise
+                pending[future] = source
+
+            nearest = min([deadlines[s.name] for s in pending.values()] + [deadlines[s.name] for s in waiting])
+            timeout = None if nearest == math.inf else max(0.0, nearest - time.monotonic())
+            if waiting:
+                timeout = SLOT_POLL_S if timeout is None else min(timeout, SLOT_POLL_S)
+            if pending:
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            else:
+                done = set()
+                time.sleep(timeout)
+
+            for future in done:
+                source = pending.pop(future)
+                rows, error, dur_ms = future.result()
+                yield self._source_result(source, rows, error, dur_ms)
+
+            now = time.monotonic()
+            for future in [f for f in pending if deadlines[pending[f].name] <= now]:
+                source = pending.pop(future)
+                if future.cancel() and source.name in self._slots:
+                    # Never started, so _run_source won't release the slot
+                    self._slots[source.name].release()
+                # A started call can't be interrupted; it keeps its slot (if
+                # limited) until it returns, and its rows are dropped.
+                error = TimeoutError(f"no response within {deadlines[source.name] - start:.2f}s")
+                yield self._source_result(source, [], error, (now - start) * 1000.0, timed_out=True)
+            for source in [s for s in waiting if deadlines[s.name] <= now]:
+                waiting.remove(source)
+                error = TimeoutError(
+                    f"no free slot within {deadlines[source.name] - start:.2f}s "
+                    f"(limit {self._limits[source.name].max_concurrent} calls)"
+                )
+                yield self._source_result(source, [], error, (now - start) * 1000.0, timed_out=True)
+
+    def check_item(
+        self,
+        item_text: str,
+        on_source_done: Callable[[SourceResult], None] | None = None,
+        deadline_s: float | None = None,
+    ) -> list[dict[str, Any]]:
         """
         Run a price check against all *enabled* sources in parallel.
 
         Returns a flat list of rows. Each row is a dict with RESULT_COLUMNS.
+        on_source_done, if given, is called with each source's SourceResult
+        as it completes (before the others finish); deadline_s is as for
+        iter_check_item().
         """
         if not item_text.strip():
             return []
 
         # Only active sources participate
-        active_sources = [s for s in self._sources if s.name in self._enabled_names]
+        active_sources = self._active_sources()
         if not active_sources:
             return []
 
         results: list[dict[str, Any]] = []
 
-        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-            future_to_source = {
-                executor.submit(source.check_item, item_text): source
-                for source in active_sources
-            }
+        with span("multi.check_item", sources=len(active_sources)):
+            for result in self._iter_results(item_text, active_sources, deadline_s):
+                results.extend(result.rows)
+                if on_source_done is not None:
+                    on_source_done(result)
 
-            for future in as_completed(future_to_source):
-                source = future_to_source[future]
-                start = time.perf_counter()
-                try:
-                    rows = future.result()
-                    ok = True
-                except Exception as e:
-                    logger.warning(
-                        f"Price source '{source.name}' failed: {e}",
-                        exc_info=True
-                    )
-                    ok = False
-                    rows = []
-                finally:
-                    dur_ms = (time.perf_counter() - start) * 1000.0
-                    extra_fields = {
-                        "source": source.name,
-                        "duration_ms": round(dur_ms, 2),
-                        "ok": ok,
-                        "row_count": len(rows) if isinstance(rows, list) else 0,
-                    }
-                    extra_fields.update(self._base_log_context)
-                    logger.debug(
-                        "price_source_done",
-                        extra=extra_fields,
-                    )
-                    # do not continue here; allow successful rows to be processed below
-
-                for row in rows:
-                    data = validate_and_normalize_row(row)
-                    if not data.get("source"):
-                        data["source"] = source.name
-                    results.append(data)
-        
         # Optionally add an arbitrated display row at the top without
         # changing existing rows, guarded by feature flag
         if self._use_arbitration and arbitrate_rows is not None:
@@ -8,6 +8,8 @@ Public API:
 - PriceExplanation: Structured explanation for price results
 - ItemPriceCache: LRU cache for recently checked items
 - get_item_price_cache: Get global cache instance
+- hash_item_text: Normalized item-text key shared by the cache and check dedup
+- parsed_item_key: Cache key text for items priced via check_parsed_item
 
 Example:
     from core.pricing import PriceService, PriceExplanation
@@ -21,6 +23,8 @@ from core.pricing.cache import (
     CacheStats,
     get_item_price_cache,
     clear_item_price_cache,
+    hash_item_text,
+    parsed_item_key,
 )
 
 __all__ = [
@@ -30,4 +34,6 @@ __all__ = [
     "CacheStats",
     "get_item_price_cache",
     "clear_item_price_cache",
+    "hash_item_text",
+    "parsed_item_key",
 ]
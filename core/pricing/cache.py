@@ -8,6 +8,7 @@ avoiding redundant API calls and database queries.
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
 import threading
 import time
@@ -38,6 +39,33 @@ def _normalize_item_text_cached(item_text: str) -> str:
     return '\n'.join(lines)
 
 
+def hash_item_text(item_text: str) -> str:
+    """Stable key for item text; whitespace and line-ending variants hash equal."""
+    normalized = _normalize_item_text_cached(item_text)
+    # MD5 used only for cache key generation, not security
+    return hashlib.md5(normalized.encode('utf-8'), usedforsecurity=False).hexdigest()
+
+
+def parsed_item_key(parsed: Any) -> str:
+    """
+    Cache key text for an already-parsed item (see PriceService.check_parsed_item).
+
+    Starts like clipboard text so the cache logs the item's name, followed
+    by every parsed field; equal stash items get equal keys.
+    """
+    fields = parsed.to_dict() if hasattr(parsed, "to_dict") else dict(vars(parsed))
+    for name in ("influences", "is_fractured", "is_synthesised", "is_mirrored"):
+        if hasattr(parsed, name):
+            fields[name] = getattr(parsed, name)
+    name = parsed.get_display_name() if hasattr(parsed, "get_display_name") else fields.get("name")
+    return "\n".join([
+        f"Rarity: {fields.get('rarity')}",
+        str(name),
+        "--------",
+        json.dumps(fields, sort_keys=True, default=list),
+    ])
+
+
 @dataclass
 class CacheEntry:
     """A cached price check result."""
@@ -155,9 +183,7 @@ class ItemPriceCache:
 
     def _hash_item(self, item_text: str) -> str:
         """Generate hash key for item text."""
-        normalized = self._normalize_item_text(item_text)
-        # MD5 used only for cache key generation, not security
-        return hashlib.md5(normalized.encode('utf-8'), usedforsecurity=False).hexdigest()
+        return hash_item_text(item_text)
 
     def _extract_item_name(self, item_text: str) -> str:
         """Extract item name from text for logging/debugging."""
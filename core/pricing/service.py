@@ -21,10 +21,16 @@ from data_sources.pricing.poe_watch import PoeWatchAPI
 from data_sources.pricing.trade_api import TradeApiSource
 from core.price_estimation import get_active_policy, round_to_step
 from core.pricing.models import PriceExplanation
-from core.pricing.cache import get_item_price_cache, ItemPriceCache
+from core.pricing.cache import get_item_price_cache, hash_item_text, parsed_item_key, ItemPriceCache
+from core.logging_setup import HotPathLogger
+from core.single_flight import SingleFlight
+from core.tracing import get_tracer, span
 
 logger = logging.getLogger(__name__)
 
+# Per-check lookup detail, collapsed into one sampled record per check
+_check_log = HotPathLogger("core.pricing.checks")
+
 
 class PriceService:
     """
@@ -75,6 +81,9 @@ class PriceService:
         self._cache = cache or get_item_price_cache()
         self._cache_enabled = bool(getattr(config, 'item_cache_enabled', True))
 
+        # Concurrent checks of the same item share one run of the pipeline
+        self._inflight: SingleFlight[list[dict[str, Any]]] = SingleFlight()
+
         # Apply cache config if available (with defensive handling for mocks)
         if self._cache:
             try:
@@ -125,6 +134,10 @@ class PriceService:
             }
         return {}
 
+    def get_timing_stats(self, prefix: str = "") -> dict:
+        """Rolling per-stage latency (p50/p95/p99) for recent price checks."""
+        return get_tracer().stage_stats(prefix)
+
     # ------------------------------------------------------------------ #
     # Public API
     # ------------------------------------------------------------------ #
@@ -144,6 +157,17 @@ class PriceService:
             item_text: Raw item text from clipboard.
             use_cache: Whether to use cached results if available.
         """
+        with span("pricing.check_item"):
+            if not (item_text or "").strip():
+                return []
+            # Identical checks already in flight (clipboard monitor, API and
+            # GUI on the same item, duplicates in a paste) wait for that run.
+            return self._inflight.do(
+                (hash_item_text(item_text), use_cache),
+                lambda: self._check_item(item_text, use_cache),
+            )
+
+    def _check_item(self, item_text: str, use_cache: bool) -> list[dict[str, Any]]:
         item_text = (item_text or "").strip()
         if not item_text:
             return []
@@ -155,12 +179,48 @@ class PriceService:
                 self.logger.debug("Returning cached price results")
                 return cached_results
 
+        # 1) Parse item text → ParsedItem
+        with span("pricing.parse"):
+            parsed = self.parser.parse(item_text)
+
+        return self._price_parsed(parsed, item_text)
+
+    def check_parsed_item(self, parsed: Any, use_cache: bool = True) -> list[dict[str, Any]]:
+        """
+        Price an item that is already parsed, skipping the text parse.
+
+        For items built without clipboard text, e.g. by
+        ParsedItem.from_stash_item() during stash scans. Runs the same
+        lookup, persistence and stats steps as check_item() and returns
+        rows of the same shape.
+
+        Args:
+            parsed: ParsedItem (or compatible object) to price.
+            use_cache: Whether to use cached results if available.
+        """
+        with span("pricing.check_parsed_item"):
+            if parsed is None:
+                return []
+            cache_key = parsed_item_key(parsed)
+            return self._inflight.do(
+                (hash_item_text(cache_key), use_cache),
+                lambda: self._check_parsed_item(parsed, cache_key, use_cache),
+            )
+
+    def _check_parsed_item(self, parsed: Any, cache_key: str, use_cache: bool) -> list[dict[str, Any]]:
+        if use_cache and self._cache_enabled and self._cache:
+            cached_results = self._cache.get(cache_key)
+            if cached_results is not None:
+                self.logger.debug("Returning cached price results")
+                return cached_results
+
+        return self._price_parsed(parsed, cache_key)
+
+    def _price_parsed(self, parsed: Any, cache_key: str) -> list[dict[str, Any]]:
+        """Price a parsed item and cache the rows under ``cache_key``."""
         # Initialize explanation tracker
         explanation = PriceExplanation()
 
-        # 1) Parse item text → ParsedItem
-        parsed = self.parser.parse(item_text)
-
         # 2) Look up aggregate price from poe.ninja + poe.watch (multi-source)
         chaos_value: float
         listing_count: int
@@ -176,9 +236,10 @@ class PriceService:
             explanation.source_name = "none"
             explanation.summary = "No pricing sources available"
         else:
-            chaos_value, listing_count, source_label, confidence = self._lookup_price_multi_source(
-                parsed
-            )
+            with span("pricing.lookup"):
+                chaos_value, listing_count, source_label, confidence = self._lookup_price_multi_source(
+                    parsed
+                )
             # Extract source name from label (before any parentheses)
             explanation.source_name = source_label.split(" (")[0] if " (" in source_label else source_label
             explanation.sample_size = listing_count
@@ -191,7 +252,8 @@ class PriceService:
         if rarity and rarity.upper() == "RARE" and self.rare_evaluator is not None and parsed is not None:
             try:
                 # Always evaluate rares to get affix data for trade API
-                rare_evaluation = self.rare_evaluator.evaluate(parsed)
+                with span("pricing.rare_evaluation"):
+                    rare_evaluation = self.rare_evaluator.evaluate(parsed)
 
                 # Attach evaluation to parsed item for trade API to use
                 parsed._rare_evaluation = rare_evaluation
@@ -304,7 +366,8 @@ class PriceService:
 
         if self.trade_source is not None:
             try:
-                trade_quotes = self.trade_source.check_item(parsed, max_results=20)
+                with span("pricing.trade"):
+                    trade_quotes = self.trade_source.check_item(parsed, max_results=20)
                 self.logger.info(
                     "PriceService.check_item: received %d trade quote(s) from TradeApiSource for %s",
                     len(trade_quotes),
@@ -321,14 +384,16 @@ class PriceService:
 
         # 4) Persist this check + quotes (poe.ninja synthetic + trade)
         try:
-            self._save_trade_quotes_for_check(parsed, trade_quotes, chaos_value)
+            with span("pricing.persist"):
+                self._save_trade_quotes_for_check(parsed, trade_quotes, chaos_value)
         except Exception as exc:  # pragma: no cover - defensive
             self.logger.exception("Failed to save trade quotes: %s", exc)
 
         # 5) Compute robust display price from latest stats (if any)
         stats: Optional[dict[str, Any]] = None
         try:
-            stats = self._get_latest_price_stats_for_item(parsed)
+            with span("pricing.stats"):
+                stats = self._get_latest_price_stats_for_item(parsed)
         except Exception as exc:  # pragma: no cover - defensive
             self.logger.exception("Failed to compute price stats: %s", exc)
             stats = None
@@ -410,7 +475,7 @@ class PriceService:
 
         # Cache results for future lookups
         if self._cache_enabled and self._cache:
-            self._cache.put(item_text, results)
+            self._cache.put(cache_key, results)
 
         return results
 
@@ -926,9 +991,7 @@ class PriceService:
             return self._lookup_price_poe2(parsed, item_name, base_type, rarity)
 
         # PoE1: Use poe.ninja + poe.watch
-        # DEBUG LOGGING
-        self.logger.info(f"[MULTI-SOURCE] Looking up price for '{item_name}' (rarity: {rarity}, base: {base_type})")
-        self.logger.info(f"[MULTI-SOURCE] Available sources: poe.ninja={self.poe_ninja is not None}, poe.watch={self.poe_watch is not None}")
+        trace = _check_log.trace("multi_source_lookup", item=item_name, rarity=rarity, base=base_type)
 
         ninja_price: Optional[float] = None
         ninja_count: int = 0
@@ -938,28 +1001,22 @@ class PriceService:
 
         # Get poe.ninja price
         if self.poe_ninja:
-            self.logger.info("[MULTI-SOURCE] Querying poe.ninja...")
             try:
-                ninja_price, ninja_count, _ = self._lookup_price_with_poe_ninja(parsed)
+                with span("pricing.ninja"):
+                    ninja_price, ninja_count, _ = self._lookup_price_with_poe_ninja(parsed)
                 if ninja_price == 0.0:
                     ninja_price = None
-                if ninja_price is not None:
-                    self.logger.info(f"[MULTI-SOURCE]   poe.ninja result: {ninja_price:.1f}c (count: {ninja_count})")
-                else:
-                    self.logger.info("[MULTI-SOURCE]   poe.ninja result: No data found")
+                trace.add(ninja_price=ninja_price, ninja_count=ninja_count)
             except Exception as e:
-                self.logger.warning(f"[MULTI-SOURCE]   poe.ninja lookup failed: {e}")
+                self.logger.warning("[MULTI-SOURCE] poe.ninja lookup failed: %s", e)
                 ninja_price = None
         else:
-            self.logger.info("[MULTI-SOURCE] Skipping poe.ninja (not initialized)")
+            trace.add(ninja="not initialized")
 
         # EARLY EXIT: If poe.ninja has high-confidence data (20+ listings), skip poe.watch
         # This avoids redundant API calls when we already have reliable pricing
         if ninja_price is not None and ninja_count >= 20:
-            self.logger.info(
-                f"[MULTI-SOURCE] ✓ Early exit: poe.ninja has {ninja_count} listings "
-                f"(high confidence), skipping poe.watch"
-            )
+            trace.emit(decision="poe.ninja early exit", confidence="high")
             return (
                 ninja_price,
                 ninja_count,
@@ -969,17 +1026,17 @@ class PriceService:
 
         # Get poe.watch price (only if ninja data is weak or unavailable)
         if self.poe_watch:
-            self.logger.info("[MULTI-SOURCE] Querying poe.watch...")
             try:
-                watch_data = self.poe_watch.find_item_price(
-                    item_name=item_name,
-                    base_type=base_type,
-                    rarity=rarity,
-                    gem_level=self._get_gem_level(parsed),
-                    gem_quality=self._get_gem_quality(parsed),
-                    corrupted=self._get_corrupted_flag(parsed),
-                    links=self._parse_links(parsed),
-                )
+                with span("pricing.watch"):
+                    watch_data = self.poe_watch.find_item_price(
+                        item_name=item_name,
+                        base_type=base_type,
+                        rarity=rarity,
+                        gem_level=self._get_gem_level(parsed),
+                        gem_quality=self._get_gem_quality(parsed),
+                        corrupted=self._get_corrupted_flag(parsed),
+                        links=self._parse_links(parsed),
+                    )
 
                 if watch_data:
                     watch_price = float(watch_data.get('mean', 0) or 0)
@@ -996,30 +1053,25 @@ class PriceService:
                     else:
                         watch_confidence = "medium"
 
-                    if watch_price is not None:
-                        self.logger.info(f"[MULTI-SOURCE]   poe.watch result: {watch_price:.1f}c (daily: {watch_daily}, confidence: {watch_confidence})")
-                    else:
-                        self.logger.info("[MULTI-SOURCE]   poe.watch result: No price data (mean=0)")
+                    trace.add(watch_price=watch_price, watch_daily=watch_daily, watch_confidence=watch_confidence)
                 else:
-                    self.logger.info("[MULTI-SOURCE]   poe.watch result: No matching item found")
+                    trace.add(watch="no match")
 
             except Exception as e:
-                self.logger.warning(f"[MULTI-SOURCE]   poe.watch lookup failed: {e}", exc_info=True)
+                self.logger.warning("[MULTI-SOURCE] poe.watch lookup failed: %s", e, exc_info=True)
                 watch_price = None
         else:
-            self.logger.info("[MULTI-SOURCE] Skipping poe.watch (not initialized)")
+            trace.add(watch="not initialized")
 
         # Decision logic
-        self.logger.info("[MULTI-SOURCE] Making pricing decision...")
-
         if ninja_price is not None and watch_price is not None:
             # Both sources available - compare and validate
             diff_pct = abs(ninja_price - watch_price) / max(ninja_price, watch_price)
-            self.logger.info(f"[MULTI-SOURCE] Both sources available - price difference: {diff_pct*100:.1f}%")
+            trace.add(diff_pct=round(diff_pct * 100, 1))
 
             if diff_pct <= 0.20:  # Within 20% - good agreement
                 # Use poe.ninja (faster updates) but note validation
-                self.logger.info(f"[MULTI-SOURCE] ✓ Decision: Using poe.ninja {ninja_price:.1f}c (validated by poe.watch, high confidence)")
+                trace.emit(decision="poe.ninja validated", confidence="high")
                 return (
                     ninja_price,
                     ninja_count,
@@ -1028,7 +1080,7 @@ class PriceService:
                 )
             elif watch_confidence == "low":
                 # poe.watch flagged as low confidence, trust ninja
-                self.logger.info(f"[MULTI-SOURCE] ✓ Decision: Using poe.ninja {ninja_price:.1f}c (poe.watch low confidence, medium confidence)")
+                trace.emit(decision="poe.ninja (watch low confidence)", confidence="medium")
                 return (
                     ninja_price,
                     ninja_count,
@@ -1038,11 +1090,7 @@ class PriceService:
             else:
                 # Significant divergence - average them
                 avg_price = (ninja_price + watch_price) / 2
-                self.logger.info(
-                    f"[MULTI-SOURCE] ⚠ Price divergence for {item_name}: "
-                    f"ninja={ninja_price:.1f}c, watch={watch_price:.1f}c, "
-                    f"using average={avg_price:.1f}c (medium confidence)"
-                )
+                trace.emit(decision="averaged (divergence)", price=avg_price, confidence="medium")
                 return (
                     avg_price,
                     max(ninja_count, watch_daily),
@@ -1052,7 +1100,7 @@ class PriceService:
 
         elif ninja_price is not None:
             # Only poe.ninja available
-            self.logger.info(f"[MULTI-SOURCE] ✓ Decision: Using poe.ninja only {ninja_price:.1f}c (medium confidence)")
+            trace.emit(decision="poe.ninja only", confidence="medium")
             return (
                 ninja_price,
                 ninja_count,
@@ -1062,7 +1110,7 @@ class PriceService:
 
         elif watch_price is not None:
             # Only poe.watch available
-            self.logger.info(f"[MULTI-SOURCE] ✓ Decision: Using poe.watch only {watch_price:.1f}c ({watch_confidence} confidence)")
+            trace.emit(decision="poe.watch only", confidence=watch_confidence)
             return (
                 watch_price,
                 watch_daily,
@@ -1072,7 +1120,7 @@ class PriceService:
 
         else:
             # No prices found
-            self.logger.info("[MULTI-SOURCE] ✗ Decision: No prices found from any source")
+            trace.emit(decision="not found", confidence="none")
             return (0.0, 0, "not found", "none")
 
     def _parse_links(self, parsed: Any) -> Optional[int]:
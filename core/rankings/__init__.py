@@ -8,7 +8,8 @@ Provides cached top 20 items by median price for various categories:
 - Divination Cards
 - Essences, Fossils, Scarabs, Oils, Incubators, Vials
 
-Cache is stored locally and only refreshed after 24 hours.
+Rankings are stored in a local SQLite database and each category is
+refreshed once it expires (24 hours by default, sooner for currency).
 
 Usage:
     from core.rankings import (
@@ -41,6 +42,7 @@ from core.rankings.models import (
 # Constants
 from core.rankings.constants import (
     CACHE_EXPIRY_DAYS,
+    CATEGORY_EXPIRY_HOURS,
     SECONDS_PER_DAY,
     CATEGORIES,
     CATEGORY_TO_API_TYPE,
@@ -52,8 +54,12 @@ from core.rankings.constants import (
     CARD_CATEGORIES,
     CATEGORY_TO_RARITY,
     get_rarity_for_category,
+    get_expiry_seconds,
 )
 
+# Storage
+from core.rankings.store import RankingStore
+
 # Cache
 from core.rankings.cache import PriceRankingCache
 
@@ -95,30 +101,29 @@ def get_rankings_by_group(
     Returns:
         Dict of category -> CategoryRanking for the specified group
     """
-    cache = PriceRankingCache(cache_dir=cache_dir, league=league)
-    calculator = Top20Calculator(cache)
+    with PriceRankingCache(cache_dir=cache_dir, league=league) as cache:
+        calculator = Top20Calculator(cache)
 
-    group_lower = group.lower()
+        group_lower = group.lower()
 
-    if group_lower in ("uniques", "equipment"):
-        categories = UNIQUE_CATEGORIES
-    elif group_lower == "consumables":
-        categories = CONSUMABLE_CATEGORIES
-    elif group_lower == "cards":
-        categories = CARD_CATEGORIES
-    elif group_lower == "all":
-        return calculator.refresh_all(force=force_refresh)
-    else:
-        logger.warning(f"Unknown group: {group}, returning all")
-        return calculator.refresh_all(force=force_refresh)
+        if group_lower in ("uniques", "equipment"):
+            categories = UNIQUE_CATEGORIES
+        elif group_lower == "consumables":
+            categories = CONSUMABLE_CATEGORIES
+        elif group_lower == "cards":
+            categories = CARD_CATEGORIES
+        elif group_lower == "all":
+            return calculator.refresh_all(force=force_refresh)
+        else:
+            logger.warning(f"Unknown group: {group}, returning all")
+            return calculator.refresh_all(force=force_refresh)
 
-    # Refresh only the specified categories
-    for category in categories:
-        calculator.refresh_category(category, force=force_refresh)
+        # Refresh only the specified categories
+        calculator.refresh_categories(categories, force=force_refresh)
 
-    # Return only the requested categories
-    all_rankings = cache.get_all_rankings()
-    return {k: v for k, v in all_rankings.items() if k in categories}
+        # Return only the requested categories
+        all_rankings = cache.get_all_rankings()
+        return {k: v for k, v in all_rankings.items() if k in categories}
 
 
 def get_top20_rankings(
@@ -137,9 +142,8 @@ def get_top20_rankings(
     Returns:
         Dict of category -> CategoryRanking
     """
-    cache = PriceRankingCache(cache_dir=cache_dir, league=league)
-    calculator = Top20Calculator(cache)
-    return calculator.refresh_all(force=force_refresh)
+    with PriceRankingCache(cache_dir=cache_dir, league=league) as cache:
+        return Top20Calculator(cache).refresh_all(force=force_refresh)
 
 
 def get_top20_for_category(
@@ -160,9 +164,8 @@ def get_top20_for_category(
     Returns:
         CategoryRanking if successful
     """
-    cache = PriceRankingCache(cache_dir=cache_dir, league=league)
-    calculator = Top20Calculator(cache)
-    return calculator.refresh_category(category, force=force_refresh)
+    with PriceRankingCache(cache_dir=cache_dir, league=league) as cache:
+        return Top20Calculator(cache).refresh_category(category, force=force_refresh)
 
 
 def get_top20_for_slot(
@@ -183,9 +186,8 @@ def get_top20_for_slot(
     Returns:
         CategoryRanking if successful
     """
-    cache = PriceRankingCache(cache_dir=cache_dir, league=league)
-    calculator = Top20Calculator(cache)
-    return calculator.refresh_slot(slot, force=force_refresh)
+    with PriceRankingCache(cache_dir=cache_dir, league=league) as cache:
+        return Top20Calculator(cache).refresh_slot(slot, force=force_refresh)
 
 
 def get_all_slot_rankings(
@@ -204,9 +206,8 @@ def get_all_slot_rankings(
     Returns:
         Dict of slot_key -> CategoryRanking
     """
-    cache = PriceRankingCache(cache_dir=cache_dir, league=league)
-    calculator = Top20Calculator(cache)
-    return calculator.refresh_all_slots(force=force_refresh)
+    with PriceRankingCache(cache_dir=cache_dir, league=league) as cache:
+        return Top20Calculator(cache).refresh_all_slots(force=force_refresh)
 
 
 __all__ = [
@@ -215,6 +216,7 @@ __all__ = [
     "CategoryRanking",
     # Constants
     "CACHE_EXPIRY_DAYS",
+    "CATEGORY_EXPIRY_HOURS",
     "SECONDS_PER_DAY",
     "CATEGORIES",
     "CATEGORY_TO_API_TYPE",
@@ -226,6 +228,9 @@ __all__ = [
     "CARD_CATEGORIES",
     "CATEGORY_TO_RARITY",
     "get_rarity_for_category",
+    "get_expiry_seconds",
+    # Storage
+    "RankingStore",
     # Cache
     "PriceRankingCache",
     # Calculator
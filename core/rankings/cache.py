@@ -1,7 +1,8 @@
 """
-Price ranking cache with file-based storage.
+Price ranking cache with SQLite storage.
 
-Manages cached price rankings stored in JSON format.
+Manages cached price rankings in the rankings database (see store.py),
+with a per-category expiry.
 """
 from __future__ import annotations
 
@@ -9,26 +10,43 @@ import json
 import logging
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from core.rankings.models import CategoryRanking
 from core.rankings.constants import (
-    CACHE_EXPIRY_DAYS,
     SECONDS_PER_DAY,
     CATEGORIES,
     CATEGORY_TO_API_TYPE,
     EQUIPMENT_SLOTS,
     SLOT_DISPLAY_NAMES,
+    RANKINGS_DB_NAME,
+    get_expiry_seconds,
 )
+from core.rankings.store import RankingStore, to_utc_text
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp (assumed UTC if naive), or None if invalid."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
 class PriceRankingCache:
     """
-    Manages cached price rankings with file-based storage.
+    Manages cached price rankings stored in SQLite.
 
-    Rankings are stored in JSON format and refreshed after 24 hours.
+    Each category expires on its own schedule (see CATEGORY_EXPIRY_HOURS),
+    and saving a category replaces just that category's rows in one
+    transaction, so refresh threads can save concurrently.
     """
 
     # Re-export constants as class attributes for backward compatibility
@@ -37,13 +55,19 @@ class PriceRankingCache:
     EQUIPMENT_SLOTS = EQUIPMENT_SLOTS
     SLOT_DISPLAY_NAMES = SLOT_DISPLAY_NAMES
 
-    def __init__(self, cache_dir: Optional[Path] = None, league: str = "Standard"):
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        league: str = "Standard",
+        store: Optional[RankingStore] = None,
+    ):
         """
         Initialize the price ranking cache.
 
         Args:
-            cache_dir: Directory for cache files. Defaults to ~/.poe_price_checker/
+            cache_dir: Directory for the rankings database. Defaults to ~/.poe_price_checker/
             league: League name for pricing data
+            store: Existing RankingStore to share (e.g. with PriceRankingHistory)
         """
         if cache_dir is None:
             cache_dir = Path.home() / ".poe_price_checker"
@@ -52,100 +76,85 @@ class PriceRankingCache:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         self.league = league
-        self._cache_file = self.cache_dir / f"price_rankings_{league.lower().replace(' ', '_')}.json"
+        # Pre-SQLite cache file, imported once if still present
+        self._legacy_file = self.cache_dir / f"price_rankings_{league.lower().replace(' ', '_')}.json"
 
-        # In-memory cache
-        self._rankings: Dict[str, CategoryRanking] = {}
-        self._cache_metadata: Dict[str, Any] = {}
+        self._owns_store = store is None
+        self.store = store if store is not None else RankingStore(self.cache_dir / RANKINGS_DB_NAME)
 
-        # Load existing cache
-        self._load_cache()
+        self._import_legacy_file()
 
         logger.info(f"PriceRankingCache initialized for league: {league}")
 
-    def _load_cache(self) -> None:
-        """Load rankings from cache file."""
-        if not self._cache_file.exists():
-            logger.info("No cache file found, will fetch fresh data")
+    def _import_legacy_file(self) -> None:
+        """Move rankings from the old JSON cache file into the database."""
+        if not self._legacy_file.exists():
             return
 
         try:
-            with open(self._cache_file, 'r', encoding='utf-8') as f:
+            with open(self._legacy_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-
-            self._cache_metadata = data.get("metadata", {})
-
-            for cat_data in data.get("rankings", []):
-                ranking = CategoryRanking.from_dict(cat_data)
-                self._rankings[ranking.category] = ranking
-
-            logger.info(f"Loaded {len(self._rankings)} category rankings from cache")
-
+            rankings = [CategoryRanking.from_dict(cat_data) for cat_data in data.get("rankings", [])]
         except Exception as e:
-            logger.warning(f"Failed to load cache: {e}")
-            self._rankings = {}
-            self._cache_metadata = {}
+            logger.warning(f"Failed to read legacy rankings cache {self._legacy_file}: {e}")
+            return
 
-    def _save_cache(self) -> None:
-        """Save rankings to cache file."""
-        try:
-            data = {
-                "metadata": {
-                    "league": self.league,
-                    "last_updated": datetime.now(timezone.utc).isoformat(),
-                    "version": 1,
-                },
-                "rankings": [ranking.to_dict() for ranking in self._rankings.values()],
-            }
+        if not self.store.has_rankings(self.league):
+            for ranking in rankings:
+                self.set_ranking(ranking)
+            logger.info(f"Imported {len(rankings)} category rankings from {self._legacy_file.name}")
 
-            with open(self._cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+        self._legacy_file.unlink(missing_ok=True)
 
-            logger.info(f"Saved {len(self._rankings)} category rankings to cache")
+    def set_ranking(self, ranking: CategoryRanking) -> None:
+        """
+        Save (replace) the ranking for its category.
 
-        except Exception as e:
-            logger.error(f"Failed to save cache: {e}")
+        The expiry is counted from ranking.updated_at using the category's
+        TTL; a ranking without a valid updated_at is stored as expired.
+        """
+        updated_dt = _parse_timestamp(ranking.updated_at)
+        expires_at = None
+        if updated_dt is not None:
+            expires_at = to_utc_text(updated_dt + timedelta(seconds=get_expiry_seconds(ranking.category)))
+        self.store.upsert_ranking(self.league, ranking, expires_at)
 
     def is_cache_valid(self, category: Optional[str] = None) -> bool:
         """
         Check if cache is still valid (not expired).
 
         Args:
-            category: Specific category to check, or None for overall cache
+            category: Specific category to check, or None for every
+                category in CATEGORIES
 
         Returns:
             True if cache is valid and not expired
         """
+        fresh = set(self.store.fresh_categories(self.league, to_utc_text(datetime.now(timezone.utc))))
         if category:
-            ranking = self._rankings.get(category)
-            if not ranking or not ranking.updated_at:
-                return False
-            updated_at = ranking.updated_at
-        else:
-            updated_at_raw = self._cache_metadata.get("last_updated")
-            if not updated_at_raw:
-                return False
-            updated_at = str(updated_at_raw)
+            return category in fresh
+        return all(key in fresh for key in CATEGORIES)
 
-        try:
-            updated_dt = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-            expiry = updated_dt + timedelta(days=CACHE_EXPIRY_DAYS)
-            return datetime.now(timezone.utc) < expiry
-        except (ValueError, AttributeError):
-            return False
+    def get_stale_categories(self, categories: List[str]) -> List[str]:
+        """
+        Filter categories down to those missing or expired.
 
-    def get_cache_age_days(self) -> Optional[float]:
-        """Get the age of the cache in days."""
-        updated_at = self._cache_metadata.get("last_updated")
-        if not updated_at:
-            return None
+        Args:
+            categories: Category keys to check
 
-        try:
-            updated_dt = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-            age = datetime.now(timezone.utc) - updated_dt
-            return age.total_seconds() / SECONDS_PER_DAY
-        except (ValueError, AttributeError):
+        Returns:
+            Keys needing a refresh, in the given order
+        """
+        fresh = set(self.store.fresh_categories(self.league, to_utc_text(datetime.now(timezone.utc))))
+        return [key for key in categories if key not in fresh]
+
+    def get_cache_age_days(self) -> Optional[float]:
+        """Get the age of the cache (its oldest category) in days."""
+        updated_dt = _parse_timestamp(self.store.oldest_update(self.league))
+        if updated_dt is None:
             return None
+        age = datetime.now(timezone.utc) - updated_dt
+        return age.total_seconds() / SECONDS_PER_DAY
 
     def get_ranking(self, category: str) -> Optional[CategoryRanking]:
         """
@@ -157,16 +166,28 @@ class PriceRankingCache:
         Returns:
             CategoryRanking if cached, None otherwise
         """
-        return self._rankings.get(category)
+        rankings = self.store.load_rankings(self.league, category)
+        return rankings[0] if rankings else None
 
     def get_all_rankings(self) -> Dict[str, CategoryRanking]:
         """Get all cached rankings."""
-        return self._rankings.copy()
+        return {ranking.category: ranking for ranking in self.store.load_rankings(self.league)}
 
     def clear_cache(self) -> None:
-        """Clear all cached data."""
-        self._rankings = {}
-        self._cache_metadata = {}
-        if self._cache_file.exists():
-            self._cache_file.unlink()
+        """Clear all cached data for this league."""
+        self.store.delete_rankings(self.league)
+        self._legacy_file.unlink(missing_ok=True)
         logger.info("Cache cleared")
+
+    def close(self) -> None:
+        """Close the database connection if this cache opened it."""
+        if self._owns_store:
+            self.store.close()
+
+    def __enter__(self) -> "PriceRankingCache":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit - ensures connection is closed."""
+        self.close()
@@ -2,15 +2,18 @@
 Top 20 price ranking calculator.
 
 Calculates top 20 items by price for each category using PoE Ninja API.
+Categories and slots are fetched concurrently; every request still passes
+through the API client's rate limiter and response cache.
 """
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 from core.rankings.models import RankedItem, CategoryRanking
-from core.rankings.constants import get_rarity_for_category
+from core.rankings.constants import REFRESH_MAX_WORKERS, get_rarity_for_category
 from core.rankings.cache import PriceRankingCache
 
 logger = logging.getLogger(__name__)
@@ -58,21 +61,55 @@ class Top20Calculator:
             return self.cache.get_all_rankings()
 
         logger.info("Refreshing all price rankings...")
+        self.refresh_categories(PriceRankingCache.CATEGORIES, force=force)
+        return self.cache.get_all_rankings()
+
+    def refresh_categories(self, categories: Iterable[str], force: bool = False) -> Dict[str, CategoryRanking]:
+        """
+        Refresh several categories concurrently.
+
+        Only missing or expired categories are fetched unless forced.
+
+        Args:
+            categories: Category keys to refresh
+            force: If True, refresh even if cache is valid
+
+        Returns:
+            Dict of category -> CategoryRanking for the categories refreshed
+        """
+        keys = list(categories)
+        if not force:
+            keys = self.cache.get_stale_categories(keys)
+        if not keys:
+            return {}
 
-        # Get divine rate for conversions
         divine_rate = self.api.ensure_divine_rate()
+        return self._refresh_parallel(keys, self._refresh_category, divine_rate)
+
+    def _refresh_parallel(
+        self,
+        keys: List[str],
+        refresh: Callable[[str, float], Optional[CategoryRanking]],
+        divine_rate: float,
+    ) -> Dict[str, CategoryRanking]:
+        """
+        Run ``refresh(key, divine_rate)`` for each key in a bounded pool.
 
-        # Refresh each category
-        for category in PriceRankingCache.CATEGORIES:
+        Each refresh saves its own ranking, so one slow or failing category
+        doesn't hold back (or discard) the others.
+        """
+        def run(key: str) -> Optional[CategoryRanking]:
             try:
-                self._refresh_category(category, divine_rate)
+                return refresh(key, divine_rate)
             except Exception as e:
-                logger.error(f"Failed to refresh {category}: {e}")
+                logger.error(f"Failed to refresh {key}: {e}")
+                return None
 
-        # Save to file
-        self.cache._save_cache()
+        workers = min(REFRESH_MAX_WORKERS, len(keys))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rankings") as pool:
+            rankings = list(pool.map(run, keys))
 
-        return self.cache.get_all_rankings()
+        return {ranking.category: ranking for ranking in rankings if ranking is not None}
 
     def refresh_category(self, category: str, force: bool = False) -> Optional[CategoryRanking]:
         """
@@ -89,9 +126,7 @@ class Top20Calculator:
             return self.cache.get_ranking(category)
 
         divine_rate = self.api.ensure_divine_rate()
-        ranking = self._refresh_category(category, divine_rate)
-        self.cache._save_cache()
-        return ranking
+        return self._refresh_category(category, divine_rate)
 
     def _refresh_category(self, category: str, divine_rate: float) -> Optional[CategoryRanking]:
         """
@@ -126,7 +161,7 @@ class Top20Calculator:
                 updated_at=datetime.now(timezone.utc).isoformat(),
             )
 
-            self.cache._rankings[category] = ranking
+            self.cache.set_ranking(ranking)
             logger.info(f"Got {len(items)} items for {display_name}")
             return ranking
 
@@ -216,12 +251,7 @@ class Top20Calculator:
             return self.cache.get_ranking(slot_key)
 
         divine_rate = self.api.ensure_divine_rate()
-        ranking = self._refresh_slot(slot, divine_rate)
-
-        if ranking:
-            self.cache._save_cache()
-
-        return ranking
+        return self._refresh_slot(slot, divine_rate)
 
     def _refresh_slot(self, slot: str, divine_rate: float) -> Optional[CategoryRanking]:
         """
@@ -257,7 +287,7 @@ class Top20Calculator:
                 updated_at=datetime.now(timezone.utc).isoformat(),
             )
 
-            self.cache._rankings[slot_key] = ranking
+            self.cache.set_ranking(ranking)
             logger.info(f"Got {len(items)} items for {display_name}")
             return ranking
 
@@ -327,19 +357,28 @@ class Top20Calculator:
         """
         Refresh top 20 for all equipment slots.
 
+        Slots sharing an API type (e.g. every armour slot) share one
+        request through the API client's cache.
+
         Args:
             force: If True, refresh even if cache is valid
 
         Returns:
             Dict of slot_key -> CategoryRanking
         """
-        divine_rate = self.api.ensure_divine_rate()
-        results = {}
-
-        for slot in PriceRankingCache.EQUIPMENT_SLOTS:
-            ranking = self._refresh_slot(slot, divine_rate)
-            if ranking:
-                results[ranking.category] = ranking
-
-        self.cache._save_cache()
+        slots = list(PriceRankingCache.EQUIPMENT_SLOTS)
+        if not force:
+            stale = set(self.cache.get_stale_categories([f"slot_{slot}" for slot in slots]))
+            slots = [slot for slot in slots if f"slot_{slot}" in stale]
+
+        results: Dict[str, CategoryRanking] = {}
+        if slots:
+            divine_rate = self.api.ensure_divine_rate()
+            results = self._refresh_parallel(slots, self._refresh_slot, divine_rate)
+
+        if not force:
+            # Include the slots that were still valid
+            for key, ranking in self.cache.get_all_rankings().items():
+                if key.startswith("slot_"):
+                    results.setdefault(key, ranking)
         return results
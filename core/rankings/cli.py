@@ -116,8 +116,12 @@ Examples:
         league = api.detect_current_league()
         print(f"Using league: {league}")
 
-    # Initialize cache
-    cache = PriceRankingCache(league=league)
+    with PriceRankingCache(league=league) as cache:
+        _run_command(args, cache, league)
+
+
+def _run_command(args: argparse.Namespace, cache: PriceRankingCache, league: str) -> None:
+    """Run the requested rankings command against an open cache."""
     calculator = Top20Calculator(cache)
 
     # Handle item history
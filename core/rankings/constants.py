@@ -12,6 +12,20 @@ CACHE_EXPIRY_DAYS = 1
 # Time constants
 SECONDS_PER_DAY = 86400
 
+# Per-category cache expiry overrides in hours (others use CACHE_EXPIRY_DAYS).
+# Currency rates move through the day; the rest barely changes.
+CATEGORY_EXPIRY_HOURS: Dict[str, float] = {
+    "currency": 6,
+    "fragments": 12,
+}
+
+# SQLite file holding cached rankings and historical snapshots
+RANKINGS_DB_NAME = "price_rankings.db"
+
+# Upper bound on concurrent category fetches during a refresh; all of them
+# still go through the API client's shared rate limiter
+REFRESH_MAX_WORKERS = 16
+
 # Category definitions with display names
 CATEGORIES: Dict[str, str] = {
     # Currency
@@ -166,3 +180,19 @@ def get_rarity_for_category(category: str) -> str:
         return "unique"
 
     return CATEGORY_TO_RARITY.get(category, "normal")
+
+
+def get_expiry_seconds(category: str) -> float:
+    """
+    Get how long a cached ranking stays valid.
+
+    Args:
+        category: Category key (e.g., "currency", "slot_helmet")
+
+    Returns:
+        Expiry in seconds
+    """
+    hours = CATEGORY_EXPIRY_HOURS.get(category)
+    if hours is not None:
+        return hours * 3600
+    return CACHE_EXPIRY_DAYS * SECONDS_PER_DAY
@@ -1,18 +1,20 @@
 """
 Historical price ranking storage.
 
-SQLite-based storage for daily price ranking snapshots.
+SQLite-based storage for daily price ranking snapshots, kept in the same
+rankings database as the current cache (see store.py).
 """
 from __future__ import annotations
 
 import logging
-import sqlite3
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from core.rankings.models import RankedItem, CategoryRanking
 from core.rankings.cache import PriceRankingCache
+from core.rankings.constants import RANKINGS_DB_NAME
+from core.rankings.store import RankingStore
 
 logger = logging.getLogger(__name__)
 
@@ -24,58 +26,26 @@ class PriceRankingHistory:
     Stores daily snapshots for trend analysis and historical queries.
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, store: Optional[RankingStore] = None):
         """
         Initialize historical storage.
 
         Args:
             db_path: Path to SQLite database. Defaults to ~/.poe_price_checker/price_rankings.db
+            store: Existing RankingStore to share (e.g. a PriceRankingCache's);
+                takes precedence over db_path
         """
-        if db_path is None:
-            db_path = Path.home() / ".poe_price_checker" / "price_rankings.db"
-
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.db_path = db_path
-
-        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
-        self._initialize_schema()
-
-        logger.info(f"PriceRankingHistory initialized: {db_path}")
-
-    def _initialize_schema(self) -> None:
-        """Create tables if they don't exist."""
-        self.conn.executescript("""
-            CREATE TABLE IF NOT EXISTS ranking_snapshots (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                league TEXT NOT NULL,
-                category TEXT NOT NULL,
-                snapshot_date DATE NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(league, category, snapshot_date)
-            );
-
-            CREATE TABLE IF NOT EXISTS ranked_items (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                snapshot_id INTEGER NOT NULL REFERENCES ranking_snapshots(id) ON DELETE CASCADE,
-                rank INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                chaos_value REAL NOT NULL,
-                divine_value REAL,
-                base_type TEXT,
-                item_class TEXT
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_snapshots_league_date
-                ON ranking_snapshots(league, snapshot_date);
-
-            CREATE INDEX IF NOT EXISTS idx_items_snapshot
-                ON ranked_items(snapshot_id);
-
-            CREATE INDEX IF NOT EXISTS idx_items_name
-                ON ranked_items(name);
-        """)
-        self.conn.commit()
+        self._owns_store = store is None
+        if store is None:
+            if db_path is None:
+                db_path = Path.home() / ".poe_price_checker" / RANKINGS_DB_NAME
+            store = RankingStore(db_path)
+
+        self.store = store
+        self.db_path = store.db_path
+        self.conn = store.conn
+
+        logger.info(f"PriceRankingHistory initialized: {self.db_path}")
 
     def save_snapshot(self, ranking: CategoryRanking, league: str) -> int:
         """
@@ -90,27 +60,26 @@ class PriceRankingHistory:
         """
         today = datetime.now(timezone.utc).date().isoformat()
 
-        cursor = self.conn.cursor()
-
-        # Insert or replace snapshot
-        cursor.execute("""
-            INSERT OR REPLACE INTO ranking_snapshots (league, category, snapshot_date)
-            VALUES (?, ?, ?)
-        """, (league, ranking.category, today))
+        with self.store.transaction() as conn:
+            # Insert or replace snapshot
+            cursor = conn.execute("""
+                INSERT OR REPLACE INTO ranking_snapshots (league, category, snapshot_date)
+                VALUES (?, ?, ?)
+            """, (league, ranking.category, today))
 
-        snapshot_id = cursor.lastrowid or 0
+            snapshot_id = cursor.lastrowid or 0
 
-        # Delete old items for this snapshot (in case of replace)
-        cursor.execute("DELETE FROM ranked_items WHERE snapshot_id = ?", (snapshot_id,))
+            # Delete old items for this snapshot (in case of replace)
+            conn.execute("DELETE FROM ranked_items WHERE snapshot_id = ?", (snapshot_id,))
 
-        # Insert new items
-        for item in ranking.items:
-            cursor.execute("""
+            conn.executemany("""
                 INSERT INTO ranked_items (snapshot_id, rank, name, chaos_value, divine_value, base_type, item_class)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (snapshot_id, item.rank, item.name, item.chaos_value, item.divine_value, item.base_type, item.item_class))
+            """, [
+                (snapshot_id, item.rank, item.name, item.chaos_value, item.divine_value, item.base_type, item.item_class)
+                for item in ranking.items
+            ])
 
-        self.conn.commit()
         logger.debug(f"Saved snapshot for {ranking.category} ({league}): {len(ranking.items)} items")
         return snapshot_id
 
@@ -155,8 +124,7 @@ class PriceRankingHistory:
 
         query += " ORDER BY s.snapshot_date DESC"
 
-        cursor = self.conn.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in self.store.fetchall(query, params)]
 
     def get_trending_items(
         self,
@@ -181,22 +149,22 @@ class PriceRankingHistory:
         past = (datetime.now(timezone.utc) - timedelta(days=days)).date().isoformat()
 
         # Get current prices
-        cursor = self.conn.execute("""
+        rows = self.store.fetchall("""
             SELECT i.name, i.chaos_value as new_price
             FROM ranked_items i
             JOIN ranking_snapshots s ON i.snapshot_id = s.id
             WHERE s.league = ? AND s.category = ? AND s.snapshot_date = ?
         """, (league, category, today))
-        current_prices = {row["name"]: row["new_price"] for row in cursor.fetchall()}
+        current_prices = {row["name"]: row["new_price"] for row in rows}
 
         # Get past prices
-        cursor = self.conn.execute("""
+        rows = self.store.fetchall("""
             SELECT i.name, i.chaos_value as old_price
             FROM ranked_items i
             JOIN ranking_snapshots s ON i.snapshot_id = s.id
             WHERE s.league = ? AND s.category = ? AND s.snapshot_date = ?
         """, (league, category, past))
-        past_prices = {row["name"]: row["old_price"] for row in cursor.fetchall()}
+        past_prices = {row["name"]: row["old_price"] for row in rows}
 
         # Calculate changes
         trending = []
@@ -228,8 +196,7 @@ class PriceRankingHistory:
 
         query += " ORDER BY snapshot_date DESC"
 
-        cursor = self.conn.execute(query, params)
-        return [row[0] for row in cursor.fetchall()]
+        return [row[0] for row in self.store.fetchall(query, params)]
 
     def get_category_snapshot(
         self,
@@ -250,25 +217,24 @@ class PriceRankingHistory:
         """
         if date is None:
             # Get latest snapshot
-            cursor = self.conn.execute("""
+            row = self.store.fetchone("""
                 SELECT id, snapshot_date FROM ranking_snapshots
                 WHERE league = ? AND category = ?
                 ORDER BY snapshot_date DESC LIMIT 1
             """, (league, category))
         else:
-            cursor = self.conn.execute("""
+            row = self.store.fetchone("""
                 SELECT id, snapshot_date FROM ranking_snapshots
                 WHERE league = ? AND category = ? AND snapshot_date = ?
             """, (league, category, date))
 
-        row = cursor.fetchone()
         if not row:
             return None
 
         snapshot_id = row["id"]
 
         # Get items
-        cursor = self.conn.execute("""
+        item_rows = self.store.fetchall("""
             SELECT rank, name, chaos_value, divine_value, base_type, item_class
             FROM ranked_items WHERE snapshot_id = ?
             ORDER BY rank
@@ -283,7 +249,7 @@ class PriceRankingHistory:
                 base_type=r["base_type"],
                 item_class=r["item_class"],
             )
-            for r in cursor.fetchall()
+            for r in item_rows
         ]
 
         display_name = PriceRankingCache.CATEGORIES.get(category, category)
@@ -295,8 +261,9 @@ class PriceRankingHistory:
         )
 
     def close(self) -> None:
-        """Close database connection."""
-        self.conn.close()
+        """Close database connection (unless it belongs to a shared store)."""
+        if self._owns_store:
+            self.store.close()
 
     def __enter__(self) -> "PriceRankingHistory":
         """Context manager entry."""
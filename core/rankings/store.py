@@ -0,0 +1,265 @@
+"""
+SQLite storage for price rankings.
+
+One database holds both the current cached rankings (used by
+PriceRankingCache) and the daily snapshots (used by PriceRankingHistory).
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from core.rankings.models import RankedItem, CategoryRanking
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_SQL = """
+    -- Current rankings, one row per (league, category)
+    CREATE TABLE IF NOT EXISTS ranking_categories (
+        league TEXT NOT NULL,
+        category TEXT NOT NULL,
+        display_name TEXT NOT NULL,
+        updated_at TEXT,
+        expires_at TEXT,
+        PRIMARY KEY (league, category)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_ranking_categories_expiry
+        ON ranking_categories(league, expires_at);
+
+    CREATE TABLE IF NOT EXISTS ranking_category_items (
+        league TEXT NOT NULL,
+        category TEXT NOT NULL,
+        rank INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        chaos_value REAL NOT NULL,
+        divine_value REAL,
+        base_type TEXT,
+        icon TEXT,
+        item_class TEXT,
+        rarity TEXT,
+        PRIMARY KEY (league, category, rank)
+    ) WITHOUT ROWID;
+
+    -- Daily snapshots for history and trends
+    CREATE TABLE IF NOT EXISTS ranking_snapshots (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        league TEXT NOT NULL,
+        category TEXT NOT NULL,
+        snapshot_date DATE NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(league, category, snapshot_date)
+    );
+
+    CREATE TABLE IF NOT EXISTS ranked_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        snapshot_id INTEGER NOT NULL REFERENCES ranking_snapshots(id) ON DELETE CASCADE,
+        rank INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        chaos_value REAL NOT NULL,
+        divine_value REAL,
+        base_type TEXT,
+        item_class TEXT
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_snapshots_league_date
+        ON ranking_snapshots(league, snapshot_date);
+
+    CREATE INDEX IF NOT EXISTS idx_items_snapshot
+        ON ranked_items(snapshot_id);
+
+    CREATE INDEX IF NOT EXISTS idx_items_name
+        ON ranked_items(name);
+"""
+
+
+def to_utc_text(value: datetime) -> str:
+    """Format a timestamp the way the store compares them (UTC, seconds)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+class RankingStore:
+    """
+    Thread-safe SQLite connection shared by the ranking cache and history.
+
+    Writes go through transaction(), so a category's ranking row and its
+    items are replaced atomically even when several refresh threads save
+    at once.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Open (and create if needed) the rankings database.
+
+        Args:
+            db_path: Path to the SQLite file
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.RLock()
+
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=10)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        try:
+            # Cache and history may open the same file separately
+            self.conn.execute("PRAGMA journal_mode = WAL")
+        except sqlite3.DatabaseError as e:
+            logger.debug(f"WAL unavailable for {db_path}: {e}")
+        self.conn.executescript(SCHEMA_SQL)
+        self.conn.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements under the lock and commit (or roll back) together."""
+        with self._lock:
+            try:
+                yield self.conn
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+
+    def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+        """Thread-safe fetchone helper."""
+        with self._lock:
+            row: Optional[sqlite3.Row] = self.conn.execute(sql, params).fetchone()
+            return row
+
+    def fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        """Thread-safe fetchall helper."""
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    # ------------------------------------------------------------------
+    # Current rankings
+    # ------------------------------------------------------------------
+
+    def upsert_ranking(self, league: str, ranking: CategoryRanking, expires_at: Optional[str]) -> None:
+        """
+        Replace the stored ranking for a category.
+
+        Args:
+            league: League name
+            ranking: Ranking to store
+            expires_at: UTC expiry (see to_utc_text), or None if unknown
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO ranking_categories (league, category, display_name, updated_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(league, category) DO UPDATE SET
+                    display_name = excluded.display_name,
+                    updated_at = excluded.updated_at,
+                    expires_at = excluded.expires_at
+                """,
+                (league, ranking.category, ranking.display_name, ranking.updated_at, expires_at),
+            )
+            conn.execute(
+                "DELETE FROM ranking_category_items WHERE league = ? AND category = ?",
+                (league, ranking.category),
+            )
+            conn.executemany(
+                """
+                INSERT INTO ranking_category_items
+                    (league, category, rank, name, chaos_value, divine_value,
+                     base_type, icon, item_class, rarity)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (league, ranking.category, item.rank, item.name, item.chaos_value,
+                     item.divine_value, item.base_type, item.icon, item.item_class, item.rarity)
+                    for item in ranking.items
+                ],
+            )
+
+    def load_rankings(self, league: str, category: Optional[str] = None) -> List[CategoryRanking]:
+        """
+        Load stored rankings for a league.
+
+        Args:
+            league: League name
+            category: Only this category, if given
+
+        Returns:
+            Rankings with their items in rank order
+        """
+        where = "league = ?"
+        params: List[Any] = [league]
+        if category is not None:
+            where += " AND category = ?"
+            params.append(category)
+
+        with self._lock:
+            headers = self.conn.execute(
+                f"SELECT category, display_name, updated_at FROM ranking_categories WHERE {where}",  # nosec B608
+                params,
+            ).fetchall()
+            item_rows = self.conn.execute(
+                f"SELECT * FROM ranking_category_items WHERE {where} ORDER BY category, rank",  # nosec B608
+                params,
+            ).fetchall()
+
+        items_by_category: Dict[str, List[RankedItem]] = {}
+        for row in item_rows:
+            items_by_category.setdefault(row["category"], []).append(RankedItem(
+                rank=row["rank"],
+                name=row["name"],
+                chaos_value=row["chaos_value"],
+                divine_value=row["divine_value"],
+                base_type=row["base_type"],
+                icon=row["icon"],
+                item_class=row["item_class"],
+                rarity=row["rarity"],
+            ))
+
+        return [
+            CategoryRanking(
+                category=row["category"],
+                display_name=row["display_name"],
+                items=items_by_category.get(row["category"], []),
+                updated_at=row["updated_at"],
+            )
+            for row in headers
+        ]
+
+    def fresh_categories(self, league: str, now: str) -> List[str]:
+        """Categories of a league whose rankings expire after ``now``."""
+        rows = self.fetchall(
+            "SELECT category FROM ranking_categories WHERE league = ? AND expires_at > ?",
+            (league, now),
+        )
+        return [row["category"] for row in rows]
+
+    def oldest_update(self, league: str) -> Optional[str]:
+        """Earliest updated_at among a league's stored rankings."""
+        row = self.fetchone(
+            "SELECT MIN(updated_at) FROM ranking_categories WHERE league = ?",
+            (league,),
+        )
+        return row[0] if row else None
+
+    def has_rankings(self, league: str) -> bool:
+        """True if anything is stored for the league."""
+        return self.fetchone(
+            "SELECT 1 FROM ranking_categories WHERE league = ? LIMIT 1", (league,)
+        ) is not None
+
+    def delete_rankings(self, league: str) -> None:
+        """Remove a league's current rankings (snapshots are kept)."""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM ranking_category_items WHERE league = ?", (league,))
+            conn.execute("DELETE FROM ranking_categories WHERE league = ?", (league,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
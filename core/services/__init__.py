@@ -5,6 +5,7 @@ Business logic services that don't belong to a specific domain.
 """
 
 from .chart_data_service import ChartDataService
-from .export_service import ExportService, ExportResult
+from .export_service import ExportService, ExportProgress, ExportResult
+from .loot_persistence_service import LootPersistenceService
 
-__all__ = ["ChartDataService", "ExportService", "ExportResult"]
+__all__ = ["ChartDataService", "ExportService", "ExportProgress", "ExportResult", "LootPersistenceService"]
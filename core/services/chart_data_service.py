@@ -2,20 +2,52 @@
 Chart data service for price history visualization.
 
 Provides data aggregation from database tables for chart rendering.
+
+A chart can't show more points than it has pixels, so series can be
+reduced before they reach Python:
+
+- resolution="hour"/"day" buckets rows in SQL, one OHLC point per bucket
+  (open/close, min/max, average and row count)
+- resolution="auto" keeps raw rows while they fit in ``max_points`` and
+  otherwise picks hourly or daily buckets from the span of the data
+- ``max_points`` then caps the result with largest-triangle-three-buckets
+  (LTTB) downsampling, which keeps the visual shape (peaks and dips)
+
+Series are cached per (item, league, range, resolution, max_points). An
+entry is dropped once the source table gains rows, and after
+CACHE_TTL_SECONDS so relative windows ("last 7 days") move forward.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple
 
 if TYPE_CHECKING:
     from core.database import Database
 
 logger = logging.getLogger(__name__)
 
+# SQL bucket key per resolution. Timestamps are stored as ISO-8601 text, so
+# a prefix is the bucket (kept in stored wall-clock time, like raw points);
+# this is cheaper than strftime(), which re-parses every row.
+BUCKET_KEYS = {
+    "hour": "replace(substr(recorded_at, 1, 13), 'T', ' ') || ':00'",
+    "day": "substr(recorded_at, 1, 10)",
+}
+RESOLUTIONS = ("raw", "auto", *BUCKET_KEYS)
+
+# Point cap for resolution="auto" when the caller gives no max_points
+DEFAULT_MAX_POINTS = 1000
+
+CACHE_TTL_SECONDS = 300
+MAX_CACHED_SERIES = 64
+
 
 @dataclass
 class PriceDataPoint:
@@ -23,6 +55,12 @@ class PriceDataPoint:
     date: datetime
     chaos_value: float
     divine_value: Optional[float] = None
+    # Set when the point summarises a bucket of rows (chaos_value is the average)
+    open: Optional[float] = None
+    close: Optional[float] = None
+    low: Optional[float] = None
+    high: Optional[float] = None
+    count: int = 1
 
 
 @dataclass
@@ -48,17 +86,239 @@ class ChartSeries:
         return [p.divine_value for p in self.data_points]
 
 
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], threshold: int) -> List[int]:
+    """
+    Indices of the points kept by largest-triangle-three-buckets downsampling.
+
+    The first and last points are always kept. Between them, the points are
+    split into ``threshold - 2`` buckets, and from each bucket it keeps the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket.
+
+    Args:
+        xs: Increasing x values (e.g. timestamps)
+        ys: y values
+        threshold: Maximum number of points to keep
+
+    Returns:
+        Sorted indices into xs/ys; all of them if len(xs) <= threshold
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    every = (n - 2) / (threshold - 2)
+    kept = [0]
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket (the last point for the final bucket)
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        span = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / span
+        avg_y = sum(ys[next_start:next_end]) / span
+
+        ax, ay = xs[a], ys[a]
+        best = start = int(i * every) + 1
+        max_area = -1.0
+        for j in range(start, int((i + 1) * every) + 1):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                best = j
+        kept.append(best)
+        a = best
+    kept.append(n - 1)
+    return kept
+
+
+def downsample_series(points: List[PriceDataPoint], max_points: int) -> List[PriceDataPoint]:
+    """Cap a list of chronologically ordered points with LTTB."""
+    if len(points) <= max_points:
+        return points
+    xs = [p.date.timestamp() for p in points]
+    ys = [p.chaos_value for p in points]
+    return [points[i] for i in lttb_indices(xs, ys, max_points)]
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value
+
+
 class ChartDataService:
     """Service for retrieving and aggregating chart data."""
 
     def __init__(self, db: "Database"):
         self.db = db
+        self._lock = threading.Lock()
+        # key -> (created, conn.total_changes, table MAX(id), series)
+        self._cache: "OrderedDict[tuple, Tuple[float, Any, Any, Optional[ChartSeries]]]" = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _table_stamp(self, table: str) -> Any:
+        return self.db.conn.execute(f"SELECT MAX(id) FROM {table}").fetchone()[0]
+
+    def _cached(
+        self,
+        key: tuple,
+        table: str,
+        load: Callable[[], Optional[ChartSeries]]
+    ) -> Optional[ChartSeries]:
+        """
+        Return the cached series for ``key`` or load and cache it.
+
+        Validity is checked without a query while the connection has made no
+        changes (sqlite3 total_changes); otherwise by ``MAX(id)`` of ``table``,
+        so writes to unrelated tables don't evict anything.
+        """
+        changes = getattr(self.db.conn, "total_changes", None)
+        if not isinstance(changes, int):
+            return load()  # not a sqlite3 connection; nothing to validate against
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < CACHE_TTL_SECONDS:
+            created, cached_changes, stamp, series = entry
+            if changes == cached_changes:
+                with self._lock:
+                    self._cache.move_to_end(key)
+                return series
+            if self._table_stamp(table) == stamp:
+                with self._lock:
+                    self._cache[key] = (created, changes, stamp, series)
+                    self._cache.move_to_end(key)
+                return series
+
+        stamp = self._table_stamp(table)
+        series = load()
+        with self._lock:
+            self._cache[key] = (now, changes, stamp, series)
+            self._cache.move_to_end(key)
+            while len(self._cache) > MAX_CACHED_SERIES:
+                self._cache.popitem(last=False)
+        return series
+
+    def invalidate(self, name: Optional[str] = None, league: Optional[str] = None) -> None:
+        """Drop cached series, optionally only for one item/currency and/or league."""
+        with self._lock:
+            for key in list(self._cache):
+                if (name is None or key[1] == name) and (league is None or key[2] == league):
+                    del self._cache[key]
+
+    # ------------------------------------------------------------------
+    # Bucketing
+    # ------------------------------------------------------------------
+
+    def _series_rows(
+        self,
+        table: str,
+        value_column: str,
+        divine_column: Optional[str],
+        where: str,
+        params: List[Any],
+        resolution: str,
+        max_points: Optional[int]
+    ) -> List[PriceDataPoint]:
+        """Load ``value_column`` over ``recorded_at`` as raw rows or OHLC buckets."""
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution}")
+
+        if resolution == "auto":
+            resolution = self._auto_resolution(table, where, params, max_points or DEFAULT_MAX_POINTS)
+
+        if resolution == "raw":
+            columns = f"recorded_at, {value_column}" + (f", {divine_column}" if divine_column else "")
+            cursor = self.db.conn.execute(f"""
+                SELECT {columns}
+                FROM {table}
+                WHERE {where}
+                ORDER BY recorded_at ASC
+            """, params)
+            return [
+                PriceDataPoint(
+                    date=_parse_timestamp(row[0]),
+                    chaos_value=float(row[1]) if row[1] else 0.0,
+                    divine_value=float(row[2]) if len(row) > 2 and row[2] else None,
+                )
+                for row in cursor.fetchall()
+            ]
+
+        # Aggregate per bucket, then look up the open/close values by the
+        # bucket's first/last timestamp (an index seek per bucket). Window
+        # functions do it in one pass but sort every row and are ~4x slower.
+        divine = divine_column or "NULL"
+        bucket = BUCKET_KEYS[resolution]
+        cursor = self.db.conn.execute(f"""
+            SELECT
+                bucket, avg_v, low, high, n, avg_d,
+                (SELECT {value_column} FROM {table}
+                 WHERE {where} AND recorded_at = first_at ORDER BY id LIMIT 1),
+                (SELECT {value_column} FROM {table}
+                 WHERE {where} AND recorded_at = last_at ORDER BY id DESC LIMIT 1)
+            FROM (
+                SELECT
+                    {bucket} AS bucket,
+                    AVG({value_column}) AS avg_v,
+                    MIN({value_column}) AS low,
+                    MAX({value_column}) AS high,
+                    COUNT(*) AS n,
+                    AVG({divine}) AS avg_d,
+                    MIN(recorded_at) AS first_at,
+                    MAX(recorded_at) AS last_at
+                FROM {table}
+                WHERE {where}
+                GROUP BY bucket
+            )
+            WHERE bucket IS NOT NULL
+            ORDER BY bucket
+        """, [*params, *params, *params])
+        return [
+            PriceDataPoint(
+                date=datetime.fromisoformat(row[0]),
+                chaos_value=float(row[1] or 0.0),
+                divine_value=float(row[5]) if row[5] else None,
+                low=row[2],
+                high=row[3],
+                open=row[6],
+                close=row[7],
+                count=row[4],
+            )
+            for row in cursor.fetchall()
+        ]
+
+    def _auto_resolution(self, table: str, where: str, params: List[Any], max_points: int) -> str:
+        """Raw rows if they fit in max_points, else the finest bucket that roughly does."""
+        count, first, last = self.db.conn.execute(f"""
+            SELECT COUNT(*), MIN(recorded_at), MAX(recorded_at)
+            FROM {table}
+            WHERE {where}
+        """, params).fetchone()
+        if not count or count <= max_points:
+            return "raw"
+        span_hours = (_parse_timestamp(last) - _parse_timestamp(first)).total_seconds() / 3600
+        # LTTB trims the rest, so a few times max_points hourly buckets is fine
+        return "hour" if span_hours <= max_points * 4 else "day"
+
+    @staticmethod
+    def _cutoff(days: int) -> Optional[str]:
+        if days > 0:
+            # Same layout as CURRENT_TIMESTAMP, so same-day rows compare by time
+            return (datetime.now() - timedelta(days=days)).isoformat(sep=" ")
+        return None
 
     def get_item_price_series(
         self,
         item_name: str,
         league: str,
-        days: int = 30
+        days: int = 30,
+        resolution: str = "raw",
+        max_points: Optional[int] = None
     ) -> Optional[ChartSeries]:
         """
         Get price history for a specific item.
@@ -67,54 +327,56 @@ class ChartDataService:
             item_name: Name of the item to query
             league: League name
             days: Number of days of history (0 = all time)
+            resolution: "raw", "hour", "day" or "auto"
+            max_points: Downsample to at most this many points (e.g. the
+                chart's pixel width)
 
         Returns:
             ChartSeries with price data points, or None if no data
         """
+        key = ("item", item_name, league, days, resolution, max_points)
         try:
-            query = """
-                SELECT recorded_at, chaos_value, divine_value
-                FROM price_history
-                WHERE item_name = ? AND league = ?
-            """
-            params: list = [item_name, league]
-
-            if days > 0:
-                cutoff = datetime.now() - timedelta(days=days)
-                query += " AND recorded_at >= ?"
-                params.append(cutoff.isoformat())
-
-            query += " ORDER BY recorded_at ASC"
-
-            cursor = self.db.conn.execute(query, params)
-            rows = cursor.fetchall()
-
-            if not rows:
-                return None
-
-            data_points = []
-            for row in rows:
-                recorded_at = row[0]
-                if isinstance(recorded_at, str):
-                    recorded_at = datetime.fromisoformat(recorded_at.replace("Z", "+00:00"))
-
-                data_points.append(PriceDataPoint(
-                    date=recorded_at,
-                    chaos_value=float(row[1]) if row[1] else 0.0,
-                    divine_value=float(row[2]) if row[2] else None
-                ))
-
-            return ChartSeries(name=item_name, data_points=data_points)
-
+            return self._cached(
+                key, "price_history",
+                lambda: self._load_item_price_series(item_name, league, days, resolution, max_points),
+            )
         except Exception as e:
             logger.error(f"Failed to get price series for {item_name}: {e}")
             return None
 
+    def _load_item_price_series(
+        self,
+        item_name: str,
+        league: str,
+        days: int,
+        resolution: str,
+        max_points: Optional[int]
+    ) -> Optional[ChartSeries]:
+        where = "item_name = ? AND league = ?"
+        params: list = [item_name, league]
+
+        cutoff = self._cutoff(days)
+        if cutoff:
+            where += " AND recorded_at >= ?"
+            params.append(cutoff)
+
+        data_points = self._series_rows(
+            "price_history", "chaos_value", "divine_value", where, params, resolution, max_points
+        )
+        if not data_points:
+            return None
+        if max_points:
+            data_points = downsample_series(data_points, max_points)
+
+        return ChartSeries(name=item_name, data_points=data_points)
+
     def get_currency_rate_series(
         self,
         currency: str,
         league: str,
-        days: int = 30
+        days: int = 30,
+        resolution: str = "raw",
+        max_points: Optional[int] = None
     ) -> Optional[ChartSeries]:
         """
         Get currency rate history.
@@ -123,6 +385,8 @@ class ChartDataService:
             currency: Currency name (e.g., "Divine Orb", "Exalted Orb")
             league: League name
             days: Number of days of history (0 = all time)
+            resolution: "raw", "hour", "day" or "auto" (currency_rates only)
+            max_points: Downsample to at most this many points
 
         Returns:
             ChartSeries with rate data points, or None if no data
@@ -139,50 +403,49 @@ class ChartDataService:
             column = column_map.get(currency)
             if not column:
                 # Try to get from league_economy_rates table
-                return self._get_currency_from_economy_rates(currency, league, days)
-
-            query = f"""
-                SELECT recorded_at, {column}
-                FROM currency_rates
-                WHERE league = ? AND {column} IS NOT NULL
-            """
-            params: list = [league]
-
-            if days > 0:
-                cutoff = datetime.now() - timedelta(days=days)
-                query += " AND recorded_at >= ?"
-                params.append(cutoff.isoformat())
-
-            query += " ORDER BY recorded_at ASC"
+                return self._get_currency_from_economy_rates(currency, league, days, max_points)
 
-            cursor = self.db.conn.execute(query, params)
-            rows = cursor.fetchall()
-
-            if not rows:
-                return None
+            key = ("currency", currency, league, days, resolution, max_points)
+            return self._cached(
+                key, "currency_rates",
+                lambda: self._load_currency_rate_series(currency, column, league, days, resolution, max_points),
+            )
 
-            data_points = []
-            for row in rows:
-                recorded_at = row[0]
-                if isinstance(recorded_at, str):
-                    recorded_at = datetime.fromisoformat(recorded_at.replace("Z", "+00:00"))
+        except Exception as e:
+            logger.error(f"Failed to get currency series for {currency}: {e}")
+            return None
 
-                data_points.append(PriceDataPoint(
-                    date=recorded_at,
-                    chaos_value=float(row[1]) if row[1] else 0.0
-                ))
+    def _load_currency_rate_series(
+        self,
+        currency: str,
+        column: str,
+        league: str,
+        days: int,
+        resolution: str,
+        max_points: Optional[int]
+    ) -> Optional[ChartSeries]:
+        where = f"league = ? AND {column} IS NOT NULL"
+        params: list = [league]
 
-            return ChartSeries(name=currency, data_points=data_points)
+        cutoff = self._cutoff(days)
+        if cutoff:
+            where += " AND recorded_at >= ?"
+            params.append(cutoff)
 
-        except Exception as e:
-            logger.error(f"Failed to get currency series for {currency}: {e}")
+        data_points = self._series_rows("currency_rates", column, None, where, params, resolution, max_points)
+        if not data_points:
             return None
+        if max_points:
+            data_points = downsample_series(data_points, max_points)
+
+        return ChartSeries(name=currency, data_points=data_points)
 
     def _get_currency_from_economy_rates(
         self,
         currency: str,
         league: str,
-        days: int
+        days: int,
+        max_points: Optional[int] = None
     ) -> Optional[ChartSeries]:
         """Get currency data from league_economy_rates table."""
         try:
@@ -218,6 +481,8 @@ class ChartDataService:
                     chaos_value=float(row[1]) if row[1] else 0.0
                 ))
 
+            if max_points:
+                data_points = downsample_series(data_points, max_points)
             return ChartSeries(name=currency, data_points=data_points)
 
         except Exception as e:
@@ -228,22 +493,27 @@ class ChartDataService:
         self,
         item_name: str,
         league: str,
-        days: int = 30
+        days: int = 30,
+        max_points: Optional[int] = None
     ) -> Optional[ChartSeries]:
         """
         Get item price history from league_economy_items table.
 
+        Falls back to price_history (bucketed automatically) when the league
+        has no imported economy data for the item.
+
         Args:
             item_name: Name of the item to query
             league: League name
             days: Number of days of history (0 = all time)
+            max_points: Downsample to at most this many points
 
         Returns:
             ChartSeries with price data points, or None if no data
         """
         try:
             query = """
-                SELECT item_date, chaos_value, divine_value
+                SELECT rate_date, chaos_value, NULL
                 FROM league_economy_items
                 WHERE league = ? AND item_name = ?
             """
@@ -251,16 +521,20 @@ class ChartDataService:
 
             if days > 0:
                 cutoff = datetime.now() - timedelta(days=days)
-                query += " AND item_date >= ?"
+                query += " AND rate_date >= ?"
                 params.append(cutoff.strftime("%Y-%m-%d"))
 
-            query += " ORDER BY item_date ASC"
+            query += " ORDER BY rate_date ASC"
 
             cursor = self.db.conn.execute(query, params)
             rows = cursor.fetchall()
 
             if not rows:
                 # Fall back to price_history table
+                if max_points:
+                    return self.get_item_price_series(
+                        item_name, league, days, resolution="auto", max_points=max_points
+                    )
                 return self.get_item_price_series(item_name, league, days)
 
             data_points = []
@@ -275,6 +549,8 @@ class ChartDataService:
                     divine_value=float(row[2]) if row[2] else None
                 ))
 
+            if max_points:
+                data_points = downsample_series(data_points, max_points)
             return ChartSeries(name=item_name, data_points=data_points)
 
         except Exception as e:
@@ -2,17 +2,25 @@
 Export service for exporting data to CSV and JSON formats.
 
 Provides data export functionality for sales history, price checks, and loot sessions.
+
+export_data() builds the result set in memory and suits small exports.
+export_stream() reads fixed-size chunks with keyset pagination and writes
+JSON Lines, CSV or JSON (optionally gzip-compressed) as it goes, so memory
+stays flat however many rows a table holds. It reports progress per chunk,
+can be cancelled between chunks and resumed after the last row written.
 """
 
 from __future__ import annotations
 
 import csv
+import gzip
 import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, IO, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from core.database import Database
@@ -20,6 +28,23 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Rows fetched and written per chunk by export_stream()
+DEFAULT_CHUNK_SIZE = 5000
+
+# Sort key of each streamed table as (timestamp column, id column), both
+# descending, matching the ORDER BY of its query. Chunks continue strictly
+# after the previous chunk's last key, so rows recorded meanwhile never
+# shift or repeat rows. The key is on the base table and indexed, so each
+# chunk is an index range scan rather than a re-sort of the whole table.
+STREAM_KEYS: Dict[str, Tuple[str, str]] = {
+    "sales": ("sold_at", "id"),
+    "price_checks": ("checked_at", "id"),
+    "loot": ("detected_at", "id"),
+}
+
+_LATEST_LOOT_SESSION_SQL = "SELECT id FROM loot_sessions ORDER BY started_at DESC LIMIT 1"
+
+
 @dataclass
 class ExportResult:
     """Result of an export operation."""
@@ -27,12 +52,26 @@ class ExportResult:
     file_path: Optional[Path] = None
     record_count: int = 0
     error: Optional[str] = None
+    cancelled: bool = False
+    # Rows in the file after this run (pass back as ``offset`` when resuming)
+    next_offset: int = 0
+    # Key of the last row written (pass back as ``resume_after`` to resume)
+    resume_after: Optional[List[Any]] = None
+
+
+@dataclass
+class ExportProgress:
+    """Progress of a streaming export, reported after each chunk."""
+    rows_written: int  # rows written by this run
+    offset: int  # rows in the file so far, including earlier runs
+    total_rows: Optional[int]  # rows the export will cover, if known
 
 
 class ExportService:
     """Service for exporting data to various formats."""
 
     SUPPORTED_FORMATS = ["csv", "json"]
+    STREAM_FORMATS = ["jsonl", "csv", "json"]
 
     def __init__(self, db: Optional["Database"] = None):
         self.db = db
@@ -115,6 +154,133 @@ class ExportService:
             logger.error(f"Failed to export to CSV: {e}")
             return ExportResult(success=False, error=str(e))
 
+    # ------------------------------------------------------------------
+    # Queries (shared by the in-memory and streaming exports)
+    # ------------------------------------------------------------------
+    # Every ORDER BY ends on the primary key so the sort key is unique,
+    # which keyset pagination (STREAM_KEYS) relies on.
+
+    @staticmethod
+    def _sales_query(
+        days: Optional[int], after: Optional[Sequence[Any]] = None, page_size: Optional[int] = None
+    ) -> Tuple[str, List[Any]]:
+        """after/page_size select one streaming chunk (see STREAM_KEYS)."""
+        query = """
+            SELECT
+                id,
+                item_name,
+                item_base_type,
+                source,
+                listed_price_chaos,
+                actual_price_chaos,
+                listed_at,
+                sold_at,
+                time_to_sale_hours,
+                league,
+                rarity,
+                notes
+            FROM sales
+        """
+        where, params = ExportService._page_conditions("sold_at", "id", days, after)
+        query += where + " ORDER BY sold_at DESC, id DESC"
+        if page_size is not None:
+            query += " LIMIT ?"
+            params.append(page_size)
+        return query, params
+
+    @staticmethod
+    def _price_checks_query(
+        days: Optional[int], after: Optional[Sequence[Any]] = None, page_size: Optional[int] = None
+    ) -> Tuple[str, List[Any]]:
+        """
+        after/page_size select one streaming chunk: a page of price_checks
+        (see STREAM_KEYS) joined to its quotes, so a check's quotes never
+        straddle two chunks.
+        """
+        where, params = ExportService._page_conditions("checked_at", "id", days, after)
+        if page_size is None:
+            checks = f"(SELECT * FROM price_checks{where})"
+        else:
+            checks = f"(SELECT * FROM price_checks{where} ORDER BY checked_at DESC, id DESC LIMIT ?)"
+            params.append(page_size)
+
+        query = f"""
+            SELECT
+                pc.id,
+                pc.item_name,
+                pc.item_base_type,
+                pc.league,
+                pc.game_version,
+                pc.checked_at,
+                pc.source,
+                pq.price_chaos,
+                pq.original_currency
+            FROM {checks} pc
+            LEFT JOIN price_quotes pq ON pc.id = pq.price_check_id
+            ORDER BY pc.checked_at DESC, pc.id DESC, pq.id
+        """
+        return query, params
+
+    def _loot_query(
+        self, session_id: Optional[Any], after: Optional[Sequence[Any]] = None, page_size: Optional[int] = None
+    ) -> Optional[Tuple[str, List[Any]]]:
+        """
+        Drops of one loot session (the latest if None); None if there are no
+        sessions. after/page_size select one streaming chunk.
+        """
+        if session_id is None:
+            cursor = self.db.conn.execute(_LATEST_LOOT_SESSION_SQL)
+            row = cursor.fetchone()
+            if not row:
+                return None
+            session_id = row[0]
+
+        query = """
+            SELECT
+                ld.id,
+                ld.item_name,
+                ld.item_base_type,
+                ld.chaos_value,
+                ld.divine_value,
+                ld.stack_size,
+                ld.rarity,
+                ld.detected_at,
+                ls.name as session_name,
+                ls.started_at as session_start
+            FROM loot_drops ld
+            JOIN loot_sessions ls ON ld.session_id = ls.id
+            WHERE ld.session_id = ?
+        """
+        params: List[Any] = [session_id]
+        if after is not None:
+            condition, condition_params = self._keyset_condition("ld.detected_at", "ld.id", after)
+            query += f" AND {condition}"
+            params += condition_params
+        query += " ORDER BY ld.detected_at DESC, ld.id DESC"
+        if page_size is not None:
+            query += " LIMIT ?"
+            params.append(page_size)
+        return query, params
+
+    @staticmethod
+    def _page_conditions(
+        time_column: str, id_column: str, days: Optional[int], after: Optional[Sequence[Any]]
+    ) -> Tuple[str, List[Any]]:
+        """WHERE clause (or "") for the days cutoff and the keyset position."""
+        conditions: List[str] = []
+        params: List[Any] = []
+        if days:
+            cutoff = datetime.now() - timedelta(days=days)
+            conditions.append(f"{time_column} >= ?")
+            params.append(cutoff.isoformat())
+        if after is not None:
+            condition, condition_params = ExportService._keyset_condition(time_column, id_column, after)
+            conditions.append(condition)
+            params += condition_params
+        if not conditions:
+            return "", params
+        return " WHERE " + " AND ".join(conditions), params
+
     def get_exportable_sales(
         self,
         days: Optional[int] = None,
@@ -134,25 +300,7 @@ class ExportService:
             return []
 
         try:
-            query = """
-                SELECT
-                    id,
-                    item_name,
-                    sale_price,
-                    buyer_name,
-                    notes,
-                    sold_at,
-                    created_at
-                FROM sales
-            """
-            params: List[Any] = []
-
-            if days:
-                cutoff = datetime.now() - timedelta(days=days)
-                query += " WHERE sold_at >= ?"
-                params.append(cutoff.isoformat())
-
-            query += " ORDER BY sold_at DESC"
+            query, params = self._sales_query(days)
 
             if limit:
                 query += f" LIMIT {limit}"
@@ -186,28 +334,7 @@ class ExportService:
             return []
 
         try:
-            query = """
-                SELECT
-                    pc.id,
-                    pc.item_name,
-                    pc.item_base_type,
-                    pc.league,
-                    pc.game_version,
-                    pc.checked_at,
-                    pc.source,
-                    pq.price_chaos,
-                    pq.original_currency
-                FROM price_checks pc
-                LEFT JOIN price_quotes pq ON pc.id = pq.price_check_id
-            """
-            params: List[Any] = []
-
-            if days:
-                cutoff = datetime.now() - timedelta(days=days)
-                query += " WHERE pc.checked_at >= ?"
-                params.append(cutoff.isoformat())
-
-            query += " ORDER BY pc.checked_at DESC"
+            query, params = self._price_checks_query(days)
 
             if limit:
                 query += f" LIMIT {limit}"
@@ -239,35 +366,11 @@ class ExportService:
             return []
 
         try:
-            # Get session ID if not specified
-            if session_id is None:
-                cursor = self.db.conn.execute("""
-                    SELECT id FROM loot_sessions
-                    ORDER BY created_at DESC LIMIT 1
-                """)
-                row = cursor.fetchone()
-                if row:
-                    session_id = row[0]
-                else:
-                    return []
-
-            # Get session items
-            cursor = self.db.conn.execute("""
-                SELECT
-                    li.id,
-                    li.item_name,
-                    li.item_base_type,
-                    li.chaos_value,
-                    li.divine_value,
-                    li.stack_size,
-                    li.created_at,
-                    ls.name as session_name,
-                    ls.created_at as session_start
-                FROM loot_items li
-                JOIN loot_sessions ls ON li.session_id = ls.id
-                WHERE li.session_id = ?
-                ORDER BY li.created_at DESC
-            """, (session_id,))
+            loot_query = self._loot_query(session_id)
+            if loot_query is None:
+                return []
+
+            cursor = self.db.conn.execute(*loot_query)
 
             columns = [desc[0] for desc in cursor.description]
             rows = cursor.fetchall()
@@ -301,10 +404,8 @@ class ExportService:
             from data_sources.pricing.poe_ninja import PoeNinjaAPI
 
             api = PoeNinjaAPI(league=league)
-            cache = PriceRankingCache(league=league)
-            calculator = Top20Calculator(cache, poe_ninja_api=api)
-
-            ranking = calculator.get_category(category)
+            with PriceRankingCache(league=league) as cache:
+                ranking = Top20Calculator(cache, poe_ninja_api=api).get_category(category)
             if not ranking:
                 return []
 
@@ -367,3 +468,230 @@ class ExportService:
             return self.export_to_csv(data, file_path)
         else:
             return ExportResult(success=False, error=f"Unknown format: {format}")
+
+    # ------------------------------------------------------------------
+    # Streaming export
+    # ------------------------------------------------------------------
+
+    def export_stream(
+        self,
+        data_type: str,
+        format: str,
+        file_path: Path,
+        days: Optional[int] = None,
+        *,
+        compress: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        offset: int = 0,
+        resume_after: Optional[List[Any]] = None,
+        progress: Optional[Callable[[ExportProgress], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None,
+        **kwargs
+    ) -> ExportResult:
+        """
+        Export a table in bounded-size chunks, one query per chunk.
+
+        Each chunk is read under the database lock and continues after the
+        previous chunk's sort key, so the export never holds a cursor open
+        on the shared connection between chunks.
+
+        Args:
+            data_type: "sales", "price_checks", "loot" or "rankings"
+            format: "jsonl", "csv" or "json"
+            file_path: Output file path
+            days: Number of days to include
+            compress: gzip the output
+            chunk_size: Rows fetched and written per chunk (for price_checks,
+                checks per chunk, each written with all its quotes)
+            offset: Rows already in ``file_path`` from earlier runs (for
+                progress and ``next_offset``)
+            resume_after: ``resume_after`` of a cancelled or failed run;
+                continue after that row and append to ``file_path``
+                (jsonl/csv only)
+            progress: Called with ExportProgress after each chunk
+            should_cancel: Polled before each chunk; return True to stop
+            **kwargs: session_id for loot; league/category for rankings
+
+        Returns:
+            ExportResult; when cancelled or failed part-way, pass its
+            ``next_offset`` and ``resume_after`` back to resume. Chunks
+            already written are complete.
+        """
+        if format not in self.STREAM_FORMATS:
+            return ExportResult(success=False, error=f"Unknown format: {format}")
+        resuming = resume_after is not None
+        if resuming and format == "json":
+            return ExportResult(success=False, error="Resuming is only supported for jsonl and csv")
+
+        written = 0
+        cancelled = False
+        try:
+            source = self._stream_source(data_type, days, resume_after, chunk_size, **kwargs)
+            if isinstance(source, ExportResult):
+                return source
+            columns, total, chunks = source
+
+            with self._open_export_file(file_path, append=resuming, compress=compress) as f:
+                write_chunk = self._chunk_writer(f, format, columns, header=not resuming)
+                for chunk, chunk_key in chunks:
+                    if should_cancel is not None and should_cancel():
+                        cancelled = True
+                        break
+                    write_chunk(chunk)
+                    f.flush()
+                    written += len(chunk)
+                    resume_after = chunk_key
+                    if progress is not None:
+                        progress(ExportProgress(written, offset + written, total))
+                if format == "json":
+                    f.write("\n]\n" if written else "]\n")
+
+        except Exception as e:
+            logger.error(f"Failed to stream {data_type} export: {e}")
+            return ExportResult(
+                success=False, file_path=file_path, record_count=written,
+                error=str(e), next_offset=offset + written, resume_after=resume_after,
+            )
+
+        if cancelled:
+            logger.info(f"Export of {data_type} cancelled after {offset + written} rows")
+        return ExportResult(
+            success=not cancelled,
+            file_path=file_path,
+            record_count=written,
+            error="Cancelled" if cancelled else None,
+            cancelled=cancelled,
+            next_offset=offset + written,
+            resume_after=resume_after,
+        )
+
+    def _stream_source(
+        self,
+        data_type: str,
+        days: Optional[int],
+        resume_after: Optional[List[Any]],
+        chunk_size: int,
+        **kwargs
+    ) -> Any:
+        """
+        (columns, total rows, chunk iterator) for a data type, or an ExportResult
+        error. The iterator yields (rows, key of the last row) per chunk.
+        """
+        if data_type == "rankings":
+            rows = self.get_exportable_rankings(
+                league=kwargs.get("league", "Standard"),
+                category=kwargs.get("category", "currency"),
+            )
+            columns = list(rows[0].keys()) if rows else []
+            # Rankings are fetched whole, so their key is the list position
+            start = resume_after[0] if resume_after else 0
+            values = [tuple(row.get(c) for c in columns) for row in rows]
+            chunks = (
+                (values[i:i + chunk_size], [min(i + chunk_size, len(values))])
+                for i in range(start, len(values), chunk_size)
+            )
+            return columns, len(rows), chunks
+
+        if data_type not in STREAM_KEYS:
+            return ExportResult(success=False, error=f"Unknown data type: {data_type}")
+        if not self.db:
+            return ExportResult(success=False, error="No database available")
+
+        page_query: Callable[[Optional[Sequence[Any]], Optional[int]], Tuple[str, List[Any]]]
+        if data_type == "sales":
+            page_query = partial(self._sales_query, days)
+        elif data_type == "price_checks":
+            page_query = partial(self._price_checks_query, days)
+        else:
+            session_id = kwargs.get("session_id")
+            if session_id is None:
+                row = self.db._execute_fetchone(_LATEST_LOOT_SESSION_SQL)
+                if not row:
+                    return [], 0, iter(())
+                session_id = row[0]
+            page_query = partial(self._loot_query, session_id)
+
+        query, params = page_query(None, None)
+        cursor = self.db._execute(f"SELECT * FROM ({query}) LIMIT 0", tuple(params), commit=False)
+        columns = [desc[0] for desc in cursor.description]
+        total = self.db._execute_fetchone(f"SELECT COUNT(*) FROM ({query})", tuple(params))[0]
+        return columns, total, self._fetch_chunks(page_query, STREAM_KEYS[data_type], resume_after, chunk_size)
+
+    def _fetch_chunks(
+        self,
+        page_query: Callable[[Optional[Sequence[Any]], Optional[int]], Tuple[str, List[Any]]],
+        keys: Tuple[str, str],
+        resume_after: Optional[List[Any]],
+        chunk_size: int,
+    ) -> Iterator[Tuple[List[Tuple[Any, ...]], List[Any]]]:
+        """Yield (rows, last row's key) chunks, one page query per chunk."""
+        after: Optional[List[Any]] = resume_after
+        while True:
+            sql, params = page_query(after, chunk_size)
+            rows = self.db._execute_fetchall(sql, tuple(params))
+            if not rows:
+                if after is None or after[0] is None:
+                    return
+                # Timestamped rows are done; rows without one sort last
+                after = [None, None]
+                continue
+            last = rows[-1]
+            after = [last[name] for name in keys]
+            yield [tuple(row) for row in rows], after
+
+    @staticmethod
+    def _keyset_condition(time_column: str, id_column: str, after: Sequence[Any]) -> Tuple[str, List[Any]]:
+        """
+        SQL matching rows after ``after`` in (time DESC, id DESC) order.
+
+        SQLite sorts NULL first, so rows without a timestamp come last when
+        descending. A row-value comparison never matches NULL, so a key with
+        a timestamp only covers the timestamped rows; _fetch_chunks moves on
+        to the NULL rows with [None, None] once those run out. Each form is
+        a range on the (time, id) index.
+        """
+        time_value, id_value = after
+        if time_value is not None:
+            return f"({time_column}, {id_column}) < (?, ?)", [time_value, id_value]
+        if id_value is None:
+            return f"{time_column} IS NULL", []
+        return f"({time_column} IS NULL AND {id_column} < ?)", [id_value]
+
+    @staticmethod
+    def _open_export_file(file_path: Path, append: bool, compress: bool) -> IO[str]:
+        mode = "at" if append else "wt"
+        if compress:
+            # Appending adds a gzip member; readers treat the file as one stream
+            return gzip.open(file_path, mode, encoding="utf-8", newline="")
+        return open(file_path, mode, encoding="utf-8", newline="")
+
+    @staticmethod
+    def _chunk_writer(
+        f: IO[str],
+        format: str,
+        columns: List[str],
+        header: bool
+    ) -> Callable[[Sequence[Sequence[Any]]], None]:
+        """Return a function writing one chunk of row tuples in ``format``."""
+        if format == "csv":
+            writer = csv.writer(f)
+            if header:
+                writer.writerow(columns)
+            return writer.writerows
+
+        def dumps(row: Sequence[Any]) -> str:
+            return json.dumps(dict(zip(columns, row)), default=str, ensure_ascii=False)
+
+        if format == "jsonl":
+            def write_jsonl(chunk: Sequence[Sequence[Any]]) -> None:
+                f.write("".join(dumps(row) + "\n" for row in chunk))
+            return write_jsonl
+
+        f.write("[")
+        first = [True]
+
+        def write_json(chunk: Sequence[Sequence[Any]]) -> None:
+            body = ",\n".join(dumps(row) for row in chunk)
+            f.write(("\n" if first[0] else ",\n") + body)
+            first[0] = False
+        return write_json
@@ -0,0 +1,264 @@
+"""
+Loot persistence service for incremental, off-thread session saves.
+
+Loot sessions are written as they progress instead of all at once when the
+session ends. Each call snapshots only what changed since the last write
+(new map runs, new drops, updated totals) into row tuples on the caller's
+thread, and a single background writer thread applies them with batched
+executemany calls in one transaction per flush.
+
+Usage:
+    service = LootPersistenceService(db)
+    service.record_progress(session)    # e.g. after each map run
+    service.save_session(session)       # when the session ends
+    service.shutdown()                  # flushes pending writes
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from core.database import Database
+    from core.loot_session import LootDrop, LootSession, MapRun
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LootWriteBatch:
+    """Rows for one write, in LootRepository.save_loot_batch column order."""
+    session_id: str
+    sessions: List[Tuple[Any, ...]] = field(default_factory=list)
+    map_runs: List[Tuple[Any, ...]] = field(default_factory=list)
+    drops: List[Tuple[Any, ...]] = field(default_factory=list)
+
+    def merge(self, other: "LootWriteBatch") -> None:
+        """Append another batch's rows (later session/run rows win on upsert)."""
+        self.sessions.extend(other.sessions)
+        self.map_runs.extend(other.map_runs)
+        self.drops.extend(other.drops)
+
+
+class LootPersistenceService:
+    """
+    Writes loot sessions to the database on a background thread.
+
+    Tracks, per session, how many drops of each map run have already been
+    queued, so every call only sends new rows. Writes are idempotent
+    (upserts for sessions/runs, insert-or-ignore for drops); if a write
+    fails the session's progress is forgotten and the next call re-sends it.
+    """
+
+    def __init__(self, db: "Database", game_version: str = "poe1"):
+        """
+        Args:
+            db: Database to write to.
+            game_version: Game version stored with new sessions.
+        """
+        self._db = db
+        self._game_version = game_version
+        self._queue: "queue.Queue[Optional[LootWriteBatch]]" = queue.Queue()
+        self._lock = threading.Lock()
+        # session_id -> {map_run_id: drops already queued}
+        self._queued_drops: Dict[str, Dict[str, int]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats = {"batches_written": 0, "rows_written": 0, "errors": 0}
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def record_progress(self, session: "LootSession") -> None:
+        """
+        Queue everything in the session that has not been written yet.
+
+        Cheap to call often: only new map runs and drops become rows, plus
+        one row each for the session and the runs whose totals changed.
+        """
+        batch = self._build_batch(session)
+        if batch is not None:
+            self._enqueue(batch)
+
+    def save_session(self, session: "LootSession") -> None:
+        """Queue the final state of an ended session and stop tracking it."""
+        self.record_progress(session)
+        with self._lock:
+            self._queued_drops.pop(session.id, None)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued writes are applied.
+
+        Returns:
+            True if the queue drained within the timeout.
+        """
+        if self._thread is None:
+            return True
+        done = threading.Event()
+
+        def wait_for_queue() -> None:
+            self._queue.join()
+            done.set()
+
+        threading.Thread(target=wait_for_queue, daemon=True).start()
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Flush pending writes and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer statistics."""
+        return {
+            **self._stats,
+            "pending": self._queue.qsize(),
+            "tracked_sessions": len(self._queued_drops),
+        }
+
+    # -------------------------------------------------------------------------
+    # Row building (caller thread)
+    # -------------------------------------------------------------------------
+
+    def _build_batch(self, session: "LootSession") -> Optional[LootWriteBatch]:
+        """Snapshot unsaved rows of a session into a LootWriteBatch."""
+        with self._lock:
+            if self._closed:
+                logger.warning(f"Loot persistence closed; dropping write for {session.id}")
+                return None
+            queued = self._queued_drops.setdefault(session.id, {})
+
+            batch = LootWriteBatch(session_id=session.id)
+            for map_run in list(session.map_runs):
+                drops = list(map_run.drops)
+                already = queued.get(map_run.id)
+                if already == len(drops):
+                    continue
+                batch.map_runs.append(self._map_run_row(session, map_run))
+                batch.drops.extend(
+                    self._drop_row(session, map_run, drop) for drop in drops[already or 0:]
+                )
+                queued[map_run.id] = len(drops)
+
+        batch.sessions.append(self._session_row(session))
+        return batch
+
+    def _session_row(self, session: "LootSession") -> Tuple[Any, ...]:
+        return (
+            session.id,
+            session.name,
+            session.league,
+            self._game_version,
+            session.started_at.isoformat(),
+            session.ended_at.isoformat() if session.ended_at else None,
+            session.state.value,
+            session.auto_detected,
+            session.notes,
+            session.total_maps,
+            session.total_drops,
+            session.total_chaos_value,
+        )
+
+    @staticmethod
+    def _map_run_row(session: "LootSession", map_run: "MapRun") -> Tuple[Any, ...]:
+        return (
+            map_run.id,
+            session.id,
+            map_run.map_name,
+            map_run.area_level,
+            map_run.started_at.isoformat(),
+            map_run.ended_at.isoformat() if map_run.ended_at else None,
+            map_run.drop_count,
+            map_run.total_chaos_value,
+        )
+
+    @staticmethod
+    def _drop_row(
+        session: "LootSession", map_run: "MapRun", drop: "LootDrop"
+    ) -> Tuple[Any, ...]:
+        item_data = None
+        if drop.raw_item_data:
+            try:
+                item_data = json.dumps(drop.raw_item_data, default=str)
+            except (TypeError, ValueError):
+                item_data = None
+        return (
+            drop.id,
+            map_run.id,
+            session.id,
+            drop.item_name,
+            drop.item_base_type,
+            drop.stack_size,
+            drop.chaos_value,
+            drop.divine_value,
+            drop.rarity,
+            drop.item_class,
+            drop.detected_at.isoformat(),
+            drop.source_tab,
+            item_data,
+        )
+
+    # -------------------------------------------------------------------------
+    # Writer thread
+    # -------------------------------------------------------------------------
+
+    def _enqueue(self, batch: LootWriteBatch) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._writer_loop, daemon=True, name="LootPersistenceWriter"
+            )
+            self._thread.start()
+        self._queue.put(batch)
+
+    def _writer_loop(self) -> None:
+        """Apply queued batches, merging whatever is pending into one transaction."""
+        while True:
+            first = self._queue.get()
+            items: List[Optional[LootWriteBatch]] = [first]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            batches = [b for b in items if b is not None]
+            try:
+                if batches:
+                    self._write(batches)
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+
+            if any(b is None for b in items):
+                return
+
+    def _write(self, batches: List[LootWriteBatch]) -> None:
+        merged = LootWriteBatch(session_id="")
+        for batch in batches:
+            merged.merge(batch)
+        try:
+            self._db.save_loot_batch(merged.sessions, merged.map_runs, merged.drops)
+            self._stats["batches_written"] += 1
+            self._stats["rows_written"] += (
+                len(merged.sessions) + len(merged.map_runs) + len(merged.drops)
+            )
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(f"Failed to save loot data: {e}")
+            # Forget progress so the next call re-sends these sessions in full
+            with self._lock:
+                for batch in batches:
+                    self._queued_drops.pop(batch.session_id, None)
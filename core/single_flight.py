@@ -0,0 +1,99 @@
+"""
+Single-flight deduplication of concurrent identical work.
+
+When several threads ask for the same key at once, only the first (the
+leader) runs the function; the others block until it finishes and receive
+the same result, or the same exception. Nothing is cached: once the call
+completes, the next request for the key runs again.
+
+Used to coalesce:
+- identical HTTP GETs in BaseAPIClient that miss the response cache
+  together (e.g. several workers loading one poe.ninja overview)
+- identical PriceService.check_item calls (clipboard monitor, API and GUI
+  checking the same item, or duplicates in a bulk paste)
+
+Usage:
+    flights = SingleFlight()
+    data = flights.do(cache_key, lambda: fetch(url))
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """One in-flight call and the waiters sharing it."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """Runs at most one call per key at a time; concurrent callers share it."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call[T]] = {}
+        self._executed = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Return ``fn()``, or the result of an identical call already running.
+
+        Args:
+            key: Identifies equivalent work.
+            fn: Zero-argument callable producing the result.
+
+        Raises:
+            Whatever ``fn`` raised, in the leader and every waiter.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Number of keys currently being computed."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        """Calls executed vs. calls that joined one already in flight."""
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "shared": self._shared,
+                "in_flight": len(self._calls),
+            }
@@ -0,0 +1,184 @@
+"""
+Startup profiling: where does time-to-interactive go?
+
+Records two things while the application starts:
+
+- imports: a meta-path hook times every module's execution, giving both
+  cumulative time (including the modules it imported) and self time
+- phases: named wall-clock sections of initialisation (Qt app, app
+  context, main window, ...)
+
+Enabled from the command line with ``python main.py --profile-startup``;
+the report is printed once the main window is shown.
+
+Usage:
+    profiler = StartupProfiler()
+    profiler.install_import_timer()
+    with profiler.phase("app_context"):
+        ctx = create_app_context()
+    profiler.uninstall_import_timer()
+    print(profiler.report())
+"""
+from __future__ import annotations
+
+import importlib.abc
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+@dataclass(slots=True)
+class ImportTiming:
+    """Execution time of one imported module, in milliseconds."""
+
+    name: str
+    cumulative_ms: float
+    self_ms: float
+
+
+class _TimedLoader:
+    """Wraps a module loader so exec_module is timed; everything else passes through."""
+
+    def __init__(self, loader: Any, profiler: "StartupProfiler") -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: Any) -> Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        self._profiler._exec_timed(module.__name__, self._loader, module)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """Meta-path finder that defers to the real finders and wraps their loaders."""
+
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self._profiler = profiler
+
+    def find_spec(self, fullname: str, path: Any, target: Any = None) -> Any:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """Collects import and phase timings for one application start."""
+
+    def __init__(self) -> None:
+        self._start = time.perf_counter()
+        self._finder: Optional[_TimingFinder] = None
+        self._imports: List[ImportTiming] = []
+        # Child time accumulated by each module currently executing
+        self._stack: List[float] = []
+        self._phases: List[Tuple[str, float]] = []
+        self._marks: Dict[str, float] = {}
+
+    # ------------------------------------------------------------------
+    # Imports
+    # ------------------------------------------------------------------
+
+    def install_import_timer(self) -> None:
+        """Start timing imports (modules already imported are not seen)."""
+        if self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall_import_timer(self) -> None:
+        if self._finder is not None:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self._finder = None
+
+    def _exec_timed(self, name: str, loader: Any, module: Any) -> None:
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            loader.exec_module(module)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self._imports.append(ImportTiming(name, elapsed, elapsed - children))
+
+    def imports(self) -> List[ImportTiming]:
+        return list(self._imports)
+
+    def package_totals(self) -> Dict[str, float]:
+        """Self time summed per top-level package, slowest first."""
+        totals: Dict[str, float] = {}
+        for timing in self._imports:
+            top = timing.name.partition(".")[0]
+            totals[top] = totals.get(top, 0.0) + timing.self_ms
+        return dict(sorted(totals.items(), key=lambda kv: kv[1], reverse=True))
+
+    # ------------------------------------------------------------------
+    # Phases
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a named initialisation phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases.append((name, (time.perf_counter() - start) * 1000))
+
+    def mark(self, name: str) -> float:
+        """Record milliseconds since the profiler was created (e.g. "interactive")."""
+        elapsed = (time.perf_counter() - self._start) * 1000
+        self._marks[name] = elapsed
+        return elapsed
+
+    def phases(self) -> List[Tuple[str, float]]:
+        return list(self._phases)
+
+    # ------------------------------------------------------------------
+    # Report
+    # ------------------------------------------------------------------
+
+    def report(self, limit: int = 20, packages: Optional[Sequence[str]] = None) -> str:
+        """
+        Human-readable breakdown of phases, marks and the slowest imports.
+
+        Args:
+            limit: Number of modules/packages to list.
+            packages: Restrict the module list to these top-level packages.
+        """
+        lines = ["Startup profile", "=" * 60, f"{'phase':<40}{'ms':>10}"]
+        for name, ms in self._phases:
+            lines.append(f"{name:<40}{ms:>10.1f}")
+        for name, ms in self._marks.items():
+            lines.append(f"{'@ ' + name:<40}{ms:>10.1f}")
+
+        total_import = sum(t.self_ms for t in self._imports)
+        lines += ["", f"imports: {len(self._imports)} modules, {total_import:.1f} ms", ""]
+
+        lines.append(f"{'package':<40}{'self ms':>10}")
+        for name, ms in list(self.package_totals().items())[:limit]:
+            lines.append(f"{name:<40}{ms:>10.1f}")
+
+        timings = self._imports
+        if packages:
+            wanted = set(packages)
+            timings = [t for t in timings if t.name.partition(".")[0] in wanted]
+        lines += ["", f"{'module':<40}{'cumul ms':>10}{'self ms':>10}"]
+        for timing in sorted(timings, key=lambda t: t.cumulative_ms, reverse=True)[:limit]:
+            lines.append(f"{timing.name:<40}{timing.cumulative_ms:>10.1f}{timing.self_ms:>10.1f}")
+        return "\n".join(lines)
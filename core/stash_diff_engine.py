@@ -4,10 +4,17 @@ Stash Diff Engine for Detecting New Loot.
 Compares stash snapshots taken before and after map runs to identify
 items that were added (loot) or removed (sales/crafting).
 
+Tabs are compared individually: each tab gets a cheap signature (id,
+position, stack size and name of every item) and tabs whose signature did not
+change are skipped without fingerprinting. Items are keyed by their stash API
+``id`` when present. With ``advance=True`` the
+after-state becomes the next before-state, so consecutive map runs only pay
+for the tabs that actually changed.
+
 Usage:
     engine = StashDiffEngine()
     engine.set_before_snapshot(before_snapshot)
-    diff = engine.compute_diff(after_snapshot)
+    diff = engine.compute_diff(after_snapshot, advance=True)
 
     for item in diff.added_items:
         print(f"New loot: {item.get('typeLine')}")
@@ -16,6 +23,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
@@ -124,6 +132,60 @@ class ItemFingerprint:
         return f"{self.tab_id}:{self.item_hash}"
 
 
+FingerprintMap = Dict[str, Tuple[ItemFingerprint, Dict[str, Any]]]
+
+
+def item_key(item: Dict[str, Any], fp: ItemFingerprint) -> str:
+    """
+    Key identifying an item across snapshots.
+
+    Uses the stash API item ``id`` when present (stable for the life of the
+    item, even when identical items share a content hash), otherwise the
+    fingerprint's content key.
+    """
+    item_id = item.get("id")
+    if item_id:
+        return f"{fp.tab_id}:id:{item_id}"
+    return fp.content_key
+
+
+TabSignature = Tuple[Tuple[Any, ...], ...]
+
+
+def tab_signature(items: List[Dict[str, Any]]) -> TabSignature:
+    """
+    Cheap per-tab signature for detecting unchanged tabs.
+
+    Covers what a diff can report for an item: its id, position, stack size,
+    name and mod count. Far cheaper than fingerprinting (or serializing) the
+    full item dicts, and compared exactly, so there are no hash collisions.
+    """
+    return tuple(
+        (
+            item.get("id"),
+            item.get("x"),
+            item.get("y"),
+            item.get("stackSize"),
+            item.get("name"),
+            item.get("typeLine"),
+            len(item.get("explicitMods") or ()),
+        )
+        for item in items
+    )
+
+
+@dataclass
+class TabState:
+    """Fingerprinted contents of one stash tab."""
+
+    tab_id: str
+    signature: TabSignature
+    content_map: FingerprintMap = field(default_factory=dict)
+    position_map: FingerprintMap = field(default_factory=dict)
+    # Items by stash ``id`` for fingerprint reuse when the tab changes
+    items_by_id: Dict[str, Tuple[ItemFingerprint, Dict[str, Any]]] = field(default_factory=dict)
+
+
 @dataclass
 class StackChange:
     """Represents a change in stack size for an item."""
@@ -224,14 +286,18 @@ class StashDiffEngine:
             tracked_tabs: Optional list of tab names to track.
                          If None, tracks all tabs.
             ignore_currency_changes: If True, ignore small currency stack changes.
+
+        The engine is shared by the GUI and worker threads, so its per-tab
+        state is only read or replaced under ``_lock``.
         """
         self._tracked_tabs: Optional[Set[str]] = (
             set(tracked_tabs) if tracked_tabs else None
         )
         self._ignore_currency_changes = ignore_currency_changes
         self._before_snapshot: Optional["StashSnapshot"] = None
-        self._before_fingerprints: Dict[str, Tuple[ItemFingerprint, Dict[str, Any]]] = {}
-        self._before_position_map: Dict[str, Tuple[ItemFingerprint, Dict[str, Any]]] = {}
+        self._before_tabs: Dict[str, TabState] = {}
+        self._stats = {"tabs_skipped": 0, "tabs_fingerprinted": 0, "fingerprints_reused": 0}
+        self._lock = threading.RLock()
 
     def _should_track_tab(self, tab_name: str) -> bool:
         """Check if a tab should be tracked."""
@@ -239,6 +305,24 @@ class StashDiffEngine:
             return True
         return tab_name in self._tracked_tabs
 
+    @property
+    def _before_fingerprints(self) -> FingerprintMap:
+        """Combined content map of all tracked tabs in the before snapshot."""
+        combined: FingerprintMap = {}
+        with self._lock:
+            for state in self._before_tabs.values():
+                combined.update(state.content_map)
+        return combined
+
+    @property
+    def _before_position_map(self) -> FingerprintMap:
+        """Combined position map of all tracked tabs in the before snapshot."""
+        combined: FingerprintMap = {}
+        with self._lock:
+            for state in self._before_tabs.values():
+                combined.update(state.position_map)
+        return combined
+
     def set_before_snapshot(self, snapshot: "StashSnapshot"):
         """
         Set the 'before' snapshot for comparison.
@@ -246,114 +330,162 @@ class StashDiffEngine:
         Args:
             snapshot: The stash state before the map run.
         """
-        self._before_snapshot = snapshot
-        self._before_fingerprints = {}
-        self._before_position_map = {}
-
-        self._build_fingerprint_maps(
-            snapshot,
-            self._before_fingerprints,
-            self._before_position_map,
-        )
+        with self._lock:
+            self._before_snapshot = snapshot
+            self._before_tabs = self._build_tab_states(snapshot, previous={})
+            total_items = sum(len(t.content_map) for t in self._before_tabs.values())
 
-        total_items = len(self._before_fingerprints)
         logger.debug(f"Set before snapshot: {total_items} items tracked")
 
-    def _build_fingerprint_maps(
-        self,
-        snapshot: "StashSnapshot",
-        content_map: Dict[str, Tuple[ItemFingerprint, Dict[str, Any]]],
-        position_map: Dict[str, Tuple[ItemFingerprint, Dict[str, Any]]],
-    ):
-        """
-        Build fingerprint maps for a snapshot.
-
-        Args:
-            snapshot: Stash snapshot to process.
-            content_map: Map to fill with content-based keys.
-            position_map: Map to fill with position-based keys.
-        """
+    def _iter_tracked_tabs(self, snapshot: "StashSnapshot"):
+        """Yield tracked tabs, including children of folder tabs."""
         for tab in snapshot.tabs:
             if not self._should_track_tab(tab.name):
                 continue
+            yield tab
+            yield from tab.children
 
-            self._process_tab_items(tab, content_map, position_map)
+    def _build_tab_states(
+        self,
+        snapshot: "StashSnapshot",
+        previous: Dict[str, TabState],
+    ) -> Dict[str, TabState]:
+        """
+        Build per-tab state for a snapshot.
 
-            # Process child tabs (for folder stashes)
-            for child in tab.children:
-                self._process_tab_items(child, content_map, position_map)
+        Tabs whose signature matches the one in ``previous`` reuse the
+        previous state outright.
+        """
+        states: Dict[str, TabState] = {}
+        for tab in self._iter_tracked_tabs(snapshot):
+            signature = tab_signature(tab.items)
+            prior = previous.get(tab.id)
+            if prior is not None and prior.signature == signature:
+                states[tab.id] = prior
+                self._stats["tabs_skipped"] += 1
+            else:
+                states[tab.id] = self._process_tab_items(tab, signature, prior)
+                self._stats["tabs_fingerprinted"] += 1
+        return states
 
     def _process_tab_items(
         self,
         tab: "StashTab",
-        content_map: Dict[str, Tuple[ItemFingerprint, Dict[str, Any]]],
-        position_map: Dict[str, Tuple[ItemFingerprint, Dict[str, Any]]],
-    ):
-        """Process items from a single tab."""
-        for item in tab.items:
-            fp = ItemFingerprint.from_item(item, tab.id)
+        signature: TabSignature,
+        prior: Optional[TabState] = None,
+    ) -> TabState:
+        """Fingerprint items from a single tab, reusing unchanged id'd items."""
+        state = TabState(tab_id=tab.id, signature=signature)
+        reusable = prior.items_by_id if prior is not None else {}
 
-            # Store by content (for detecting same items)
-            content_key = fp.content_key
-            if content_key not in content_map:
-                content_map[content_key] = (fp, item)
+        for item in tab.items:
+            item_id = item.get("id")
+            reused = reusable.get(item_id) if item_id else None
+            if reused is not None and reused[1] == item:
+                fp = reused[0]
+                self._stats["fingerprints_reused"] += 1
+            else:
+                fp = ItemFingerprint.from_item(item, tab.id)
+
+            if item_id:
+                state.items_by_id[item_id] = (fp, item)
+
+            # Store by id/content (for detecting same items)
+            key = item_key(item, fp)
+            if key not in state.content_map:
+                state.content_map[key] = (fp, item)
 
             # Store by position (for detecting moves)
-            position_key = fp.position_key
-            position_map[position_key] = (fp, item)
+            state.position_map[fp.position_key] = (fp, item)
+
+        return state
 
-    def compute_diff(self, after_snapshot: "StashSnapshot") -> StashDiff:
+    def compute_diff(
+        self,
+        after_snapshot: "StashSnapshot",
+        advance: bool = False,
+    ) -> StashDiff:
         """
         Compute the diff between before and after snapshots.
 
         Args:
             after_snapshot: The 'after' stash state.
+            advance: If True, the after snapshot becomes the before snapshot
+                for the next diff (its tab states are kept, not rebuilt).
 
         Returns:
             StashDiff with added, removed, and changed items.
         """
-        if not self._before_snapshot:
-            logger.warning("No before snapshot set - returning empty diff")
-            return StashDiff()
-
-        # Build maps for after snapshot
-        after_content_map: Dict[str, Tuple[ItemFingerprint, Dict[str, Any]]] = {}
-        after_position_map: Dict[str, Tuple[ItemFingerprint, Dict[str, Any]]] = {}
-
-        self._build_fingerprint_maps(
-            after_snapshot,
-            after_content_map,
-            after_position_map,
-        )
+        with self._lock:
+            if not self._before_snapshot:
+                logger.warning("No before snapshot set - returning empty diff")
+                return StashDiff()
+
+            before_tabs = self._before_tabs
+            after_tabs = self._build_tab_states(after_snapshot, previous=before_tabs)
+
+            added_items: List[Dict[str, Any]] = []
+            removed_items: List[Dict[str, Any]] = []
+            stack_changes: List[StackChange] = []
+
+            for tab_id in before_tabs.keys() | after_tabs.keys():
+                before_state = before_tabs.get(tab_id)
+                after_state = after_tabs.get(tab_id)
+                if before_state is after_state:
+                    continue  # Unchanged tab
+                self._diff_tab(
+                    before_state.content_map if before_state else {},
+                    after_state.content_map if after_state else {},
+                    added_items,
+                    removed_items,
+                    stack_changes,
+                )
 
-        # Compare content maps
-        before_keys = set(self._before_fingerprints.keys())
-        after_keys = set(after_content_map.keys())
+            diff = StashDiff(
+                added_items=added_items,
+                removed_items=removed_items,
+                stack_changes=stack_changes,
+                before_total_items=sum(len(t.content_map) for t in before_tabs.values()),
+                after_total_items=sum(len(t.content_map) for t in after_tabs.values()),
+                computed_at=datetime.now(),
+            )
 
-        added_keys = after_keys - before_keys
-        removed_keys = before_keys - after_keys
-        common_keys = before_keys & after_keys
+            logger.info(f"Stash diff computed: {diff.get_summary()}")
 
-        added_items: List[Dict[str, Any]] = []
-        removed_items: List[Dict[str, Any]] = []
-        stack_changes: List[StackChange] = []
+            if advance:
+                self._before_snapshot = after_snapshot
+                self._before_tabs = after_tabs
+
+            return diff
+
+    def _diff_tab(
+        self,
+        before_map: FingerprintMap,
+        after_map: FingerprintMap,
+        added_items: List[Dict[str, Any]],
+        removed_items: List[Dict[str, Any]],
+        stack_changes: List[StackChange],
+    ) -> None:
+        """Compare one tab's before/after maps, appending to the result lists."""
+        before_keys = before_map.keys()
+        after_keys = after_map.keys()
 
         # Process added items
-        for key in added_keys:
-            fp, item = after_content_map[key]
+        for key in after_keys - before_keys:
+            fp, item = after_map[key]
             added_items.append(item)
             logger.debug(f"Added: {fp.display_name}")
 
         # Process removed items
-        for key in removed_keys:
-            fp, item = self._before_fingerprints[key]
+        for key in before_keys - after_keys:
+            fp, item = before_map[key]
             removed_items.append(item)
             logger.debug(f"Removed: {fp.display_name}")
 
         # Check for stack size changes on common items
-        for key in common_keys:
-            before_fp, before_item = self._before_fingerprints[key]
-            after_fp, after_item = after_content_map[key]
+        for key in before_keys & after_keys:
+            before_fp, before_item = before_map[key]
+            after_fp, after_item = after_map[key]
 
             before_stack = before_fp.stack_size
             after_stack = after_fp.stack_size
@@ -378,19 +510,6 @@ class StashDiffEngine:
                     f"{before_stack} -> {after_stack} ({delta:+d})"
                 )
 
-        diff = StashDiff(
-            added_items=added_items,
-            removed_items=removed_items,
-            stack_changes=stack_changes,
-            before_total_items=len(self._before_fingerprints),
-            after_total_items=len(after_content_map),
-            computed_at=datetime.now(),
-        )
-
-        logger.info(f"Stash diff computed: {diff.get_summary()}")
-
-        return diff
-
     def get_added_items_with_fingerprints(
         self, diff: StashDiff
     ) -> List[Tuple[Dict[str, Any], ItemFingerprint]]:
@@ -415,9 +534,9 @@ class StashDiffEngine:
 
     def clear(self):
         """Clear the stored before snapshot."""
-        self._before_snapshot = None
-        self._before_fingerprints = {}
-        self._before_position_map = {}
+        with self._lock:
+            self._before_snapshot = None
+            self._before_tabs = {}
         logger.debug("Diff engine cleared")
 
     @property
@@ -425,6 +544,16 @@ class StashDiffEngine:
         """Check if a before snapshot is set."""
         return self._before_snapshot is not None
 
+    @property
+    def before_snapshot(self) -> Optional["StashSnapshot"]:
+        """The snapshot the next diff is computed against."""
+        return self._before_snapshot
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counters for skipped/fingerprinted tabs and reused fingerprints."""
+        with self._lock:
+            return dict(self._stats)
+
 
 # Utility functions
 
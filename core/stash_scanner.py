@@ -7,10 +7,12 @@ Fetches stash tabs via OAuth API and scans for valuable items.
 import logging
 import requests
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from core.constants import API_TIMEOUT_STASH
+from core.item_parser import ParsedItem
 from core.poe_oauth import PoeOAuthClient
+from core.pricing.cache import parsed_item_key
 
 
 @dataclass
@@ -34,6 +36,9 @@ class StashItem:
     divine_value: float = 0.0
     confidence: str = "unknown"
 
+    # Full item data for pricing, built from the API JSON by _parse_item
+    parsed: Optional[ParsedItem] = field(default=None, repr=False, compare=False)
+
     def __str__(self) -> str:
         name = self.name or self.type_line
         return f"{name} @ Tab '{self.stash_tab_name}' ({self.position_x}, {self.position_y})"
@@ -313,6 +318,7 @@ class StashScanner:
                 identified=item_data.get('identified', False),
                 corrupted=item_data.get('corrupted', False),
                 icon=item_data.get('icon', ''),
+                parsed=ParsedItem.from_stash_item(item_data).compact(),
             )
 
             return item
@@ -365,43 +371,15 @@ class StashScanner:
         # Scan all tabs
         stash_tabs = self.scan_all_tabs()
 
-        # Price check each item
+        # Price check each tab's items as one batch
         for tab in stash_tabs:
-            tab_total_chaos = 0.0
-            tab_total_divine = 0.0
-
-            for item in tab.items:
-                # Build item text for parser
-                item_text = self._build_item_text(item)
-
-                # Get prices
-                try:
-                    results = price_service.check_item(item_text)
-
-                    if results:
-                        # Take first result (usually poe_ninja)
-                        best = results[0]
-
-                        item.chaos_value = float(
-                            best.get('chaos_value', 0) or 0)
-                        item.divine_value = float(
-                            best.get('divine_value', 0) or 0)
-                        item.confidence = best.get('source', 'unknown')
-
-                        tab_total_chaos += item.chaos_value
-                        tab_total_divine += item.divine_value
-
-                except Exception as e:
-                    self.logger.warning("Failed to price item %s: %s", item, e)
-
-            tab.total_value_chaos = tab_total_chaos
-            tab.total_value_divine = tab_total_divine
+            self._price_tab(tab, price_service)
 
             self.logger.info(
                 "Tab '%s': %.1fc (%.2fd) total",
                 tab.name,
-                tab_total_chaos,
-                tab_total_divine,
+                tab.total_value_chaos,
+                tab.total_value_divine,
             )
 
         # Filter valuable items
@@ -414,6 +392,58 @@ class StashScanner:
 
         return valuable
 
+    def _price_tab(self, tab: StashTab, price_service: Any) -> None:
+        """
+        Price every item of a tab and total the tab's value.
+
+        Items are priced from their parsed API data via
+        price_service.check_parsed_item(), once per distinct item: a tab of
+        identical stacks or cards costs one check. Items without parsed
+        data fall back to check_item() on minimal built text.
+
+        Args:
+            tab: Tab whose items get their price fields filled
+            price_service: PriceService instance to use for pricing
+        """
+        batches: Dict[str, List[StashItem]] = {}
+        for item in tab.items:
+            key = parsed_item_key(item.parsed) if item.parsed is not None else self._build_item_text(item)
+            batches.setdefault(key, []).append(item)
+
+        tab_total_chaos = 0.0
+        tab_total_divine = 0.0
+
+        for items in batches.values():
+            first = items[0]
+            try:
+                if first.parsed is not None:
+                    results = price_service.check_parsed_item(first.parsed)
+                else:
+                    results = price_service.check_item(self._build_item_text(first))
+            except Exception as e:
+                self.logger.warning("Failed to price item %s: %s", first, e)
+                continue
+
+            if not results:
+                continue
+
+            # Take first result (usually poe_ninja)
+            best = results[0]
+            chaos_value = float(best.get('chaos_value', 0) or 0)
+            divine_value = float(best.get('divine_value', 0) or 0)
+            confidence = best.get('source', 'unknown')
+
+            for item in items:
+                item.chaos_value = chaos_value
+                item.divine_value = divine_value
+                item.confidence = confidence
+
+            tab_total_chaos += chaos_value * len(items)
+            tab_total_divine += divine_value * len(items)
+
+        tab.total_value_chaos = tab_total_chaos
+        tab.total_value_divine = tab_total_divine
+
     def _build_item_text(self, item: StashItem) -> str:
         """
         Build pseudo-item text for parser.
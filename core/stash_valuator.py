@@ -11,6 +11,7 @@ Provides sorted, filterable results for the Stash Viewer window.
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
@@ -39,9 +40,13 @@ class PriceSource(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class PricedItem:
-    """An item with pricing information."""
+    """
+    An item with pricing information.
+
+    Slotted: a full account valuation holds tens of thousands of these.
+    """
     # Item data from stash API
     name: str
     type_line: str
@@ -382,10 +387,12 @@ class StashValuator:
             except Exception as e:
                 logger.warning("Failed to evaluate rare item '%s': %s", type_line, e)
 
+        # Names, bases and icon URLs repeat across a stash; intern them so
+        # every Divine Orb shares one set of strings.
         return PricedItem(
-            name=name,
-            type_line=type_line,
-            base_type=base_type,
+            name=sys.intern(name),
+            type_line=sys.intern(type_line),
+            base_type=sys.intern(base_type),
             item_class=item_class,
             stack_size=stack_size,
             ilvl=item.get("ilvl", 0),
@@ -393,8 +400,8 @@ class StashValuator:
             identified=item.get("identified", True),
             corrupted=item.get("corrupted", False),
             links=links,
-            sockets=socket_str,
-            icon=item.get("icon", ""),
+            sockets=sys.intern(socket_str),
+            icon=sys.intern(item.get("icon", "")),
             raw_item=item,
             unit_price=unit_price,
             total_price=total_price,
@@ -0,0 +1,339 @@
+"""
+Lightweight span tracing for the price-check path.
+
+A span is a context-manager timer. Spans opened while another span is active
+on the same thread (or in a context copied from it) become its children, so a
+price check records a tree like::
+
+    pricing.check_item
+      pricing.parse
+      pricing.lookup
+        pricing.ninja
+          http.poe.ninja
+      pricing.trade
+        trade.search
+          http.www.pathofexile.com
+      pricing.persist
+        db.PriceQuotesRepository
+
+Every finished span also feeds a rolling window of durations for its stage
+name, from which p50/p95/p99 are reported. The most recent root spans that
+have children are kept as traces for drilling into a single slow check.
+
+Profiling is opt-in: while enabled (``set_profiling(True)`` or the
+``POE_PROFILE`` environment variable), root spans run under cProfile and the
+accumulated stats are available as text or a ``.prof`` dump.
+
+Usage:
+    from core.tracing import span, get_tracer
+
+    with span("pricing.parse"):
+        parsed = parser.parse(text)
+
+    get_tracer().stage_stats()["pricing.parse"]["p95_ms"]
+"""
+from __future__ import annotations
+
+import contextvars
+import cProfile
+import functools
+import io
+import math
+import os
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+PROFILE_ENV = "POE_PROFILE"
+
+# Children kept per span; repository calls in loops would otherwise grow
+# a single trace without bound.
+MAX_CHILDREN = 100
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "poe_current_span", default=None
+)
+
+
+@dataclass
+class Span:
+    """One timed operation and the spans opened inside it."""
+
+    name: str
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.time)
+    duration_ms: float = 0.0
+    error: Optional[str] = None
+    children: List["Span"] = field(default_factory=list)
+    dropped_children: int = 0
+
+    def set(self, **attrs: Any) -> None:
+        """Attach attributes (e.g. result counts) to the span."""
+        self.attrs.update(attrs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "name": self.name,
+            "duration_ms": round(self.duration_ms, 3),
+            "started_at": self.started_at,
+        }
+        if self.attrs:
+            data["attrs"] = {k: v if isinstance(v, (int, float, bool, str)) else str(v) for k, v in self.attrs.items()}
+        if self.error:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [child.to_dict() for child in self.children]
+        if self.dropped_children:
+            data["dropped_children"] = self.dropped_children
+        return data
+
+
+class StageStats:
+    """Counters plus a rolling window of durations for one stage."""
+
+    __slots__ = ("count", "errors", "total_ms", "max_ms", "samples")
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def add(self, duration_ms: float, error: bool) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        if error:
+            self.errors += 1
+        self.samples.append(duration_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(_percentile(ordered, 50), 3),
+            "p95_ms": round(_percentile(ordered, 95), 3),
+            "p99_ms": round(_percentile(ordered, 99), 3),
+            "max_ms": round(self.max_ms, 3),
+            "window": len(ordered),
+        }
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Tracer:
+    """Collects spans into per-stage statistics and recent traces."""
+
+    DEFAULT_WINDOW = 1024
+    DEFAULT_MAX_TRACES = 50
+
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        max_traces: int = DEFAULT_MAX_TRACES,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            window: Durations kept per stage for percentiles.
+            max_traces: Completed root spans kept for inspection.
+            enabled: When False, ``span`` yields a throwaway span and records nothing.
+        """
+        self.window = window
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stages: Dict[str, StageStats] = {}
+        self._traces: Deque[Span] = deque(maxlen=max_traces)
+
+        self._profiler: Optional[cProfile.Profile] = None
+        self._profile_lock = threading.Lock()
+        if os.environ.get(PROFILE_ENV, "").strip().lower() in ("1", "true", "yes", "on"):
+            self.set_profiling(True)
+
+    # ------------------------------------------------------------------ #
+    # Spans
+    # ------------------------------------------------------------------ #
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Span]:
+        """Time the enclosed block as stage ``name``."""
+        current = Span(name, attrs)
+        if not self.enabled:
+            yield current
+            return
+
+        parent = _current_span.get()
+        token = _current_span.set(current)
+        profiler = self._start_profile() if parent is None else None
+        start = time.perf_counter()
+        try:
+            yield current
+        except BaseException as exc:
+            current.error = type(exc).__name__
+            raise
+        finally:
+            current.duration_ms = (time.perf_counter() - start) * 1000.0
+            if profiler is not None:
+                profiler.disable()
+                self._profile_lock.release()
+            _current_span.reset(token)
+            self._finish(current, parent)
+
+    def _finish(self, current: Span, parent: Optional[Span]) -> None:
+        with self._lock:
+            stats = self._stages.get(current.name)
+            if stats is None:
+                stats = self._stages[current.name] = StageStats(self.window)
+            stats.add(current.duration_ms, current.error is not None)
+            if parent is None:
+                # Lone leaf spans (an isolated query) aren't worth a trace slot
+                if current.children:
+                    self._traces.append(current)
+            elif len(parent.children) < MAX_CHILDREN:
+                parent.children.append(current)
+            else:
+                parent.dropped_children += 1
+
+    # ------------------------------------------------------------------ #
+    # Stats
+    # ------------------------------------------------------------------ #
+
+    def stage_stats(self, prefix: str = "") -> Dict[str, Dict[str, Any]]:
+        """Per-stage counters and rolling p50/p95/p99, optionally by name prefix."""
+        with self._lock:
+            return {
+                name: stats.snapshot()
+                for name, stats in sorted(self._stages.items())
+                if name.startswith(prefix)
+            }
+
+    def recent_traces(self, limit: int = 10, slowest: bool = False) -> List[Dict[str, Any]]:
+        """Most recent (or slowest) completed root spans with their children."""
+        with self._lock:
+            traces = list(self._traces)
+        if slowest:
+            traces.sort(key=lambda s: s.duration_ms, reverse=True)
+        else:
+            traces.reverse()
+        return [trace.to_dict() for trace in traces[:limit]]
+
+    def reset(self) -> None:
+        """Drop all collected stats, traces and profile data."""
+        with self._lock:
+            self._stages.clear()
+            self._traces.clear()
+        if self._profiler is not None:
+            with self._profile_lock:
+                self._profiler = cProfile.Profile()
+
+    # ------------------------------------------------------------------ #
+    # Profiling
+    # ------------------------------------------------------------------ #
+
+    @property
+    def profiling(self) -> bool:
+        return self._profiler is not None
+
+    def set_profiling(self, enabled: bool) -> None:
+        """Start or stop capturing cProfile data for root spans."""
+        with self._profile_lock:
+            if enabled and self._profiler is None:
+                self._profiler = cProfile.Profile()
+            elif not enabled:
+                self._profiler = None
+
+    def _start_profile(self) -> Optional[cProfile.Profile]:
+        profiler = self._profiler
+        # One profiled root span at a time; concurrent ones run unprofiled.
+        if profiler is None or not self._profile_lock.acquire(blocking=False):
+            return None
+        profiler.enable()
+        return profiler
+
+    def _profile_stats(self) -> Optional[pstats.Stats]:
+        with self._profile_lock:
+            if self._profiler is None:
+                return None
+            try:
+                return pstats.Stats(self._profiler)
+            except TypeError:  # nothing captured yet
+                return None
+
+    def profile_report(self, limit: int = 30, sort: str = "cumulative") -> str:
+        """Top functions from the captured profile as text."""
+        stats = self._profile_stats()
+        if stats is None:
+            return ""
+        out = io.StringIO()
+        stats.stream = out  # type: ignore[attr-defined]
+        stats.sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+    def dump_profile(self, path: Path) -> bool:
+        """Write captured profile data for snakeviz/pstats; False if none."""
+        stats = self._profile_stats()
+        if stats is None:
+            return False
+        stats.dump_stats(str(path))
+        return True
+
+
+# Global tracer instance
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Get or create the shared tracer."""
+    global _tracer
+
+    if _tracer is None:
+        _tracer = Tracer()
+
+    return _tracer
+
+
+def reset_tracer() -> None:
+    """Clear the shared tracer's stats (keeps the instance)."""
+    if _tracer is not None:
+        _tracer.reset()
+
+
+def span(name: str, **attrs: Any) -> Any:
+    """Open a span on the shared tracer."""
+    return get_tracer().span(name, **attrs)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator that wraps a function in a span on the shared tracer."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with get_tracer().span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def current_span() -> Optional[Span]:
+    """The innermost open span in this context, if any."""
+    return _current_span.get()
@@ -6,13 +6,19 @@ Calculates the real impact of item upgrades on a build by:
 2. Comparing against current gear
 3. Applying build scaling to show effective impact
 4. Tracking resistance and attribute gaps
+
+For ranking many candidates at once, calculate_upgrades_batch extracts all
+candidates into a (candidates x stats) NumPy matrix and scores them with
+array operations against the equipped item's stat vector.
 """
 from __future__ import annotations
 
 import re
 import logging
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 from core.build_stat_calculator import BuildStats, BuildStatCalculator
 
@@ -64,6 +70,66 @@ class ItemStats:
         """Total attributes."""
         return self.strength + self.dexterity + self.intelligence
 
+    def to_vector(self) -> np.ndarray:
+        """Stats as a float vector in STAT_COLUMNS order."""
+        return np.array([getattr(self, name) for name in STAT_COLUMNS], dtype=float)
+
+    @classmethod
+    def from_vector(cls, vector: Sequence[float]) -> "ItemStats":
+        """Build ItemStats from a vector in STAT_COLUMNS order."""
+        return cls(**{name: float(v) for name, v in zip(STAT_COLUMNS, vector)})
+
+
+# Column order of stat vectors/matrices produced by ItemStatExtractor
+STAT_COLUMNS: Tuple[str, ...] = tuple(f.name for f in fields(ItemStats))
+_COL = {name: i for i, name in enumerate(STAT_COLUMNS)}
+_RES_COLUMNS = [_COL["fire_res"], _COL["cold_res"], _COL["lightning_res"], _COL["chaos_res"]]
+
+
+class ModPatternMatcher:
+    """
+    First-match mod matcher over an ordered pattern table.
+
+    Patterns are compiled once. A single combined regex rejects mods that
+    match none of them in one pass, and results are memoised per mod text
+    since the same mod lines recur across many candidates. Match semantics
+    are identical to trying each pattern in order with re.search.
+    """
+
+    MAX_CACHE_SIZE = 20_000
+
+    def __init__(self, patterns: Mapping[str, str], flags: int = re.IGNORECASE):
+        self._ordered = [(key, re.compile(pattern, flags)) for key, pattern in patterns.items()]
+        self._any = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in patterns.values()), flags
+        )
+        self._cache: Dict[str, Optional[Tuple[str, float]]] = {}
+
+    def match(self, mod: str) -> Optional[Tuple[str, float]]:
+        """
+        Find the first pattern matching a mod.
+
+        Returns:
+            (pattern key, captured value) or None if no pattern matches.
+        """
+        try:
+            return self._cache[mod]
+        except KeyError:
+            pass
+
+        result: Optional[Tuple[str, float]] = None
+        if self._any.search(mod):
+            for key, regex in self._ordered:
+                match = regex.search(mod)
+                if match:
+                    result = (key, float(match.group(1)))
+                    break
+
+        if len(self._cache) >= self.MAX_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[mod] = result
+        return result
+
 
 @dataclass
 class UpgradeImpact:
@@ -198,6 +264,24 @@ class ItemStatExtractor:
         "movement_speed": r"(\d+)% increased Movement Speed",
     }
 
+    # Stat columns each pattern contributes to (compound mods fan out)
+    PATTERN_COLUMNS: Dict[str, Tuple[str, ...]] = {
+        "all_ele_res": ("fire_res", "cold_res", "lightning_res"),
+        "all_attributes": ("strength", "dexterity", "intelligence"),
+        "str_dex": ("strength", "dexterity"),
+        "str_int": ("strength", "intelligence"),
+        "dex_int": ("dexterity", "intelligence"),
+    }
+
+    _matcher: Optional[ModPatternMatcher] = None
+
+    @classmethod
+    def _get_matcher(cls) -> ModPatternMatcher:
+        """Shared compiled matcher for PATTERNS."""
+        if cls._matcher is None:
+            cls._matcher = ModPatternMatcher(cls.PATTERNS)
+        return cls._matcher
+
     def extract(self, mods: List[str]) -> ItemStats:
         """Extract stats from a list of item mods."""
         stats = ItemStats()
@@ -207,14 +291,46 @@ class ItemStatExtractor:
 
         return stats
 
+    def extract_vector(self, mods: Sequence[str]) -> np.ndarray:
+        """Extract stats from a list of mods as a vector in STAT_COLUMNS order."""
+        vector = np.zeros(len(STAT_COLUMNS), dtype=float)
+        self._accumulate(mods, vector)
+        return vector
+
+    def extract_matrix(self, mod_lists: Sequence[Sequence[str]]) -> np.ndarray:
+        """
+        Extract stats for many items at once.
+
+        Args:
+            mod_lists: One list of mods per item
+
+        Returns:
+            Array of shape (len(mod_lists), len(STAT_COLUMNS))
+        """
+        matrix = np.zeros((len(mod_lists), len(STAT_COLUMNS)), dtype=float)
+        for row, mods in enumerate(mod_lists):
+            self._accumulate(mods, matrix[row])
+        return matrix
+
+    def _accumulate(self, mods: Sequence[str], row: np.ndarray) -> None:
+        """Add the stats of each mod into a stat row."""
+        matcher = self._get_matcher()
+        for mod in mods:
+            found = matcher.match(mod)
+            if found is None:
+                continue
+            stat_name, value = found
+            for column in self.PATTERN_COLUMNS.get(stat_name, (stat_name,)):
+                index = _COL.get(column)
+                if index is not None:
+                    row[index] += value
+
     def _extract_mod(self, mod: str, stats: ItemStats) -> None:
         """Extract values from a single mod."""
-        for stat_name, pattern in self.PATTERNS.items():
-            match = re.search(pattern, mod, re.IGNORECASE)
-            if match:
-                value = float(match.group(1))
-                self._apply_value(stats, stat_name, value)
-                return  # Only match once per mod
+        found = self._get_matcher().match(mod)
+        if found:
+            stat_name, value = found
+            self._apply_value(stats, stat_name, value)
 
     def _apply_value(self, stats: ItemStats, stat_name: str, value: float) -> None:
         """Apply an extracted value to the stats object."""
@@ -248,6 +364,76 @@ class ItemStatExtractor:
                 setattr(stats, stat_name, getattr(stats, stat_name) + value)
 
 
+@dataclass
+class BatchUpgradeResult:
+    """
+    Vectorised upgrade impact for many candidates against one equipped item.
+
+    Row i of every array corresponds to the i-th candidate passed to
+    UpgradeCalculator.calculate_upgrades_batch.
+    """
+    new_stats: np.ndarray            # (N, S) candidate stats
+    current_stats: np.ndarray        # (S,) equipped item stats
+    deltas: np.ndarray               # (N, S) new - current
+    effective_life_delta: np.ndarray  # (N,)
+    effective_es_delta: np.ndarray    # (N,)
+    effective_armour_delta: np.ndarray  # (N,)
+    res_gap_covered: np.ndarray      # (N, 4) fire/cold/lightning/chaos % of gap
+    upgrade_scores: np.ndarray       # (N,)
+    gaps: ResistanceGaps = field(default_factory=ResistanceGaps)
+    _calculator: Optional["UpgradeCalculator"] = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return int(self.upgrade_scores.shape[0])
+
+    def ranked_indices(self) -> np.ndarray:
+        """Candidate indices ordered by upgrade score, best first (stable)."""
+        return np.argsort(-self.upgrade_scores, kind="stable")
+
+    def delta(self, stat_name: str) -> np.ndarray:
+        """Column of deltas for one stat."""
+        return self.deltas[:, _COL[stat_name]]
+
+    def impact(self, index: int) -> UpgradeImpact:
+        """
+        Materialise a full UpgradeImpact (with improvement/loss text) for
+        one candidate. Equivalent to UpgradeCalculator.calculate_upgrade.
+        """
+        d = self.deltas[index]
+        impact = UpgradeImpact(
+            life_delta=float(d[_COL["flat_life"]]),
+            es_delta=float(d[_COL["flat_es"]]),
+            armour_delta=float(d[_COL["flat_armour"]]),
+            evasion_delta=float(d[_COL["flat_evasion"]]),
+            fire_res_delta=float(d[_COL["fire_res"]]),
+            cold_res_delta=float(d[_COL["cold_res"]]),
+            lightning_res_delta=float(d[_COL["lightning_res"]]),
+            chaos_res_delta=float(d[_COL["chaos_res"]]),
+            strength_delta=float(d[_COL["strength"]]),
+            dexterity_delta=float(d[_COL["dexterity"]]),
+            intelligence_delta=float(d[_COL["intelligence"]]),
+            effective_life_delta=float(self.effective_life_delta[index]),
+            effective_es_delta=float(self.effective_es_delta[index]),
+            effective_armour_delta=float(self.effective_armour_delta[index]),
+            fire_res_gap_covered=float(self.res_gap_covered[index, 0]),
+            cold_res_gap_covered=float(self.res_gap_covered[index, 1]),
+            lightning_res_gap_covered=float(self.res_gap_covered[index, 2]),
+            chaos_res_gap_covered=float(self.res_gap_covered[index, 3]),
+            upgrade_score=float(self.upgrade_scores[index]),
+        )
+
+        if self._calculator is not None:
+            self._calculator._categorize_changes(
+                impact,
+                ItemStats.from_vector(self.new_stats[index]),
+                ItemStats.from_vector(self.current_stats),
+                self.gaps,
+            )
+
+        UpgradeCalculator._classify(impact)
+        return impact
+
+
 class UpgradeCalculator:
     """
     Calculates upgrade impact between items.
@@ -348,15 +534,99 @@ class UpgradeCalculator:
         impact.upgrade_score = self._calculate_upgrade_score(impact, gaps)
 
         # Determine upgrade/sidegrade/downgrade
-        if impact.upgrade_score > 10:
-            impact.is_upgrade = True
-        elif impact.upgrade_score < -10:
-            impact.is_downgrade = True
-        else:
-            impact.is_sidegrade = True
+        self._classify(impact)
 
         return impact
 
+    @staticmethod
+    def _classify(impact: UpgradeImpact) -> None:
+        """Set upgrade/sidegrade/downgrade flags from the score."""
+        impact.is_upgrade = impact.upgrade_score > 10
+        impact.is_downgrade = impact.upgrade_score < -10
+        impact.is_sidegrade = not (impact.is_upgrade or impact.is_downgrade)
+
+    def calculate_upgrades_batch(
+        self,
+        candidate_mods: Sequence[Sequence[str]],
+        current_item_mods: Optional[Sequence[str]] = None,
+    ) -> BatchUpgradeResult:
+        """
+        Score many candidates against the same equipped item.
+
+        Produces the same numbers as calling calculate_upgrade per candidate,
+        but extracts all candidates into one matrix and computes deltas,
+        effective values, resistance gap coverage and scores as array
+        operations. Use BatchUpgradeResult.impact(i) to get a full
+        UpgradeImpact for the candidates you keep.
+
+        Args:
+            candidate_mods: One mod list per candidate
+            current_item_mods: Mods on current equipped item (None = empty slot)
+
+        Returns:
+            BatchUpgradeResult with per-candidate arrays
+        """
+        new_stats = self.extractor.extract_matrix(candidate_mods)
+        current_stats = self.extractor.extract_vector(current_item_mods or [])
+        deltas = new_stats - current_stats
+
+        bs = self.build_stats
+        life_mult = 1 + (bs.life_inc / 100)
+        es_mult = 1 + (bs.es_inc / 100)
+        armour_mult = 1 + (bs.armour_inc / 100)
+
+        effective_life = (
+            deltas[:, _COL["flat_life"]] + deltas[:, _COL["strength"]] / 2
+        ) * life_mult
+        effective_es = deltas[:, _COL["flat_es"]] * es_mult
+        effective_armour = deltas[:, _COL["flat_armour"]] * armour_mult
+
+        # Gap coverage: % of each resistance gap filled by a positive delta
+        gaps = self.calculate_resistance_gaps()
+        gap_vec = np.array(
+            [gaps.fire_gap, gaps.cold_gap, gaps.lightning_gap, gaps.chaos_gap], dtype=float
+        )
+        res_deltas = deltas[:, _RES_COLUMNS]
+        fillable = (gap_vec > 0) & (res_deltas > 0)
+        ratio = np.divide(
+            res_deltas * 100, gap_vec, out=np.zeros_like(res_deltas), where=gap_vec > 0
+        )
+        res_gap_covered = np.where(fillable, np.minimum(100.0, ratio), 0.0)
+
+        # Score weights mirror _calculate_upgrade_score
+        res_weight = 2.0 if gaps.has_gaps() else 0.5
+        res_weights = np.array(
+            [
+                3.0 if gaps.fire_gap > 0 else res_weight,
+                3.0 if gaps.cold_gap > 0 else res_weight,
+                3.0 if gaps.lightning_gap > 0 else res_weight,
+                1.5,
+            ],
+            dtype=float,
+        )
+        scores = effective_life * 0.5
+        if bs.total_es > 500:
+            scores = scores + effective_es * 0.5
+        scores = scores + res_deltas @ res_weights
+        scores = scores + (
+            deltas[:, _COL["strength"]] * 0.3
+            + deltas[:, _COL["dexterity"]] * 0.2
+            + deltas[:, _COL["intelligence"]] * 0.2
+        )
+
+        return BatchUpgradeResult(
+            new_stats=new_stats,
+            current_stats=current_stats,
+            deltas=deltas,
+            effective_life_delta=effective_life,
+            effective_es_delta=effective_es,
+            effective_armour_delta=effective_armour,
+            res_gap_covered=res_gap_covered,
+            upgrade_scores=scores,
+            gaps=gaps,
+            _calculator=self,
+        )
+
     def _categorize_changes(
         self,
         impact: UpgradeImpact,
@@ -4,20 +4,28 @@ Upgrade Finder Service.
 Finds the best gear upgrades for a build within a budget constraint.
 Analyzes each equipment slot, queries the trade API, and ranks results
 by upgrade impact (defensive stats, DPS, gap coverage).
+
+Slots are searched concurrently on a small thread pool. All trade requests
+are paced by the trade client's rate limiter, and slots that produce the
+same trade query (e.g. Ring 1 / Ring 2) share a single search + fetch.
 """
 from __future__ import annotations
 
+import json
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from enum import Enum
 
+import numpy as np
+
 from core.pob import CharacterProfile, PoBItem
 from core.build_stat_calculator import BuildStats
 from core.bis_calculator import BiSCalculator, BiSRequirements, EQUIPMENT_SLOTS
 from core.upgrade_calculator import UpgradeCalculator, UpgradeImpact, ItemStatExtractor
 from core.dps_impact_calculator import DPSStats, DPSImpactCalculator, DPSImpactResult
-
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +44,9 @@ class UpgradeSlot(str, Enum):
     # Note: We use Ring 1/Ring 2 from PoB slot names
 
 
+# Slots that share BiS requirements with another slot name
+RING_SLOTS = ("Ring", "Ring 1", "Ring 2")
+
 # Map BiS slot names to PoB slot names
 BIS_TO_POB_SLOT = {
     "Helmet": "Helmet",
@@ -44,6 +55,8 @@ BIS_TO_POB_SLOT = {
     "Boots": "Boots",
     "Belt": "Belt",
     "Ring": "Ring 1",  # Default to Ring 1 for BiS
+    "Ring 1": "Ring 1",
+    "Ring 2": "Ring 2",
     "Amulet": "Amulet",
     "Shield": "Weapon 2",  # Offhand
 }
@@ -162,17 +175,32 @@ class UpgradeFinderResult:
         return summary
 
 
+@dataclass
+class _UpgradeRun:
+    """State shared by the slot workers of one find_upgrades() run."""
+    # Trade query key -> listings future of the slot that requested it first
+    listing_futures: Dict[str, Future] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
 class UpgradeFinderService:
     """
     Service for finding gear upgrades within a budget.
 
     Usage:
         service = UpgradeFinderService(character_manager)
-        result = service.find_upgrades("MyCharacter", budget_chaos=500)
+        result = service.find_upgrades(
+            "MyCharacter",
+            budget_chaos=500,
+            on_slot_result=lambda r: print(f"{r.slot} done"),
+        )
         for slot, candidate in result.get_best_upgrades():
             print(f"{slot}: {candidate.name} - {candidate.price_display}")
     """
 
+    # Concurrent slot searches
+    DEFAULT_MAX_WORKERS = 4
+
     # Default equipment slots to search
     DEFAULT_SLOTS = [
         "Helmet", "Body Armour", "Gloves", "Boots",
@@ -183,6 +211,8 @@ class UpgradeFinderService:
         self,
         character_manager: Any,
         league: str = "Standard",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        trade_source: Any = None,
     ):
         """
         Initialize the upgrade finder.
@@ -190,17 +220,25 @@ class UpgradeFinderService:
         Args:
             character_manager: CharacterManager for loading profiles
             league: League to search in
+            max_workers: Maximum slots searched concurrently
+            trade_source: TradeApiSource to search with (created on first
+                use if omitted); its client's rate limiter paces requests
         """
         self.character_manager = character_manager
         self.league = league
+        self.max_workers = max(1, max_workers)
         self._stat_extractor = ItemStatExtractor()
 
+        self._trade_source_lock = threading.Lock()
+        self._trade_source: Any = trade_source
+
     def find_upgrades(
         self,
         profile_name: str,
         budget_chaos: float,
         slots: Optional[List[str]] = None,
         max_results_per_slot: int = 10,
+        on_slot_result: Optional[Callable[[SlotUpgradeResult], None]] = None,
     ) -> UpgradeFinderResult:
         """
         Find upgrade items for a character within budget.
@@ -210,9 +248,12 @@ class UpgradeFinderService:
             budget_chaos: Maximum price in chaos orbs
             slots: Specific slots to search (None = all default slots)
             max_results_per_slot: Maximum candidates per slot
+            on_slot_result: Called on the calling thread with each
+                SlotUpgradeResult as soon as that slot completes
 
         Returns:
-            UpgradeFinderResult with candidates for each slot
+            UpgradeFinderResult with candidates for each slot (in the
+            order the slots were requested)
         """
         import time
         start_time = time.time()
@@ -247,18 +288,48 @@ class UpgradeFinderService:
             logger.debug(f"Could not initialize DPS calculator: {e}")
 
         # Determine which slots to search
-        search_slots = slots or self.DEFAULT_SLOTS
+        search_slots = list(dict.fromkeys(slots or self.DEFAULT_SLOTS))
+
+        completed: Dict[str, SlotUpgradeResult] = {}
+        run = _UpgradeRun()
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(search_slots)) or 1,
+            thread_name_prefix="UpgradeFinder",
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._search_slot,
+                    profile=profile,
+                    slot=slot,
+                    budget_chaos=budget_chaos,
+                    bis_calculator=bis_calculator,
+                    upgrade_calculator=upgrade_calculator,
+                    dps_calculator=dps_calculator,
+                    max_results=max_results_per_slot,
+                    run=run,
+                ): slot
+                for slot in search_slots
+            }
+
+            for future in as_completed(futures):
+                slot = futures[future]
+                try:
+                    slot_result = future.result()
+                except Exception as e:
+                    logger.exception(f"Slot search crashed: {slot}")
+                    slot_result = SlotUpgradeResult(
+                        slot=slot, current_item=None, error=str(e)
+                    )
+                completed[slot] = slot_result
+
+                if on_slot_result:
+                    try:
+                        on_slot_result(slot_result)
+                    except Exception as e:
+                        logger.error(f"Slot result callback error: {e}")
 
         for slot in search_slots:
-            slot_result = self._search_slot(
-                profile=profile,
-                slot=slot,
-                budget_chaos=budget_chaos,
-                bis_calculator=bis_calculator,
-                upgrade_calculator=upgrade_calculator,
-                dps_calculator=dps_calculator,
-                max_results=max_results_per_slot,
-            )
+            slot_result = completed[slot]
             result.slot_results[slot] = slot_result
             result.total_candidates += len(slot_result.candidates)
 
@@ -279,6 +350,7 @@ class UpgradeFinderService:
         upgrade_calculator: UpgradeCalculator,
         dps_calculator: Optional[DPSImpactCalculator],
         max_results: int,
+        run: Optional[_UpgradeRun] = None,
     ) -> SlotUpgradeResult:
         """Search for upgrades in a single equipment slot."""
         # Map BiS slot to PoB slot
@@ -300,7 +372,7 @@ class UpgradeFinderService:
             # Get BiS requirements for this slot
             if slot not in EQUIPMENT_SLOTS:
                 # Handle Ring specifically
-                if slot == "Ring":
+                if slot in RING_SLOTS:
                     requirements = bis_calculator.calculate_requirements(
                         "Ring", custom_priorities=profile.priorities
                     )
@@ -319,20 +391,16 @@ class UpgradeFinderService:
             query = self._build_upgrade_query(requirements, budget_chaos)
 
             # Search trade API
-            candidates = self._execute_trade_search(query, max_results)
+            candidates = self._execute_trade_search(query, max_results, run)
 
-            # Score each candidate
-            for candidate in candidates:
-                self._score_candidate(
-                    candidate=candidate,
-                    current_mods=current_mods,
-                    upgrade_calculator=upgrade_calculator,
-                    dps_calculator=dps_calculator,
-                )
-
-            # Sort by total score
-            candidates.sort(key=lambda c: c.total_score, reverse=True)
-            result.candidates = candidates[:max_results]
+            # Score all candidates in one batch, keep the best
+            result.candidates = self._score_candidates(
+                candidates=candidates,
+                current_mods=current_mods,
+                upgrade_calculator=upgrade_calculator,
+                dps_calculator=dps_calculator,
+                max_results=max_results,
+            )
 
         except Exception as e:
             logger.exception(f"Error searching slot {slot}")
@@ -385,25 +453,81 @@ class UpgradeFinderService:
 
         return query
 
+    def _get_trade_source(self) -> Any:
+        """Get the trade source, creating a rate-paced one on first use."""
+        from data_sources.pricing.trade_api import TradeApiSource
+
+        with self._trade_source_lock:
+            if self._trade_source is None:
+                self._trade_source = TradeApiSource(league=self.league, pace_requests=True)
+            return self._trade_source
+
+    def _fetch_trade_listings(
+        self,
+        query: Dict[str, Any],
+        max_results: int,
+        run: Optional[_UpgradeRun] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search and fetch raw trade listings for a query.
+
+        Within a find_upgrades run, identical queries from different slots
+        are coalesced: the first caller performs the requests and the others
+        wait for and reuse its listings.
+        """
+        if run is None:
+            return self._request_trade_listings(query, max_results)
+
+        key = json.dumps(query, sort_keys=True, default=str) + f"|{max_results}"
+
+        owner = False
+        with run.lock:
+            future = run.listing_futures.get(key)
+            if future is None:
+                future = Future()
+                run.listing_futures[key] = future
+                owner = True
+
+        if not owner:
+            logger.debug("Reusing shared trade listings for identical slot query")
+            return future.result()
+
+        try:
+            listings = self._request_trade_listings(query, max_results)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        future.set_result(listings)
+        return listings
+
+    def _request_trade_listings(
+        self,
+        query: Dict[str, Any],
+        max_results: int,
+    ) -> List[Dict[str, Any]]:
+        """Perform the search + fetch requests for a query."""
+        source = self._get_trade_source()
+
+        search_id, result_ids = source._search(query, max_results=max_results)
+
+        if not result_ids or not search_id:
+            return []
+
+        return list(source._fetch_listings(search_id, result_ids[:max_results]))
+
     def _execute_trade_search(
         self,
         query: Dict[str, Any],
         max_results: int,
+        run: Optional[_UpgradeRun] = None,
     ) -> List[UpgradeCandidate]:
         """Execute trade API search and return candidates."""
         candidates: List[UpgradeCandidate] = []
 
         try:
-            from data_sources.pricing.trade_api import TradeApiSource
-
-            source = TradeApiSource(league=self.league)
-            search_id, result_ids = source._search(query, max_results=max_results)
-
-            if not result_ids or not search_id:
-                return candidates
-
-            listings = source._fetch_listings(search_id, result_ids[:max_results])
+            listings = self._fetch_trade_listings(query, max_results, run)
 
+            # Parse per call so each slot scores its own candidate objects
             for listing in listings:
                 candidate = self._parse_listing(listing)
                 if candidate:
@@ -450,6 +574,66 @@ class UpgradeFinderService:
             logger.debug(f"Failed to parse listing: {e}")
             return None
 
+    def _score_candidates(
+        self,
+        candidates: List[UpgradeCandidate],
+        current_mods: List[str],
+        upgrade_calculator: UpgradeCalculator,
+        dps_calculator: Optional[DPSImpactCalculator],
+        max_results: int,
+    ) -> List[UpgradeCandidate]:
+        """
+        Score candidates as a batch and return the top ``max_results``.
+
+        Defensive and DPS scores are computed with array operations over all
+        candidates; full UpgradeImpact/DPSImpactResult details are only
+        built for the candidates that are kept. Falls back to per-candidate
+        scoring if the batch calculation fails.
+        """
+        if not candidates:
+            return []
+
+        mod_lists = [c.all_mods for c in candidates]
+        try:
+            batch = upgrade_calculator.calculate_upgrades_batch(mod_lists, current_mods)
+            if dps_calculator:
+                dps_percents = dps_calculator.calculate_dps_percent_batch(mod_lists)
+            else:
+                dps_percents = np.zeros(len(candidates))
+        except Exception as e:
+            logger.debug(f"Batch scoring failed, scoring individually: {e}")
+            for candidate in candidates:
+                self._score_candidate(
+                    candidate=candidate,
+                    current_mods=current_mods,
+                    upgrade_calculator=upgrade_calculator,
+                    dps_calculator=dps_calculator,
+                )
+            candidates.sort(key=lambda c: c.total_score, reverse=True)
+            return candidates[:max_results]
+
+        prices = np.array([c.price_chaos for c in candidates], dtype=float)
+        price_penalty = np.where(prices > 0, prices / 100, 0.0)
+        totals = batch.upgrade_scores + dps_percents * 10 - price_penalty
+
+        kept = []
+        for index in np.argsort(-totals, kind="stable")[:max_results]:
+            candidate = candidates[index]
+            candidate.upgrade_impact = batch.impact(int(index))
+            candidate.upgrade_score = float(batch.upgrade_scores[index])
+            candidate.total_score = float(totals[index])
+            if dps_calculator:
+                try:
+                    dps_impact = dps_calculator.calculate_impact(candidate.all_mods)
+                    candidate.dps_impact = dps_impact
+                    candidate.dps_change = dps_impact.total_dps_change
+                    candidate.dps_percent_change = dps_impact.total_dps_percent
+                except Exception as e:
+                    logger.debug(f"Failed to calculate DPS impact: {e}")
+            kept.append(candidate)
+
+        return kept
+
     def _score_candidate(
         self,
         candidate: UpgradeCandidate,
@@ -12,6 +12,9 @@ Usage:
         if result.is_ok():
             response = result.unwrap()
             print(response.content)
+
+Responses can be cached on disk (and recorded/replayed for offline tests)
+by passing an AIResponseCache; see response_cache.py.
 """
 
 from __future__ import annotations
@@ -26,6 +29,12 @@ from data_sources.ai.openai_client import OpenAIClient
 from data_sources.ai.groq_client import GroqClient
 from data_sources.ai.xai_client import XAIClient
 from data_sources.ai.ollama_client import OllamaClient
+from data_sources.ai.response_cache import (
+    AIResponseCache,
+    CachingAIClient,
+    get_ai_response_cache,
+    reset_ai_response_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +62,8 @@ def create_ai_client(
     max_tokens: int = 500,
     ollama_host: str = "",
     ollama_model: str = "",
+    cache: Optional[AIResponseCache] = None,
+    cache_mode: str = "cache",
 ) -> Optional[BaseAIClient]:
     """Create an AI client for the specified provider.
 
@@ -63,6 +74,8 @@ def create_ai_client(
         max_tokens: Maximum tokens in response.
         ollama_host: Ollama server URL (optional, for ollama provider).
         ollama_model: Ollama model name (optional, for ollama provider).
+        cache: Response cache to serve repeated prompts from (optional).
+        cache_mode: "cache", "record" or "replay" (only used with cache).
 
     Returns:
         An AI client instance, or None if provider is invalid/empty.
@@ -85,6 +98,7 @@ def create_ai_client(
 
     logger.info(f"Creating AI client for provider: {provider_lower}")
 
+    client: BaseAIClient
     # Special handling for Ollama
     if provider_lower == "ollama":
         ollama_kwargs: Dict[str, Any] = {
@@ -95,13 +109,17 @@ def create_ai_client(
             ollama_kwargs["host"] = ollama_host
         if ollama_model:
             ollama_kwargs["model"] = ollama_model
-        return OllamaClient(**ollama_kwargs)
+        client = OllamaClient(**ollama_kwargs)
+    else:
+        client = client_class(
+            api_key=api_key,
+            timeout=timeout,
+            max_tokens=max_tokens,
+        )
 
-    return client_class(
-        api_key=api_key,
-        timeout=timeout,
-        max_tokens=max_tokens,
-    )
+    if cache is not None:
+        return CachingAIClient(client, cache, mode=cache_mode)  # type: ignore[arg-type]
+    return client
 
 
 def get_provider_display_name(provider: str) -> str:
@@ -138,8 +156,10 @@ def is_local_provider(provider: str) -> bool:
 
 __all__ = [
     "AIResponse",
+    "AIResponseCache",
     "AIProvider",
     "BaseAIClient",
+    "CachingAIClient",
     "ClaudeClient",
     "GeminiClient",
     "GroqClient",
@@ -148,6 +168,8 @@ __all__ = [
     "XAIClient",
     "SUPPORTED_PROVIDERS",
     "create_ai_client",
+    "get_ai_response_cache",
     "get_provider_display_name",
     "is_local_provider",
+    "reset_ai_response_cache",
 ]
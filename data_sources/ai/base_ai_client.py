@@ -8,8 +8,8 @@ All implementations return Result types for consistent error handling.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
 import logging
 
 from core.result import Result
@@ -26,12 +26,21 @@ class AIResponse:
         model: The model that generated the response.
         tokens_used: Number of tokens consumed (if available).
         provider: The provider name (e.g., "gemini", "claude", "openai").
+        metadata: Extra details about how the response was obtained, e.g.
+            {"cache": "hit", "cache_key": ..., "cached_at": ...} when it
+            came from the AIResponseCache (see response_cache.py).
     """
 
     content: str
     model: str
     tokens_used: int = 0
     provider: str = ""
+    metadata: Dict[str, Any] = field(default_factory=dict, compare=False, hash=False)
+
+    @property
+    def from_cache(self) -> bool:
+        """True if this response was served from the response cache."""
+        return self.metadata.get("cache") in ("hit", "replay")
 
 
 class BaseAIClient(ABC):
@@ -72,6 +81,16 @@ class BaseAIClient(ABC):
         """Return the provider name (e.g., 'gemini', 'claude', 'openai')."""
         pass
 
+    @property
+    def model_name(self) -> str:
+        """Return the model requests are sent to (empty if not applicable)."""
+        return str(getattr(self, "_model", ""))
+
+    @property
+    def max_tokens(self) -> int:
+        """Return the response token limit sent with each request."""
+        return self._max_tokens
+
     @abstractmethod
     def complete(
         self,
@@ -0,0 +1,420 @@
+"""
+On-disk response cache for AI clients, with record/replay.
+
+Responses are stored in SQLite under a content-addressed key built from
+the provider, model, request parameters and a hash of the normalised
+prompt, so re-analysing the same item or build returns the stored answer
+instead of paying the provider's latency and cost again.
+
+CachingAIClient wraps any BaseAIClient and has three modes:
+
+- "cache": serve fresh entries, call the provider (and store) otherwise
+- "record": always call the provider and store the response
+- "replay": never call the provider; unknown prompts are errors
+
+A cache can be saved to and loaded from a JSON transcript, so advisors
+can be tested offline against recorded provider responses.
+
+Usage:
+    cache = AIResponseCache(Path("ai_responses.db"))
+    client = CachingAIClient(create_ai_client("claude", key), cache)
+    result = client.complete(prompt, system_prompt)
+    if result.is_ok() and result.unwrap().from_cache:
+        ...
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from core.result import Result, Ok, Err
+from data_sources.ai.base_ai_client import BaseAIClient, AIResponse
+
+logger = logging.getLogger(__name__)
+
+CacheMode = Literal["cache", "record", "replay"]
+CACHE_MODES: Tuple[str, ...] = ("cache", "record", "replay")
+
+AI_CACHE_DB_NAME = "ai_responses.db"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 2000
+
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS ai_responses (
+        cache_key TEXT PRIMARY KEY,
+        provider TEXT NOT NULL,
+        model TEXT NOT NULL,
+        prompt_hash TEXT NOT NULL,
+        params TEXT NOT NULL,
+        content TEXT NOT NULL,
+        response_model TEXT NOT NULL,
+        tokens_used INTEGER NOT NULL DEFAULT 0,
+        created_at REAL NOT NULL,
+        last_used_at REAL NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_ai_responses_last_used
+        ON ai_responses(last_used_at);
+"""
+
+TRANSCRIPT_COLUMNS = (
+    "cache_key", "provider", "model", "prompt_hash", "params",
+    "content", "response_model", "tokens_used", "created_at",
+)
+
+
+def normalize_prompt(text: str) -> str:
+    """Normalise line endings and trailing whitespace so equal prompts hash equal."""
+    text = text.replace("\r\n", "\n").replace("\r", "\n").strip()
+    return "\n".join(line.rstrip() for line in text.split("\n"))
+
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, str]:
+    """
+    Build the cache key for a request.
+
+    Args:
+        provider: Provider name (e.g. "claude")
+        model: Model the request is sent to
+        prompt: User prompt
+        system_prompt: System prompt, if any
+        params: Other request parameters that change the answer (max_tokens, ...)
+
+    Returns:
+        (cache_key, prompt_hash), both hex SHA-256 digests
+    """
+    prompt_hash = hashlib.sha256(
+        json.dumps([normalize_prompt(system_prompt or ""), normalize_prompt(prompt)]).encode("utf-8")
+    ).hexdigest()
+    identity = json.dumps(
+        [provider, model, prompt_hash, params or {}], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest(), prompt_hash
+
+
+class AIResponseCache:
+    """
+    SQLite store of AI responses with a TTL and an entry cap.
+
+    Entries older than ``ttl_seconds`` are not served in "cache" mode (replay
+    ignores age). When more than ``max_entries`` are stored, the least
+    recently used are evicted. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            db_path: Path to the SQLite file (":memory:" for a throwaway cache)
+            ttl_seconds: Age after which entries are stale
+            max_entries: Maximum number of stored responses
+        """
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=10)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA_SQL)
+        self.conn.commit()
+
+    def get(self, cache_key: str, ignore_ttl: bool = False) -> Optional[sqlite3.Row]:
+        """
+        Look up a stored response and mark it used.
+
+        Args:
+            cache_key: Key from make_cache_key()
+            ignore_ttl: Return the entry even if it is stale
+
+        Returns:
+            The stored row, or None if missing (or stale)
+        """
+        now = time.time()
+        with self._lock:
+            row: Optional[sqlite3.Row] = self.conn.execute(
+                "SELECT * FROM ai_responses WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            if row is None or (not ignore_ttl and now - row["created_at"] > self.ttl_seconds):
+                self.misses += 1
+                return None
+            self.conn.execute(
+                "UPDATE ai_responses SET last_used_at = ? WHERE cache_key = ?", (now, cache_key)
+            )
+            self.conn.commit()
+            self.hits += 1
+            return row
+
+    def put(
+        self,
+        cache_key: str,
+        prompt_hash: str,
+        params: Dict[str, Any],
+        response: AIResponse,
+        provider: str,
+        model: str,
+    ) -> None:
+        """Store (or replace) a response, then evict down to max_entries."""
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO ai_responses
+                    (cache_key, provider, model, prompt_hash, params, content,
+                     response_model, tokens_used, created_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (cache_key, provider, model, prompt_hash, json.dumps(params, sort_keys=True),
+                 response.content, response.model, response.tokens_used, now, now),
+            )
+            self.conn.execute(
+                """
+                DELETE FROM ai_responses WHERE cache_key IN (
+                    SELECT cache_key FROM ai_responses
+                    ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            self.conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete stale entries; returns how many were removed."""
+        with self._lock:
+            cursor = self.conn.execute(
+                "DELETE FROM ai_responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            self.conn.commit()
+            return cursor.rowcount
+
+    def clear(self) -> int:
+        """Delete every entry; returns how many were removed."""
+        with self._lock:
+            cursor = self.conn.execute("DELETE FROM ai_responses")
+            self.conn.commit()
+            self.hits = self.misses = 0
+            return cursor.rowcount
+
+    @property
+    def size(self) -> int:
+        """Number of stored responses."""
+        with self._lock:
+            return int(self.conn.execute("SELECT COUNT(*) FROM ai_responses").fetchone()[0])
+
+    def save_transcript(self, path: Path) -> int:
+        """
+        Write every entry to a JSON transcript (for test fixtures).
+
+        Returns:
+            Number of entries written
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT {', '.join(TRANSCRIPT_COLUMNS)} FROM ai_responses ORDER BY created_at"  # nosec B608
+            ).fetchall()
+        entries = [dict(row) for row in rows]
+        for entry in entries:
+            entry["params"] = json.loads(entry["params"])
+        Path(path).write_text(json.dumps({"entries": entries}, indent=2), encoding="utf-8")
+        return len(entries)
+
+    def load_transcript(self, path: Path) -> int:
+        """
+        Add the entries of a JSON transcript written by save_transcript().
+
+        Returns:
+            Number of entries loaded
+        """
+        entries: List[Dict[str, Any]] = json.loads(Path(path).read_text(encoding="utf-8"))["entries"]
+        with self._lock:
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO ai_responses
+                    (cache_key, provider, model, prompt_hash, params, content,
+                     response_model, tokens_used, created_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (e["cache_key"], e["provider"], e["model"], e["prompt_hash"],
+                     json.dumps(e.get("params", {}), sort_keys=True), e["content"],
+                     e.get("response_model", e["model"]), e.get("tokens_used", 0),
+                     e.get("created_at", 0.0), e.get("created_at", 0.0))
+                    for e in entries
+                ],
+            )
+            self.conn.commit()
+        return len(entries)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+
+class CachingAIClient(BaseAIClient):
+    """
+    BaseAIClient wrapper serving responses from an AIResponseCache.
+
+    Responses carry metadata["cache"]: "hit" or "replay" when served from
+    the cache, "miss" or "record" when fetched from the provider.
+
+    Example:
+        >>> client = CachingAIClient(ClaudeClient(api_key="..."), cache)
+        >>> result = client.complete("Tell me about this item")
+        >>> result.unwrap().from_cache
+        False
+    """
+
+    def __init__(self, client: BaseAIClient, cache: AIResponseCache, mode: CacheMode = "cache"):
+        """
+        Wrap a provider client.
+
+        Args:
+            client: Client that talks to the provider
+            cache: Response store
+            mode: "cache", "record" or "replay" (see module docstring)
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown AI cache mode: {mode}")
+        super().__init__(client._api_key, client._timeout, client._max_tokens)
+        self._client = client
+        self._cache = cache
+        self._mode = mode
+
+    @property
+    def provider_name(self) -> str:
+        return self._client.provider_name
+
+    @property
+    def model_name(self) -> str:
+        return self._client.model_name
+
+    @property
+    def mode(self) -> str:
+        """The cache mode ("cache", "record" or "replay")."""
+        return self._mode
+
+    @property
+    def client(self) -> BaseAIClient:
+        """The wrapped provider client."""
+        return self._client
+
+    def is_configured(self) -> bool:
+        # Replay never reaches the provider, so needs no credentials
+        return self._mode == "replay" or self._client.is_configured()
+
+    def complete(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+    ) -> Result[AIResponse, str]:
+        """Return the stored response for this request, or ask the provider."""
+        params = {"max_tokens": self._client.max_tokens}
+        cache_key, prompt_hash = make_cache_key(
+            self.provider_name, self.model_name, prompt, system_prompt, params
+        )
+
+        if self._mode != "record":
+            row = self._cache.get(cache_key, ignore_ttl=self._mode == "replay")
+            if row is not None:
+                logger.debug(f"[{self.provider_name}] Response cache {self._mode} hit: {cache_key[:12]}")
+                return Ok(AIResponse(
+                    content=row["content"],
+                    model=row["response_model"],
+                    tokens_used=row["tokens_used"],
+                    provider=row["provider"],
+                    metadata={
+                        "cache": "replay" if self._mode == "replay" else "hit",
+                        "cache_key": cache_key,
+                        "cached_at": datetime.fromtimestamp(row["created_at"], timezone.utc).isoformat(),
+                    },
+                ))
+            if self._mode == "replay":
+                return Err(f"No recorded {self.provider_name} response for this prompt ({cache_key[:12]})")
+
+        result = self._client.complete(prompt, system_prompt)
+        if result.is_err():
+            return result
+
+        response = result.unwrap()
+        self._cache.put(cache_key, prompt_hash, params, response, self.provider_name, self.model_name)
+        return Ok(AIResponse(
+            content=response.content,
+            model=response.model,
+            tokens_used=response.tokens_used,
+            provider=response.provider,
+            metadata={**response.metadata, "cache": "record" if self._mode == "record" else "miss",
+                      "cache_key": cache_key},
+        ))
+
+    def close(self) -> None:
+        """Close the wrapped client (the cache is shared and stays open)."""
+        if hasattr(self._client, "close"):
+            self._client.close()
+
+
+# Global cache instance
+_ai_response_cache: Optional[AIResponseCache] = None
+_ai_response_cache_lock = threading.Lock()
+
+
+def get_ai_response_cache(
+    db_path: Optional[Path] = None,
+    ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+) -> AIResponseCache:
+    """
+    Get or create the global AI response cache.
+
+    Args:
+        db_path: Database path (only used on first call; defaults to the config dir)
+        ttl_seconds: Entry TTL (only used on first call)
+        max_entries: Entry cap (only used on first call)
+
+    Returns:
+        The global cache instance.
+    """
+    global _ai_response_cache
+
+    with _ai_response_cache_lock:
+        if _ai_response_cache is None:
+            if db_path is None:
+                from core.config.defaults import get_config_dir
+                db_path = get_config_dir() / AI_CACHE_DB_NAME
+            _ai_response_cache = AIResponseCache(db_path, ttl_seconds, max_entries)
+            logger.info(f"Created AI response cache at {db_path} (ttl={ttl_seconds}s, max={max_entries})")
+        return _ai_response_cache
+
+
+def reset_ai_response_cache() -> None:
+    """Close and drop the global cache (for tests)."""
+    global _ai_response_cache
+
+    with _ai_response_cache_lock:
+        if _ai_response_cache is not None:
+            _ai_response_cache.close()
+        _ai_response_cache = None
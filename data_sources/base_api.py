@@ -16,8 +16,11 @@ import os
 from datetime import datetime, timedelta
 from functools import wraps
 import threading
+from urllib.parse import urlsplit
 
 from core.constants import CACHE_MAX_SIZE
+from core.single_flight import SingleFlight
+from core.tracing import span
 
 # Get logger - configuration should be done by application entrypoint, not library modules
 logger = logging.getLogger(__name__)
@@ -322,6 +325,8 @@ class BaseAPIClient(ABC):
         self.base_url = base_url.rstrip('/')
         self.rate_limiter = RateLimiter(calls_per_second=rate_limit)
         self.cache = ResponseCache(default_ttl=cache_ttl)
+        # Coalesces concurrent GETs that miss the cache for the same key
+        self._inflight: SingleFlight[Dict[str, Any]] = SingleFlight()
         self.timeout: TimeoutType = timeout  # may be int or (connect, read)
         # Optional per-endpoint TTLs. Keys are endpoint identifiers or URL paths.
         self.endpoint_ttls: Dict[str, int] = endpoint_ttls or {}
@@ -389,9 +394,6 @@ class BaseAPIClient(ABC):
             RateLimitExceeded: If API returns 429
             APIError: For other API errors
         """
-        # Build full URL
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-
         # Check cache for GET requests
         if method.upper() == 'GET' and use_cache:
             cache_key = self._get_cache_key(endpoint, params)
@@ -399,6 +401,30 @@ class BaseAPIClient(ABC):
             if cached_response is not None:
                 return cast(Dict[str, Any], cached_response)
 
+            # Threads missing the same key together share one request
+            return self._inflight.do(
+                cache_key,
+                lambda: self._send_request(
+                    method, endpoint, params, data, cache_key, ttl_override, timeout_override
+                ),
+            )
+
+        return self._send_request(method, endpoint, params, data, None, ttl_override, timeout_override)
+
+    def _send_request(
+            self,
+            method: str,
+            endpoint: str,
+            params: Optional[Dict],
+            data: Optional[Dict],
+            cache_key: Optional[str],
+            ttl_override: Optional[int],
+            timeout_override: Optional[TimeoutType],
+    ) -> Dict[str, Any]:
+        """Rate-limit, send and decode one request; cache it under ``cache_key`` if given."""
+        # Build full URL
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+
         # Rate limit
         self.rate_limiter.wait_if_needed()
 
@@ -406,13 +432,14 @@ class BaseAPIClient(ABC):
         try:
             logger.debug(f"{method} {url} - params: {params}")
 
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data,
-                timeout=(timeout_override if timeout_override is not None else self.timeout)
-            )
+            with span(f"http.{urlsplit(self.base_url).netloc}", method=method, endpoint=endpoint):
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=data,
+                    timeout=(timeout_override if timeout_override is not None else self.timeout)
+                )
 
             # Handle rate limiting
             if response.status_code == 429:
@@ -430,8 +457,7 @@ class BaseAPIClient(ABC):
             json_data = cast(Dict[str, Any], response.json())
 
             # Cache successful GET requests
-            if method.upper() == 'GET' and use_cache:
-                cache_key = self._get_cache_key(endpoint, params)
+            if cache_key is not None:
                 # Determine TTL: per-request override, then per-endpoint map, else default
                 ttl_to_use: Optional[int]
                 if ttl_override is not None:
@@ -3,10 +3,14 @@ Mod Database Manager
 
 Stores Path of Exile mod/affix data in a local SQLite database.
 Data is fetched from the PoE Wiki Cargo API and cached locally.
+
+Mod stat templates and item names are indexed in FTS5 tables (kept in
+sync by triggers), which back search() and the stat/name lookups.
 """
 from __future__ import annotations
 
 import logging
+import re
 import sqlite3
 import threading
 from datetime import datetime
@@ -15,6 +19,67 @@ from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+SEARCH_KINDS = ("mod", "item")
+
+_WIKI_LINK_RE = re.compile(r"\[\[(?:[^\]|]*\|)?([^\]]*)\]\]")
+_NUMBER_RANGE_RE = re.compile(r"\(\s*[-+]?\d+(?:\.\d+)?\s*(?:-|to)\s*[-+]?\d+(?:\.\d+)?\s*\)")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def stat_template(text: Optional[str]) -> Optional[str]:
+    """
+    Reduce stat text to its template: wiki links unwrapped, numbers and
+    value ranges replaced by '#'.
+
+    "+(80-89) to maximum [[Life]]" and "+92 to maximum Life" both become
+    "+# to maximum Life", so rolled mods match their definitions.
+    """
+    if text is None:
+        return None
+    text = _WIKI_LINK_RE.sub(r"\1", text)
+    text = _NUMBER_RANGE_RE.sub("#", text)
+    return _NUMBER_RE.sub("#", text)
+
+
+def _fts_phrase(token: str, prefix: bool = False) -> str:
+    return f'"{token}"*' if prefix else f'"{token}"'
+
+
+def _query_to_fts(query: str) -> Optional[str]:
+    """FTS5 MATCH expression for free text: every word, the last one as a prefix."""
+    tokens = _TOKEN_RE.findall(stat_template(query) or "")
+    if not tokens:
+        return None
+    phrases = [_fts_phrase(t) for t in tokens[:-1]] + [_fts_phrase(tokens[-1], prefix=True)]
+    return " ".join(phrases)
+
+
+def _like_to_fts(pattern: str, column: str) -> Optional[str]:
+    """
+    FTS5 MATCH expression selecting a superset of the rows a LIKE pattern matches.
+
+    Only whole words are required; a word cut by a wildcard is kept as a
+    prefix when the wildcard follows it and dropped when it precedes it.
+    Numbers are not indexed (see stat_template) and are dropped too.
+    Returns None when nothing selective is left, e.g. for "%".
+    """
+    phrases = []
+    segments = re.split(r"([%_])", pattern)
+    for i in range(0, len(segments), 2):
+        segment = stat_template(segments[i]) or ""
+        tokens = list(_TOKEN_RE.finditer(segment))
+        if not tokens:
+            continue
+        wildcard_before = i > 0
+        wildcard_after = i + 1 < len(segments)
+        for n, token in enumerate(tokens):
+            if n == 0 and wildcard_before and token.start() == 0:
+                continue
+            prefix = n == len(tokens) - 1 and wildcard_after and token.end() == len(segment)
+            phrases.append(f"{column} : {_fts_phrase(token.group(), prefix)}")
+    return " AND ".join(phrases) or None
+
 
 class ModDatabase:
     """
@@ -81,27 +146,104 @@ class ModDatabase:
     );
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    # FTS5 indexes over mods/items, kept in sync by triggers. Mods are indexed
+    # by stat template (the stat_template() SQL function registered in
+    # _init_database). INSERT OR REPLACE only fires the delete triggers with
+    # recursive_triggers on, which _init_database also sets.
+    FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS mods_fts USING fts5(name, stat_template);
+
+    CREATE TRIGGER IF NOT EXISTS mods_fts_ai AFTER INSERT ON mods BEGIN
+        INSERT INTO mods_fts(rowid, name, stat_template)
+        VALUES (new.rowid, new.name, stat_template(COALESCE(new.stat_text_raw, new.stat_text)));
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS mods_fts_ad AFTER DELETE ON mods BEGIN
+        DELETE FROM mods_fts WHERE rowid = old.rowid;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS mods_fts_au AFTER UPDATE ON mods BEGIN
+        DELETE FROM mods_fts WHERE rowid = old.rowid;
+        INSERT INTO mods_fts(rowid, name, stat_template)
+        VALUES (new.rowid, new.name, stat_template(COALESCE(new.stat_text_raw, new.stat_text)));
+    END;
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(name, base_item, item_class);
+
+    CREATE TRIGGER IF NOT EXISTS items_fts_ai AFTER INSERT ON items BEGIN
+        INSERT INTO items_fts(rowid, name, base_item, item_class)
+        VALUES (new.rowid, new.name, new.base_item, new.item_class);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS items_fts_ad AFTER DELETE ON items BEGIN
+        DELETE FROM items_fts WHERE rowid = old.rowid;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS items_fts_au AFTER UPDATE ON items BEGIN
+        DELETE FROM items_fts WHERE rowid = old.rowid;
+        INSERT INTO items_fts(rowid, name, base_item, item_class)
+        VALUES (new.rowid, new.name, new.base_item, new.item_class);
+    END;
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, use_fts: bool = True):
         """
         Initialize the mod database.
 
         Args:
             db_path: Path to SQLite database file (default: data/mods.db)
+            use_fts: Build and query the FTS5 indexes (False forces the
+                     LIKE scans, e.g. for benchmarking)
         """
         self.db_path = db_path or self.DEFAULT_DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.RLock()
+        self.fts_enabled = use_fts
         self.conn: sqlite3.Connection = self._init_database()
 
     def _init_database(self) -> sqlite3.Connection:
         """Initialize database schema if needed."""
         conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         conn.row_factory = sqlite3.Row  # Enable dict-like access
+        # Needed by the index triggers, which also run for writes made
+        # while use_fts is False
+        conn.create_function("stat_template", 1, stat_template, deterministic=True)
+        conn.execute("PRAGMA recursive_triggers = ON")
         conn.executescript(self.SCHEMA)
+        if self.fts_enabled:
+            self.fts_enabled = self._init_fts(conn)
         conn.commit()
         logger.info(f"Initialized mod database at {self.db_path}")
         return conn
 
+    def _init_fts(self, conn: sqlite3.Connection) -> bool:
+        """Create the FTS5 indexes, filling them from existing rows when new."""
+        existing = conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name IN ('mods_fts', 'items_fts')"
+        ).fetchone()[0]
+        try:
+            conn.executescript(self.FTS_SCHEMA)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, mod/item search falls back to LIKE scans: {e}")
+            return False
+        if existing < 2:
+            self._rebuild_fts(conn)
+        return True
+
+    def _rebuild_fts(self, conn: sqlite3.Connection) -> None:
+        """Re-index every mod and item."""
+        conn.execute("DELETE FROM mods_fts")
+        conn.execute(
+            "INSERT INTO mods_fts(rowid, name, stat_template) "
+            "SELECT rowid, name, stat_template(COALESCE(stat_text_raw, stat_text)) FROM mods"
+        )
+        conn.execute("DELETE FROM items_fts")
+        conn.execute(
+            "INSERT INTO items_fts(rowid, name, base_item, item_class) "
+            "SELECT rowid, name, base_item, item_class FROM items"
+        )
+        logger.info("Built mod/item search indexes")
+
     def get_metadata(self, key: str) -> Optional[str]:
         """Get metadata value by key."""
         with self._lock:
@@ -228,6 +370,10 @@ class ModDatabase:
         """
         Find mods matching a stat text pattern.
 
+        The search index narrows the candidates to mods containing the
+        pattern's words; LIKE is then checked on those rows only, so the
+        result is the same as a full LIKE scan.
+
         Args:
             stat_text_pattern: SQL LIKE pattern (e.g., "%maximum Life")
             generation_type: 6=prefix, 7=suffix, None=all
@@ -235,13 +381,23 @@ class ModDatabase:
         Returns:
             List of matching mod dictionaries
         """
+        match = _like_to_fts(stat_text_pattern, "stat_template") if self.fts_enabled else None
+
         # Search in stat_text_raw (plain text) for better pattern matching
-        query = "SELECT * FROM mods WHERE (stat_text_raw LIKE ? OR stat_text LIKE ?)"
-        params: List[Any] = [stat_text_pattern, stat_text_pattern]
+        if match:
+            query = (
+                "SELECT mods.* FROM mods_fts JOIN mods ON mods.rowid = mods_fts.rowid "
+                "WHERE mods_fts MATCH ? AND (mods.stat_text_raw LIKE ? OR mods.stat_text LIKE ?)"
+            )
+            params: List[Any] = [match, stat_text_pattern, stat_text_pattern]
+        else:
+            query = "SELECT * FROM mods WHERE (stat_text_raw LIKE ? OR stat_text LIKE ?)"
+            params = [stat_text_pattern, stat_text_pattern]
 
         if generation_type is not None:
             query += " AND generation_type = ?"
             params.append(generation_type)
+        query += " ORDER BY mods.rowid" if match else " ORDER BY rowid"
 
         with self._lock:
             cursor = self.conn.execute(query, params)
@@ -464,11 +620,18 @@ class ModDatabase:
             return [dict(row) for row in cursor.fetchall()]
 
     def get_scarabs(self) -> List[Dict[str, Any]]:
-        """Get all scarabs."""
+        """Get all scarabs (items with a name word starting with "Scarab")."""
         with self._lock:
-            cursor = self.conn.execute(
-                "SELECT * FROM items WHERE name LIKE '%Scarab%'",
-            )
+            if self.fts_enabled:
+                cursor = self.conn.execute(
+                    "SELECT items.* FROM items_fts JOIN items ON items.rowid = items_fts.rowid "
+                    "WHERE items_fts MATCH ? ORDER BY items.rowid",
+                    ('name : "scarab"*',),
+                )
+            else:
+                cursor = self.conn.execute(
+                    "SELECT * FROM items WHERE name LIKE '%Scarab%'",
+                )
             return [dict(row) for row in cursor.fetchall()]
 
     def get_currency_items(self) -> List[Dict[str, Any]]:
@@ -504,13 +667,84 @@ class ModDatabase:
         Returns:
             List of matching item dictionaries
         """
+        match = _like_to_fts(name_pattern, "name") if self.fts_enabled else None
         with self._lock:
-            cursor = self.conn.execute(
-                "SELECT * FROM items WHERE name LIKE ? LIMIT ?",
-                (name_pattern, limit),
+            if match:
+                cursor = self.conn.execute(
+                    "SELECT items.* FROM items_fts JOIN items ON items.rowid = items_fts.rowid "
+                    "WHERE items_fts MATCH ? AND items.name LIKE ? ORDER BY items.rowid LIMIT ?",
+                    (match, name_pattern, limit),
+                )
+            else:
+                cursor = self.conn.execute(
+                    "SELECT * FROM items WHERE name LIKE ? LIMIT ?",
+                    (name_pattern, limit),
+                )
+            return [dict(row) for row in cursor.fetchall()]
+
+    # =========================================================================
+    # Full-text search
+    # =========================================================================
+
+    def search(self, query: str, kind: str = "mod", limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Ranked full-text search over mods or items.
+
+        Every word of the query must match (the last one as a prefix, so
+        partial input works); numbers are ignored for mods, so rolled text
+        like "+92 to maximum Life" finds the "+(80-89) ..." definitions.
+        Mods rank on stat text over name; items on name over base/class.
+
+        Args:
+            query: Free text (e.g., "maximum life", "Kaom")
+            kind: "mod" or "item"
+            limit: Maximum results to return
+
+        Returns:
+            Row dictionaries, best match first, each with a "score"
+            (bm25; lower is better)
+
+        Raises:
+            ValueError: If kind is not "mod" or "item"
+        """
+        if kind not in SEARCH_KINDS:
+            raise ValueError(f"Unknown search kind: {kind!r} (expected one of {SEARCH_KINDS})")
+
+        if not self.fts_enabled:
+            return self._search_like(query, kind, limit)
+
+        match = _query_to_fts(query)
+        if not match:
+            return []
+
+        if kind == "mod":
+            sql = (
+                "SELECT mods.*, bm25(mods_fts, 1.0, 5.0) AS score "
+                "FROM mods_fts JOIN mods ON mods.rowid = mods_fts.rowid "
+                "WHERE mods_fts MATCH ? ORDER BY score LIMIT ?"
+            )
+        else:
+            sql = (
+                "SELECT items.*, bm25(items_fts, 10.0, 2.0, 1.0) AS score "
+                "FROM items_fts JOIN items ON items.rowid = items_fts.rowid "
+                "WHERE items_fts MATCH ? ORDER BY score LIMIT ?"
             )
+        with self._lock:
+            cursor = self.conn.execute(sql, (match, limit))
             return [dict(row) for row in cursor.fetchall()]
 
+    def _search_like(self, query: str, kind: str, limit: int) -> List[Dict[str, Any]]:
+        """Unranked substring fallback for search() when FTS5 is unavailable."""
+        tokens = _TOKEN_RE.findall(stat_template(query) or "")
+        if not tokens:
+            return []
+        pattern = "%" + "%".join(tokens) + "%"
+        if kind == "mod":
+            rows = self.find_mods_by_stat_text(pattern)[:limit]
+        else:
+            rows = self.search_items(pattern, limit)
+        return [{**row, "score": 0.0} for row in rows]
+
     def close(self) -> None:
         """Close database connection."""
         with self._lock:
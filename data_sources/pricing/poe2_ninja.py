@@ -80,6 +80,20 @@ class Poe2NinjaAPI(BaseAPIClient):
 
         logger.info(f"Initialized Poe2NinjaAPI for league: {league}")
 
+    def set_league(self, league: str) -> None:
+        """
+        Point the client at another league.
+
+        Drops the currency index and divine rate built for the old league so
+        the next lookup refetches them; response-cache keys already include
+        the league.
+        """
+        self.league = league
+        self._currency_index.clear()
+        self.divine_exalted_rate = 0.0
+        self._divine_rate_expiry = 0.0
+        logger.info(f"Poe2NinjaAPI switched to league: {league}")
+
     def refresh_divine_rate_from_currency(self) -> float:
         """
         Fetch poe2.ninja currencyoverview and derive exalts_per_divine from
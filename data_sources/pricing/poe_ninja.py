@@ -78,6 +78,20 @@ class PoeNinjaAPI(BaseAPIClient):
 
         logger.info(f"Initialized PoeNinjaAPI for league: {league}")
 
+    def set_league(self, league: str) -> None:
+        """
+        Point the client at another league.
+
+        Drops the currency index and divine rate built for the old league so
+        the next lookup refetches them; response-cache keys already include
+        the league.
+        """
+        self.league = league
+        self._currency_index.clear()
+        self.divine_chaos_rate = 0.0
+        self._divine_rate_expiry = 0.0
+        logger.info(f"PoeNinjaAPI switched to league: {league}")
+
     def refresh_divine_rate_from_currency(self) -> float:
         """
         Fetch poe.ninja currencyoverview and derive chaos_per_divine from
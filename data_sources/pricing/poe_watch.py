@@ -46,6 +46,12 @@ class PoeWatchAPI(BaseAPIClient):
 
         logger.info(f"Initialized PoeWatchAPI for league: {league}")
 
+    def set_league(self, league: str) -> None:
+        """Point the client at another league, dropping per-league item data."""
+        self.league = league
+        self._item_cache.clear()
+        logger.info(f"PoeWatchAPI switched to league: {league}")
+
     def _get_cache_key(self, endpoint: str, params: Optional[Dict] = None) -> str:
         """Generate cache key from endpoint and params."""
         league = params.get('league', '') if params else ''
@@ -64,7 +70,7 @@ class PoeWatchAPI(BaseAPIClient):
     ) -> Dict[str, Any]:
         """Override get to track request count."""
         self.request_count += 1
-        logger.info(f"[poe.watch] API Request #{self.request_count}: {endpoint} (params: {params})")
+        logger.debug("[poe.watch] API Request #%d: %s (params: %s)", self.request_count, endpoint, params)
         return super().get(
             endpoint, params=params, use_cache=use_cache,
             ttl_override=ttl_override, timeout_override=timeout_override
@@ -270,7 +276,7 @@ class PoeWatchAPI(BaseAPIClient):
         Returns:
             Item data dict or None if not found
         """
-        logger.info(f"[poe.watch] find_item_price called for '{item_name}' (rarity={rarity}, links={links})")
+        logger.debug("[poe.watch] find_item_price called for '%s' (rarity=%s, links=%s)", item_name, rarity, links)
 
         # Try exact search first
         try:
@@ -314,19 +320,21 @@ class PoeWatchAPI(BaseAPIClient):
                     candidates,
                     key=lambda x: float(x.get('mean', 0) or 0)
                 )
-                logger.info(f"[poe.watch] Found match for '{item_name}': {best.get('mean')}c (daily: {best.get('daily')})")
+                logger.debug(
+                    "[poe.watch] Found match for '%s': %sc (daily: %s)", item_name, best.get('mean'), best.get('daily')
+                )
                 return best
 
             # Fallback to first result if no filters matched
             if results:
-                logger.info(f"[poe.watch] Using first result for '{item_name}': {results[0].get('mean')}c")
+                logger.debug("[poe.watch] Using first result for '%s': %sc", item_name, results[0].get('mean'))
                 return results[0]
 
-            logger.info(f"[poe.watch] No results found for '{item_name}'")
+            logger.debug("[poe.watch] No results found for '%s'", item_name)
             return None
 
         except Exception as e:
-            logger.warning(f"[poe.watch] Failed to find price for {item_name}: {e}")
+            logger.warning("[poe.watch] Failed to find price for %s: %s", item_name, e)
             return None
 
     def get_item_with_confidence(
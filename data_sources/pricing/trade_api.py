@@ -8,13 +8,18 @@ import requests
 
 from core.constants import API_TIMEOUT_STANDARD
 from core.game_version import GameVersion
+from core.logging_setup import HotPathLogger
+from core.tracing import span
 from data_sources.base_api import BaseAPIClient
+from data_sources.pricing.trade_cache import TradeCache, get_trade_cache
 from data_sources.pricing.trade_stat_ids import build_stat_filters
 from core.price_multi import RESULT_COLUMNS
-from core.smart_trade_filters import build_smart_filters
 
 logger = logging.getLogger(__name__)
 
+# One sampled summary record per trade check
+_check_log = HotPathLogger("data_sources.pricing.trade_checks")
+
 
 # Mapping: ParsedItem influence names → Trade API filter keys
 # Note: shaper/elder/conqueror influences go in type_filters
@@ -135,6 +140,8 @@ class TradeApiSource:
         name: Optional[str] = None,
         logger: Optional[logging.Logger] = None,
         session: Optional[requests.Session] = None,
+        trade_cache: Optional[TradeCache] = None,
+        pace_requests: bool = False,
         **_: Any,
     ) -> None:
         """
@@ -148,6 +155,10 @@ class TradeApiSource:
             name: Optional logical name for this source (e.g. "trade_api").
             logger: Logger to use; defaults to module logger.
             session: Optional requests.Session (used in tests to inject fakes).
+            trade_cache: Search/listing cache; defaults to the shared instance.
+            pace_requests: Wait on the client's rate limiter before every
+                    low-level search and fetch request (each fetch batch
+                    counts as one request).
         """
         self.logger = logger or logging.getLogger(__name__)
 
@@ -179,6 +190,9 @@ class TradeApiSource:
         else:
             self.session = requests.Session()
 
+        self.trade_cache = trade_cache if trade_cache is not None else get_trade_cache()
+        self.pace_requests = pace_requests
+
         self.logger.info(
             "Initialized TradeApiSource(name=%s, league=%s, game=%s)",
             self.name,
@@ -223,13 +237,13 @@ class TradeApiSource:
         Used by unit tests via FakeTradeClient, and by any callers that
         treat this as a PriceSource.
         """
-        self.logger.info(
+        self.logger.debug(
             "TradeApiSource._check_item_text called for league=%s", self.league
         )
 
         # Blank item text: do NOT call the client, just return no rows.
         if not item_text or item_text.strip() == "":
-            self.logger.info(
+            self.logger.debug(
                 "TradeApiSource._check_item_text: blank item_text; returning 0 rows."
             )
             return []
@@ -270,7 +284,7 @@ class TradeApiSource:
 
             rows.append(row)
 
-        self.logger.info(
+        self.logger.debug(
             "TradeApiSource._check_item_text: returning %d row(s) for %r in league=%s",
             len(rows),
             item_text,
@@ -293,16 +307,18 @@ class TradeApiSource:
         This is what PriceService uses to get listing-level quotes to
         save into price_quotes.
         """
-        self.logger.info(
+        self.logger.debug(
             "TradeApiSource._check_parsed_item called for league=%s", self.league
         )
 
         if parsed_item is None:
-            self.logger.info(
+            self.logger.debug(
                 "TradeApiSource._check_parsed_item: parsed_item is None; returning 0 quotes."
             )
             return []
 
+        trace = _check_log.trace("trade_check", league=self.league)
+
         # 1) Build a simple search query JSON based on ParsedItem
         query = self._build_query(parsed_item)
 
@@ -311,7 +327,7 @@ class TradeApiSource:
         q_name = (q_inner.get("name") or "").strip() if isinstance(q_inner, dict) else ""
         q_type = (q_inner.get("type") or "").strip() if isinstance(q_inner, dict) else ""
         if not q_name and not q_type:
-            self.logger.info(
+            self.logger.debug(
                 "TradeApiSource._check_parsed_item: blank query (no name/type); returning 0 quotes."
             )
             return []
@@ -319,7 +335,7 @@ class TradeApiSource:
         # 2) POST /search/{league}
         search_id, result_ids = self._search(query, max_results=max_results)
         if not search_id or not result_ids:
-            self.logger.info(
+            self.logger.debug(
                 "TradeApiSource._check_parsed_item: no result_ids for item; search_id=%s",
                 search_id,
             )
@@ -335,12 +351,11 @@ class TradeApiSource:
             if q is not None:
                 quotes.append(q)
 
-        self.logger.info(
-            "TradeApiSource._check_parsed_item: normalized %d/%d listings into quotes "
-            "for league=%s",
-            len(quotes),
-            len(listings),
-            self.league,
+        trace.emit(
+            search_id=search_id,
+            results=len(result_ids),
+            listings=len(listings),
+            quotes=len(quotes),
         )
 
         return quotes
@@ -349,6 +364,11 @@ class TradeApiSource:
     # Internal helpers (low-level HTTP mode)
     # ------------------------------------------------------------------ #
 
+    def _wait_for_rate_limit(self) -> None:
+        """Block on the client's rate limiter if this source paces its requests."""
+        if self.pace_requests:
+            self.client.rate_limiter.wait_if_needed()
+
     def _build_query(
         self,
         parsed_item: Any,
@@ -419,7 +439,7 @@ class TradeApiSource:
                         "filters": misc_filters
                     }
 
-                self.logger.info(
+                self.logger.debug(
                     "Added influence filters: type=%s, misc=%s for influences %s",
                     list(type_filters.keys()),
                     list(misc_filters.keys()),
@@ -433,6 +453,9 @@ class TradeApiSource:
 
             # Try smart filters first if enabled
             if use_smart_filters and (archetype or build_stats):
+                # Deferred: pulls in the upgrade calculator (and numpy)
+                from core.smart_trade_filters import build_smart_filters
+
                 smart_filters, filter_result = build_smart_filters(
                     archetype=archetype,
                     build_stats=build_stats,
@@ -441,7 +464,7 @@ class TradeApiSource:
                 )
                 if smart_filters:
                     query["query"]["stats"][0]["filters"] = smart_filters
-                    self.logger.info(
+                    self.logger.debug(
                         "Built rare item query with %d smart filters for base '%s': %s",
                         len(smart_filters),
                         base_str,
@@ -462,7 +485,7 @@ class TradeApiSource:
 
                         if stat_filters:
                             query["query"]["stats"][0]["filters"] = stat_filters
-                            self.logger.info(
+                            self.logger.debug(
                                 "Built rare item query with %d affix filters for base '%s' (game=%s)",
                                 len(stat_filters),
                                 base_str,
@@ -486,17 +509,32 @@ class TradeApiSource:
     ) -> tuple[Optional[str], List[str]]:
         """
         POST /search/{league} and return (search_id, [result_ids]).
+
+        Identical queries (after canonicalisation) within the search cache
+        TTL reuse the previous search instead of posting again.
         """
-        url = f"{self.BASE_URL}/search/{self.league}"
-        self.logger.info("Trade API search: %s", url)
+        cached = self.trade_cache.get_search(self.BASE_URL, self.league, query)
+        if cached is not None:
+            search_id, all_ids = cached
+            self.logger.debug(
+                "Trade API search cache hit: search_id=%s (%d ids)", search_id, len(all_ids)
+            )
+            return search_id, all_ids[:max_results]
 
-        try:
-            query_snippet = json.dumps(query)[:800]
-        except TypeError:
-            query_snippet = str(query)[:800]
-        self.logger.debug("Trade API search payload (truncated): %s", query_snippet)
+        url = f"{self.BASE_URL}/search/{self.league}"
+        self.logger.debug("Trade API search: %s", url)
 
-        resp = self.session.post(url, json=query, timeout=API_TIMEOUT_STANDARD)
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            try:
+                query_snippet = json.dumps(query)[:800]
+            except TypeError:
+                query_snippet = str(query)[:800]
+            self.logger.debug("Trade API search payload (truncated): %s", query_snippet)
+
+        self._wait_for_rate_limit()
+        with span("trade.search"):
+            resp = self.session.post(url, json=query, timeout=API_TIMEOUT_STANDARD)
         self.logger.debug("Trade API search status=%s", resp.status_code)
 
         # Log error details before raising
@@ -515,8 +553,9 @@ class TradeApiSource:
             self.logger.exception("Trade API search returned non-JSON response")
             return None, []
 
-        raw_snippet = json.dumps(data, default=str)[:1200]
-        self.logger.debug("Trade API search raw JSON (truncated): %s", raw_snippet)
+        if debug_enabled:
+            raw_snippet = json.dumps(data, default=str)[:1200]
+            self.logger.debug("Trade API search raw JSON (truncated): %s", raw_snippet)
 
         search_id = data.get("id")
         result_ids = data.get("result") or []
@@ -529,7 +568,10 @@ class TradeApiSource:
         total = data.get("total", len(result_ids))
         trimmed_result_ids = result_ids[:max_results]
 
-        self.logger.info(
+        if search_id and result_ids:
+            self.trade_cache.put_search(self.BASE_URL, self.league, query, search_id, result_ids)
+
+        self.logger.debug(
             "Trade API search parsed: search_id=%s total=%s result_count=%s (using %s)",
             search_id,
             total,
@@ -554,6 +596,9 @@ class TradeApiSource:
     ) -> List[Dict[str, Any]]:
         """
         GET /fetch/{id1,id2,...}?query=search_id
+
+        Listings already in the listing cache are not requested again;
+        results are returned in result_ids order.
         """
         if not result_ids:
             self.logger.warning(
@@ -562,23 +607,34 @@ class TradeApiSource:
             )
             return []
 
-        listings: List[Dict[str, Any]] = []
+        by_id, missing_ids = self.trade_cache.get_listings(self.BASE_URL, result_ids)
+        if by_id:
+            self.logger.debug(
+                "Trade API listing cache: %d/%d cached for search_id=%s",
+                len(by_id),
+                len(result_ids),
+                search_id,
+            )
+
+        fetched: List[Dict[str, Any]] = []
         batch_size = 10
 
-        for i in range(0, len(result_ids), batch_size):
-            batch_ids = result_ids[i:i + batch_size]
+        for i in range(0, len(missing_ids), batch_size):
+            batch_ids = missing_ids[i:i + batch_size]
             ids_str = ",".join(batch_ids)
             url = f"{self.BASE_URL}/fetch/{ids_str}"
             params = {"query": search_id}
 
-            self.logger.info(
+            self.logger.debug(
                 "Trade API fetch: %s (batch size=%d, query=%s)",
                 url,
                 len(batch_ids),
                 search_id,
             )
 
-            resp = self.session.get(url, params=params, timeout=API_TIMEOUT_STANDARD)
+            self._wait_for_rate_limit()
+            with span("trade.fetch", batch=len(batch_ids)):
+                resp = self.session.get(url, params=params, timeout=API_TIMEOUT_STANDARD)
             self.logger.debug("Trade API fetch status=%s", resp.status_code)
             resp.raise_for_status()
 
@@ -591,16 +647,29 @@ class TradeApiSource:
                 )
                 continue
 
-            batch_results = data.get("result") or []
-            self.logger.info(
+            batch_results = [r for r in (data.get("result") or []) if r]
+            self.logger.debug(
                 "Trade API fetch parsed: search_id=%s, batch_results=%d",
                 search_id,
                 len(batch_results),
             )
 
-            listings.extend(batch_results)
+            fetched.extend(batch_results)
 
-        self.logger.info(
+        self.trade_cache.put_listings(self.BASE_URL, fetched)
+
+        # Listings without an id cannot be matched back; keep them at the end
+        unkeyed: List[Dict[str, Any]] = []
+        for listing in fetched:
+            listing_id = listing.get("id") if isinstance(listing, dict) else None
+            if listing_id:
+                by_id[listing_id] = listing
+            else:
+                unkeyed.append(listing)
+
+        listings = [by_id[rid] for rid in result_ids if rid in by_id] + unkeyed
+
+        self.logger.debug(
             "Trade API fetch total listings: %d for search_id=%s",
             len(listings),
             search_id,
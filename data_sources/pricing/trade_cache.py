@@ -0,0 +1,173 @@
+"""
+Trade API search and listing cache.
+
+Two levels, both keyed by content rather than by request:
+
+1. Searches: the canonical JSON of a trade query (sorted keys, compact
+   separators) scoped by endpoint and league is hashed and mapped to the
+   (search_id, result_ids) the API returned. Identical queries built for
+   similar items reuse the search instead of spending another POST.
+2. Listings: fetched listing JSON keyed by listing ID, so fetches only
+   request IDs that are not already cached.
+
+A single shared instance is used by default so every TradeApiSource
+(price checks, upgrade finder, BiS search) benefits from the same cache.
+
+Usage:
+    cache = get_trade_cache()
+    hit = cache.get_search(base_url, league, query)
+    cached, missing = cache.get_listings(base_url, result_ids)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from data_sources.base_api import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+SearchResult = Tuple[str, List[str]]
+
+
+def canonical_query_hash(base_url: str, league: str, query: Dict[str, Any]) -> str:
+    """
+    Hash a trade query independent of dict ordering and whitespace.
+
+    Args:
+        base_url: Trade API base URL (separates PoE1/PoE2 endpoints).
+        league: League the search is run against.
+        query: Trade query body.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    canonical = json.dumps(query, sort_keys=True, separators=(",", ":"), default=str)
+    payload = f"{base_url}|{league}|{canonical}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TradeCache:
+    """Content-addressed cache for trade searches and fetched listings."""
+
+    DEFAULT_SEARCH_TTL = 30     # seconds; new listings appear quickly
+    DEFAULT_LISTING_TTL = 120   # seconds; prices/availability drift slower
+    DEFAULT_MAX_SEARCHES = 500
+    DEFAULT_MAX_LISTINGS = 5000
+
+    def __init__(
+        self,
+        search_ttl: int = DEFAULT_SEARCH_TTL,
+        listing_ttl: int = DEFAULT_LISTING_TTL,
+        max_searches: int = DEFAULT_MAX_SEARCHES,
+        max_listings: int = DEFAULT_MAX_LISTINGS,
+    ):
+        """
+        Args:
+            search_ttl: Seconds a query -> result IDs mapping stays valid.
+            listing_ttl: Seconds a fetched listing stays valid.
+            max_searches: Maximum cached searches (LRU eviction).
+            max_listings: Maximum cached listings (LRU eviction).
+        """
+        self.searches = ResponseCache(default_ttl=search_ttl, max_size=max_searches)
+        self.listings = ResponseCache(default_ttl=listing_ttl, max_size=max_listings)
+
+    # ------------------------------------------------------------------ #
+    # Searches
+    # ------------------------------------------------------------------ #
+
+    def get_search(
+        self, base_url: str, league: str, query: Dict[str, Any]
+    ) -> Optional[SearchResult]:
+        """Get a cached (search_id, result_ids) for an identical query."""
+        result: Optional[SearchResult] = self.searches.get(
+            canonical_query_hash(base_url, league, query)
+        )
+        return result
+
+    def put_search(
+        self,
+        base_url: str,
+        league: str,
+        query: Dict[str, Any],
+        search_id: str,
+        result_ids: List[str],
+    ) -> None:
+        """Cache the result of a search."""
+        self.searches.set(
+            canonical_query_hash(base_url, league, query),
+            (search_id, list(result_ids)),
+        )
+
+    # ------------------------------------------------------------------ #
+    # Listings
+    # ------------------------------------------------------------------ #
+
+    def get_listings(
+        self, base_url: str, listing_ids: Iterable[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """
+        Split listing IDs into cached listings and IDs still to fetch.
+
+        Returns:
+            (cached listings by ID, missing IDs in input order)
+        """
+        cached: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for listing_id in listing_ids:
+            listing = self.listings.get(f"{base_url}|{listing_id}")
+            if listing is None:
+                missing.append(listing_id)
+            else:
+                cached[listing_id] = listing
+        return cached, missing
+
+    def put_listings(self, base_url: str, listings: Iterable[Dict[str, Any]]) -> None:
+        """Cache fetched listings by their ``id``."""
+        for listing in listings:
+            listing_id = listing.get("id") if isinstance(listing, dict) else None
+            if listing_id:
+                self.listings.set(f"{base_url}|{listing_id}", listing)
+
+    # ------------------------------------------------------------------ #
+    # Maintenance
+    # ------------------------------------------------------------------ #
+
+    def clear(self) -> None:
+        """Drop all cached searches and listings."""
+        self.searches.clear()
+        self.listings.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss metrics for both levels."""
+        return {
+            "searches": self.searches.stats(),
+            "listings": self.listings.stats(),
+        }
+
+
+# Global cache instance
+_trade_cache: Optional[TradeCache] = None
+
+
+def get_trade_cache() -> TradeCache:
+    """Get or create the shared trade cache."""
+    global _trade_cache
+
+    if _trade_cache is None:
+        _trade_cache = TradeCache()
+        logger.info(
+            f"Created trade cache (search_ttl={TradeCache.DEFAULT_SEARCH_TTL}s, "
+            f"listing_ttl={TradeCache.DEFAULT_LISTING_TTL}s)"
+        )
+
+    return _trade_cache
+
+
+def clear_trade_cache() -> None:
+    """Clear the shared trade cache."""
+    if _trade_cache is not None:
+        _trade_cache.clear()
@@ -2,8 +2,35 @@
 gui_qt - PyQt6 GUI for PoE Price Checker
 
 This module contains the PyQt6-based user interface.
+
+The main window is imported on first access, so importing a light module
+such as gui_qt.widgets.loading_screen doesn't pull in the whole GUI.
 """
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from gui_qt.main_window import PriceCheckerWindow, run
+if TYPE_CHECKING:
+    from gui_qt.main_window import PriceCheckerWindow, run
+
+# Exported name -> defining module, imported on first access
+_LAZY_IMPORTS = {
+    "PriceCheckerWindow": "gui_qt.main_window",
+    "run": "gui_qt.main_window",
+}
 
 __all__ = ["PriceCheckerWindow", "run"]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__} has no attribute {name}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -30,7 +30,7 @@ if TYPE_CHECKING:
     from core.build_summarizer import BuildSummary
     from gui_qt.widgets.ai_analysis_panel import AIAnalysisPanelWidget
     from gui_qt.workers.ai_analysis_worker import AIAnalysisWorker
-    from data_sources.ai import AIResponse
+    from data_sources.ai import AIResponse, AIResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -151,6 +151,16 @@ class AIAnalysisController:
         """
         return self._config.ai_provider
 
+    def _response_cache(self) -> Optional["AIResponseCache"]:
+        """Shared AI response cache, or None when disabled in settings."""
+        if not self._config.ai_response_cache_enabled:
+            return None
+        from data_sources.ai import get_ai_response_cache
+
+        return get_ai_response_cache(
+            ttl_seconds=self._config.ai_response_cache_ttl_hours * 3600,
+        )
+
     def analyze_item(
         self,
         item_text: str,
@@ -207,6 +217,7 @@ class AIAnalysisController:
             custom_prompt=custom_prompt,
             ollama_host=ollama_host,
             ollama_model=ollama_model,
+            response_cache=self._response_cache(),
         )
 
         # Connect signals
@@ -336,6 +347,7 @@ class AIAnalysisController:
                 raw_prompt=True,  # Use the upgrade prompt directly without wrapping
                 ollama_host=ollama_host,
                 ollama_model=ollama_model,
+                response_cache=self._response_cache(),
             )
 
             # Connect signals
@@ -6,7 +6,7 @@ Integrates:
 - LootSessionManager for session state
 - StashDiffEngine for loot detection
 - Workers for background stash fetching
-- Database persistence
+- LootPersistenceService for incremental background saves
 
 Usage:
     controller = LootTrackingController(ctx)
@@ -33,6 +33,7 @@ from core.loot_session import (
     SessionState,
 )
 from core.result import Err, Ok, Result
+from core.services.loot_persistence_service import LootPersistenceService
 from core.stash_diff_engine import (
     StashDiff,
     StashDiffEngine,
@@ -133,6 +134,7 @@ class LootTrackingController(QObject):
 
         # Snapshot state
         self._before_snapshot: Optional["StashSnapshot"] = None
+        self._pending_after_snapshot: Optional["StashSnapshot"] = None
         self._pending_snapshot_type: Optional[str] = None  # "before" or "after"
 
         # Active workers
@@ -143,6 +145,9 @@ class LootTrackingController(QObject):
         # Stats tracking
         self._monitoring_started_at: Optional[datetime] = None
 
+        # Incremental session persistence (writes on a background thread)
+        self._persistence = LootPersistenceService(cast("Database", ctx.db))
+
     # =========================================================================
     # Public API
     # =========================================================================
@@ -278,6 +283,7 @@ class LootTrackingController(QObject):
         """Clean up resources."""
         self.stop_monitoring()
         self._cancel_workers()
+        self._persistence.shutdown()
 
     # =========================================================================
     # Zone Change Handling
@@ -329,12 +335,14 @@ class LootTrackingController(QObject):
     def _on_map_complete(self, map_run: MapRun):
         """Handle map completion."""
         logger.info(f"Map completed: {map_run.map_name}")
+        self._persist_progress()
         self.map_completed.emit(map_run)
         self._emit_stats()
 
     def _on_drops_detected(self, drops: List[LootDrop]):
         """Handle new drops detected."""
         logger.info(f"Drops detected: {len(drops)} items")
+        self._persist_progress()
         self.drops_detected.emit(drops)
 
         # Check for high-value drops
@@ -440,7 +448,9 @@ class LootTrackingController(QObject):
             after_snapshot=after_snapshot,
             tracked_tabs=self._config.loot_tracked_tabs or None,
             parent=self,
+            engine=self._diff_engine,
         )
+        self._pending_after_snapshot = after_snapshot
 
         self._diff_worker.result.connect(self._on_diff_result)
         self._diff_worker.error.connect(self._on_diff_error)
@@ -450,6 +460,12 @@ class LootTrackingController(QObject):
         """Handle diff computation result."""
         self._diff_worker = None
 
+        # The after snapshot is the baseline for the next map run; the engine
+        # has already advanced its per-tab state to match.
+        if self._pending_after_snapshot is not None:
+            self._before_snapshot = self._pending_after_snapshot
+            self._pending_after_snapshot = None
+
         if not diff.has_changes:
             self.status_message.emit("No changes detected")
             return
@@ -460,14 +476,11 @@ class LootTrackingController(QObject):
         # Price and convert added items to LootDrops using worker
         if diff.added_items:
             self._start_valuation(diff.added_items)
-        else:
-            # Reset for next comparison
-            self._before_snapshot = None
-            self._diff_engine.clear()
 
     def _on_diff_error(self, message: str, traceback: str):
         """Handle diff error."""
         self._diff_worker = None
+        self._pending_after_snapshot = None
         logger.error(f"Diff failed: {message}")
         self.status_message.emit(f"Diff error: {message}")
 
@@ -522,20 +535,12 @@ class LootTrackingController(QObject):
         self._valuation_worker = None
         self._process_loot_items(priced_items)
 
-        # Reset for next comparison
-        self._before_snapshot = None
-        self._diff_engine.clear()
-
     def _on_valuation_error(self, message: str, traceback: str):
         """Handle valuation worker error."""
         self._valuation_worker = None
         logger.error(f"Valuation failed: {message}")
         self.status_message.emit(f"Pricing error: {message}")
 
-        # Reset for next comparison
-        self._before_snapshot = None
-        self._diff_engine.clear()
-
     def _process_loot_items(self, priced_items: List[Dict[str, Any]]):
         """
         Convert priced items to LootDrops and add to session.
@@ -607,10 +612,6 @@ class LootTrackingController(QObject):
             self._session_manager.add_drops(drops)
             self.status_message.emit(f"Added {len(drops)} drops (fallback pricing)")
 
-        # Reset for next comparison
-        self._before_snapshot = None
-        self._diff_engine.clear()
-
     def _estimate_item_value_fallback(self, item: Dict[str, Any]) -> float:
         """
         Fallback item valuation using basic heuristics.
@@ -659,197 +660,85 @@ class LootTrackingController(QObject):
     # Database Operations
     # =========================================================================
 
+    def _persist_progress(self):
+        """Queue unsaved map runs and drops of the current session."""
+        session = self._session_manager.current_session
+        if session:
+            self._persistence.record_progress(session)
+
     def _save_session_to_db(self, session: LootSession):
         """
-        Save a completed session to the database.
+        Queue the final state of a completed session for saving.
+
+        Map runs and drops written during the session are not re-sent,
+        and the write happens on the persistence thread.
 
         Args:
             session: The session to save.
         """
-        try:
-            db: "Database" = cast("Database", self._ctx.db)
-            cursor = db.conn.cursor()
-
-            # Insert session
-            cursor.execute(
-                """
-                INSERT INTO loot_sessions (
-                    id, name, league, started_at, ended_at, state,
-                    total_maps, total_drops, total_chaos_value,
-                    chaos_per_hour, auto_detected, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    session.id,
-                    session.name,
-                    session.league,
-                    session.started_at.isoformat(),
-                    session.ended_at.isoformat() if session.ended_at else None,
-                    session.state.value,
-                    session.total_maps,
-                    session.total_drops,
-                    session.total_chaos_value,
-                    session.chaos_per_hour,
-                    session.auto_detected,
-                    session.notes,
-                ),
-            )
-
-            # Insert map runs
-            for map_run in session.map_runs:
-                cursor.execute(
-                    """
-                    INSERT INTO loot_map_runs (
-                        id, session_id, map_name, area_level,
-                        started_at, ended_at, drop_count, total_chaos_value
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        map_run.id,
-                        session.id,
-                        map_run.map_name,
-                        map_run.area_level,
-                        map_run.started_at.isoformat(),
-                        map_run.ended_at.isoformat() if map_run.ended_at else None,
-                        map_run.drop_count,
-                        map_run.total_chaos_value,
-                    ),
-                )
-
-                # Insert drops
-                for drop in map_run.drops:
-                    cursor.execute(
-                        """
-                        INSERT INTO loot_drops (
-                            id, session_id, map_run_id, item_name,
-                            item_base_type, stack_size, chaos_value,
-                            divine_value, rarity, item_class, detected_at,
-                            source_tab, raw_item_data
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            drop.id,
-                            session.id,
-                            map_run.id,
-                            drop.item_name,
-                            drop.item_base_type,
-                            drop.stack_size,
-                            drop.chaos_value,
-                            drop.divine_value,
-                            drop.rarity,
-                            drop.item_class,
-                            drop.detected_at.isoformat(),
-                            drop.source_tab,
-                            None,  # Skip raw data for now
-                        ),
-                    )
-
-            db.conn.commit()
-            logger.info(f"Saved session to database: {session.id}")
-
-        except Exception as e:
-            logger.error(f"Failed to save session: {e}")
+        self._persistence.save_session(session)
+        logger.info(f"Queued session save: {session.id}")
 
     def load_session_history(
         self,
         limit: int = 50,
         league: Optional[str] = None,
+        offset: int = 0,
     ) -> List[Dict[str, Any]]:
         """
-        Load session history from the database.
+        Load one page of session history from the database.
 
         Args:
             limit: Maximum sessions to return.
-            league: Optional league filter.
+            league: Optional league filter (defaults to current league).
+            offset: Number of sessions to skip (for paging).
 
         Returns:
             List of session summary dicts.
         """
         try:
+            self._persistence.flush(timeout=1.0)
             db: "Database" = cast("Database", self._ctx.db)
-            cursor = db.conn.cursor()
-
-            query = """
-                SELECT id, name, league, started_at, ended_at,
-                       total_maps, total_drops, total_chaos_value, chaos_per_hour
-                FROM loot_sessions
-                WHERE (:league IS NULL OR league = :league)
-                ORDER BY started_at DESC
-                LIMIT :limit
-            """
-            cursor.execute(
-                query,
-                {"league": league or self._league, "limit": limit},
+            return db.get_loot_session_history(
+                league=league or self._league, limit=limit, offset=offset
             )
-
-            sessions = []
-            for row in cursor.fetchall():
-                sessions.append({
-                    "id": row[0],
-                    "name": row[1],
-                    "league": row[2],
-                    "started_at": row[3],
-                    "ended_at": row[4],
-                    "total_maps": row[5],
-                    "total_drops": row[6],
-                    "total_chaos_value": row[7],
-                    "chaos_per_hour": row[8],
-                })
-
-            return sessions
-
         except Exception as e:
             logger.error(f"Failed to load sessions: {e}")
             return []
 
-    def load_session_details(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def load_session_totals(self, league: Optional[str] = None) -> Dict[str, Any]:
         """
-        Load full details for a session.
+        Load totals across all stored sessions.
 
         Args:
-            session_id: ID of the session to load.
+            league: Optional league filter (defaults to current league).
 
         Returns:
-            Dict with session details, or None if not found.
+            Dict with session_count, total_maps, total_drops, total_chaos_value.
         """
         try:
+            self._persistence.flush(timeout=1.0)
             db: "Database" = cast("Database", self._ctx.db)
-            cursor = db.conn.cursor()
+            return db.get_loot_session_totals(league or self._league)
+        except Exception as e:
+            logger.error(f"Failed to load session totals: {e}")
+            return {}
 
-            # Get session
-            cursor.execute(
-                "SELECT * FROM loot_sessions WHERE id = ?",
-                (session_id,),
-            )
-            row = cursor.fetchone()
-            if not row:
-                return None
-
-            # Get map runs
-            cursor.execute(
-                "SELECT * FROM loot_map_runs WHERE session_id = ? ORDER BY started_at",
-                (session_id,),
-            )
-            map_runs = cursor.fetchall()
-
-            # Get top drops
-            cursor.execute(
-                """
-                SELECT * FROM loot_drops
-                WHERE session_id = ?
-                ORDER BY chaos_value DESC
-                LIMIT 20
-                """,
-                (session_id,),
-            )
-            top_drops = cursor.fetchall()
+    def load_session_details(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load details for a session.
 
-            return {
-                "session": dict(row) if hasattr(row, "keys") else row,
-                "map_runs": [dict(r) if hasattr(r, "keys") else r for r in map_runs],
-                "top_drops": [dict(d) if hasattr(d, "keys") else d for d in top_drops],
-            }
+        Args:
+            session_id: ID of the session to load.
 
+        Returns:
+            Dict with session, map_runs, top_drops and drops_by_rarity,
+            or None if not found.
+        """
+        try:
+            self._persistence.flush(timeout=1.0)
+            db: "Database" = cast("Database", self._ctx.db)
+            return db.get_loot_session_details(session_id)
         except Exception as e:
             logger.error(f"Failed to load session details: {e}")
             return None
@@ -867,6 +756,7 @@ class LootTrackingController(QObject):
     def _clear_snapshot_state(self):
         """Clear snapshot state after session ends."""
         self._before_snapshot = None
+        self._pending_after_snapshot = None
         self._pending_snapshot_type = None
         self._diff_engine.clear()
 
@@ -25,7 +25,7 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 
 from core.result import Result, Ok, Err
 
@@ -33,6 +33,7 @@ if TYPE_CHECKING:
     from core.interfaces import IItemParser, IPriceService
     from core.rare_evaluation import RareItemEvaluator, RareItemEvaluation
     from core.item_parser import ParsedItem
+    from core.price_multi import SourceResult
 
 logger = logging.getLogger(__name__)
 
@@ -114,12 +115,18 @@ class PriceCheckController:
         """Set or update the rare item evaluator."""
         self._rare_evaluator = evaluator
 
-    def check_price(self, item_text: str) -> Result[PriceCheckResult, str]:
+    def check_price(
+        self,
+        item_text: str,
+        on_source_done: Optional[Callable[['SourceResult'], None]] = None,
+    ) -> Result[PriceCheckResult, str]:
         """
         Perform a complete price check on item text.
 
         Args:
             item_text: Raw item text from game (Ctrl+C)
+            on_source_done: Optional callback given each source's SourceResult
+                as it finishes (needs a MultiSourcePriceService)
 
         Returns:
             Result containing PriceCheckResult on success, error message on failure
@@ -138,7 +145,10 @@ class PriceCheckController:
 
         # Get prices
         try:
-            results = self._price_service.check_item(item_text)
+            if on_source_done is not None:
+                results = self._price_service.check_item(item_text, on_source_done=on_source_done)
+            else:
+                results = self._price_service.check_item(item_text)
         except Exception as e:
             logger.exception("Price lookup failed")
             return Err(f"Price lookup error: {e}")
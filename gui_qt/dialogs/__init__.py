@@ -1,22 +1,49 @@
 """
 gui_qt.dialogs - Dialog windows for PoE Price Checker.
+
+Dialogs are imported on first access so that importing one of them (or the
+package) doesn't load every dialog and its dependencies at startup.
 """
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from gui_qt.dialogs.record_sale_dialog import RecordSaleDialog
-from gui_qt.dialogs.build_comparison_dialog import BuildComparisonDialog
-from gui_qt.dialogs.bis_search_dialog import BiSSearchDialog
-from gui_qt.dialogs.priorities_editor_dialog import PrioritiesEditorDialog
-from gui_qt.dialogs.loadout_selector_dialog import LoadoutSelectorDialog
-from gui_qt.dialogs.clear_builds_dialog import ClearBuildsDialog
-from gui_qt.dialogs.find_builds_dialog import FindBuildsDialog
-from gui_qt.dialogs.item_comparison_dialog import ItemComparisonDialog
-from gui_qt.dialogs.recent_items_dialog import RecentItemsDialog
-from gui_qt.dialogs.upgrade_finder_dialog import UpgradeFinderDialog
-from gui_qt.dialogs.stash_grid_dialog import StashGridDialog
-from gui_qt.dialogs.build_library_dialog import BuildLibraryDialog
-from gui_qt.dialogs.settings_dialog import SettingsDialog
-from gui_qt.dialogs.item_planning_hub import ItemPlanningHub
-from gui_qt.dialogs.price_alerts_dialog import PriceAlertsDialog
+if TYPE_CHECKING:
+    from gui_qt.dialogs.record_sale_dialog import RecordSaleDialog
+    from gui_qt.dialogs.build_comparison_dialog import BuildComparisonDialog
+    from gui_qt.dialogs.bis_search_dialog import BiSSearchDialog
+    from gui_qt.dialogs.priorities_editor_dialog import PrioritiesEditorDialog
+    from gui_qt.dialogs.loadout_selector_dialog import LoadoutSelectorDialog
+    from gui_qt.dialogs.clear_builds_dialog import ClearBuildsDialog
+    from gui_qt.dialogs.find_builds_dialog import FindBuildsDialog
+    from gui_qt.dialogs.item_comparison_dialog import ItemComparisonDialog
+    from gui_qt.dialogs.recent_items_dialog import RecentItemsDialog
+    from gui_qt.dialogs.upgrade_finder_dialog import UpgradeFinderDialog
+    from gui_qt.dialogs.stash_grid_dialog import StashGridDialog
+    from gui_qt.dialogs.build_library_dialog import BuildLibraryDialog
+    from gui_qt.dialogs.settings_dialog import SettingsDialog
+    from gui_qt.dialogs.item_planning_hub import ItemPlanningHub
+    from gui_qt.dialogs.price_alerts_dialog import PriceAlertsDialog
+
+# Exported name -> defining module, imported on first access
+_LAZY_IMPORTS = {
+    "RecordSaleDialog": "gui_qt.dialogs.record_sale_dialog",
+    "BuildComparisonDialog": "gui_qt.dialogs.build_comparison_dialog",
+    "BiSSearchDialog": "gui_qt.dialogs.bis_search_dialog",
+    "PrioritiesEditorDialog": "gui_qt.dialogs.priorities_editor_dialog",
+    "LoadoutSelectorDialog": "gui_qt.dialogs.loadout_selector_dialog",
+    "ClearBuildsDialog": "gui_qt.dialogs.clear_builds_dialog",
+    "FindBuildsDialog": "gui_qt.dialogs.find_builds_dialog",
+    "ItemComparisonDialog": "gui_qt.dialogs.item_comparison_dialog",
+    "RecentItemsDialog": "gui_qt.dialogs.recent_items_dialog",
+    "UpgradeFinderDialog": "gui_qt.dialogs.upgrade_finder_dialog",
+    "StashGridDialog": "gui_qt.dialogs.stash_grid_dialog",
+    "BuildLibraryDialog": "gui_qt.dialogs.build_library_dialog",
+    "SettingsDialog": "gui_qt.dialogs.settings_dialog",
+    "ItemPlanningHub": "gui_qt.dialogs.item_planning_hub",
+    "PriceAlertsDialog": "gui_qt.dialogs.price_alerts_dialog",
+}
 
 __all__ = [
     "RecordSaleDialog",
@@ -35,3 +62,16 @@ __all__ = [
     "ItemPlanningHub",
     "PriceAlertsDialog",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__} has no attribute {name}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,6 +2,8 @@
 Export dialog for data export options.
 
 Allows users to select data type, format, and date range for export.
+The export streams in a background worker with a progress bar; a cancelled
+export can be resumed into the same file.
 """
 
 from __future__ import annotations
@@ -11,6 +13,7 @@ from pathlib import Path
 from typing import Any, Optional, TYPE_CHECKING
 
 from PyQt6.QtWidgets import (
+    QCheckBox,
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
@@ -25,6 +28,7 @@ from PyQt6.QtWidgets import (
 )
 
 from gui_qt.styles import apply_window_icon
+from gui_qt.workers.export_worker import ExportWorker
 
 if TYPE_CHECKING:
     from core.app_context import AppContext
@@ -33,7 +37,7 @@ logger = logging.getLogger(__name__)
 
 
 class ExportDialog(QDialog):
-    """Dialog for exporting data to CSV or JSON."""
+    """Dialog for exporting data to CSV, JSON or JSON Lines."""
 
     DATA_TYPES = [
         ("sales", "Sales History"),
@@ -45,8 +49,11 @@ class ExportDialog(QDialog):
     FORMATS = [
         ("csv", "CSV (.csv)"),
         ("json", "JSON (.json)"),
+        ("jsonl", "JSON Lines (.jsonl)"),
     ]
 
+    FORMAT_FILTERS = {"csv": "CSV", "json": "JSON", "jsonl": "JSON Lines"}
+
     DATE_RANGES = [
         (None, "All Time"),
         (7, "Last 7 Days"),
@@ -58,6 +65,9 @@ class ExportDialog(QDialog):
         super().__init__(parent)
         self.ctx = ctx
         self._export_service: Any = None
+        self._worker: Optional[ExportWorker] = None
+        # Arguments and resume point of a cancelled export, for "Resume"
+        self._resume: Optional[dict] = None
 
         self.setWindowTitle("Export Data")
         self.setMinimumWidth(400)
@@ -91,12 +101,18 @@ class ExportDialog(QDialog):
         self._format_combo = QComboBox()
         for key, label in self.FORMATS:
             self._format_combo.addItem(label, key)
+        self._format_combo.currentIndexChanged.connect(self._clear_resume)
         options_layout.addRow("Format:", self._format_combo)
 
+        self._compress_check = QCheckBox("Compress (gzip)")
+        self._compress_check.toggled.connect(self._clear_resume)
+        options_layout.addRow("", self._compress_check)
+
         # Date range selector
         self._date_range_combo = QComboBox()
         for days, label in self.DATE_RANGES:
             self._date_range_combo.addItem(label, days)
+        self._date_range_combo.currentIndexChanged.connect(self._clear_resume)
         options_layout.addRow("Date Range:", self._date_range_combo)
 
         layout.addWidget(options_group)
@@ -113,6 +129,7 @@ class ExportDialog(QDialog):
         self._category_combo.addItem("Unique Accessories", "unique_accessories")
         self._category_combo.addItem("Scarabs", "scarabs")
         self._category_combo.addItem("Fragments", "fragments")
+        self._category_combo.currentIndexChanged.connect(self._clear_resume)
         rankings_layout.addRow("Category:", self._category_combo)
 
         self._rankings_group.setVisible(False)
@@ -137,9 +154,9 @@ class ExportDialog(QDialog):
         self._export_btn.clicked.connect(self._do_export)
         button_layout.addWidget(self._export_btn)
 
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        button_layout.addWidget(cancel_btn)
+        self._cancel_btn = QPushButton("Cancel")
+        self._cancel_btn.clicked.connect(self._on_cancel_clicked)
+        button_layout.addWidget(self._cancel_btn)
 
         layout.addLayout(button_layout)
 
@@ -152,21 +169,38 @@ class ExportDialog(QDialog):
 
         # Disable date range for rankings
         self._date_range_combo.setEnabled(data_type != "rankings")
+        self._clear_resume()
+
+    def _clear_resume(self, *_: Any) -> None:
+        """Forget a cancelled export once the options change."""
+        self._resume = None
+        self._export_btn.setText("Export...")
+
+    def _is_exporting(self) -> bool:
+        return self._worker is not None and self._worker.isRunning()
 
     def _do_export(self) -> None:
-        """Perform the export."""
+        """Choose a file and start the export (or resume a cancelled one)."""
+        if self._is_exporting():
+            return
+
+        if self._resume is not None:
+            self._start_export(**self._resume)
+            return
+
         data_type = self._data_type_combo.currentData()
         export_format = self._format_combo.currentData()
         days = self._date_range_combo.currentData()
+        compress = self._compress_check.isChecked()
 
         # Get file extension
-        ext = ".csv" if export_format == "csv" else ".json"
+        ext = f".{export_format}" + (".gz" if compress else "")
 
         # Get default filename
         default_name = f"{data_type}_export{ext}"
 
         # Show file dialog
-        file_filter = f"{'CSV' if export_format == 'csv' else 'JSON'} Files (*{ext})"
+        file_filter = f"{self.FORMAT_FILTERS[export_format]} Files (*{ext})"
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Export Data",
@@ -181,60 +215,99 @@ class ExportDialog(QDialog):
         if not file_path.endswith(ext):
             file_path += ext
 
-        # Show progress
+        # Build kwargs for export
+        kwargs = {}
+        if data_type == "rankings":
+            kwargs["league"] = self.ctx.config.league or "Standard"
+            kwargs["category"] = self._category_combo.currentData()
+
+        self._start_export(
+            data_type=data_type,
+            export_format=export_format,
+            file_path=Path(file_path),
+            days=days,
+            compress=compress,
+            offset=0,
+            **kwargs
+        )
+
+    def _start_export(self, **export_args: Any) -> None:
+        """Run the export in a background worker."""
+        self._resume = None
         self._progress.setVisible(True)
-        self._progress.setRange(0, 0)  # Indeterminate
+        self._progress.setRange(0, 0)  # Indeterminate until the row count is known
         self._export_btn.setEnabled(False)
         self._status_label.setText("Exporting...")
 
-        try:
-            service = self._get_export_service()
-
-            # Build kwargs for export
-            kwargs = {}
-            if data_type == "rankings":
-                kwargs["league"] = self.ctx.config.league or "Standard"
-                kwargs["category"] = self._category_combo.currentData()
-
-            result = service.export_data(
-                data_type=data_type,
-                format=export_format,
-                file_path=Path(file_path),
-                days=days,
-                **kwargs
-            )
-
-            if result.success:
-                self._status_label.setText(
-                    f"Exported {result.record_count} records to {result.file_path.name}"
-                )
-                QMessageBox.information(
-                    self,
-                    "Export Complete",
-                    f"Successfully exported {result.record_count} records.\n\n"
-                    f"File: {file_path}"
-                )
-                self.accept()
-            else:
-                self._status_label.setText(f"Export failed: {result.error}")
-                QMessageBox.warning(
-                    self,
-                    "Export Failed",
-                    f"Failed to export data:\n{result.error}"
-                )
-
-        except Exception as e:
-            logger.error(f"Export error: {e}")
-            self._status_label.setText(f"Error: {e}")
-            QMessageBox.critical(
-                self,
-                "Export Error",
-                f"An error occurred during export:\n{str(e)}"
-            )
-
-        finally:
-            self._progress.setVisible(False)
-            self._export_btn.setEnabled(True)
+        worker = ExportWorker(self._get_export_service(), parent=self, **export_args)
+        worker.progress.connect(self._on_export_progress)
+        worker.result.connect(self._on_export_finished)
+        worker.error.connect(self._on_export_error)
+        worker.finished.connect(lambda: self._on_worker_done(worker, export_args))
+        self._worker = worker
+        worker.start()
+
+    def _on_export_progress(self, done: int, total: int) -> None:
+        if total > 0:
+            self._progress.setRange(0, total)
+            self._progress.setValue(done)
+        self._status_label.setText(f"Exported {done:,} of {total:,} records..." if total else f"Exported {done:,}...")
+
+    def _on_export_finished(self, result: Any) -> None:
+        """Handle a completed export."""
+        self._status_label.setText(
+            f"Exported {result.next_offset} records to {result.file_path.name}"
+        )
+        QMessageBox.information(
+            self,
+            "Export Complete",
+            f"Successfully exported {result.next_offset} records.\n\n"
+            f"File: {result.file_path}"
+        )
+        self.accept()
+
+    def _on_export_error(self, message: str, _traceback: str) -> None:
+        """Handle a failed export."""
+        logger.error(f"Export error: {message}")
+        self._status_label.setText(f"Export failed: {message}")
+        QMessageBox.warning(
+            self,
+            "Export Failed",
+            f"Failed to export data:\n{message}"
+        )
+
+    def _on_worker_done(self, worker: ExportWorker, export_args: dict) -> None:
+        """Reset the UI; after a cancel, offer to resume where it stopped."""
+        if self._worker is worker:
+            self._worker = None
+        self._progress.setVisible(False)
+        self._export_btn.setEnabled(True)
+
+        result = worker.last_result
+        if worker.is_cancelled and result is not None and export_args["export_format"] != "json":
+            self._resume = {
+                **export_args, "offset": result.next_offset, "resume_after": result.resume_after
+            }
+            self._export_btn.setText("Resume")
+            self._status_label.setText(f"Export cancelled after {result.next_offset:,} records")
+        elif worker.is_cancelled:
+            self._status_label.setText("Export cancelled")
+        worker.deleteLater()
+
+    def _on_cancel_clicked(self) -> None:
+        """Cancel a running export, otherwise close the dialog."""
+        if self._is_exporting():
+            self._status_label.setText("Cancelling...")
+            self._worker.cancel()
+        else:
+            self.reject()
+
+    def reject(self) -> None:
+        """Stop any running export before closing."""
+        if self._is_exporting():
+            self._worker.cancel()
+            self._worker.wait()
+        super().reject()
 
     def set_data_type(self, data_type: str) -> None:
         """Set the data type programmatically."""
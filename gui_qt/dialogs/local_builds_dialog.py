@@ -199,9 +199,9 @@ class LocalBuildsDialog(QDialog):
         )
 
         if folder:
-            from core.pob_local_scanner import PoBLocalScanner
+            from core.pob_local_scanner import DEFAULT_INDEX_PATH, PoBLocalScanner
 
-            self._scanner = PoBLocalScanner(Path(folder))
+            self._scanner = PoBLocalScanner(Path(folder), index_path=DEFAULT_INDEX_PATH)
             if self._scanner.builds_path:
                 self._path_label.setText(str(self._scanner.builds_path))
                 self._start_scan()
@@ -36,6 +36,7 @@ from core.upgrade_finder import (
     UpgradeFinderService,
     UpgradeFinderResult,
     UpgradeCandidate,
+    SlotUpgradeResult,
 )
 
 logger = logging.getLogger(__name__)
@@ -48,6 +49,7 @@ class UpgradeSearchWorker(QThread):
     error = pyqtSignal(str)
     progress = pyqtSignal(str)
     slot_progress = pyqtSignal(str, int, int)  # slot_name, current, total
+    slot_finished = pyqtSignal(object)  # SlotUpgradeResult, as each slot completes
 
     def __init__(
         self,
@@ -64,6 +66,7 @@ class UpgradeSearchWorker(QThread):
         self.budget_chaos = budget_chaos
         self.slots = slots
         self.max_results = max_results
+        self._completed_slots = 0
 
     def run(self):
         """Perform the upgrade search."""
@@ -75,6 +78,7 @@ class UpgradeSearchWorker(QThread):
                 budget_chaos=self.budget_chaos,
                 slots=self.slots,
                 max_results_per_slot=self.max_results,
+                on_slot_result=self._on_slot_result,
             )
 
             self.finished.emit(result)
@@ -83,6 +87,12 @@ class UpgradeSearchWorker(QThread):
             logger.exception("Upgrade search failed")
             self.error.emit("Upgrade search failed")
 
+    def _on_slot_result(self, slot_result) -> None:
+        """Forward a completed slot to the UI (called on this worker thread)."""
+        self._completed_slots += 1
+        self.slot_finished.emit(slot_result)
+        self.slot_progress.emit(slot_result.slot, self._completed_slots, len(self.slots))
+
 
 class UpgradeFinderDialog(QDialog):
     """Dialog for finding gear upgrades within a budget."""
@@ -433,6 +443,7 @@ class UpgradeFinderDialog(QDialog):
         # Clear previous results
         self.results_table.setRowCount(0)
         self.details_browser.clear()
+        self._current_result = UpgradeFinderResult(profile_name=profile_name, budget_chaos=budget)
 
         # Start worker
         self._search_worker = UpgradeSearchWorker(
@@ -446,12 +457,37 @@ class UpgradeFinderDialog(QDialog):
         self._search_worker.finished.connect(self._on_search_finished)
         self._search_worker.error.connect(self._on_search_error)
         self._search_worker.progress.connect(self._on_search_progress)
+        self._search_worker.slot_progress.connect(self._on_slot_progress)
+        self._search_worker.slot_finished.connect(self._on_slot_finished)
         self._search_worker.start()
 
     def _on_search_progress(self, message: str) -> None:
         """Handle search progress update."""
         self.progress_bar.setFormat(message)
 
+    def _on_slot_progress(self, slot: str, completed: int, total: int) -> None:
+        """Handle a slot finishing its search."""
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(completed)
+        self.progress_bar.setFormat(f"Searched {completed}/{total} slots ({slot})")
+
+    def _on_slot_finished(self, slot_result: SlotUpgradeResult) -> None:
+        """Add a finished slot's upgrades to the table while the rest are searched."""
+        partial = self._current_result
+        if partial is None:
+            return
+
+        partial.slot_results[slot_result.slot] = slot_result
+        partial.total_candidates += len(slot_result.candidates)
+
+        best_upgrades = partial.get_best_upgrades(limit=50)
+        if best_upgrades:
+            self._fill_results_table(best_upgrades)
+        self.summary_label.setText(
+            f"Found {partial.total_candidates} potential upgrades in "
+            f"{len(partial.slot_results)} slots so far..."
+        )
+
     def _on_search_finished(self, result: UpgradeFinderResult) -> None:
         """Handle search completion."""
         self.progress_bar.setVisible(False)
@@ -481,6 +517,21 @@ class UpgradeFinderDialog(QDialog):
             )
             return
 
+        self._fill_results_table(best_upgrades)
+
+        # Summary
+        self.summary_label.setText(
+            f"Found {result.total_candidates} potential upgrades across "
+            f"{len(result.slot_results)} slots in {result.search_time_seconds:.1f}s. "
+            f"Budget: {int(result.budget_chaos)} chaos."
+        )
+
+        # Select first row
+        if self.results_table.rowCount() > 0:
+            self.results_table.selectRow(0)
+
+    def _fill_results_table(self, best_upgrades: List[tuple[str, UpgradeCandidate]]) -> None:
+        """Replace the table rows with the given (slot, candidate) upgrades."""
         self.results_table.setRowCount(len(best_upgrades))
 
         for row, (slot, candidate) in enumerate(best_upgrades):
@@ -539,17 +590,6 @@ class UpgradeFinderDialog(QDialog):
                 score_item.setForeground(Qt.GlobalColor.yellow)
             self.results_table.setItem(row, 5, score_item)
 
-        # Summary
-        self.summary_label.setText(
-            f"Found {result.total_candidates} potential upgrades across "
-            f"{len(result.slot_results)} slots in {result.search_time_seconds:.1f}s. "
-            f"Budget: {int(result.budget_chaos)} chaos."
-        )
-
-        # Select first row
-        if self.results_table.rowCount() > 0:
-            self.results_table.selectRow(0)
-
     def _on_selection_changed(self) -> None:
         """Handle table selection change."""
         selected = self.results_table.selectedItems()
@@ -763,8 +763,11 @@ class PriceCheckerWindow(BackgroundServicesMixin, MenuBarMixin, ShortcutsMixin,
         self._set_status("Checking price...")
 
         try:
-            # Use the controller for price checking
-            result = self._price_controller.check_price(item_text)
+            # Use the controller for price checking; report each source as it
+            # finishes rather than only once the slowest one is done
+            result = self._price_controller.check_price(
+                item_text, on_source_done=self._on_price_source_done
+            )
 
             if result.is_err():
                 self._set_status(result.error or "Unknown error")
@@ -853,6 +856,18 @@ class PriceCheckerWindow(BackgroundServicesMixin, MenuBarMixin, ShortcutsMixin,
             self._check_in_progress = False
             panel.check_btn.setEnabled(True)
 
+    def _on_price_source_done(self, result: Any) -> None:
+        """Show one price source's outcome while the others are still running."""
+        if result.timed_out:
+            message = f"Checking price... {result.source} timed out"
+        elif not result.ok:
+            message = f"Checking price... {result.source} failed"
+        else:
+            message = f"Checking price... {result.source}: {len(result.rows)} result(s)"
+        self._set_status(message)
+        # The check runs on the UI thread; paint the status bar now
+        self.status_bar.repaint()
+
     def _clear_input(self) -> None:
         """Clear the input text."""
         self.input_text.clear()
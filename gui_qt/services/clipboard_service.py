@@ -2,7 +2,8 @@
 Clipboard Service - Global hotkey support for price checking.
 
 Provides system-wide hotkey support for triggering price checks
-without requiring the application window to be focused.
+without requiring the application window to be focused, and optional
+automatic detection of copied items driven by QClipboard.dataChanged.
 """
 
 from __future__ import annotations
@@ -11,8 +12,10 @@ import logging
 from typing import TYPE_CHECKING, Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QClipboard, QGuiApplication
 
 from core.clipboard_monitor import ClipboardMonitor, KEYBOARD_AVAILABLE
+from core.clipboard_sources import ClipboardCallback, ClipboardSource
 
 if TYPE_CHECKING:
     from core.app_context import AppContext
@@ -20,6 +23,59 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class QtClipboardSource(ClipboardSource):
+    """
+    Clipboard source driven by QClipboard.dataChanged.
+
+    Changes are pushed by Qt on the GUI thread, so there is no polling
+    thread and no per-read subprocess. Must be started, read and stopped
+    from the GUI thread.
+    """
+
+    name = "qt"
+    push_based = True
+
+    def __init__(self, clipboard: Optional[QClipboard] = None):
+        """
+        Args:
+            clipboard: Clipboard to watch (defaults to the application's).
+        """
+        self._clipboard = clipboard
+        self._on_change: Optional[ClipboardCallback] = None
+
+    def _get_clipboard(self) -> Optional[QClipboard]:
+        if self._clipboard is None and QGuiApplication.instance() is not None:
+            self._clipboard = QGuiApplication.clipboard()
+        return self._clipboard
+
+    def read(self) -> str:
+        clipboard = self._get_clipboard()
+        return clipboard.text() if clipboard is not None else ""
+
+    def start(self, on_change: ClipboardCallback) -> bool:
+        clipboard = self._get_clipboard()
+        if clipboard is None or self._on_change is not None:
+            return False
+        self._on_change = on_change
+        clipboard.dataChanged.connect(self._on_data_changed)
+        return True
+
+    def stop(self) -> None:
+        if self._on_change is None:
+            return
+        clipboard = self._get_clipboard()
+        if clipboard is not None:
+            try:
+                clipboard.dataChanged.disconnect(self._on_data_changed)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected or clipboard destroyed
+        self._on_change = None
+
+    def _on_data_changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change(self.read())
+
+
 class ClipboardService(QObject):
     """
     Qt service wrapper for global hotkey-based clipboard price checking.
@@ -43,6 +99,10 @@ class ClipboardService(QObject):
     # Emitted when hotkey is pressed but no PoE item in clipboard
     no_item_in_clipboard = pyqtSignal()
 
+    # Emitted when auto detection sees a PoE item copied to the clipboard
+    # Argument: item_text (str)
+    item_copied = pyqtSignal(str)
+
     # Emitted when service status changes
     status_changed = pyqtSignal(str)
 
@@ -65,6 +125,7 @@ class ClipboardService(QObject):
 
         self._ctx = ctx
         self._monitor: Optional[ClipboardMonitor] = None
+        self._auto_monitor: Optional[ClipboardMonitor] = None
         self._hotkey = self.DEFAULT_HOTKEY
         self._enabled = True
         self._is_running = False
@@ -149,8 +210,47 @@ class ClipboardService(QObject):
             self.status_changed.emit("error")
             return False
 
+    @property
+    def is_auto_detecting(self) -> bool:
+        """Check if copied items are being detected automatically."""
+        return self._auto_monitor is not None and self._auto_monitor.is_running
+
+    def start_auto_detection(self) -> bool:
+        """
+        Emit item_copied whenever a PoE item is copied to the clipboard.
+
+        Uses QClipboard.dataChanged, so nothing runs while the clipboard
+        is idle. Must be called from the GUI thread.
+
+        Returns:
+            True if auto detection is active.
+        """
+        if self.is_auto_detecting:
+            return True
+
+        self._auto_monitor = ClipboardMonitor(
+            on_item_detected=self.item_copied.emit,
+            source=QtClipboardSource(),
+        )
+        if not self._auto_monitor.start_monitoring():
+            logger.warning("Failed to start clipboard auto detection")
+            self._auto_monitor = None
+            return False
+
+        logger.info("Clipboard auto detection started")
+        return True
+
+    def stop_auto_detection(self) -> None:
+        """Stop automatic clipboard item detection."""
+        if self._auto_monitor:
+            self._auto_monitor.stop_monitoring()
+            self._auto_monitor = None
+            logger.info("Clipboard auto detection stopped")
+
     def stop(self) -> None:
         """Stop the clipboard service and unregister hotkeys."""
+        self.stop_auto_detection()
+
         if not self._is_running:
             return
 
@@ -253,6 +353,7 @@ class ClipboardService(QObject):
             "enabled": self._enabled,
             "running": self._is_running,
             "hotkey": self._hotkey,
+            "auto_detecting": self.is_auto_detecting,
         }
 
         if self._monitor:
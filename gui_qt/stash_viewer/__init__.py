@@ -251,6 +251,9 @@ class StashViewerWindow(QDialog):
         self.item_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.item_table.setAlternatingRowColors(True)
         self.item_table.setSortingEnabled(True)
+        # Most valuable first; sorting by verdict would evaluate every item
+        total_col = [key for key, _, _ in ItemTableModel.COLUMNS].index("total_price")
+        self.item_table.sortByColumn(total_col, Qt.SortOrder.DescendingOrder)
         self.item_table.doubleClicked.connect(self._on_item_double_click)
 
         # Context menu for items
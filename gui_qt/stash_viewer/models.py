@@ -3,7 +3,7 @@ Table models for stash viewer.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QColor
@@ -14,6 +14,73 @@ from core.stash_valuator import PricedItem, PriceSource
 from core.quick_verdict import QuickVerdictCalculator, Verdict, VerdictResult
 
 
+class ItemViewIndex:
+    """
+    Filtered, sorted rows over a list of PricedItems.
+
+    Plays the role of a QSortFilterProxyModel without its per-row Python
+    callbacks: lowercased search keys and prices are computed once per
+    set_items(), the sort order once per sort(), and the visible rows only
+    when a filter changes. Looking up a row is then a list index, so
+    painting cost doesn't depend on how many items the tab holds.
+    """
+
+    def __init__(self) -> None:
+        self._items: Sequence[PricedItem] = []
+        self._search_keys: List[str] = []
+        self._prices: List[float] = []
+        self._order: List[int] = []  # every item index, in sort order
+        self._rows: List[int] = []  # visible item indices, in sort order
+        self._min_value: float = 0.0
+        self._needle: str = ""
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def set_items(self, items: Sequence[PricedItem]) -> None:
+        self._items = items
+        self._search_keys = [item.display_name.lower() for item in items]
+        self._prices = [item.total_price for item in items]
+        self._order = list(range(len(items)))
+        self._refilter()
+
+    def set_min_value(self, min_value: float) -> None:
+        self._min_value = min_value
+        self._refilter()
+
+    def set_search_text(self, text: str) -> None:
+        needle = text.strip().lower()
+        # Typing more characters can only narrow the current matches
+        narrowing = bool(self._needle) and self._needle in needle
+        self._needle = needle
+        self._refilter(self._rows if narrowing else None)
+
+    def sort(self, key: Optional[Callable[[PricedItem], Any]], descending: bool = False) -> None:
+        """Order rows by ``key(item)``; ``None`` restores the original order."""
+        if key is None:
+            self._order = list(range(len(self._items)))
+        else:
+            keys = [key(item) for item in self._items]
+            self._order = sorted(range(len(keys)), key=keys.__getitem__, reverse=descending)
+        self._refilter()
+
+    def _refilter(self, candidates: Optional[List[int]] = None) -> None:
+        source = self._order if candidates is None else candidates
+        prices = self._prices
+        min_value = self._min_value
+        needle = self._needle
+        if needle:
+            keys = self._search_keys
+            self._rows = [i for i in source if prices[i] >= min_value and needle in keys[i]]
+        else:
+            self._rows = [i for i in source if prices[i] >= min_value]
+
+    def item_at(self, row: int) -> Optional[PricedItem]:
+        if 0 <= row < len(self._rows):
+            return self._items[self._rows[row]]
+        return None
+
+
 class ItemTableModel(QAbstractTableModel):
     """Table model for priced items."""
 
@@ -34,27 +101,70 @@ class ItemTableModel(QAbstractTableModel):
         Verdict.MAYBE: QColor("#bbbb22"),   # Yellow
     }
 
+    # Verdict column sorts keep > maybe > vendor when descending
+    VERDICT_RANK = {Verdict.VENDOR: 0, Verdict.MAYBE: 1, Verdict.KEEP: 2}
+
+    RARITY_COLORS = {
+        "Unique": QColor(COLORS["unique"]),
+        "Rare": QColor(COLORS["rare"]),
+        "Magic": QColor(COLORS["magic"]),
+        "Currency": QColor(COLORS["currency"]),
+        "Gem": QColor(COLORS["gem"]),
+        "Divination": QColor(COLORS["divination"]),
+    }
+
+    SOURCE_LABELS = {
+        PriceSource.POE_NINJA: "poe.ninja",
+        PriceSource.POE_PRICES: "poeprices",
+        PriceSource.RARE_EVALUATED: "eval",
+    }
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._items: List[PricedItem] = []
         self._min_value: float = 0.0
         self._search_text: str = ""
+        self._view = ItemViewIndex()
+        self._sort_column: int = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
         self._verdict_calculator = QuickVerdictCalculator()
         self._verdict_cache: Dict[tuple, VerdictResult] = {}  # Cache verdicts by item id
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        return len(self._filtered_items())
+        return len(self._view)
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return len(self.COLUMNS)
 
-    def _filtered_items(self) -> List[PricedItem]:
-        """Get items filtered by minimum value and search text."""
-        items = [i for i in self._items if i.total_price >= self._min_value]
-        if self._search_text:
-            search_lower = self._search_text.lower()
-            items = [i for i in items if search_lower in i.display_name.lower()]
-        return items
+    def _sort_key(self, column: int) -> Optional[Callable[[PricedItem], Any]]:
+        """Sort key for a column, or None for the original order."""
+        if not 0 <= column < len(self.COLUMNS):
+            return None
+        col_key = self.COLUMNS[column][0]
+        if col_key == "verdict":
+            return lambda item: self.VERDICT_RANK.get(self._get_verdict(item).verdict, -1)
+        if col_key == "display_name":
+            return lambda item: item.display_name.lower()
+        if col_key in ("stack_size", "unit_price", "total_price"):
+            return lambda item: getattr(item, col_key)
+        return lambda item: self._display_text(item, col_key)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Sort rows by column (called by the view when a header is clicked)."""
+        self.beginResetModel()
+        self._sort_column = column
+        self._sort_order = order
+        self._apply_sort()
+        self.endResetModel()
+
+    def _is_sorted_by_verdict(self) -> bool:
+        return 0 <= self._sort_column < len(self.COLUMNS) and self.COLUMNS[self._sort_column][0] == "verdict"
+
+    def _apply_sort(self) -> None:
+        self._view.sort(
+            self._sort_key(self._sort_column),
+            descending=self._sort_order == Qt.SortOrder.DescendingOrder,
+        )
 
     def _get_verdict(self, item: PricedItem) -> VerdictResult:
         """Get verdict for an item, using cache if available."""
@@ -123,41 +233,39 @@ class ItemTableModel(QAbstractTableModel):
         self._verdict_cache[cache_key] = verdict
         return verdict
 
+    def _display_text(self, item: PricedItem, col_key: str) -> str:
+        if col_key == "verdict":
+            verdict = self._get_verdict(item)
+            return verdict.emoji
+        elif col_key == "display_name":
+            return item.display_name
+        elif col_key == "stack_size":
+            return str(item.stack_size) if item.stack_size > 1 else ""
+        elif col_key == "unit_price":
+            if item.unit_price >= 1:
+                return f"{item.unit_price:.1f}c"
+            elif item.unit_price > 0:
+                return f"{item.unit_price:.2f}c"
+            return ""
+        elif col_key == "total_price":
+            return item.display_price
+        elif col_key == "rarity":
+            return item.rarity
+        elif col_key == "price_source":
+            return self.SOURCE_LABELS.get(item.price_source, "")
+        return ""
+
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
-        items = self._filtered_items()
-        if not index.isValid() or not (0 <= index.row() < len(items)):
+        if not index.isValid():
+            return None
+        item = self._view.item_at(index.row())
+        if item is None:
             return None
 
-        item = items[index.row()]
         col_key = self.COLUMNS[index.column()][0]
 
         if role == Qt.ItemDataRole.DisplayRole:
-            if col_key == "verdict":
-                verdict = self._get_verdict(item)
-                return verdict.emoji
-            elif col_key == "display_name":
-                return item.display_name
-            elif col_key == "stack_size":
-                return str(item.stack_size) if item.stack_size > 1 else ""
-            elif col_key == "unit_price":
-                if item.unit_price >= 1:
-                    return f"{item.unit_price:.1f}c"
-                elif item.unit_price > 0:
-                    return f"{item.unit_price:.2f}c"
-                return ""
-            elif col_key == "total_price":
-                return item.display_price
-            elif col_key == "rarity":
-                return item.rarity
-            elif col_key == "price_source":
-                if item.price_source == PriceSource.POE_NINJA:
-                    return "poe.ninja"
-                elif item.price_source == PriceSource.POE_PRICES:
-                    return "poeprices"
-                elif item.price_source == PriceSource.RARE_EVALUATED:
-                    return "eval"
-                return ""
-            return ""
+            return self._display_text(item, col_key)
 
         elif role == Qt.ItemDataRole.ToolTipRole:
             if col_key == "verdict":
@@ -176,16 +284,8 @@ class ItemTableModel(QAbstractTableModel):
                 verdict = self._get_verdict(item)
                 return self.VERDICT_COLORS.get(verdict.verdict, QColor(COLORS["text"]))
             # Color by rarity
-            rarity_colors = {
-                "Unique": QColor(COLORS["unique"]),
-                "Rare": QColor(COLORS["rare"]),
-                "Magic": QColor(COLORS["magic"]),
-                "Currency": QColor(COLORS["currency"]),
-                "Gem": QColor(COLORS["gem"]),
-                "Divination": QColor(COLORS["divination"]),
-            }
             if col_key == "display_name":
-                return rarity_colors.get(item.rarity, QColor(COLORS["text"]))
+                return self.RARITY_COLORS.get(item.rarity, QColor(COLORS["text"]))
             # Color by value
             if col_key == "total_price":
                 if item.total_price >= 100:
@@ -218,6 +318,9 @@ class ItemTableModel(QAbstractTableModel):
         self.beginResetModel()
         self._items = items
         self._verdict_cache.clear()  # Clear cache when items change
+        self._view.set_items(items)
+        if self._sort_column >= 0:
+            self._apply_sort()
         self.endResetModel()
 
     def set_meta_weights(self, meta_weights: dict) -> None:
@@ -226,6 +329,8 @@ class ItemTableModel(QAbstractTableModel):
         self._verdict_cache.clear()  # Clear cache to recalculate with new weights
         # Refresh display
         self.beginResetModel()
+        if self._is_sorted_by_verdict():
+            self._apply_sort()
         self.endResetModel()
 
     def set_verdict_thresholds(self, vendor: float, keep: float) -> None:
@@ -234,23 +339,24 @@ class ItemTableModel(QAbstractTableModel):
         self._verdict_cache.clear()  # Clear cache to recalculate with new thresholds
         # Refresh display
         self.beginResetModel()
+        if self._is_sorted_by_verdict():
+            self._apply_sort()
         self.endResetModel()
 
     def set_min_value(self, min_value: float) -> None:
         """Set minimum value filter."""
         self.beginResetModel()
         self._min_value = min_value
+        self._view.set_min_value(min_value)
         self.endResetModel()
 
     def set_search_text(self, text: str) -> None:
         """Set search text filter."""
         self.beginResetModel()
         self._search_text = text.strip()
+        self._view.set_search_text(self._search_text)
         self.endResetModel()
 
     def get_item(self, row: int) -> Optional[PricedItem]:
         """Get item at row."""
-        items = self._filtered_items()
-        if 0 <= row < len(items):
-            return items[row]
-        return None
+        return self._view.item_at(row)
@@ -1,15 +1,38 @@
 """
 gui_qt.widgets - Reusable PyQt6 widgets for PoE Price Checker.
+
+Widgets are imported on first access; importing a single widget module no
+longer pulls in every widget (and numpy via the item inspector).
 """
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from gui_qt.widgets.results_table import ResultsTableWidget
-from gui_qt.widgets.item_inspector import ItemInspectorWidget
-from gui_qt.widgets.rare_evaluation_panel import RareEvaluationPanelWidget
-from gui_qt.widgets.build_filter_widget import BuildFilterWidget
-from gui_qt.widgets.toast_notification import ToastManager, ToastNotification, ToastType
-from gui_qt.widgets.pinned_items_widget import PinnedItemsWidget, PinnedItemWidget
-from gui_qt.widgets.stash_grid_visualizer import StashGridVisualizerWidget
-from gui_qt.widgets.upgrade_history_panel import UpgradeHistoryPanel
+if TYPE_CHECKING:
+    from gui_qt.widgets.results_table import ResultsTableWidget
+    from gui_qt.widgets.item_inspector import ItemInspectorWidget
+    from gui_qt.widgets.rare_evaluation_panel import RareEvaluationPanelWidget
+    from gui_qt.widgets.build_filter_widget import BuildFilterWidget
+    from gui_qt.widgets.toast_notification import ToastManager, ToastNotification, ToastType
+    from gui_qt.widgets.pinned_items_widget import PinnedItemsWidget, PinnedItemWidget
+    from gui_qt.widgets.stash_grid_visualizer import StashGridVisualizerWidget
+    from gui_qt.widgets.upgrade_history_panel import UpgradeHistoryPanel
+
+# Exported name -> defining module, imported on first access
+_LAZY_IMPORTS = {
+    "ResultsTableWidget": "gui_qt.widgets.results_table",
+    "ItemInspectorWidget": "gui_qt.widgets.item_inspector",
+    "RareEvaluationPanelWidget": "gui_qt.widgets.rare_evaluation_panel",
+    "BuildFilterWidget": "gui_qt.widgets.build_filter_widget",
+    "ToastManager": "gui_qt.widgets.toast_notification",
+    "ToastNotification": "gui_qt.widgets.toast_notification",
+    "ToastType": "gui_qt.widgets.toast_notification",
+    "PinnedItemsWidget": "gui_qt.widgets.pinned_items_widget",
+    "PinnedItemWidget": "gui_qt.widgets.pinned_items_widget",
+    "StashGridVisualizerWidget": "gui_qt.widgets.stash_grid_visualizer",
+    "UpgradeHistoryPanel": "gui_qt.widgets.upgrade_history_panel",
+}
 
 __all__ = [
     "ResultsTableWidget",
@@ -24,3 +47,16 @@ __all__ = [
     "StashGridVisualizerWidget",
     "UpgradeHistoryPanel",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__} has no attribute {name}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -192,7 +192,9 @@ class AIAnalysisPanelWidget(QGroupBox):
         self.provider_label.setStyleSheet(f"color: {COLORS['accent']};")
 
         # Update status with token info
-        if response.tokens_used > 0:
+        if getattr(response, "from_cache", False) is True:
+            self.status_label.setText("(cached)")
+        elif response.tokens_used > 0:
             self.status_label.setText(f"({response.tokens_used} tokens)")
         else:
             self.status_label.setText("")
@@ -9,7 +9,7 @@ Uses QTextBrowser for native scrolling and copy/paste support.
 from __future__ import annotations
 
 import html
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from PyQt6.QtWidgets import (
     QWidget,
@@ -21,9 +21,11 @@ from gui_qt.styles import COLORS, get_rarity_color, get_tier_color, TIER_COLORS
 from core.build_stat_calculator import BuildStatCalculator, BuildStats
 from core.mod_tier_detector import detect_mod_tier
 from core.build_archetype import BuildArchetype
-from core.upgrade_calculator import UpgradeCalculator
 from core.dps_impact_calculator import DPSImpactCalculator, DPSStats
 
+if TYPE_CHECKING:
+    from core.upgrade_calculator import UpgradeCalculator
+
 
 class ItemInspectorWidget(QWidget):
     """Widget for displaying parsed item information using HTML."""
@@ -103,6 +105,10 @@ class ItemInspectorWidget(QWidget):
         self._build_stats = stats
         if stats:
             self._calculator = BuildStatCalculator(stats)
+            # Deferred: the upgrade calculator pulls in numpy, which isn't
+            # needed until a build is loaded.
+            from core.upgrade_calculator import UpgradeCalculator
+
             self._upgrade_calculator = UpgradeCalculator(stats)
         else:
             self._calculator = None
@@ -278,6 +278,13 @@ class PriceChartWidget(QWidget):
         self._title_label.setText("Price History")
         self._status_label.setText("")
 
+    def plot_width(self) -> int:
+        """Width of the plot area in device pixels; a series needs no more points."""
+        if self.canvas is None or self.ax is None:
+            return 0
+        width = self.ax.get_position().width * self.canvas.width() * self.canvas.devicePixelRatioF()
+        return max(int(width), 100)
+
     def get_current_days(self) -> int:
         """Get the current time range in days."""
         return self._current_days
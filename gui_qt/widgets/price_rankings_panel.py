@@ -309,10 +309,8 @@ class PriceRankingsPanel(QFrame):
                 league = self.ctx.config.league or "Standard"
 
             api = PoeNinjaAPI(league=league)
-            cache = PriceRankingCache(league=league)
-            calculator = Top20Calculator(cache, poe_ninja_api=api)
-
-            ranking = calculator.refresh_category(category, force=force)
+            with PriceRankingCache(league=league) as cache:
+                ranking = Top20Calculator(cache, poe_ninja_api=api).refresh_category(category, force=force)
 
             if ranking:
                 self._cached_rankings[category] = ranking
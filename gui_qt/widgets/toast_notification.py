@@ -10,7 +10,7 @@ import weakref
 from enum import Enum
 from typing import Optional, List
 
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal
 from PyQt6.QtWidgets import (
     QFrame,
     QLabel,
@@ -62,6 +62,9 @@ TOAST_COLORS = {
 class ToastNotification(QFrame):
     """A single toast notification that auto-dismisses."""
 
+    # Emitted once the fade out finishes, just before the toast deletes itself
+    dismissed = pyqtSignal()
+
     def __init__(
         self,
         message: str,
@@ -173,6 +176,7 @@ class ToastNotification(QFrame):
 
     def _on_fade_out_finished(self) -> None:
         """Called when fade out completes."""
+        self.dismissed.emit()
         self.close()
         self.deleteLater()
 
@@ -198,6 +202,7 @@ class ToastManager:
         # Use weak reference to avoid preventing parent from being garbage collected
         self._parent_ref: weakref.ref[QWidget] = weakref.ref(parent)
         self._toasts: List[ToastNotification] = []
+        self._parent_destroyed = False
 
         # Connect to parent's destroyed signal to clean up all toasts
         parent.destroyed.connect(self._on_parent_destroyed)
@@ -205,15 +210,15 @@ class ToastManager:
     @property
     def _parent(self) -> Optional[QWidget]:
         """Get the parent widget if it still exists."""
+        if self._parent_destroyed:
+            return None
         return self._parent_ref()
 
     def _on_parent_destroyed(self) -> None:
         """Called when parent widget is destroyed. Clean up all toasts."""
-        # Clear toasts list without trying to fade them out (parent is already gone)
-        for toast in list(self._toasts):
-            # Just hide and delete, don't animate (animation needs parent)
-            toast.hide()
-            toast.deleteLater()
+        # The toasts are child widgets, so Qt has already deleted them along
+        # with the parent; only forget them here, never touch them
+        self._parent_destroyed = True
         self._toasts.clear()
 
     def show_toast(
@@ -244,7 +249,9 @@ class ToastManager:
             oldest._fade_out()
 
         toast = ToastNotification(message, toast_type, duration_ms, parent)
-        toast.destroyed.connect(lambda: self._remove_toast(toast))
+        # Not destroyed: that also fires mid-teardown of the parent, when
+        # neither the parent nor the sibling toasts may be repositioned
+        toast.dismissed.connect(lambda: self._remove_toast(toast))
         self._toasts.append(toast)
 
         # Position and show
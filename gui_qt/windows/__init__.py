@@ -1,15 +1,35 @@
 """
 gui_qt.windows - Secondary windows for PoE Price Checker.
+
+Windows are imported on first access so that importing one of them (or the
+package) doesn't load every window and its dependencies at startup.
 """
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from gui_qt.windows.recent_sales_window import RecentSalesWindow
-from gui_qt.windows.sales_dashboard_window import SalesDashboardWindow
-from gui_qt.windows.pob_character_window import PoBCharacterWindow
-from gui_qt.windows.rare_eval_config_window import RareEvalConfigWindow
-from gui_qt.windows.price_rankings_window import PriceRankingsWindow
-from gui_qt.windows.stash_viewer_window import StashViewerWindow
-from gui_qt.windows.upgrade_advisor_window import UpgradeAdvisorWindow
-from gui_qt.windows.build_manager_window import BuildManagerWindow
+if TYPE_CHECKING:
+    from gui_qt.windows.recent_sales_window import RecentSalesWindow
+    from gui_qt.windows.sales_dashboard_window import SalesDashboardWindow
+    from gui_qt.windows.pob_character_window import PoBCharacterWindow
+    from gui_qt.windows.rare_eval_config_window import RareEvalConfigWindow
+    from gui_qt.windows.price_rankings_window import PriceRankingsWindow
+    from gui_qt.windows.stash_viewer_window import StashViewerWindow
+    from gui_qt.windows.upgrade_advisor_window import UpgradeAdvisorWindow
+    from gui_qt.windows.build_manager_window import BuildManagerWindow
+
+# Exported name -> defining module, imported on first access
+_LAZY_IMPORTS = {
+    "RecentSalesWindow": "gui_qt.windows.recent_sales_window",
+    "SalesDashboardWindow": "gui_qt.windows.sales_dashboard_window",
+    "PoBCharacterWindow": "gui_qt.windows.pob_character_window",
+    "RareEvalConfigWindow": "gui_qt.windows.rare_eval_config_window",
+    "PriceRankingsWindow": "gui_qt.windows.price_rankings_window",
+    "StashViewerWindow": "gui_qt.windows.stash_viewer_window",
+    "UpgradeAdvisorWindow": "gui_qt.windows.upgrade_advisor_window",
+    "BuildManagerWindow": "gui_qt.windows.build_manager_window",
+}
 
 __all__ = [
     "RecentSalesWindow",
@@ -21,3 +41,16 @@ __all__ = [
     "UpgradeAdvisorWindow",
     "BuildManagerWindow",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__} has no attribute {name}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
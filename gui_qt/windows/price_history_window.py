@@ -5,7 +5,8 @@ PyQt6 window for historical economy data analysis.
 Shows currency statistics and top unique items over a league's lifetime.
 All values are in chaos orb equivalents.
 
-Uses pre-aggregated summary tables for fast queries when available.
+League statistics come from the summary tables, which the economy service
+materialises on first access; they load in a background worker.
 """
 
 from __future__ import annotations
@@ -26,15 +27,16 @@ from PyQt6.QtWidgets import (
     QTableView,
     QAbstractItemView,
     QSplitter,
-    QMessageBox,
     QTabWidget,
 )
 
 from gui_qt.styles import apply_window_icon
 from gui_qt.widgets.price_chart_widget import PriceChartWidget
+from gui_qt.workers.economy_worker import LeagueSummaryWorker
 
 if TYPE_CHECKING:
     from core.app_context import AppContext
+    from core.economy import LeagueEconomyOverview
     from core.services.chart_data_service import ChartDataService
 
 logger = logging.getLogger(__name__)
@@ -224,6 +226,7 @@ class PriceHistoryWindow(QDialog):
         self.ctx = ctx
         self._economy_service: Any = None
         self._chart_service: Optional["ChartDataService"] = None
+        self._summary_worker: Optional[LeagueSummaryWorker] = None
         self._setup_ui()
         self._load_leagues()
 
@@ -257,15 +260,6 @@ class PriceHistoryWindow(QDialog):
         self._league_combo.currentTextChanged.connect(self._on_league_changed)
         selector_layout.addWidget(self._league_combo)
 
-        # Aggregate button
-        self._aggregate_btn = QPushButton("Aggregate Data")
-        self._aggregate_btn.setToolTip(
-            "Pre-compute summary statistics for faster queries.\n"
-            "Run this once per league after importing data."
-        )
-        self._aggregate_btn.clicked.connect(self._on_aggregate_clicked)
-        selector_layout.addWidget(self._aggregate_btn)
-
         selector_layout.addStretch()
 
         # Stats label
@@ -408,212 +402,71 @@ class PriceHistoryWindow(QDialog):
         """Handle league selection change."""
         if not league:
             return
-        self._load_currency_data(league)
-        self._load_uniques_data(league)
-        self._update_aggregate_button(league)
+        self._load_league_summary(league)
 
         # Update chart item selector
         chart_type = self._chart_type_combo.currentData()
         self._populate_chart_items(league, chart_type)
 
-    def _update_aggregate_button(self, league: str) -> None:
-        """Update aggregate button state based on league status."""
-        service = self._get_economy_service()
-        if service.is_league_aggregated(league):
-            self._aggregate_btn.setText("Re-aggregate")
-            self._aggregate_btn.setToolTip("League data already aggregated. Click to refresh.")
-        else:
-            self._aggregate_btn.setText("Aggregate Data")
-            self._aggregate_btn.setToolTip(
-                "Pre-compute summary statistics for faster queries.\n"
-                "Run this once per league after importing data."
-            )
-
-    def _on_aggregate_clicked(self) -> None:
-        """Handle aggregate button click."""
-        league = self._league_combo.currentText()
-        if not league:
-            return
-
-        self._stats_label.setText("Aggregating...")
-        self._aggregate_btn.setEnabled(False)
-
-        try:
-            service = self._get_economy_service()
-            success = service.aggregate_league(league, is_finalized=True)
-
-            if success:
-                self._stats_label.setText("Aggregation complete!")
-                # Reload data from summary tables
-                self._load_currency_data(league)
-                self._load_uniques_data(league)
-                self._update_aggregate_button(league)
-            else:
-                self._stats_label.setText("Aggregation failed")
-                QMessageBox.warning(
-                    self,
-                    "Aggregation Failed",
-                    "Failed to aggregate league data. Check the log for details."
-                )
-
-        except Exception as e:
-            logger.error(f"Failed to aggregate: {e}")
-            self._stats_label.setText(f"Error: {e}")
-
-        finally:
-            self._aggregate_btn.setEnabled(True)
-
-    def _load_currency_data(self, league: str) -> None:
-        """Load currency data for the selected league."""
-        try:
-            service = self._get_economy_service()
-
-            # Try summary table first
-            if service.is_league_aggregated(league):
-                summaries = service.get_currency_summary(league, TRACKED_CURRENCIES)
-                if summaries:
-                    # Convert to display format
-                    rows = []
-                    for s in summaries:
-                        rows.append({
-                            "currency_name": s.get("currency_name"),
-                            "currency": s.get("currency_name"),
-                            "avg_value": s.get("avg_value"),
-                            "min_value": s.get("min_value"),
-                            "max_value": s.get("max_value"),
-                            "start_value": s.get("start_value"),
-                            "end_value": s.get("end_value"),
-                            "data_points": s.get("data_points"),
-                        })
-
-                    # Sort by TRACKED_CURRENCIES order
-                    currency_order = {c: i for i, c in enumerate(TRACKED_CURRENCIES)}
-                    rows.sort(key=lambda r: currency_order.get(r["currency_name"], 999))
-
-                    self._currency_model.set_data(rows)
-
-                    # Update stats from league summary
-                    league_summary = service.get_league_summary(league)
-                    if league_summary:
-                        first = league_summary.get("first_date", "?")[:10]
-                        last = league_summary.get("last_date", "?")[:10]
-                        self._stats_label.setText(f"Aggregated ({first} to {last})")
-                    return
-
-            # Fall back to raw query
-            self._load_currency_data_raw(league)
-
-        except Exception as e:
-            logger.error(f"Failed to load currency data: {e}")
-            self._currency_model.set_data([])
+    def _load_league_summary(self, league: str) -> None:
+        """Load currency and top item statistics for a league in the background."""
+        if self._summary_worker is not None:
+            # A superseded load finishes in the background; its result is dropped
+            self._summary_worker.cancel()
 
-    def _load_currency_data_raw(self, league: str) -> None:
-        """Load currency data from raw tables (slower)."""
-        rows = []
-        for currency in TRACKED_CURRENCIES:
-            cursor = self.ctx.db.conn.execute("""
-                SELECT
-                    MIN(chaos_value) as min_val,
-                    MAX(chaos_value) as max_val,
-                    AVG(chaos_value) as avg_val,
-                    COUNT(*) as data_points
-                FROM league_economy_rates
-                WHERE league = ? AND currency_name = ?
-            """, (league, currency))
-            result = cursor.fetchone()
-
-            if result and result[0] is not None:
-                # Get start value
-                start_cursor = self.ctx.db.conn.execute("""
-                    SELECT chaos_value FROM league_economy_rates
-                    WHERE league = ? AND currency_name = ?
-                    ORDER BY rate_date ASC LIMIT 1
-                """, (league, currency))
-                start = start_cursor.fetchone()
-
-                # Get end value
-                end_cursor = self.ctx.db.conn.execute("""
-                    SELECT chaos_value FROM league_economy_rates
-                    WHERE league = ? AND currency_name = ?
-                    ORDER BY rate_date DESC LIMIT 1
-                """, (league, currency))
-                end = end_cursor.fetchone()
-
-                rows.append({
-                    "currency_name": currency,
-                    "currency": currency,
-                    "avg_value": result[2],
-                    "min_value": result[0],
-                    "max_value": result[1],
-                    "start_value": start[0] if start else None,
-                    "end_value": end[0] if end else None,
-                    "data_points": result[3],
-                })
+        self._stats_label.setText("Loading...")
+        worker = LeagueSummaryWorker(
+            self._get_economy_service(), league, TRACKED_CURRENCIES, parent=self
+        )
+        worker.result.connect(lambda overview: self._on_league_summary_loaded(league, overview))
+        worker.error.connect(lambda message, _tb: self._on_league_summary_error(league, message))
+        worker.finished.connect(worker.deleteLater)
+        self._summary_worker = worker
+        worker.start()
+
+    def _on_league_summary_loaded(self, league: str, overview: "LeagueEconomyOverview") -> None:
+        """Show a loaded league overview (if that league is still selected)."""
+        if league != self._league_combo.currentText():
+            return
+        self._summary_worker = None
+
+        rows = [
+            {
+                "currency_name": s.get("currency_name"),
+                "currency": s.get("currency_name"),
+                "avg_value": s.get("avg_value"),
+                "min_value": s.get("min_value"),
+                "max_value": s.get("max_value"),
+                "start_value": s.get("start_value"),
+                "end_value": s.get("end_value"),
+                "data_points": s.get("data_points"),
+            }
+            for s in overview.currencies
+        ]
+
+        # Sort by TRACKED_CURRENCIES order
+        currency_order = {c: i for i, c in enumerate(TRACKED_CURRENCIES)}
+        rows.sort(key=lambda r: currency_order.get(r["currency_name"], 999))
 
         self._currency_model.set_data(rows)
+        self._uniques_model.set_data(overview.top_items)
 
-        # Update stats
-        if rows:
-            cursor = self.ctx.db.conn.execute("""
-                SELECT MIN(rate_date), MAX(rate_date)
-                FROM league_economy_rates WHERE league = ?
-            """, (league,))
-            dates = cursor.fetchone()
-            if dates and dates[0]:
-                self._stats_label.setText(
-                    f"Raw data ({dates[0][:10]} to {dates[1][:10]})"
-                )
+        if overview.summary:
+            first = (overview.summary.get("first_date") or "?")[:10]
+            last = (overview.summary.get("last_date") or "?")[:10]
+            self._stats_label.setText(f"{first} to {last}")
         else:
             self._stats_label.setText("No data")
 
-    def _load_uniques_data(self, league: str) -> None:
-        """Load top unique items for the selected league."""
-        try:
-            service = self._get_economy_service()
-
-            # Try summary table first
-            if service.is_league_aggregated(league):
-                items = service.get_top_items_summary(league, limit=10)
-                if items:
-                    self._uniques_model.set_data(items)
-                    return
-
-            # Fall back to raw query
-            self._load_uniques_data_raw(league)
-
-        except Exception as e:
-            logger.error(f"Failed to load uniques data: {e}")
-            self._uniques_model.set_data([])
-
-    def _load_uniques_data_raw(self, league: str) -> None:
-        """Load uniques data from raw tables (slower)."""
-        cursor = self.ctx.db.conn.execute("""
-            SELECT
-                item_name,
-                AVG(chaos_value) as avg_value,
-                MIN(chaos_value) as min_value,
-                MAX(chaos_value) as max_value,
-                COUNT(*) as data_points
-            FROM league_economy_items
-            WHERE league = ?
-            GROUP BY item_name
-            HAVING COUNT(*) >= 10
-            ORDER BY avg_value DESC
-            LIMIT 10
-        """, (league,))
-
-        rows = []
-        for idx, row in enumerate(cursor.fetchall()):
-            rows.append({
-                "rank": idx + 1,
-                "item_name": row[0],
-                "avg_value": row[1],
-                "min_value": row[2],
-                "max_value": row[3],
-                "data_points": row[4],
-            })
-
-        self._uniques_model.set_data(rows)
+    def _on_league_summary_error(self, league: str, message: str) -> None:
+        """Clear the tables when a league's overview fails to load."""
+        logger.error(f"Failed to load economy summary for {league}: {message}")
+        if league != self._league_combo.currentText():
+            return
+        self._summary_worker = None
+        self._currency_model.set_data([])
+        self._uniques_model.set_data([])
+        self._stats_label.setText("Failed to load data")
 
     # --- Chart tab handlers ---
 
@@ -674,10 +527,15 @@ class PriceHistoryWindow(QDialog):
         try:
             service = self._get_chart_service()
 
+            # No point fetching more points than the chart has pixels
+            max_points = self._chart_widget.plot_width() or None
+
             if chart_type == "currency":
-                series = service.get_currency_rate_series(item_name, league, days)
+                series = service.get_currency_rate_series(
+                    item_name, league, days, resolution="auto", max_points=max_points
+                )
             else:
-                series = service.get_item_from_economy_items(item_name, league, days)
+                series = service.get_item_from_economy_items(item_name, league, days, max_points=max_points)
 
             if series:
                 self._chart_widget.plot_series(series)
@@ -741,3 +599,11 @@ class PriceHistoryWindow(QDialog):
         # If not found, add it and select
         self._chart_item_combo.addItem(item_name, item_name)
         self._chart_item_combo.setCurrentIndex(self._chart_item_combo.count() - 1)
+
+    def closeEvent(self, event) -> None:
+        """Stop summary loads before closing (they're parented to the window)."""
+        for worker in self.findChildren(LeagueSummaryWorker):
+            worker.cancel()
+            worker.wait()
+        self._summary_worker = None
+        super().closeEvent(event)
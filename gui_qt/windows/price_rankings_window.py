@@ -373,32 +373,31 @@ class FetchWorker(QThread):
             self.progress.emit("Initializing...")
 
             api = PoeNinjaAPI(league=self.league)
-            cache = PriceRankingCache(league=self.league)
-            calculator = Top20Calculator(cache, poe_ninja_api=api)
-
-            if self.slot:
-                # Single equipment slot
-                display_name = PriceRankingCache.SLOT_DISPLAY_NAMES.get(self.slot, self.slot)
-                self.progress.emit(f"Fetching {display_name}...")
-                ranking = calculator.refresh_slot(self.slot, force=self.force_refresh)
-                rankings = {f"slot_{self.slot}": ranking} if ranking else {}
-            elif self.all_slots:
-                # All equipment slots
-                self.progress.emit("Fetching all equipment slots...")
-                rankings = calculator.refresh_all_slots(force=self.force_refresh)
-            elif self.category:
-                self.progress.emit(f"Fetching {self.category}...")
-                ranking = calculator.refresh_category(self.category, force=self.force_refresh)
-                rankings = {self.category: ranking} if ranking else {}
-            else:
-                self.progress.emit("Fetching all categories...")
-                rankings = calculator.refresh_all(force=self.force_refresh)
+            with PriceRankingCache(league=self.league) as cache:
+                calculator = Top20Calculator(cache, poe_ninja_api=api)
+
+                if self.slot:
+                    # Single equipment slot
+                    display_name = PriceRankingCache.SLOT_DISPLAY_NAMES.get(self.slot, self.slot)
+                    self.progress.emit(f"Fetching {display_name}...")
+                    ranking = calculator.refresh_slot(self.slot, force=self.force_refresh)
+                    rankings = {f"slot_{self.slot}": ranking} if ranking else {}
+                elif self.all_slots:
+                    # All equipment slots
+                    self.progress.emit("Fetching all equipment slots...")
+                    rankings = calculator.refresh_all_slots(force=self.force_refresh)
+                elif self.category:
+                    self.progress.emit(f"Fetching {self.category}...")
+                    ranking = calculator.refresh_category(self.category, force=self.force_refresh)
+                    rankings = {self.category: ranking} if ranking else {}
+                else:
+                    self.progress.emit("Fetching all categories...")
+                    rankings = calculator.refresh_all(force=self.force_refresh)
 
             # Save to history database
             self.progress.emit("Saving to database...")
-            history = PriceRankingHistory()
-            history.save_all_snapshots(rankings, self.league)
-            history.close()
+            with PriceRankingHistory() as history:
+                history.save_all_snapshots(rankings, self.league)
 
             self.finished.emit(rankings)
 
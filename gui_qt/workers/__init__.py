@@ -1,7 +1,16 @@
 """Worker classes for background thread execution."""
 
 from gui_qt.workers.base_worker import BaseWorker, BaseThreadWorker
+from gui_qt.workers.economy_worker import LeagueSummaryWorker
+from gui_qt.workers.export_worker import ExportWorker
 from gui_qt.workers.price_check_worker import PriceCheckWorker
 from gui_qt.workers.rankings_worker import RankingsPopulationWorker
 
-__all__ = ["BaseWorker", "BaseThreadWorker", "PriceCheckWorker", "RankingsPopulationWorker"]
+__all__ = [
+    "BaseWorker",
+    "BaseThreadWorker",
+    "ExportWorker",
+    "LeagueSummaryWorker",
+    "PriceCheckWorker",
+    "RankingsPopulationWorker",
+]
@@ -17,6 +17,7 @@ from core.result import Result
 
 if TYPE_CHECKING:
     from core.build_summarizer import BuildSummary
+    from data_sources.ai import AIResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +57,7 @@ class AIAnalysisWorker(BaseThreadWorker):
         raw_prompt: bool = False,
         ollama_host: str = "",
         ollama_model: str = "",
+        response_cache: Optional["AIResponseCache"] = None,
         parent: Optional[Any] = None,
     ):
         """Initialize the AI analysis worker.
@@ -74,6 +76,7 @@ class AIAnalysisWorker(BaseThreadWorker):
             raw_prompt: If True, use item_text directly as the prompt without wrapping.
             ollama_host: Ollama server URL (for ollama provider).
             ollama_model: Ollama model name (for ollama provider).
+            response_cache: Optional cache answering repeated prompts without an API call.
             parent: Optional parent QObject.
         """
         super().__init__(parent)
@@ -90,6 +93,7 @@ class AIAnalysisWorker(BaseThreadWorker):
         self._raw_prompt = raw_prompt
         self._ollama_host = ollama_host
         self._ollama_model = ollama_model
+        self._response_cache = response_cache
         self._prompt_builder = AIPromptBuilder()
 
     def _execute(self) -> AIResponse:
@@ -115,6 +119,7 @@ class AIAnalysisWorker(BaseThreadWorker):
             max_tokens=self._max_tokens,
             ollama_host=self._ollama_host,
             ollama_model=self._ollama_model,
+            cache=self._response_cache,
         )
 
         if not client:
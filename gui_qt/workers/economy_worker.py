@@ -0,0 +1,53 @@
+"""
+League economy summary worker.
+"""
+
+import logging
+from typing import Any, List, Optional
+
+from gui_qt.workers.base_worker import BaseThreadWorker
+
+logger = logging.getLogger(__name__)
+
+
+class LeagueSummaryWorker(BaseThreadWorker):
+    """
+    Background worker loading a league's economy overview.
+
+    The first load of a league (or the first after an import) aggregates
+    its raw rows into the summary tables, which can take a while on a full
+    league of data; later loads only read the summaries.
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        league: str,
+        currencies: Optional[List[str]] = None,
+        top_items_limit: int = 10,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._service = service
+        self._league = league
+        self._currencies = currencies
+        self._top_items_limit = top_items_limit
+
+    @property
+    def league(self) -> str:
+        """League this worker loads."""
+        return self._league
+
+    def _execute(self) -> Any:
+        """
+        Load (aggregating first if needed) the league overview.
+
+        Returns:
+            LeagueEconomyOverview
+        """
+        self.emit_status(f"Loading {self._league} summary...")
+        return self._service.get_league_overview(
+            self._league,
+            self._currencies,
+            top_items_limit=self._top_items_limit,
+        )
@@ -0,0 +1,79 @@
+"""
+Export worker for streaming large exports off the UI thread.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, List, Optional
+
+from PyQt6.QtCore import pyqtSignal
+
+from gui_qt.workers.base_worker import BaseThreadWorker
+
+logger = logging.getLogger(__name__)
+
+
+class ExportWorker(BaseThreadWorker):
+    """
+    Background worker running ExportService.export_stream().
+
+    Emits progress after each chunk. Cancelling stops the export between
+    chunks; ``last_result`` then holds the ExportResult, whose next_offset
+    and resume_after can be passed back as ``offset`` and ``resume_after``
+    to resume into the same file.
+    """
+
+    progress = pyqtSignal(int, int)  # (rows done, total rows; 0 if unknown)
+
+    def __init__(
+        self,
+        service: Any,
+        data_type: str,
+        export_format: str,
+        file_path: Path,
+        days: Optional[int] = None,
+        compress: bool = False,
+        offset: int = 0,
+        resume_after: Optional[List[Any]] = None,
+        parent=None,
+        **kwargs
+    ):
+        super().__init__(parent)
+        self._service = service
+        self._data_type = data_type
+        self._format = export_format
+        self._file_path = file_path
+        self._days = days
+        self._compress = compress
+        self._offset = offset
+        self._resume_after = resume_after
+        self._kwargs = kwargs
+        self.last_result: Any = None
+
+    def _execute(self) -> Any:
+        """
+        Stream the export.
+
+        Returns:
+            ExportResult from the export service
+        """
+        self.emit_status(f"Exporting {self._data_type}...")
+        result = self._service.export_stream(
+            self._data_type,
+            self._format,
+            self._file_path,
+            self._days,
+            compress=self._compress,
+            offset=self._offset,
+            resume_after=self._resume_after,
+            progress=self._on_progress,
+            should_cancel=lambda: self.is_cancelled,
+            **self._kwargs
+        )
+        self.last_result = result
+        if result.error and not result.cancelled:
+            raise RuntimeError(result.error)
+        return result
+
+    def _on_progress(self, update: Any) -> None:
+        self.progress.emit(update.offset, update.total_rows or 0)
@@ -13,7 +13,7 @@ from gui_qt.workers.base_worker import BaseThreadWorker
 
 if TYPE_CHECKING:
     from data_sources.poe_stash_api import StashSnapshot
-    from core.stash_diff_engine import StashDiff
+    from core.stash_diff_engine import StashDiff, StashDiffEngine
 
 logger = logging.getLogger(__name__)
 
@@ -142,6 +142,7 @@ class StashDiffWorker(BaseThreadWorker):
         after_snapshot: "StashSnapshot",
         tracked_tabs: Optional[List[str]] = None,
         parent: Optional[Any] = None,
+        engine: Optional["StashDiffEngine"] = None,
     ):
         """
         Initialize the diff worker.
@@ -151,11 +152,15 @@ class StashDiffWorker(BaseThreadWorker):
             after_snapshot: Stash state after map run.
             tracked_tabs: Optional list of tab names to compare.
             parent: Optional parent QObject.
+            engine: Optional long-lived engine. When given, its cached
+                before-state is reused and advanced to the after snapshot so
+                the next diff only re-fingerprints changed tabs.
         """
         super().__init__(parent)
         self._before_snapshot = before_snapshot
         self._after_snapshot = after_snapshot
         self._tracked_tabs = tracked_tabs
+        self._engine = engine
 
     def _execute(self) -> "StashDiff":
         """
@@ -171,13 +176,19 @@ class StashDiffWorker(BaseThreadWorker):
         if self.is_cancelled:
             raise InterruptedError("Diff cancelled")
 
-        engine = StashDiffEngine(tracked_tabs=self._tracked_tabs)
-        engine.set_before_snapshot(self._before_snapshot)
+        engine = self._engine
+        if engine is None:
+            engine = StashDiffEngine(tracked_tabs=self._tracked_tabs)
+        if engine.before_snapshot is not self._before_snapshot:
+            engine.set_before_snapshot(self._before_snapshot)
 
         if self.is_cancelled:
             raise InterruptedError("Diff cancelled")
 
-        diff = engine.compute_diff(self._after_snapshot)
+        if self._engine is not None:
+            diff = engine.compute_diff(self._after_snapshot, advance=True)
+        else:
+            diff = engine.compute_diff(self._after_snapshot)
 
         self.emit_status(f"Diff complete: {diff.get_summary()}")
         return diff
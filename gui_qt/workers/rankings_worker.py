@@ -52,30 +52,29 @@ class RankingsPopulationWorker(BaseThreadWorker):
             return 0
 
         # Check if cache is valid
-        cache = PriceRankingCache(league=league)
+        with PriceRankingCache(league=league) as cache:
+            if cache.is_cache_valid():
+                age = cache.get_cache_age_days()
+                self.emit_status(f"Rankings cache valid ({age:.1f} days old)")
+                return 0
 
-        if cache.is_cache_valid():
-            age = cache.get_cache_age_days()
-            self.emit_status(f"Rankings cache valid ({age:.1f} days old)")
-            return 0
+            if self.is_cancelled:
+                return 0
 
-        if self.is_cancelled:
-            return 0
+            # Need to populate
+            self.emit_status(f"Fetching Top 20 rankings for {league}...")
 
-        # Need to populate
-        self.emit_status(f"Fetching Top 20 rankings for {league}...")
+            calculator = Top20Calculator(cache, poe_ninja_api=api)
+            rankings = calculator.refresh_all(force=False)
 
-        calculator = Top20Calculator(cache, poe_ninja_api=api)
-        rankings = calculator.refresh_all(force=False)
-
-        if self.is_cancelled:
-            return len(rankings)
+            if self.is_cancelled:
+                return len(rankings)
 
-        # Save to history database
-        self.emit_status("Saving rankings to database...")
-        history = PriceRankingHistory()
-        history.save_all_snapshots(rankings, league)
-        history.close()
+            # Save to history database
+            self.emit_status("Saving rankings to database...")
+            history = PriceRankingHistory(store=cache.store)
+            history.save_all_snapshots(rankings, league)
+            history.close()
 
         self.emit_status(f"Populated {len(rankings)} categories")
         return len(rankings)
@@ -3,20 +3,37 @@
 PoE Price Checker - PyQt6 desktop application.
 
 Entry point for the application.
+
+Options:
+    --profile-startup   Print an import-time and init-phase breakdown once
+                        the main window is shown.
 """
 from __future__ import annotations
 
 import logging
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 
-from core.logging_setup import setup_logging
+PROFILE_FLAG = "--profile-startup"
 
 
 def main() -> None:
     """Main entry point for the PoE Price Checker application."""
+    profiler = None
+    if PROFILE_FLAG in sys.argv:
+        sys.argv = [arg for arg in sys.argv if arg != PROFILE_FLAG]
+        from core.startup_profile import StartupProfiler
+        profiler = StartupProfiler()
+        profiler.install_import_timer()
+
+    def phase(name: str):
+        return profiler.phase(name) if profiler else nullcontext()
+
     # Initialize logging once for the whole app
-    setup_logging()
+    with phase("logging"):
+        from core.logging_setup import setup_logging
+        setup_logging(use_queue=True)
     logger = logging.getLogger(__name__)
     logger.info("Starting PoE Price Checker GUI")
 
@@ -34,8 +51,9 @@ def main() -> None:
         except Exception:
             pass
 
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
+    with phase("qt_application"):
+        app = QApplication(sys.argv)
+        app.setStyle("Fusion")
 
     # Set application icon
     app_icon = None
@@ -50,13 +68,14 @@ def main() -> None:
             app.setWindowIcon(app_icon)
 
     # Show loading screen immediately
-    from gui_qt.widgets.loading_screen import LoadingScreen
-    loading = LoadingScreen()
-    if app_icon:
-        loading.set_icon(app_icon)
-    loading.set_version("1.5.0")
-    loading.show()
-    app.processEvents()
+    with phase("loading_screen"):
+        from gui_qt.widgets.loading_screen import LoadingScreen
+        loading = LoadingScreen()
+        if app_icon:
+            loading.set_icon(app_icon)
+        loading.set_version("1.5.0")
+        loading.show()
+        app.processEvents()
 
     # Phase 1: Configuration
     loading.set_status("Loading configuration...")
@@ -78,13 +97,15 @@ def main() -> None:
     loading.set_progress(35)
     app.processEvents()
 
-    # Create full app context (this does the heavy API initialization)
+    # Create the app context. League detection and the pricing warm-up
+    # (network) run in the background so the window isn't blocked on them.
     loading.set_status("Connecting to poe.ninja...")
     loading.set_progress(45)
     app.processEvents()
 
-    from core.app_context import create_app_context
-    ctx = create_app_context()
+    with phase("app_context"):
+        from core.app_context import create_app_context
+        ctx = create_app_context(defer_startup=True)
 
     loading.set_status("Initializing price service...")
     loading.set_progress(65)
@@ -101,8 +122,10 @@ def main() -> None:
     loading.set_progress(80)
     app.processEvents()
 
-    from gui_qt.main_window import PriceCheckerWindow
-    window = PriceCheckerWindow(ctx)
+    with phase("main_window.import"):
+        from gui_qt.main_window import PriceCheckerWindow
+    with phase("main_window.init"):
+        window = PriceCheckerWindow(ctx)
 
     # Complete loading
     loading.set_status("Ready!")
@@ -114,6 +137,18 @@ def main() -> None:
     window.showMaximized()
 
     logger.info("Application ready")
+
+    if profiler is not None:
+        from PyQt6.QtCore import QTimer
+
+        def _report_startup() -> None:
+            # First event-loop turn after show(): the window is interactive
+            profiler.mark("interactive")
+            profiler.uninstall_import_timer()
+            print(profiler.report(), flush=True)
+
+        QTimer.singleShot(0, _report_startup)
+
     sys.exit(app.exec())
 
 
@@ -10,6 +10,7 @@ from core.item_parser import ItemParser
 from core.config import Config
 from core.game_version import GameVersion
 from core.pob import CharacterManager, UpgradeChecker
+from data_sources.mod_database import ModDatabase
 import json
 import subprocess
 import os
@@ -21,6 +22,7 @@ mcp = FastMCP("PoE Price Checker", dependencies=["requests"])
 # Initialize core services
 config = Config()
 db = Database()
+mod_db = ModDatabase()
 parser = ItemParser()
 character_manager = CharacterManager()
 upgrade_checker = UpgradeChecker(character_manager)
@@ -146,34 +148,63 @@ def search_database(
     query: str,
     game: str = "POE1",
     league: str = None,
-    limit: int = 10
+    limit: int = 10,
+    kind: str = "item"
 ) -> dict:
     """
-    Search for items in the price database.
+    Search the local item/mod database (full-text, ranked best first).
     
     Args:
-        query: Search term (partial item name)
+        query: Search term (words or partial item name, e.g. "kaom", "maximum life")
         game: Game version ("POE1" or "POE2")
         league: League name (optional)
         limit: Maximum results to return
+        kind: "item" (with recent price stats) or "mod"
         
     Returns:
-        Matching items with price information
+        Matching items with price information, or matching mods
     """
     game_version = GameVersion.POE1 if game == "POE1" else GameVersion.POE2
     
     if league is None:
         league = config.get_game_config(game_version).league
 
-    # This is a simplified search - you'd need to add a proper search method to Database
-    # For now, we'll just show the concept
-    
+    try:
+        rows = mod_db.search(query, kind=kind, limit=limit)
+    except ValueError as e:
+        return {"query": query, "error": str(e)}
+
+    results = []
+    for row in rows:
+        if kind == "mod":
+            results.append({
+                "id": row["id"],
+                "name": row["name"],
+                "stat_text": row["stat_text_raw"] or row["stat_text"],
+                "tier": row["tier_text"],
+                "generation_type": row["generation_type"],
+                "score": row["score"],
+            })
+            continue
+
+        stats = db.get_latest_price_stats_for_item(game_version, league, row["name"], days=7)
+        results.append({
+            "name": row["name"],
+            "base_item": row["base_item"],
+            "item_class": row["item_class"],
+            "rarity": row["rarity"],
+            "score": row["score"],
+            "median_price": stats.get("median") if stats else None,
+            "sample_size": stats.get("count", 0) if stats else 0,
+        })
+
     return {
         "query": query,
         "game": game,
         "league": league,
-        "message": "Database search functionality - implement db.search_items() for full functionality",
-        "suggestion": f"Use get_item_price('{query}', '{league}', '{game}') for exact matches"
+        "kind": kind,
+        "count": len(results),
+        "results": results,
     }
 
 @mcp.resource("config://current")
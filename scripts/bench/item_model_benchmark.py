@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Headless benchmark for the stash viewer item table model.
+
+Builds synthetic PricedItems at several sizes (up to 50k by default) and
+times, per size:
+
+- set_items: building the search keys and initial rows
+- min_value / search: recomputing the visible rows after a filter change
+- sort: re-ordering by total value
+- cell_ns: one data() call, averaged over a simulated repaint of the
+  visible viewport (40 rows x every column)
+
+Cell access should stay flat as the item count grows; the filter and sort
+costs are linear and paid once per change, not per paint.
+
+Usage:
+    python scripts/bench/item_model_benchmark.py
+    python scripts/bench/item_model_benchmark.py --sizes 1000 50000 --output model.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from PyQt6.QtCore import Qt  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from core.stash_valuator import PricedItem, PriceSource  # noqa: E402
+from gui_qt.stash_viewer.models import ItemTableModel  # noqa: E402
+
+NAMES = ["Chaos Orb", "Divine Orb", "Tabula Rasa", "Goldrim", "Headhunter", "Vaal Orb", "Hubris Circlet"]
+RARITIES = ["Currency", "Unique", "Rare", "Magic", "Normal"]
+VIEWPORT_ROWS = 40
+
+
+def build_items(count: int) -> List[PricedItem]:
+    items = []
+    for i in range(count):
+        name = f"{NAMES[i % len(NAMES)]} {i}"
+        price = float((i * 7919) % 5000) / 10
+        items.append(PricedItem(
+            name=name,
+            type_line=name,
+            base_type=name,
+            item_class="Currency",
+            stack_size=1 + i % 20,
+            rarity=RARITIES[i % len(RARITIES)],
+            unit_price=price,
+            total_price=price,
+            price_source=PriceSource.POE_NINJA,
+            tab_name=f"Tab {i % 10}",
+        ))
+    return items
+
+
+def _timed_ms(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+def paint_viewport(model: ItemTableModel, first_row: int) -> int:
+    """Read every cell of a viewport the way a repaint would; returns cells read."""
+    cells = 0
+    last = min(first_row + VIEWPORT_ROWS, model.rowCount())
+    for row in range(first_row, last):
+        for col in range(model.columnCount()):
+            index = model.index(row, col)
+            model.data(index, Qt.ItemDataRole.DisplayRole)
+            model.data(index, Qt.ItemDataRole.ForegroundRole)
+            cells += 1
+    return cells
+
+
+def measure(count: int, repaints: int = 50) -> Dict[str, Any]:
+    model = ItemTableModel()
+    # Keep verdicts out of the measurement; they're cached per item anyway
+    model.COLUMNS = [c for c in ItemTableModel.COLUMNS if c[0] != "verdict"]
+    items = build_items(count)
+
+    report: Dict[str, Any] = {"items": count}
+    report["set_items_ms"] = _timed_ms(lambda: model.set_items(items))
+    report["min_value_ms"] = _timed_ms(lambda: model.set_min_value(10.0))
+    report["search_ms"] = _timed_ms(lambda: model.set_search_text("orb"))
+    total_col = [key for key, _, _ in model.COLUMNS].index("total_price")
+    report["sort_ms"] = _timed_ms(lambda: model.sort(total_col, Qt.SortOrder.DescendingOrder))
+    report["visible_rows"] = model.rowCount()
+
+    # Repaint viewports spread across the whole table
+    step = max(1, model.rowCount() // repaints)
+    cells = 0
+    start = time.perf_counter()
+    for first_row in range(0, model.rowCount(), step):
+        cells += paint_viewport(model, first_row)
+    elapsed = time.perf_counter() - start
+    report["cell_ns"] = round(elapsed / max(cells, 1) * 1e9)
+    return report
+
+
+def run(sizes: List[int]) -> Dict[str, Any]:
+    QApplication.instance() or QApplication([])
+    return {str(size): measure(size) for size in sizes}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    columns = ["items", "set_items_ms", "min_value_ms", "search_ms", "sort_ms", "visible_rows", "cell_ns"]
+    lines = ["".join(f"{c:>14}" for c in columns)]
+    for stats in report.values():
+        lines.append("".join(f"{stats[c]:>14}" for c in columns))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the stash viewer item table model")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000], help="Item counts")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes)
+    print(format_report(report))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
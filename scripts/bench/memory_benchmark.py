@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for stash valuation and bulk parsing.
+
+Values a synthetic stash (20k items by default, same generator as
+run_benchmarks.py) against the recorded poe.ninja fixtures and reports, via
+tracemalloc:
+
+- retained: memory still held by the ValuationResult after valuation
+  (the stash snapshot itself is built beforehand and not counted)
+- peak: highest allocation during valuation
+- per_item: retained bytes per priced item
+
+It also parses the same number of clipboard items with
+ItemParser.parse_batch, plain and with ``compact=True``, and reports the
+retained memory of the resulting ParsedItems. Process max RSS is included
+where the platform exposes it.
+
+Usage:
+    python scripts/bench/memory_benchmark.py
+    python scripts/bench/memory_benchmark.py --items 50000 --output mem.json
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import logging
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from run_benchmarks import (  # noqa: E402
+    RESPONSES_FILE,
+    build_stash_valuator,
+    build_synthetic_snapshot,
+    load_item_texts,
+)
+from replay import ReplaySession  # noqa: E402
+
+from core.item_parser import ItemParser  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+def _max_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def traced_allocation(fn: Callable[[], Any]) -> Tuple[Any, int, int]:
+    """Run ``fn`` under tracemalloc; return (result, retained bytes, peak bytes)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = fn()
+        gc.collect()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, after - before, peak - before
+
+
+def _report(retained: int, peak: int, count: int) -> Dict[str, Any]:
+    return {
+        "items": count,
+        "retained_mb": round(retained / 2**20, 2),
+        "peak_mb": round(peak / 2**20, 2),
+        "per_item_bytes": round(retained / count) if count else 0,
+    }
+
+
+def measure_valuation(items: int, league: str = "Standard") -> Dict[str, Any]:
+    replay = ReplaySession.from_file(RESPONSES_FILE)
+    valuator = build_stash_valuator(replay, league)
+    snapshot = build_synthetic_snapshot(items, league)
+
+    result, retained, peak = traced_allocation(lambda: valuator.valuate_snapshot(snapshot))
+    return _report(retained, peak, result.total_items)
+
+
+def measure_parse(items: int, compact: bool) -> Dict[str, Any]:
+    texts: List[str] = [text.strip() for text in load_item_texts()]
+    bulk = "\n\n".join(texts[i % len(texts)] for i in range(items))
+    parser = ItemParser()
+
+    parsed, retained, peak = traced_allocation(lambda: parser.parse_batch(bulk, compact=compact))
+    return _report(retained, peak, len(parsed))
+
+
+def run(items: int) -> Dict[str, Any]:
+    return {
+        "stash_valuator.valuate_snapshot": measure_valuation(items),
+        "item_parser.parse_batch": measure_parse(items, compact=False),
+        "item_parser.parse_batch.compact": measure_parse(items, compact=True),
+        "max_rss_mb": _max_rss_mb(),
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [f"{'benchmark':<36}{'items':>8}{'retained':>12}{'peak':>12}{'per item':>12}"]
+    for name, stats in report.items():
+        if not isinstance(stats, dict):
+            continue
+        lines.append(
+            f"{name:<36}{stats['items']:>8}{stats['retained_mb']:>10.2f}MB"
+            f"{stats['peak_mb']:>10.2f}MB{stats['per_item_bytes']:>11}B"
+        )
+    if report.get("max_rss_mb") is not None:
+        lines.append(f"max RSS: {report['max_rss_mb']} MB")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure memory held by stash valuation and bulk parsing")
+    parser.add_argument("--items", type=int, default=20_000, help="Items to value and parse")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+
+    report = run(args.items)
+    print(format_report(report))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark the ModDatabase FTS5 search index against the LIKE scans.
+
+Builds synthetic mod/item databases at several sizes (tens of thousands of
+mods over a few hundred stat templates, like a full Cargo import) twice,
+once with the FTS5 index and once with use_fts=False, and times per size:
+
+- stat_ms: find_mods_by_stat_text() for the LIKE patterns AffixExtractor
+  builds from rolled mod text, averaged per lookup
+- scarabs_ms: get_scarabs()
+- search_ms: the ranked search() (FTS) or its substring fallback (LIKE)
+- insert_ms: insert_mods() for the whole table, so the trigger cost of
+  keeping the index in sync is visible too
+
+Both paths must return the same mods for every stat lookup; a mismatch
+fails the run.
+
+Usage:
+    python scripts/bench/mod_search_benchmark.py
+    python scripts/bench/mod_search_benchmark.py --sizes 5000 40000 --output search.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from data_sources.mod_database import ModDatabase  # noqa: E402
+from ml.collection.affix_extractor import _build_like_pattern  # noqa: E402
+
+FORMS = [
+    "+({lo}-{hi}) to maximum {noun}",
+    "({lo}-{hi})% increased {noun}",
+    "+({lo}-{hi})% to {noun} Resistance",
+    "Adds ({lo}-{hi}) to ({hi}-{top}) {noun} Damage",
+    "{noun} Regeneration of ({lo}-{hi}) per second",
+    "({lo}-{hi})% reduced {noun} Cost of Skills",
+]
+NOUNS = [
+    "Life", "Mana", "Energy Shield", "Armour", "Evasion", "Fire", "Cold", "Lightning", "Chaos",
+    "Physical", "Attack Speed", "Cast Speed", "Accuracy", "Strength", "Dexterity", "Intelligence",
+    "Stun Threshold", "Block", "Spell Suppression", "Ward", "Rage", "Flask Charges", "Minion Life",
+    "Totem Life", "Trap Throwing Speed", "Mine Laying Speed", "Projectile Speed", "Area of Effect",
+    "Critical Strike Chance", "Critical Strike Multiplier", "Ignite Duration", "Freeze Duration",
+    "Shock Effect", "Bleeding Damage", "Poison Duration", "Movement Speed", "Item Rarity",
+    "Item Quantity", "Light Radius", "Aura Effect",
+]
+WORDS = ["Ancient", "Brutal", "Vicious", "Gleaming", "Hexed", "Veiled", "Blazing", "Frozen", "Sundered"]
+ROLLED = [
+    "+92 to maximum Life",
+    "+35% to Fire Resistance",
+    "Adds 12 to 24 Cold Damage",
+    "14% increased Attack Speed",
+    "Life Regeneration of 40 per second",
+]
+LOOKUPS = 20
+
+
+def build_mods(count: int) -> List[Dict[str, Any]]:
+    mods = []
+    for i in range(count):
+        lo = 1 + i % 97
+        form = FORMS[i % len(FORMS)]
+        noun = NOUNS[(i // len(FORMS)) % len(NOUNS)]
+        mods.append({
+            "id": f"Mod{i}",
+            "name": f"{WORDS[i % len(WORDS)]}{i}",
+            "stat_text_raw": form.format(lo=lo, hi=lo + 9, top=lo + 20, noun=noun),
+            "generation_type": 6 + i % 2,
+            "tier_text": f"Tier {1 + i % 8}",
+        })
+    return mods
+
+
+def build_items(count: int) -> List[Dict[str, Any]]:
+    items = []
+    for i in range(count):
+        kind = "Scarab" if i % 25 == 0 else "Ring"
+        items.append({"name": f"{WORDS[i % len(WORDS)]} {kind} {i}", "item_class": "Map Fragment"})
+    return items
+
+
+def _timed_ms(fn: Callable[[], Any], repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return round((time.perf_counter() - start) * 1000 / repeat, 3)
+
+
+def measure(db: ModDatabase, mods: List[Dict[str, Any]], items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    report: Dict[str, Any] = {}
+    report["insert_ms"] = _timed_ms(lambda: db.insert_mods(mods))
+    db.insert_items(items)
+
+    patterns = [_build_like_pattern(text) for text in ROLLED]
+    report["stat_ms"] = round(
+        sum(_timed_ms(lambda p=p: db.find_mods_by_stat_text(p), LOOKUPS) for p in patterns) / len(patterns), 3
+    )
+    report["scarabs_ms"] = _timed_ms(db.get_scarabs, LOOKUPS)
+    report["search_ms"] = _timed_ms(lambda: db.search("maximum life", limit=20), LOOKUPS)
+    report["matches"] = {p: [m["id"] for m in db.find_mods_by_stat_text(p)] for p in patterns}
+    return report
+
+
+def run(sizes: List[int]) -> Dict[str, Any]:
+    report: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            mods = build_mods(size)
+            items = build_items(max(1, size // 10))
+            results = {}
+            for label, use_fts in (("fts", True), ("like", False)):
+                with ModDatabase(Path(workdir) / f"{label}-{size}.db", use_fts=use_fts) as db:
+                    results[label] = measure(db, mods, items)
+            if results["fts"].pop("matches") != results["like"].pop("matches"):
+                raise AssertionError(f"FTS and LIKE lookups disagree at {size} mods")
+            report[str(size)] = {"mods": size, **results}
+    return report
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    columns = ["insert_ms", "stat_ms", "scarabs_ms", "search_ms"]
+    lines = [f"{'mods':>8}{'path':>6}" + "".join(f"{c:>12}" for c in columns)]
+    for stats in report.values():
+        for label in ("fts", "like"):
+            lines.append(f"{stats['mods']:>8}{label:>6}" + "".join(f"{stats[label][c]:>12}" for c in columns))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ModDatabase FTS5 search against LIKE scans")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5_000, 20_000, 40_000], help="Mod counts")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes)
+    print(format_report(report))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+Recorded-response replay for the pricing benchmarks.
+
+ReplaySession stands in for ``requests.Session`` on the poe.ninja, poe.watch
+and trade API clients and serves responses from a JSON fixture instead of the
+network, so benchmark runs are reproducible and offline.
+
+Responses are keyed by method, host, path and the query params that select
+content (``league`` and ``language`` are dropped so one recording serves any
+league). Two trade endpoints are special-cased:
+
+- ``POST .../search/<league>`` is keyed without the league.
+- ``GET .../fetch/<ids>`` is answered from recorded listing templates with
+  the requested IDs substituted, so any search result can be fetched.
+
+RecordingSession wraps a real session and captures responses in the same
+format (``--record`` in run_benchmarks.py).
+
+Usage:
+    replay = ReplaySession.from_file(FIXTURES / "responses.json")
+    client.session = replay
+    ...
+    print(replay.stats())
+"""
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlsplit
+
+import requests
+
+# Params that scope a request but don't change which recording applies
+IGNORED_PARAMS = frozenset({"league", "language"})
+
+FETCH_KEY = "GET www.pathofexile.com/api/{api}/fetch"
+
+
+def request_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Build the fixture key for a request."""
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/")
+    segments = path.split("/")
+    if len(segments) >= 4 and segments[-2] == "search" and segments[-3].startswith("trade"):
+        path = "/".join(segments[:-1])
+    key = f"{method.upper()} {parts.netloc}{path}"
+    selected = sorted(
+        (str(k), str(v)) for k, v in (params or {}).items() if k not in IGNORED_PARAMS
+    )
+    if selected:
+        key += "?" + "&".join(f"{k}={v}" for k, v in selected)
+    return key
+
+
+def _fetch_key(url: str) -> Optional[str]:
+    """Return the listing-template key if ``url`` is a trade fetch."""
+    parts = urlsplit(url)
+    segments = parts.path.rstrip("/").split("/")
+    if len(segments) >= 3 and segments[-2] == "fetch" and segments[-3].startswith("trade"):
+        return FETCH_KEY.format(api=segments[-3])
+    return None
+
+
+class ReplayResponse:
+    """Minimal ``requests.Response`` stand-in."""
+
+    def __init__(self, body: Any, status_code: int = 200):
+        self._body = body
+        self.status_code = status_code
+        self.headers: Dict[str, str] = {}
+        self.text = json.dumps(body)
+
+    def json(self) -> Any:
+        return self._body
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} replay error")
+
+
+class ReplaySession:
+    """Serves recorded responses; unknown requests get an empty body."""
+
+    def __init__(
+        self,
+        responses: Dict[str, Any],
+        listing_templates: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        latency_ms: float = 0.0,
+    ):
+        """
+        Args:
+            responses: Fixture key -> JSON body.
+            listing_templates: Fetch key -> listings cycled over requested IDs.
+            latency_ms: Simulated network latency added to every request.
+        """
+        self.responses = responses
+        self.listing_templates = listing_templates or {}
+        self.latency = latency_ms / 1000.0
+        self.headers: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.missed_keys: Set[str] = set()
+
+    @classmethod
+    def from_file(cls, path: Path, latency_ms: float = 0.0) -> "ReplaySession":
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(data.get("responses", {}), data.get("listing_templates", {}), latency_ms)
+
+    # ------------------------------------------------------------------ #
+    # requests.Session surface
+    # ------------------------------------------------------------------ #
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Any = None,
+        **_: Any,
+    ) -> ReplayResponse:
+        if self.latency:
+            time.sleep(self.latency)
+
+        fetch_key = _fetch_key(url) if method.upper() == "GET" else None
+        if fetch_key is not None:
+            body = self._fetch(fetch_key, url.rstrip("/").rsplit("/", 1)[-1].split(","))
+            return self._record(fetch_key, body)
+
+        key = request_key(method, url, params)
+        body = self.responses.get(key)
+        return self._record(key, copy.deepcopy(body) if body is not None else None)
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> ReplayResponse:
+        return self.request("GET", url, params=params, **kwargs)
+
+    def post(self, url: str, json: Optional[Dict[str, Any]] = None, **kwargs: Any) -> ReplayResponse:
+        return self.request("POST", url, json=json, **kwargs)
+
+    def close(self) -> None:
+        pass
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+
+    def _fetch(self, key: str, ids: List[str]) -> Optional[Dict[str, Any]]:
+        templates = self.listing_templates.get(key)
+        if not templates:
+            return None
+        result = []
+        for i, listing_id in enumerate(ids):
+            listing = copy.deepcopy(templates[i % len(templates)])
+            listing["id"] = listing_id
+            result.append(listing)
+        return {"result": result}
+
+    def _record(self, key: str, body: Any) -> ReplayResponse:
+        with self._lock:
+            if body is None:
+                self.misses += 1
+                self.missed_keys.add(key)
+            else:
+                self.hits += 1
+        return ReplayResponse(body if body is not None else {})
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counts; misses indicate fixtures need re-recording."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "missed_keys": sorted(self.missed_keys),
+            }
+
+
+class RecordingSession:
+    """Wraps a real session and captures responses for replay."""
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session or requests.Session()
+        self.headers = self.session.headers
+        self.responses: Dict[str, Any] = {}
+        self.listing_templates: Dict[str, List[Dict[str, Any]]] = {}
+
+    def request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        response = self.session.request(method, url, params=params, **kwargs)
+        if response.status_code < 400:
+            try:
+                body = response.json()
+            except ValueError:
+                return response
+            fetch_key = _fetch_key(url) if method.upper() == "GET" else None
+            if fetch_key is not None:
+                templates = self.listing_templates.setdefault(fetch_key, [])
+                templates.extend((body or {}).get("result") or [])
+            else:
+                self.responses[request_key(method, url, params)] = body
+        return response
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        return self.request("GET", url, params=params, **kwargs)
+
+    def post(self, url: str, json: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        return self.request("POST", url, json=json, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def save(self, path: Path) -> None:
+        """Write captured responses in the replay fixture format."""
+        payload = {
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "responses": self.responses,
+            "listing_templates": self.listing_templates,
+        }
+        Path(path).write_text(json.dumps(payload, indent=1, sort_keys=True), encoding="utf-8")
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark suite for the pricing pipeline.
+
+Replays recorded poe.ninja / poe.watch / trade API responses from
+``scripts/bench/fixtures/responses.json`` through a local stub session (see
+replay.py), so runs are offline and reproducible, and times:
+
+- ItemParser.parse, and ItemParser.parse_batch on a 1000-item buffer
+  (reported per item, so it compares directly with parse)
+- RareItemEvaluator.evaluate
+- PriceService.check_item (cold: all caches cleared; warm: source caches hot)
+- StashValuator.valuate_snapshot on a synthetic stash (10k items by default)
+- MLPollingService.poll_once
+
+Each benchmark reports n/min/mean/p50/p90/p95/p99/max in milliseconds, and
+the report is written as JSON for comparison between runs.
+
+Usage:
+    python scripts/bench/run_benchmarks.py
+    python scripts/bench/run_benchmarks.py --output bench.json
+    python scripts/bench/run_benchmarks.py --compare bench.json
+    python scripts/bench/run_benchmarks.py --latency-ms 50    # simulate network
+    python scripts/bench/run_benchmarks.py --record --league Standard  # refresh fixtures (live APIs)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add project root to path
+ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from replay import RecordingSession, ReplaySession  # noqa: E402
+
+from core.config import Config  # noqa: E402
+from core.database import Database  # noqa: E402
+from core.item_parser import ItemParser  # noqa: E402
+from core.pricing.cache import ItemPriceCache  # noqa: E402
+from core.pricing.service import PriceService  # noqa: E402
+from core.rare_evaluation import RareItemEvaluator  # noqa: E402
+from core.stash_valuator import StashValuator  # noqa: E402
+from data_sources.mod_database import ModDatabase  # noqa: E402
+from data_sources.poe_ninja_client import PoeNinjaClient  # noqa: E402
+from data_sources.poe_stash_api import StashSnapshot, StashTab  # noqa: E402
+from data_sources.pricing.poe_ninja import PoeNinjaAPI  # noqa: E402
+from data_sources.pricing.poe_watch import PoeWatchAPI  # noqa: E402
+from data_sources.pricing.trade_api import PoeTradeClient, TradeApiSource  # noqa: E402
+from data_sources.pricing.trade_cache import TradeCache  # noqa: E402
+from ml.collection.polling_service import DefaultPriceConverter, MLPollingService  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+RESPONSES_FILE = FIXTURES / "responses.json"
+ITEMS_FILE = FIXTURES / "items.txt"
+ITEM_SEPARATOR = "====="
+
+PERCENTILES = (50, 90, 95, 99)
+
+logger = logging.getLogger("bench")
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = math.floor(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    """Reduce timing samples to the report's summary statistics."""
+    ordered = sorted(samples_ms)
+    summary: Dict[str, float] = {
+        "n": len(ordered),
+        "min": ordered[0] if ordered else 0.0,
+        "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+    }
+    for pct in PERCENTILES:
+        summary[f"p{pct}"] = percentile(ordered, pct)
+    summary["max"] = ordered[-1] if ordered else 0.0
+    return {key: round(value, 4) if isinstance(value, float) else value for key, value in summary.items()}
+
+
+def measure(
+    fn: Callable[[], Any],
+    iterations: int,
+    before_each: Optional[Callable[[], None]] = None,
+    warmup: int = 1,
+) -> List[float]:
+    """Time ``fn`` ``iterations`` times; ``before_each`` runs untimed."""
+    for _ in range(warmup):
+        if before_each:
+            before_each()
+        fn()
+    samples: List[float] = []
+    for _ in range(iterations):
+        if before_each:
+            before_each()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+def load_item_texts(path: Path = ITEMS_FILE) -> List[str]:
+    """Load the sample clipboard texts, separated by ``=====`` lines."""
+    text = path.read_text(encoding="utf-8")
+    return [block.strip() for block in text.split(ITEM_SEPARATOR) if block.strip()]
+
+
+def _stash_item(kind: int, i: int) -> Dict[str, Any]:
+    """One synthetic stash API item; ``kind`` selects the category."""
+    base = {"id": f"bench-{i:06d}", "x": i % 12, "y": (i // 12) % 12, "w": 1, "h": 1, "icon": ""}
+    if kind == 0:
+        base.update(frameType=5, typeLine="Divine Orb", baseType="Divine Orb", stackSize=1 + i % 10)
+    elif kind == 1:
+        base.update(frameType=5, typeLine="Orb of Alchemy", baseType="Orb of Alchemy", stackSize=1 + i % 20)
+    elif kind == 2:
+        base.update(frameType=3, name="Goldrim", typeLine="Leather Cap", baseType="Leather Cap", ilvl=70)
+    elif kind == 3:
+        base.update(frameType=6, typeLine="Rain of Chaos", baseType="Rain of Chaos", stackSize=1 + i % 8)
+    elif kind == 4:
+        base.update(frameType=4, typeLine="Empower Support", baseType="Empower Support",
+                    properties=[{"name": "Level", "values": [["3", 0]]}])
+    elif kind == 5:
+        base.update(
+            frameType=2, name="Bench Visor", typeLine="Hubris Circlet", baseType="Hubris Circlet",
+            ilvl=84, identified=True,
+            explicitMods=[f"+{60 + i % 40} to maximum Life", f"+{20 + i % 25}% to Fire Resistance",
+                          f"+{15 + i % 30}% to Cold Resistance"],
+        )
+    else:
+        base.update(frameType=0, typeLine="Iron Ring", baseType="Iron Ring", ilvl=1 + i % 80)
+    return base
+
+
+def build_synthetic_snapshot(total_items: int, league: str, items_per_tab: int = 500) -> StashSnapshot:
+    """Mixed-category stash with ``total_items`` items across tabs."""
+    tabs: List[StashTab] = []
+    for start in range(0, total_items, items_per_tab):
+        count = min(items_per_tab, total_items - start)
+        index = len(tabs)
+        tabs.append(StashTab(
+            id=f"tab{index}",
+            name=f"Bench {index}",
+            index=index,
+            type="QuadStash",
+            items=[_stash_item((start + j) % 7, start + j) for j in range(count)],
+        ))
+    return StashSnapshot(account_name="bench", league=league, tabs=tabs, total_items=total_items)
+
+
+# ---------------------------------------------------------------------------
+# Harness
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class BenchContext:
+    """Everything the benchmarks need, wired to one session (replay or live)."""
+
+    session: Any
+    league: str
+    workdir: Path
+    poe_ninja: PoeNinjaAPI
+    poe_watch: PoeWatchAPI
+    trade_source: TradeApiSource
+    trade_cache: TradeCache
+    price_service: PriceService
+    db: Database
+
+    def reset_caches(self) -> None:
+        """Drop every cache on the check path so the next check is cold."""
+        self.price_service.clear_cache()
+        for client in (self.poe_ninja, self.poe_watch):
+            client.cache.clear()
+        self.poe_ninja._currency_index.clear()
+        self.trade_cache.clear()
+
+
+def _attach(client: Any, session: Any) -> Any:
+    """Point a BaseAPIClient at ``session`` and lift its rate limit."""
+    client.session = session
+    client.rate_limiter.min_interval = 0.0
+    return client
+
+
+def build_context(session: Any, league: str, workdir: Path) -> BenchContext:
+    poe_ninja = _attach(PoeNinjaAPI(league=league), session)
+    poe_watch = _attach(PoeWatchAPI(league=league), session)
+    trade_client = _attach(PoeTradeClient(league=league), session)
+    trade_cache = TradeCache()
+    trade_source = TradeApiSource(trade_client, league=league, session=session, trade_cache=trade_cache)
+    db = Database(workdir / "bench.db")
+    service = PriceService(
+        config=Config(workdir / "config.json"),
+        parser=ItemParser(),
+        db=db,
+        poe_ninja=poe_ninja,
+        poe_watch=poe_watch,
+        trade_source=trade_source,
+        rare_evaluator=RareItemEvaluator(),
+        cache=ItemPriceCache(),
+    )
+    return BenchContext(session, league, workdir, poe_ninja, poe_watch, trade_source, trade_cache, service, db)
+
+
+def bench_parse(texts: List[str], iterations: int) -> List[float]:
+    parser = ItemParser()
+    samples: List[float] = []
+    for text in texts:
+        samples.extend(measure(lambda t=text: parser.parse(t), iterations))
+    return samples
+
+
+def bench_parse_batch(texts: List[str], iterations: int, batch_size: int = 1000) -> List[float]:
+    parser = ItemParser()
+    blocks = [text.strip() for text in texts]
+    bulk = "\n\n".join(blocks[i % len(blocks)] for i in range(batch_size))
+    return [sample / batch_size for sample in measure(lambda: parser.parse_batch(bulk), iterations)]
+
+
+def bench_evaluate(texts: List[str], iterations: int) -> List[float]:
+    parser = ItemParser()
+    evaluator = RareItemEvaluator()
+    rares = [item for item in (parser.parse(t) for t in texts) if item and item.rarity == "RARE"]
+    samples: List[float] = []
+    for item in rares:
+        samples.extend(measure(lambda i=item: evaluator.evaluate(i), iterations))
+    return samples
+
+
+def bench_check_item(ctx: BenchContext, texts: List[str], iterations: int, cold: bool) -> List[float]:
+    samples: List[float] = []
+    for text in texts:
+        samples.extend(measure(
+            lambda t=text: ctx.price_service.check_item(t, use_cache=False),
+            iterations,
+            before_each=ctx.reset_caches if cold else None,
+        ))
+    return samples
+
+
+def build_stash_valuator(session: Any, league: str) -> StashValuator:
+    valuator = StashValuator(evaluate_rares=True)
+    valuator.ninja_client = _attach(PoeNinjaClient(), session)
+    valuator.load_prices(league)
+    return valuator
+
+
+def bench_valuate(session: Any, league: str, stash_items: int, iterations: int) -> List[float]:
+    valuator = build_stash_valuator(session, league)
+    snapshot = build_synthetic_snapshot(stash_items, league)
+    return measure(lambda: valuator.valuate_snapshot(snapshot), iterations)
+
+
+def build_polling_service(ctx: BenchContext) -> MLPollingService:
+    trade_client = _attach(PoeTradeClient(league=ctx.league), ctx.session)
+    return MLPollingService(
+        {"league": ctx.league, "base_types": ["Hubris Circlet"], "max_listings_per_base": 40},
+        db=ctx.db,
+        mod_database=ModDatabase(ctx.workdir / "mods.db"),
+        trade_client=trade_client,
+        price_converter=DefaultPriceConverter(league=ctx.league, game_id="poe1", poe_ninja=ctx.poe_ninja),
+    )
+
+
+def bench_poll(ctx: BenchContext, iterations: int) -> List[float]:
+    service = build_polling_service(ctx)
+    return measure(service.poll_once, iterations)
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    texts = load_item_texts()
+    replay = ReplaySession.from_file(args.fixtures, latency_ms=args.latency_ms)
+
+    with tempfile.TemporaryDirectory(prefix="poe-bench-") as tmp:
+        ctx = build_context(replay, args.league, Path(tmp))
+        plan: Dict[str, Callable[[], List[float]]] = {
+            "item_parser.parse": lambda: bench_parse(texts, args.iterations),
+            "item_parser.parse_batch": lambda: bench_parse_batch(texts, args.iterations),
+            "rare_evaluator.evaluate": lambda: bench_evaluate(texts, args.iterations),
+            "price_service.check_item.cold": lambda: bench_check_item(ctx, texts, args.iterations, cold=True),
+            "price_service.check_item.warm": lambda: bench_check_item(ctx, texts, args.iterations, cold=False),
+            "stash_valuator.valuate_snapshot": lambda: bench_valuate(
+                replay, args.league, args.stash_items, args.heavy_iterations
+            ),
+            "ml_polling.poll_once": lambda: bench_poll(ctx, args.heavy_iterations),
+        }
+        results: Dict[str, Dict[str, float]] = {}
+        for name, bench in plan.items():
+            if args.only and not any(part in name for part in args.only):
+                continue
+            logger.info("Running %s ...", name)
+            results[name] = summarize(bench())
+        ctx.db.close()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "commit": _git_commit(),
+            "iterations": args.iterations,
+            "heavy_iterations": args.heavy_iterations,
+            "stash_items": args.stash_items,
+            "latency_ms": args.latency_ms,
+            "fixtures": str(args.fixtures),
+        },
+        "replay": replay.stats(),
+        "benchmarks": results,
+    }
+
+
+def record(args: argparse.Namespace) -> None:
+    """Run each workload once against the live APIs and save the responses."""
+    recorder = RecordingSession()
+    texts = load_item_texts()
+    with tempfile.TemporaryDirectory(prefix="poe-bench-record-") as tmp:
+        ctx = build_context(recorder, args.league, Path(tmp))
+        for text in texts:
+            ctx.price_service.check_item(text, use_cache=False)
+        build_stash_valuator(recorder, args.league)
+        build_polling_service(ctx).poll_once()
+        ctx.db.close()
+    recorder.save(args.fixtures)
+    print(f"Recorded {len(recorder.responses)} responses to {args.fixtures}")
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, timeout=5, check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def format_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """Render a report as a table, with p50/p95 deltas against ``baseline``."""
+    previous = (baseline or {}).get("benchmarks", {})
+    lines = [f"{'benchmark':<34}{'n':>6}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}  (ms)"]
+    for name, stats in report["benchmarks"].items():
+        line = (
+            f"{name:<34}{stats['n']:>6}{stats['mean']:>10.3f}{stats['p50']:>10.3f}"
+            f"{stats['p95']:>10.3f}{stats['p99']:>10.3f}{stats['max']:>10.3f}"
+        )
+        if name in previous:
+            deltas = []
+            for key in ("p50", "p95"):
+                before = previous[name].get(key) or 0.0
+                if before:
+                    deltas.append(f"{key} {(stats[key] - before) / before * 100:+.1f}%")
+            if deltas:
+                line += "  " + ", ".join(deltas)
+        lines.append(line)
+    replay = report.get("replay", {})
+    lines.append(f"replay: {replay.get('hits', 0)} hits, {replay.get('misses', 0)} misses")
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the pricing pipeline against recorded responses")
+    parser.add_argument("--iterations", type=int, default=50, help="Samples per item for per-item benchmarks")
+    parser.add_argument("--heavy-iterations", type=int, default=5,
+                        help="Samples for stash valuation and ML polling")
+    parser.add_argument("--stash-items", type=int, default=10_000, help="Items in the synthetic stash")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated latency per replayed request")
+    parser.add_argument("--league", default="Standard")
+    parser.add_argument("--fixtures", type=Path, default=RESPONSES_FILE, help="Recorded responses file")
+    parser.add_argument("--only", nargs="*", help="Run benchmarks whose name contains any of these")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--compare", type=Path, help="Previous JSON report to diff against")
+    parser.add_argument("--record", action="store_true", help="Re-record fixtures from the live APIs")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(levelname)s %(message)s")
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.ERROR)
+        logger.setLevel(logging.INFO)
+
+    if args.record:
+        record(args)
+        return 0
+
+    report = run(args)
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+    print(format_report(report, baseline))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
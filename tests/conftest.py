@@ -69,6 +69,20 @@ def reset_qt_singletons():
     except ImportError:
         pass
 
+    # Reset shared trade search/listing cache between tests
+    try:
+        from data_sources.pricing.trade_cache import clear_trade_cache
+        clear_trade_cache()
+    except ImportError:
+        pass
+
+    # Reset shared span timings between tests
+    try:
+        from core.tracing import reset_tracer
+        reset_tracer()
+    except ImportError:
+        pass
+
 
 @pytest.fixture
 def temp_config(tmp_path):
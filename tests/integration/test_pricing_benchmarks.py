@@ -0,0 +1,76 @@
+"""
+Smoke tests for the pricing benchmark harness (scripts/bench).
+
+Runs every benchmark with tiny iteration counts against the recorded
+fixtures so the harness can't silently rot as the pipeline changes.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCH_DIR = Path(__file__).parent.parent.parent / "scripts" / "bench"
+sys.path.insert(0, str(BENCH_DIR))
+
+import run_benchmarks  # noqa: E402
+from replay import ReplaySession, request_key  # noqa: E402
+
+pytestmark = pytest.mark.integration
+
+
+class TestReplaySession:
+    def test_key_ignores_league_and_trade_search_league(self):
+        a = request_key("GET", "https://poe.ninja/api/data/itemoverview",
+                        {"league": "Settlers", "type": "Oil", "language": "en"})
+        b = request_key("GET", "https://poe.ninja/api/data/itemoverview", {"type": "Oil", "league": "Standard"})
+        assert a == b == "GET poe.ninja/api/data/itemoverview?type=Oil"
+        assert request_key("POST", "https://www.pathofexile.com/api/trade/search/Settlers") == \
+            "POST www.pathofexile.com/api/trade/search"
+
+    def test_fetch_substitutes_requested_ids(self):
+        replay = ReplaySession.from_file(run_benchmarks.RESPONSES_FILE)
+        body = replay.get("https://www.pathofexile.com/api/trade/fetch/a,b,c", params={"query": "x"}).json()
+        assert [listing["id"] for listing in body["result"]] == ["a", "b", "c"]
+        assert all(listing["listing"]["price"] for listing in body["result"])
+
+    def test_unknown_request_is_counted_as_miss(self):
+        replay = ReplaySession({})
+        assert replay.get("https://api.poe.watch/search", params={"q": "Nothing"}).json() == {}
+        assert replay.stats()["misses"] == 1
+
+
+class TestHarness:
+    def test_percentile_interpolates(self):
+        assert run_benchmarks.percentile([1.0, 2.0, 3.0, 4.0], 50) == pytest.approx(2.5)
+        assert run_benchmarks.percentile([5.0], 99) == 5.0
+
+    def test_synthetic_snapshot_size(self):
+        snapshot = run_benchmarks.build_synthetic_snapshot(1200, "Standard", items_per_tab=500)
+        assert [len(tab.items) for tab in snapshot.tabs] == [500, 500, 200]
+
+    def test_full_run_replays_without_misses(self, tmp_path):
+        output = tmp_path / "report.json"
+        args = run_benchmarks.parse_args([
+            "--iterations", "1", "--heavy-iterations", "1", "--stash-items", "200", "--output", str(output),
+        ])
+
+        report = run_benchmarks.run(args)
+        output.write_text(json.dumps(report))
+
+        assert set(report["benchmarks"]) == {
+            "item_parser.parse",
+            "item_parser.parse_batch",
+            "rare_evaluator.evaluate",
+            "price_service.check_item.cold",
+            "price_service.check_item.warm",
+            "stash_valuator.valuate_snapshot",
+            "ml_polling.poll_once",
+        }
+        assert report["replay"]["misses"] == 0
+        for stats in report["benchmarks"].values():
+            assert stats["n"] >= 1
+            assert stats["min"] <= stats["p50"] <= stats["p99"] <= stats["max"]
+        assert "p50" in run_benchmarks.format_report(report, baseline=report)
@@ -151,11 +151,19 @@ class TestMCPServerTools:
         
         result = search_database("Kaom", "POE1", "Standard", 10)
         
-        # Currently returns a placeholder
         assert result["query"] == "Kaom"
         assert result["game"] == "POE1"
         assert result["league"] == "Standard"
-        assert "message" in result
+        assert result["count"] == len(result["results"])
+        assert result["count"] <= 10
+
+    def test_search_database_rejects_unknown_kind(self):
+        """Test that an unknown search kind is reported, not raised"""
+        from mcp_poe_server import search_database
+
+        result = search_database("Kaom", "POE1", "Standard", 10, kind="gem")
+
+        assert "error" in result
 
 
 class TestMCPServerIntegration:
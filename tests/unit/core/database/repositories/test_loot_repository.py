@@ -0,0 +1,134 @@
+"""
+Tests for core/database/repositories/loot_repository.py
+
+Tests paged and aggregated loot session queries.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.database import Database
+from core.loot_session import LootDrop, LootSession, MapRun, SessionState
+from core.services.loot_persistence_service import LootPersistenceService
+
+pytestmark = pytest.mark.unit
+
+
+def make_drop(drop_id, value=10.0, rarity="Currency"):
+    return LootDrop(
+        id=drop_id,
+        item_name=f"Item {drop_id}",
+        item_base_type=None,
+        stack_size=1,
+        chaos_value=value,
+        divine_value=value / 200,
+        rarity=rarity,
+        item_class="Currency",
+        detected_at=datetime.now(),
+    )
+
+
+def make_run(run_id, drops):
+    started = datetime.now() - timedelta(minutes=10)
+    return MapRun(
+        id=run_id,
+        map_name="Strand",
+        area_level=83,
+        started_at=started,
+        ended_at=started + timedelta(minutes=5),
+        drops=drops,
+    )
+
+
+def count(db, table):
+    return db.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(tmp_path / "test.db")
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def service(db):
+    svc = LootPersistenceService(db)
+    yield svc
+    svc.shutdown()
+
+
+class TestLootRepositoryQueries:
+    """Paged and aggregated reads."""
+
+    def _save(self, service, session_id, league, drops):
+        session = LootSession(
+            id=session_id,
+            name=session_id,
+            league=league,
+            started_at=datetime.now() - timedelta(hours=2),
+            ended_at=datetime.now(),
+            state=SessionState.COMPLETED,
+            map_runs=[make_run(f"{session_id}-run", drops)],
+        )
+        service.save_session(session)
+        return session
+
+    def test_history_paging(self, db, service):
+        for i in range(5):
+            self._save(service, f"s{i}", "Settlers", [make_drop(f"s{i}-d")])
+        service.flush(timeout=5)
+
+        first = db.get_loot_session_history("Settlers", limit=2)
+        second = db.get_loot_session_history("Settlers", limit=2, offset=2)
+
+        assert len(first) == 2 and len(second) == 2
+        assert not {s["id"] for s in first} & {s["id"] for s in second}
+
+    def test_history_computes_chaos_per_hour(self, db, service):
+        session = self._save(service, "s1", "Settlers", [make_drop("d1", 100.0)])
+        service.flush(timeout=5)
+
+        history = db.get_loot_session_history("Settlers")
+
+        assert history[0]["chaos_per_hour"] == pytest.approx(session.chaos_per_hour, rel=1e-3)
+
+    def test_history_league_filter(self, db, service):
+        self._save(service, "s1", "Settlers", [])
+        self._save(service, "s2", "Standard", [])
+        service.flush(timeout=5)
+
+        assert [s["id"] for s in db.get_loot_session_history("Standard")] == ["s2"]
+        assert len(db.get_loot_session_history(None)) == 2
+
+    def test_totals(self, db, service):
+        self._save(service, "s1", "Settlers", [make_drop("a", 10.0)])
+        self._save(service, "s2", "Settlers", [make_drop("b", 5.0), make_drop("c", 5.0)])
+        service.flush(timeout=5)
+
+        totals = db.get_loot_session_totals("Settlers")
+
+        assert totals == {
+            "session_count": 2, "total_maps": 2, "total_drops": 3, "total_chaos_value": 20.0,
+        }
+
+    def test_details(self, db, service):
+        drops = [make_drop(f"d{i}", float(i), rarity="Rare" if i % 2 else "Unique") for i in range(30)]
+        self._save(service, "s1", "Settlers", drops)
+        service.flush(timeout=5)
+
+        details = db.get_loot_session_details("s1", top_drops_limit=5)
+
+        assert details["session"]["id"] == "s1"
+        assert len(details["map_runs"]) == 1
+        assert [d["id"] for d in details["top_drops"]] == ["d29", "d28", "d27", "d26", "d25"]
+        assert details["drops_by_rarity"] == {"Rare": 15, "Unique": 15}
+        assert db.get_loot_session_details("missing") is None
+
+    def test_delete_session(self, db, service):
+        self._save(service, "s1", "Settlers", [make_drop("d1")])
+        service.flush(timeout=5)
+
+        assert db.delete_loot_session("s1") is True
+        assert count(db, "loot_drops") == 0
+        assert count(db, "loot_map_runs") == 0
@@ -394,3 +394,103 @@ class TestSalesIntegration:
         # Source should be tracked
         sources = temp_db.get_distinct_sale_sources()
         assert "loot" in sources
+
+
+class TestApiQueries:
+    """Tests for SQL-side paging and aggregates used by the REST API."""
+
+    @pytest.fixture
+    def seeded(self, temp_db):
+        rows = [
+            (1, "A", 10.0, 12.0, "2025-01-01 10:00:00", "2025-01-01 12:00:00", 2.0),
+            (2, "B", 5.0, None, "2025-01-02 10:00:00", None, None),
+            (3, "C", 7.0, None, "2025-01-02 10:00:00", None, None),
+        ]
+        temp_db.conn.executemany(
+            """
+            INSERT INTO sales (id, item_name, listed_price_chaos, actual_price_chaos,
+                               listed_at, sold_at, time_to_sale_hours)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        # Recent completed sales for period aggregates
+        temp_db.conn.execute(
+            """
+            INSERT INTO sales (id, item_name, listed_price_chaos, actual_price_chaos,
+                               listed_at, sold_at, time_to_sale_hours)
+            VALUES (4, 'Mageblood', 100.0, 90.0, DATETIME('now', '-1 day'), DATETIME('now'), 24.0),
+                   (5, 'Goldrim', 2.0, 3.0, DATETIME('now', '-1 day'), DATETIME('now', '-1 day'), 1.0)
+            """
+        )
+        temp_db.conn.commit()
+        return temp_db
+
+    def test_keyset_pages_break_ties_by_id(self, seeded):
+        first = seeded.query_sales(status="pending", limit=1)
+        last = first[-1]
+        second = seeded.query_sales(status="pending", limit=1, after=(last["listed_at"], last["id"]))
+
+        assert [r["id"] for r in first] == [3]
+        assert [r["id"] for r in second] == [2]
+
+    def test_count_and_get_by_id(self, seeded):
+        assert seeded.count_sales() == 5
+        assert seeded.count_sales(status="pending") == 2
+        assert seeded.get_sale(1)["item_name"] == "A"
+        assert seeded.get_sale(999) is None
+
+    def test_period_stats_aggregate_in_sql(self, seeded):
+        stats = seeded.get_sales_period_stats(days=7, top_limit=1)
+
+        assert stats["total_sales"] == 2
+        assert stats["total_chaos"] == 93.0
+        # All-time average, including sale 1 from outside the window
+        assert stats["avg_time_to_sale"] == 9.0
+        assert stats["top_items"] == [{"item_name": "Mageblood", "price": 90.0}]
+        assert sum(day["total_sales"] for day in stats["daily"]) == 2
+
+    def test_activity_today(self, seeded):
+        assert seeded.get_sales_activity_today() == {"sold_today": 1, "pending": 2}
+
+    def test_indexes_exist(self, temp_db):
+        names = {
+            row[0] for row in temp_db.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        assert {"idx_sales_listed", "idx_sales_sold", "idx_checked_items_recent"} <= names
+
+
+class TestCheckedItemQueries:
+    """Tests for checked item filtering, paging and daily buckets."""
+
+    def test_filters_search_and_keyset(self, temp_db):
+        from core.game_version import GameVersion
+
+        for name in ("Headhunter", "Head_band", "Chaos Orb"):
+            temp_db.add_checked_item(GameVersion.POE1, "Standard", name, 1.0)
+        temp_db.add_checked_item(GameVersion.POE2, "Dawn", "Headhunter", 1.0)
+
+        assert temp_db.count_checked_items(search="head") == 3
+        assert temp_db.count_checked_items(search="_") == 1  # LIKE wildcard escaped
+        assert temp_db.count_checked_items(game_version="poe2") == 1
+
+        page = temp_db.query_checked_items(league="Standard", limit=2)
+        rest = temp_db.query_checked_items(
+            league="Standard", limit=2, after=(page[-1]["checked_at"], page[-1]["id"])
+        )
+        assert [r["item_name"] for r in page + rest] == ["Chaos Orb", "Head_band", "Headhunter"]
+        assert temp_db.get_checked_item(page[0]["id"])["item_name"] == "Chaos Orb"
+
+    def test_counts_by_day(self, temp_db):
+        from core.game_version import GameVersion
+
+        temp_db.add_checked_item(GameVersion.POE1, "Standard", "A", 1.0)
+        temp_db.conn.execute(
+            "INSERT INTO checked_items (game_version, league, item_name, chaos_value, checked_at) "
+            "VALUES ('poe1', 'Standard', 'Old', 1.0, DATETIME('now', '-40 days'))"
+        )
+
+        assert sum(d["count"] for d in temp_db.get_checked_items_by_day(days=30)) == 1
+        assert temp_db.get_checked_items_by_day(days=0)[0]["count"] == 1
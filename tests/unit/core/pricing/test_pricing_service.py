@@ -195,6 +195,44 @@ class TestPriceServiceCheckItem:
         service.cache_enabled = True
         assert service.cache_enabled is True
 
+    def test_concurrent_identical_checks_run_once(self, mock_config, mock_parser, mock_cache):
+        """Concurrent checks of the same item (modulo whitespace) share one run."""
+        import threading
+        import time
+
+        service = PriceService(
+            config=mock_config,
+            parser=mock_parser,
+            db=Mock(),
+            poe_ninja=Mock(),
+            cache=mock_cache,
+        )
+        release = threading.Event()
+        rows = [{"item_name": "Goldrim", "chaos_value": 1.0}]
+
+        def slow_check(item_text, use_cache):
+            release.wait(timeout=5)
+            return rows
+
+        service._check_item = Mock(side_effect=slow_check)
+
+        results = []
+        texts = ["Rarity: Unique\nGoldrim\nLeather Cap", "Rarity: Unique\r\nGoldrim\r\nLeather  Cap\n"] * 2
+        threads = [threading.Thread(target=lambda t=t: results.append(service.check_item(t))) for t in texts]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while service._inflight.stats()["shared"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        shared = service._inflight.stats()["shared"]
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert shared == 3, "callers were not deduplicated onto one in-flight check"
+        assert service._check_item.call_count == 1
+        assert results == [rows] * 4
+
 
 class TestPriceServiceConfidenceCalculation:
     """Tests for confidence-related calculations."""
@@ -1130,3 +1168,26 @@ class TestGameLeagueResolution:
         game, league = service._resolve_game_and_league()
         assert game == GameVersion.POE2
         assert league == "PoE2Standard"
+
+
+class TestPriceServiceTiming:
+    """Tests for per-stage span timing of check_item."""
+
+    def test_check_item_records_stage_spans(self):
+        from core.tracing import get_tracer
+
+        config = Mock()
+        config.item_cache_enabled = False
+        config.item_cache_ttl_seconds = 300
+        service = PriceService(config=config, parser=Mock(), db=Mock(), poe_ninja=Mock(), cache=None)
+        service._lookup_price_multi_source = Mock(return_value=(10.0, 5, "poe.ninja", "medium"))
+        service._save_trade_quotes_for_check = Mock()
+        service._get_latest_price_stats_for_item = Mock(return_value=None)
+
+        service.check_item("Rarity: Unique\nGoldrim\nLeather Cap", use_cache=False)
+
+        stats = service.get_timing_stats("pricing.")
+        assert {"pricing.check_item", "pricing.parse", "pricing.lookup", "pricing.persist", "pricing.stats"} <= set(stats)
+        trace = get_tracer().recent_traces(1)[0]
+        assert trace["name"] == "pricing.check_item"
+        assert [child["name"] for child in trace["children"]][:2] == ["pricing.parse", "pricing.lookup"]
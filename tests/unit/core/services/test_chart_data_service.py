@@ -3,13 +3,17 @@ Tests for ChartDataService.
 """
 
 import pytest
+import sqlite3
 from datetime import datetime, timedelta
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from core.database.schema import CREATE_SCHEMA_SQL
 from core.services.chart_data_service import (
     ChartDataService,
     ChartSeries,
     PriceDataPoint,
+    downsample_series,
+    lttb_indices,
 )
 
 
@@ -279,3 +283,205 @@ class TestChartDataService:
         series = service.get_item_from_economy_items("Unknown Item", "Settlers")
 
         assert series is None
+
+
+@pytest.fixture
+def sqlite_db():
+    """A database object backed by a real in-memory SQLite schema."""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(CREATE_SCHEMA_SQL)
+    db = Mock()
+    db.conn = conn
+    yield db
+    conn.close()
+
+
+def _add_history(db, item_name, rows, league="Settlers"):
+    """Insert (recorded_at, chaos_value) rows into price_history."""
+    db.conn.executemany(
+        "INSERT INTO price_history (game_version, league, item_name, chaos_value, divine_value, recorded_at)"
+        " VALUES ('poe1', ?, ?, ?, ?, ?)",
+        [(league, item_name, value, value / 200, ts.strftime("%Y-%m-%d %H:%M:%S")) for ts, value in rows],
+    )
+
+
+class TestLttb:
+    """Tests for largest-triangle-three-buckets downsampling."""
+
+    def test_keeps_everything_under_threshold(self):
+        assert lttb_indices([0, 1, 2], [5, 6, 7], 10) == [0, 1, 2]
+
+    def test_caps_points_and_keeps_endpoints(self):
+        xs = list(range(1000))
+        ys = [float(x % 17) for x in xs]
+
+        kept = lttb_indices(xs, ys, 50)
+
+        assert len(kept) == 50
+        assert kept[0] == 0
+        assert kept[-1] == 999
+        assert kept == sorted(set(kept))
+
+    def test_preserves_spike(self):
+        xs = list(range(500))
+        ys = [10.0] * 500
+        ys[321] = 900.0
+
+        assert 321 in lttb_indices(xs, ys, 20)
+
+    def test_downsample_series(self):
+        start = datetime(2025, 1, 1)
+        points = [PriceDataPoint(date=start + timedelta(minutes=i), chaos_value=float(i)) for i in range(300)]
+
+        result = downsample_series(points, 30)
+
+        assert len(result) == 30
+        assert result[0] is points[0]
+        assert result[-1] is points[-1]
+
+
+class TestChartDataServiceBucketing:
+    """Tests for SQL-side OHLC bucketing against a real schema."""
+
+    def test_hourly_ohlc(self, sqlite_db):
+        base = datetime.now().replace(minute=0, second=0, microsecond=0) - timedelta(hours=5)
+        _add_history(sqlite_db, "Mageblood", [
+            (base + timedelta(minutes=5), 100.0),
+            (base + timedelta(minutes=50), 120.0),
+            (base + timedelta(minutes=20), 90.0),
+            (base + timedelta(hours=1, minutes=10), 130.0),
+        ])
+        service = ChartDataService(sqlite_db)
+
+        series = service.get_item_price_series("Mageblood", "Settlers", days=1, resolution="hour")
+
+        assert [p.date for p in series.data_points] == [base, base + timedelta(hours=1)]
+        first = series.data_points[0]
+        assert (first.open, first.close, first.low, first.high, first.count) == (100.0, 120.0, 90.0, 120.0, 3)
+        assert first.chaos_value == pytest.approx(310.0 / 3)
+        assert first.divine_value == pytest.approx(310.0 / 3 / 200)
+        assert series.data_points[1].count == 1
+
+    def test_hour_bucket_accepts_iso_t_separator(self, sqlite_db):
+        sqlite_db.conn.executemany(
+            "INSERT INTO price_history (game_version, league, item_name, chaos_value, recorded_at)"
+            " VALUES ('poe1', 'Settlers', 'Mirror', ?, ?)",
+            [(1.0, "2024-02-01 10:15:00"), (3.0, "2024-02-01T10:45:00")],
+        )
+        service = ChartDataService(sqlite_db)
+
+        series = service.get_item_price_series("Mirror", "Settlers", days=0, resolution="hour")
+
+        assert len(series.data_points) == 1
+        assert series.data_points[0].date == datetime(2024, 2, 1, 10)
+        assert series.data_points[0].count == 2
+
+    def test_daily_buckets_all_time(self, sqlite_db):
+        start = datetime(2024, 3, 1, 1)
+        _add_history(sqlite_db, "Headhunter", [(start + timedelta(hours=6 * i), float(i)) for i in range(40)])
+        service = ChartDataService(sqlite_db)
+
+        series = service.get_item_price_series("Headhunter", "Settlers", days=0, resolution="day")
+
+        assert len(series.data_points) == 10
+        assert sum(p.count for p in series.data_points) == 40
+        assert series.data_points[0].date == datetime(2024, 3, 1)
+
+    def test_auto_resolution(self, sqlite_db):
+        start = datetime(2024, 1, 1)
+        # 3,000 rows a minute apart: ~50 hours
+        _add_history(sqlite_db, "Divine Orb", [(start + timedelta(minutes=i), 150.0 + i % 7) for i in range(3000)])
+        service = ChartDataService(sqlite_db)
+
+        few = service.get_item_price_series("Divine Orb", "Settlers", days=0, resolution="auto", max_points=5000)
+        capped = service.get_item_price_series("Divine Orb", "Settlers", days=0, resolution="auto", max_points=40)
+
+        assert len(few.data_points) == 3000  # fits, so raw rows
+        assert len(capped.data_points) == 40  # hourly buckets, then LTTB
+        assert all(p.count == 60 for p in capped.data_points[:-1])
+
+    def test_unknown_resolution_returns_none(self, sqlite_db):
+        _add_history(sqlite_db, "Exalted Orb", [(datetime.now(), 10.0)])
+        service = ChartDataService(sqlite_db)
+
+        assert service.get_item_price_series("Exalted Orb", "Settlers", resolution="minute") is None
+
+    def test_currency_rates_bucketed(self, sqlite_db):
+        base = datetime(2024, 5, 1)
+        sqlite_db.conn.executemany(
+            "INSERT INTO currency_rates (league, game_version, divine_to_chaos, recorded_at) VALUES (?, 'poe1', ?, ?)",
+            [("Settlers", 150.0 + i, (base + timedelta(hours=i)).strftime("%Y-%m-%d %H:%M:%S")) for i in range(48)],
+        )
+        service = ChartDataService(sqlite_db)
+
+        series = service.get_currency_rate_series("Divine Orb", "Settlers", days=0, resolution="day")
+
+        assert [p.count for p in series.data_points] == [24, 24]
+        assert series.data_points[1].open == 174.0
+        assert series.data_points[1].close == 197.0
+
+    def test_economy_items_query(self, sqlite_db):
+        sqlite_db.conn.executemany(
+            "INSERT INTO league_economy_items (league, item_name, rate_date, chaos_value) VALUES (?, ?, ?, ?)",
+            [("Settlers", "Mageblood", f"2024-01-{d:02d}", 1000.0 + d) for d in range(1, 21)],
+        )
+        service = ChartDataService(sqlite_db)
+
+        series = service.get_item_from_economy_items("Mageblood", "Settlers", days=0, max_points=10)
+
+        assert len(series.data_points) == 10
+        assert series.data_points[0].date == datetime(2024, 1, 1)
+
+
+class TestChartDataServiceCache:
+    """Tests for the per-series cache."""
+
+    def test_repeat_call_served_from_cache(self, sqlite_db):
+        _add_history(sqlite_db, "Mageblood", [(datetime.now(), 100.0)])
+        service = ChartDataService(sqlite_db)
+
+        with patch.object(service, "_load_item_price_series", wraps=service._load_item_price_series) as load:
+            first = service.get_item_price_series("Mageblood", "Settlers", days=7)
+            second = service.get_item_price_series("Mageblood", "Settlers", days=7)
+            service.get_item_price_series("Mageblood", "Settlers", days=30)
+
+        assert second is first
+        assert load.call_count == 2  # one per range
+
+    def test_new_rows_invalidate(self, sqlite_db):
+        _add_history(sqlite_db, "Mageblood", [(datetime.now() - timedelta(hours=1), 100.0)])
+        service = ChartDataService(sqlite_db)
+        assert len(service.get_item_price_series("Mageblood", "Settlers").data_points) == 1
+
+        _add_history(sqlite_db, "Mageblood", [(datetime.now(), 110.0)])
+
+        assert len(service.get_item_price_series("Mageblood", "Settlers").data_points) == 2
+
+    def test_unrelated_writes_keep_cache(self, sqlite_db):
+        _add_history(sqlite_db, "Mageblood", [(datetime.now(), 100.0)])
+        service = ChartDataService(sqlite_db)
+        first = service.get_item_price_series("Mageblood", "Settlers")
+
+        sqlite_db.conn.execute("INSERT INTO plugin_state (plugin_name, enabled) VALUES ('x', 1)")
+
+        assert service.get_item_price_series("Mageblood", "Settlers") is first
+
+    def test_ttl_expiry(self, sqlite_db):
+        _add_history(sqlite_db, "Mageblood", [(datetime.now(), 100.0)])
+        service = ChartDataService(sqlite_db)
+        first = service.get_item_price_series("Mageblood", "Settlers")
+
+        with patch("core.services.chart_data_service.time.monotonic", return_value=1e12):
+            assert service.get_item_price_series("Mageblood", "Settlers") is not first
+
+    def test_invalidate_by_name(self, sqlite_db):
+        _add_history(sqlite_db, "Mageblood", [(datetime.now(), 100.0)])
+        _add_history(sqlite_db, "Headhunter", [(datetime.now(), 50.0)])
+        service = ChartDataService(sqlite_db)
+        mageblood = service.get_item_price_series("Mageblood", "Settlers")
+        headhunter = service.get_item_price_series("Headhunter", "Settlers")
+
+        service.invalidate("Mageblood")
+
+        assert service.get_item_price_series("Mageblood", "Settlers") is not mageblood
+        assert service.get_item_price_series("Headhunter", "Settlers") is headhunter
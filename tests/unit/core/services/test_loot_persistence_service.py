@@ -0,0 +1,166 @@
+"""
+Tests for LootPersistenceService.
+"""
+
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from core.database import Database
+from core.loot_session import LootDrop, LootSession, MapRun, SessionState
+from core.services.loot_persistence_service import LootPersistenceService
+
+pytestmark = pytest.mark.unit
+
+
+def make_drop(drop_id, value=10.0, rarity="Currency"):
+    return LootDrop(
+        id=drop_id,
+        item_name=f"Item {drop_id}",
+        item_base_type=None,
+        stack_size=1,
+        chaos_value=value,
+        divine_value=value / 200,
+        rarity=rarity,
+        item_class="Currency",
+        detected_at=datetime.now(),
+    )
+
+
+def make_run(run_id, drops=None, minutes_ago=10):
+    started = datetime.now() - timedelta(minutes=minutes_ago)
+    return MapRun(
+        id=run_id,
+        map_name="Strand",
+        area_level=83,
+        started_at=started,
+        ended_at=started + timedelta(minutes=5),
+        drops=drops or [],
+    )
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(tmp_path / "test.db")
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def session():
+    return LootSession(
+        id="session-1",
+        name="Farming",
+        league="Settlers",
+        started_at=datetime.now() - timedelta(hours=1),
+        state=SessionState.ACTIVE,
+    )
+
+
+@pytest.fixture
+def service(db):
+    svc = LootPersistenceService(db)
+    yield svc
+    svc.shutdown()
+
+
+def count(db, table):
+    return db.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestIncrementalWrites:
+    """Sessions are written as they progress."""
+
+    def test_map_run_written_before_session_ends(self, db, service, session):
+        session.map_runs.append(make_run("run-1", [make_drop("d1"), make_drop("d2")]))
+
+        service.record_progress(session)
+        assert service.flush(timeout=5)
+
+        assert count(db, "loot_sessions") == 1
+        assert count(db, "loot_map_runs") == 1
+        assert count(db, "loot_drops") == 2
+
+    def test_only_new_rows_are_sent(self, session):
+        db = Mock()
+        service = LootPersistenceService(db)
+        run = make_run("run-1", [make_drop("d1")])
+        session.map_runs.append(run)
+
+        service.record_progress(session)
+        service.record_progress(session)  # nothing new
+        run.drops.append(make_drop("d2"))
+        service.record_progress(session)
+        service.shutdown()
+
+        sent_drops = [row[0] for call in db.save_loot_batch.call_args_list for row in call.args[2]]
+        sent_runs = [row[0] for call in db.save_loot_batch.call_args_list for row in call.args[1]]
+        assert sent_drops == ["d1", "d2"]
+        assert sent_runs == ["run-1", "run-1"]
+
+    def test_run_totals_updated_when_drops_arrive(self, db, service, session):
+        run = make_run("run-1")
+        session.map_runs.append(run)
+        service.record_progress(session)
+
+        run.drops.extend([make_drop("d1", 30.0), make_drop("d2", 20.0)])
+        service.record_progress(session)
+        assert service.flush(timeout=5)
+
+        row = db.conn.execute(
+            "SELECT drop_count, total_chaos_value FROM loot_map_runs WHERE id = 'run-1'"
+        ).fetchone()
+        assert tuple(row) == (2, 50.0)
+
+    def test_save_session_writes_final_state(self, db, service, session):
+        session.map_runs.append(make_run("run-1", [make_drop("d1", 100.0)]))
+        service.record_progress(session)
+
+        session.ended_at = datetime.now()
+        session.state = SessionState.COMPLETED
+        service.save_session(session)
+        assert service.flush(timeout=5)
+
+        row = db.conn.execute("SELECT state, ended_at, total_chaos_value FROM loot_sessions").fetchone()
+        assert row["state"] == "completed"
+        assert row["ended_at"] is not None
+        assert row["total_chaos_value"] == 100.0
+        assert count(db, "loot_drops") == 1
+        assert service.get_stats()["tracked_sessions"] == 0
+
+    def test_writes_happen_off_caller_thread(self, session):
+        threads = []
+        db = Mock()
+        db.save_loot_batch.side_effect = lambda *a: threads.append(threading.current_thread())
+        service = LootPersistenceService(db)
+
+        service.record_progress(session)
+        service.shutdown()
+
+        assert threads and threading.current_thread() not in threads
+
+    def test_failed_write_is_resent(self, session):
+        db = Mock()
+        db.save_loot_batch.side_effect = [RuntimeError("locked"), None]
+        service = LootPersistenceService(db)
+        session.map_runs.append(make_run("run-1", [make_drop("d1")]))
+
+        service.record_progress(session)
+        service.flush(timeout=5)
+        service.record_progress(session)
+        service.shutdown()
+
+        last_drops = db.save_loot_batch.call_args_list[-1].args[2]
+        assert [row[0] for row in last_drops] == ["d1"]
+        assert service.get_stats()["errors"] == 1
+
+    def test_writes_after_shutdown_are_dropped(self, session):
+        db = Mock()
+        service = LootPersistenceService(db)
+        service.shutdown()
+
+        service.record_progress(session)
+
+        db.save_loot_batch.assert_not_called()
@@ -91,6 +91,27 @@ class TestAppContextClose:
         mock_poe_ninja.close.assert_called_once()
         mock_poe2_ninja.close.assert_called_once()
         mock_poe_watch.close.assert_called_once()
+        mock_price_service.close.assert_called_once()
+
+    def test_close_handles_price_service_error(self):
+        """close() should keep closing other resources if the price pool fails."""
+        mock_db = Mock()
+        mock_price_service = Mock()
+        mock_price_service.close.side_effect = Exception("pool error")
+
+        ctx = AppContext(
+            config=Mock(),
+            parser=Mock(),
+            db=mock_db,
+            poe_ninja=None,
+            poe2_ninja=None,
+            poe_watch=None,
+            price_service=mock_price_service,
+        )
+
+        # Should not raise
+        ctx.close()
+        mock_db.close.assert_called_once()
 
     def test_close_handles_database_error(self):
         """close() should handle database close error gracefully."""
@@ -560,6 +581,34 @@ class TestAppContextMultiSourceSetup:
             assert call_kwargs.get("use_arbitration") is False
 
 
+    @patch("core.app_context.Config")
+    def test_source_limits_from_config(self, mock_config_class):
+        """Configured per-source limits reach MultiSourcePriceService."""
+        from core.price_multi import SourceLimits
+
+        mock_config = Mock()
+        mock_config.current_game = GameVersion.POE2
+        mock_config.display_policy = {}
+        mock_config.price_source_limits = {
+            "default": {"max_concurrent": 2, "deadline_s": 20.0},
+            "poe2.ninja": {"max_concurrent": 1, "deadline_s": 8.0},
+        }
+        mock_config_class.return_value = mock_config
+
+        with patch("core.app_context.ItemParser"), \
+             patch("core.app_context.Database"), \
+             patch("core.app_context.PriceService"), \
+             patch("core.app_context.MultiSourcePriceService") as mock_multi, \
+             patch("core.app_context.ExistingServiceAdapter"), \
+             patch("core.app_context.UndercutPriceSource"), \
+             patch("core.app_context.set_active_policy_from_dict"), \
+             patch("core.app_context.set_retry_logging_verbosity"):
+            create_app_context()
+            call_kwargs = mock_multi.call_args.kwargs
+            assert call_kwargs["default_limits"] == SourceLimits(max_concurrent=2, deadline_s=20.0)
+            assert call_kwargs["source_limits"] == {"poe2.ninja": SourceLimits(max_concurrent=1, deadline_s=8.0)}
+
+
 class TestAppContextEnabledSources:
     """Tests for enabled_sources config loading."""
 
@@ -768,3 +817,160 @@ class TestAppContextPOE2Setup:
             ctx = create_app_context()
             assert ctx.poe_ninja is None
             assert ctx.poe_watch is None
+
+
+class TestAppContextDeferredStartup:
+    """Tests for create_app_context(defer_startup=True)."""
+
+    @staticmethod
+    def _poe1_config(league: str) -> tuple[Mock, Mock]:
+        mock_config = Mock()
+        mock_config.current_game = GameVersion.POE1
+        mock_config.display_policy = {}
+        mock_config.auto_detect_league = True
+        mock_config.get_api_timeouts.return_value = (10, 30)
+        mock_config.get_pricing_ttls.return_value = {}
+        mock_game_cfg = Mock()
+        mock_game_cfg.league = league
+        mock_config.get_game_config.return_value = mock_game_cfg
+        return mock_config, mock_game_cfg
+
+    @patch("core.app_context.Config")
+    def test_league_detected_in_background(self, mock_config_class):
+        """Detection runs off the calling thread and re-points every client."""
+        import threading
+
+        mock_config, mock_game_cfg = self._poe1_config("OldLeague")
+        mock_config_class.return_value = mock_config
+        release = threading.Event()
+        detect_threads = []
+
+        def detect():
+            detect_threads.append(threading.current_thread())
+            release.wait(5)
+            return "NewLeague"
+
+        with patch("core.app_context.ItemParser"), \
+             patch("core.app_context.Database"), \
+             patch("core.app_context.PoeNinjaAPI") as mock_ninja, \
+             patch("core.app_context.PoeWatchAPI") as mock_watch, \
+             patch("core.app_context.PoeTradeClient") as mock_trade_client, \
+             patch("core.app_context.TradeApiSource") as mock_trade_source, \
+             patch("core.app_context.RareItemEvaluator"), \
+             patch("core.app_context.PriceService") as mock_price_service, \
+             patch("core.app_context.MultiSourcePriceService"), \
+             patch("core.app_context.ExistingServiceAdapter"), \
+             patch("core.app_context.UndercutPriceSource"), \
+             patch("core.app_context.set_active_policy_from_dict"), \
+             patch("core.app_context.set_retry_logging_verbosity"):
+            mock_ninja.return_value.detect_current_league.side_effect = detect
+
+            ctx = create_app_context(defer_startup=True)
+
+            # Returned before detection finished; clients on the configured league
+            assert mock_game_cfg.league == "OldLeague"
+            assert not ctx.wait_for_startup(timeout=0.01)
+
+            release.set()
+            assert ctx.wait_for_startup(timeout=5)
+
+        assert detect_threads[0] is not threading.main_thread()
+        assert mock_game_cfg.league == "NewLeague"
+        mock_config.set_game_config.assert_called_once_with(mock_game_cfg)
+        for client in (mock_ninja, mock_watch, mock_trade_client, mock_trade_source):
+            client.return_value.set_league.assert_called_once_with("NewLeague")
+        mock_price_service.return_value.clear_cache.assert_called_once()
+        mock_ninja.return_value.ensure_divine_rate.assert_called_once()
+
+    @patch("core.app_context.Config")
+    def test_prices_from_before_detection_are_dropped_on_switch(self, mock_config_class):
+        """An item priced on the configured league is repriced on the detected one."""
+        import threading
+
+        from data_sources.pricing.poe_ninja import PoeNinjaAPI
+
+        mock_config, _ = self._poe1_config("OldLeague")
+        mock_config_class.return_value = mock_config
+        release = threading.Event()
+        divine_by_league = {"OldLeague": 150.0, "NewLeague": 90.0}
+
+        class FakeNinja(PoeNinjaAPI):
+            def detect_current_league(self) -> str:
+                release.wait(5)
+                return "NewLeague"
+
+            def get(self, endpoint, params=None):
+                chaos = divine_by_league[params["league"]]
+                return {"lines": [{"currencyTypeName": "Divine Orb", "chaosEquivalent": chaos}]}
+
+        with patch("core.app_context.ItemParser"), \
+             patch("core.app_context.Database"), \
+             patch("core.app_context.PoeNinjaAPI", FakeNinja), \
+             patch("core.app_context.PoeWatchAPI"), \
+             patch("core.app_context.PoeTradeClient"), \
+             patch("core.app_context.TradeApiSource"), \
+             patch("core.app_context.RareItemEvaluator"), \
+             patch("core.app_context.PriceService") as mock_price_service, \
+             patch("core.app_context.MultiSourcePriceService"), \
+             patch("core.app_context.ExistingServiceAdapter"), \
+             patch("core.app_context.UndercutPriceSource"), \
+             patch("core.app_context.set_active_policy_from_dict"), \
+             patch("core.app_context.set_retry_logging_verbosity"):
+            ctx = create_app_context(defer_startup=True)
+            ninja = ctx.poe_ninja
+
+            # First price check lands before detection finishes
+            assert ninja.get_currency_price("Divine Orb") == (150.0, "poe.ninja currency")
+            assert ninja.ensure_divine_rate() == 150.0
+            mock_price_service.return_value.clear_cache.assert_not_called()
+
+            release.set()
+            assert ctx.wait_for_startup(timeout=5)
+
+        assert ninja.league == "NewLeague"
+        mock_price_service.return_value.clear_cache.assert_called_once()
+        # Warm-up refilled the rate from the new league, not the cached 150c
+        assert ninja.divine_chaos_rate == 90.0
+        assert ninja.get_currency_price("Divine Orb") == (90.0, "poe.ninja currency")
+
+    @patch("core.app_context.Config")
+    def test_background_failures_are_logged_not_raised(self, mock_config_class):
+        """Network errors in deferred startup keep the configured league."""
+        mock_config, mock_game_cfg = self._poe1_config("FallbackLeague")
+        mock_config_class.return_value = mock_config
+
+        with patch("core.app_context.ItemParser"), \
+             patch("core.app_context.Database"), \
+             patch("core.app_context.PoeNinjaAPI") as mock_ninja, \
+             patch("core.app_context.PoeWatchAPI"), \
+             patch("core.app_context.PoeTradeClient"), \
+             patch("core.app_context.TradeApiSource"), \
+             patch("core.app_context.RareItemEvaluator"), \
+             patch("core.app_context.PriceService"), \
+             patch("core.app_context.MultiSourcePriceService"), \
+             patch("core.app_context.ExistingServiceAdapter"), \
+             patch("core.app_context.UndercutPriceSource"), \
+             patch("core.app_context.set_active_policy_from_dict"), \
+             patch("core.app_context.set_retry_logging_verbosity"):
+            ninja = mock_ninja.return_value
+            ninja.detect_current_league.side_effect = requests.RequestException("offline")
+            ninja.ensure_divine_rate.side_effect = requests.RequestException("offline")
+
+            ctx = create_app_context(defer_startup=True)
+            assert ctx.wait_for_startup(timeout=5)
+
+        assert mock_game_cfg.league == "FallbackLeague"
+        mock_config.set_game_config.assert_not_called()
+
+    def test_wait_for_startup_without_deferred_work(self):
+        """A context without a startup thread is immediately ready."""
+        ctx = AppContext(
+            config=Mock(),
+            parser=Mock(),
+            db=Mock(),
+            poe_ninja=None,
+            poe2_ninja=None,
+            poe_watch=None,
+            price_service=Mock(),
+        )
+        assert ctx.wait_for_startup(timeout=0) is True
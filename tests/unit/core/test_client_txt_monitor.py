@@ -1,5 +1,9 @@
 """Tests for core/client_txt_monitor.py - Client.txt log monitoring."""
 
+import sys
+import threading
+import time
+
 import pytest
 from datetime import datetime
 from pathlib import Path
@@ -518,3 +522,145 @@ class TestPathDetection:
         with patch.object(Path, "exists", return_value=False):
             result = detect_client_txt_path()
             assert result is None
+
+
+# =============================================================================
+# Tailing Tests
+# =============================================================================
+
+
+class TestTailing:
+    """Tests for chunked tailing, prefiltering and rotation handling."""
+
+    ZONE_LINE = "2024/01/15 12:34:56 123456 [INFO Client 1234] : You have entered {}.\n"
+
+    def test_prefilter_skips_regex_for_irrelevant_lines(self, tmp_path):
+        """Only lines containing a marker should reach the regex parser."""
+        log_path = tmp_path / "Client.txt"
+        log_path.write_text(
+            "2024/01/15 12:34:50 123456 [DEBUG Client 1234] Got Instance Details\n"
+            "2024/01/15 12:34:51 123456 [INFO Client 1234] Connecting to instance\n"
+            + self.ZONE_LINE.format("Glacier Map")
+        )
+        monitor = ClientTxtMonitor(log_path=log_path)
+
+        with patch.object(
+            monitor, "_parse_log_line", wraps=monitor._parse_log_line
+        ) as parse:
+            monitor._check_for_new_lines()
+
+        assert monitor.lines_processed == 3
+        assert parse.call_count == 1
+        assert monitor.get_last_zone() == "Glacier Map"
+
+    def test_reads_in_bounded_chunks(self, tmp_path):
+        """Lines split across chunk boundaries should be reassembled."""
+        log_path = tmp_path / "Client.txt"
+        filler = "2024/01/15 12:00:00 123456 [DEBUG Client 1234] filler\n" * 50
+        log_path.write_text(filler + self.ZONE_LINE.format("Strand Map"))
+
+        events = []
+        monitor = ClientTxtMonitor(log_path=log_path, on_zone_change=events.append)
+
+        with patch("core.client_txt_monitor.READ_CHUNK_SIZE", 37):
+            monitor._check_for_new_lines()
+
+        assert [e.zone_name for e in events] == ["Strand Map"]
+        assert monitor.lines_processed == 51
+        assert monitor._last_position == log_path.stat().st_size
+
+    def test_partial_line_completed_on_next_read(self, tmp_path):
+        """An unterminated line should be processed once its newline arrives."""
+        log_path = tmp_path / "Client.txt"
+        line = self.ZONE_LINE.format("Celestial Hideout")
+        log_path.write_text(line[:30])
+
+        events = []
+        monitor = ClientTxtMonitor(log_path=log_path, on_zone_change=events.append)
+        monitor._check_for_new_lines()
+        assert events == []
+
+        with open(log_path, "a") as f:
+            f.write(line[30:])
+        monitor._check_for_new_lines()
+
+        assert [e.zone_name for e in events] == ["Celestial Hideout"]
+        monitor.cleanup()
+
+    def test_keeps_file_handle_open(self, tmp_path):
+        """The same handle should be reused across checks."""
+        log_path = tmp_path / "Client.txt"
+        log_path.write_text(self.ZONE_LINE.format("Map One"))
+
+        monitor = ClientTxtMonitor(log_path=log_path)
+        monitor._check_for_new_lines()
+        handle = monitor._file
+
+        with open(log_path, "a") as f:
+            f.write(self.ZONE_LINE.format("Map Two"))
+        monitor._check_for_new_lines()
+
+        assert handle is not None
+        assert monitor._file is handle
+        assert monitor.get_last_zone() == "Map Two"
+        monitor.cleanup()
+        assert monitor._file is None
+
+    def test_handles_rotation(self, tmp_path):
+        """A replaced log file should be reopened and read from the start."""
+        log_path = tmp_path / "Client.txt"
+        log_path.write_text(self.ZONE_LINE.format("Old Map") * 3)
+
+        monitor = ClientTxtMonitor(log_path=log_path)
+        monitor._check_for_new_lines()
+        assert monitor.get_last_zone() == "Old Map"
+
+        # Rotate: move old file away and create a fresh one
+        log_path.rename(tmp_path / "Client.txt.1")
+        log_path.write_text(self.ZONE_LINE.format("New Hideout"))
+        monitor._check_for_new_lines()
+
+        assert monitor.get_last_zone() == "New Hideout"
+        assert monitor._last_position == log_path.stat().st_size
+        monitor.cleanup()
+
+    def test_polling_fallback_when_inotify_disabled(self, tmp_path):
+        """Monitor should use polling when inotify is disabled."""
+        log_path = tmp_path / "Client.txt"
+        log_path.write_text("")
+        monitor = ClientTxtMonitor(log_path=log_path, use_inotify=False, poll_interval=0.05)
+
+        monitor.start_monitoring()
+        try:
+            assert monitor.tail_mode == "polling"
+            assert monitor.get_stats()["tail_mode"] == "polling"
+        finally:
+            monitor.stop_monitoring()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_detects_append(self, tmp_path):
+        """inotify mode should pick up appended zone lines."""
+        log_path = tmp_path / "Client.txt"
+        log_path.write_text("")
+
+        detected = threading.Event()
+        monitor = ClientTxtMonitor(
+            log_path=log_path,
+            on_zone_change=lambda e: detected.set(),
+            poll_interval=5.0,
+        )
+        monitor.start_monitoring()
+        try:
+            deadline = time.time() + 2.0
+            while monitor._watcher is None and time.time() < deadline:
+                time.sleep(0.01)
+            if monitor.tail_mode != "inotify":
+                pytest.skip("inotify unavailable in this environment")
+
+            with open(log_path, "a") as f:
+                f.write(self.ZONE_LINE.format("Glacier Map"))
+
+            # Well under poll_interval, so the wake-up came from inotify
+            assert detected.wait(timeout=2.0)
+        finally:
+            monitor.stop_monitoring()
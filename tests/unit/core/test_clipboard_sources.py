@@ -0,0 +1,166 @@
+"""Tests for core/clipboard_sources.py and push-based ClipboardMonitor usage."""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, List, Optional
+
+import pytest
+
+from core.clipboard_monitor import ClipboardMonitor
+from core.clipboard_sources import (
+    ClipboardSource,
+    PollingClipboardSource,
+    X11SelectionClipboardSource,
+    create_clipboard_source,
+)
+
+pytestmark = pytest.mark.unit
+
+
+ITEM_TEXT = """Item Class: Rings
+Rarity: Rare
+Storm Loop
+Ruby Ring
+--------
+Item Level: 84"""
+
+
+class FakePushSource(ClipboardSource):
+    """Push source driven manually by the test."""
+
+    name = "fake"
+    push_based = True
+
+    def __init__(self, text: str = ""):
+        self.text = text
+        self.on_change: Optional[Callable[[str], None]] = None
+        self.stopped = False
+
+    def start(self, on_change):
+        self.on_change = on_change
+        return True
+
+    def stop(self):
+        self.stopped = True
+        self.on_change = None
+
+    def read(self):
+        return self.text
+
+    def copy(self, text: str) -> None:
+        self.text = text
+        if self.on_change:
+            self.on_change(text)
+
+
+class TestPollingClipboardSource:
+    def test_delivers_reads_until_stopped(self):
+        reads: List[str] = []
+        got_two = threading.Event()
+
+        def on_change(text):
+            reads.append(text)
+            if len(reads) >= 2:
+                got_two.set()
+
+        source = PollingClipboardSource(lambda: "abc", poll_interval=0.01)
+        assert source.start(on_change) is True
+        assert got_two.wait(timeout=1.0)
+        source.stop()
+
+        assert set(reads) == {"abc"}
+        assert source._thread is None
+
+    def test_start_twice_returns_false(self):
+        source = PollingClipboardSource(lambda: "", poll_interval=0.01)
+        assert source.start(lambda t: None) is True
+        assert source.start(lambda t: None) is False
+        source.stop()
+
+
+class TestMonitorWithPushSource:
+    def test_start_uses_source_without_thread(self):
+        source = FakePushSource()
+        monitor = ClipboardMonitor(source=source)
+
+        assert monitor.start_monitoring() is True
+        assert monitor.is_running is True
+        assert monitor._monitor_thread is None
+        assert source.on_change is not None
+
+        monitor.stop_monitoring()
+        assert source.stopped is True
+        assert monitor.is_running is False
+
+    def test_on_item_detected_contract_preserved(self):
+        detected: List[str] = []
+        source = FakePushSource()
+        monitor = ClipboardMonitor(on_item_detected=detected.append, source=source)
+        monitor.start_monitoring()
+
+        source.copy("not an item")
+        source.copy(ITEM_TEXT)
+        source.copy(ITEM_TEXT)  # Same content again - ignored
+
+        assert detected == [ITEM_TEXT]
+        assert monitor.items_detected == 1
+        assert monitor.clipboard_reads == 3
+        monitor.stop_monitoring()
+
+    def test_callback_error_does_not_propagate(self):
+        def boom(text):
+            raise RuntimeError("callback failed")
+
+        source = FakePushSource()
+        monitor = ClipboardMonitor(on_item_detected=boom, source=source)
+        monitor.start_monitoring()
+
+        source.copy(ITEM_TEXT)
+
+        assert monitor.items_detected == 1
+        monitor.stop_monitoring()
+
+    def test_check_clipboard_now_reads_from_source(self):
+        monitor = ClipboardMonitor(source=FakePushSource(ITEM_TEXT))
+        assert monitor.check_clipboard_now() == ITEM_TEXT
+
+    def test_failed_source_start(self):
+        source = FakePushSource()
+        source.start = lambda on_change: False
+        monitor = ClipboardMonitor(source=source)
+
+        assert monitor.start_monitoring() is False
+        assert monitor.is_running is False
+
+    def test_stats_report_source(self):
+        assert ClipboardMonitor(source=FakePushSource()).get_stats()["source"] == "fake"
+        assert ClipboardMonitor().get_stats()["source"] == "polling"
+
+
+class TestCreateClipboardSource:
+    def test_falls_back_to_polling_without_display(self, monkeypatch):
+        monkeypatch.delenv("DISPLAY", raising=False)
+        source = create_clipboard_source(lambda: "", poll_interval=0.2)
+
+        assert isinstance(source, PollingClipboardSource)
+        assert source.poll_interval == 0.2
+
+    def test_prefers_x11_when_available(self, monkeypatch):
+        monkeypatch.setattr(
+            X11SelectionClipboardSource, "is_available", classmethod(lambda cls: True)
+        )
+        source = create_clipboard_source(lambda: "")
+        assert isinstance(source, X11SelectionClipboardSource)
+        assert source.push_based is True
+
+    def test_prefer_push_false_forces_polling(self, monkeypatch):
+        monkeypatch.setattr(
+            X11SelectionClipboardSource, "is_available", classmethod(lambda cls: True)
+        )
+        source = create_clipboard_source(lambda: "", prefer_push=False)
+        assert isinstance(source, PollingClipboardSource)
+
+    def test_x11_unavailable_without_display(self, monkeypatch):
+        monkeypatch.delenv("DISPLAY", raising=False)
+        assert X11SelectionClipboardSource.is_available() is False
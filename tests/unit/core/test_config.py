@@ -6,6 +6,7 @@ Unit tests for core.config module (finalized + isolated)
 
 import pytest
 import json
+import threading
 import uuid
 from pathlib import Path
 
@@ -361,6 +362,28 @@ class TestConfigPersistence:
         cfg2 = Config(path)
         assert cfg2.min_value_chaos == 75.0
 
+    def test_concurrent_saves_keep_every_change(self, tmp_path):
+        """A background league update and GUI settings saves don't clobber each other."""
+        path = get_unique_config_path(tmp_path)
+        cfg = Config(path)
+        game_cfg = cfg.get_game_config(GameVersion.POE1)
+
+        def detect_league():
+            for i in range(50):
+                game_cfg.league = f"League {i}"
+                cfg.set_game_config(game_cfg)
+
+        thread = threading.Thread(target=detect_league)
+        thread.start()
+        for i in range(50):
+            cfg.min_value_chaos = float(i)
+        thread.join(10.0)
+
+        reloaded = Config(path)
+        assert reloaded.get_game_config(GameVersion.POE1).league == "League 49"
+        assert reloaded.min_value_chaos == 49.0
+        assert not path.with_name(path.name + ".tmp").exists()
+
 
 # -------------------------
 # Utility Tests
@@ -891,6 +914,23 @@ class TestCrossSourceArbitration:
         # Should not crash
         assert isinstance(cfg.enabled_sources, dict)
 
+    def test_price_source_limits_default(self, tmp_path):
+        cfg = Config(get_unique_config_path(tmp_path))
+        assert cfg.price_source_limits == {"default": {"max_concurrent": 2, "deadline_s": 20.0}}
+
+    def test_price_source_limits_override_and_clamp(self, tmp_path):
+        cfg = Config(get_unique_config_path(tmp_path))
+        cfg.data["pricing"]["source_limits"] = {
+            "poe.ninja": {"max_concurrent": 100, "deadline_s": 0.1},
+            "suggested_undercut": {"max_concurrent": None, "deadline_s": None},
+            "broken": {"max_concurrent": "many"},
+        }
+        limits = cfg.price_source_limits
+        assert limits["default"] == {"max_concurrent": 2, "deadline_s": 20.0}
+        assert limits["poe.ninja"] == {"max_concurrent": 16, "deadline_s": 1.0}
+        assert limits["suggested_undercut"] == {"max_concurrent": None, "deadline_s": None}
+        assert "broken" not in limits
+
 
 # -------------------------
 # Stash Settings Tests
@@ -968,6 +1008,21 @@ class TestAISettings:
         cfg.ai_max_tokens = 5000  # Above max
         assert cfg.ai_max_tokens == 2000
 
+    def test_ai_response_cache_defaults(self, tmp_path):
+        cfg = Config(get_unique_config_path(tmp_path))
+        assert cfg.ai_response_cache_enabled is True
+        assert cfg.ai_response_cache_ttl_hours == 168
+
+    def test_ai_response_cache_setters(self, tmp_path):
+        cfg = Config(get_unique_config_path(tmp_path))
+        cfg.ai_response_cache_enabled = False
+        assert cfg.ai_response_cache_enabled is False
+
+        cfg.ai_response_cache_ttl_hours = 0  # Below min
+        assert cfg.ai_response_cache_ttl_hours == 1
+        cfg.ai_response_cache_ttl_hours = 10000  # Above max
+        assert cfg.ai_response_cache_ttl_hours == 720
+
     def test_ai_timeout_default(self, tmp_path):
         cfg = Config(get_unique_config_path(tmp_path))
         # Default is 30 for non-ollama
@@ -854,3 +854,39 @@ class TestDamagePatterns:
 
         assert len(result1.mod_impacts) == 1
         assert len(result2.mod_impacts) == 1
+
+
+# ============================================================================
+# Batch DPS Tests
+# ============================================================================
+
+class TestCalculateDpsPercentBatch:
+    """Batch DPS estimates must agree with calculate_impact."""
+
+    MOD_LISTS = [
+        ["25% increased Fire Damage", "15% increased Cast Speed"],
+        ["Adds 10 to 20 Physical Damage", "12% increased Attack Speed"],
+        ["+30% to Global Critical Strike Multiplier", "20% increased Spell Damage"],
+        ["10% more Damage", "+50 to maximum Life"],
+        [],
+    ]
+
+    @pytest.mark.parametrize("stats", [
+        DPSStats(combined_dps=100000, fire_dps=80000, physical_dps=20000,
+                 primary_damage_type=DamageType.FIRE, is_spell_build=True,
+                 is_crit_build=True, crit_chance=60.0),
+        DPSStats(combined_dps=50000, physical_dps=50000,
+                 primary_damage_type=DamageType.PHYSICAL, is_attack_build=True),
+    ])
+    def test_parity_with_scalar(self, stats):
+        calc = DPSImpactCalculator(stats)
+        batch = calc.calculate_dps_percent_batch(self.MOD_LISTS)
+
+        assert batch.shape == (len(self.MOD_LISTS),)
+        for i, mods in enumerate(self.MOD_LISTS):
+            assert batch[i] == pytest.approx(calc.calculate_impact(mods).total_dps_percent)
+
+    def test_no_dps_data_returns_zeros(self):
+        calc = DPSImpactCalculator(DPSStats())
+        batch = calc.calculate_dps_percent_batch(self.MOD_LISTS)
+        assert not batch.any()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import fields
+
 import pytest
 from core.item_parser import ItemParser, ParsedItem
 
@@ -216,7 +218,7 @@ class TestFromStashItem:
 
         item = ParsedItem.from_stash_item(stash_item)
 
-        assert item.sockets == "RGBWWW"
+        assert item.sockets == "R-G-B-W-W-W"
         assert item.links == 6
 
     def test_with_multiple_socket_groups(self):
@@ -234,7 +236,7 @@ class TestFromStashItem:
 
         item = ParsedItem.from_stash_item(stash_item)
 
-        assert item.sockets == "RG-BW"
+        assert item.sockets == "R-G B-W"
         assert item.links == 2
 
     def test_with_enchants(self):
@@ -530,6 +532,82 @@ Hubris Circlet
     assert "Doom Visor" in names or "Hubris Circlet" in names
 
 
+def test_parse_batch_matches_single_parse():
+    parser = ItemParser()
+
+    blocks = [
+        """Item Class: Helmets
+Rarity: Rare
+Doom Visor
+Hubris Circlet
+--------
+Quality: +20%
+Energy Shield: 120
+--------
+Requirements:
+Level: 69
+Int: 154
+--------
+Sockets: B-B-B B
+--------
+Item Level: 86
+--------
++1 to Level of Socketed Minion Gems (enchant)
+--------
++25% to Lightning Resistance (implicit)
+--------
++95 to maximum Energy Shield
++42% to Fire Resistance
+--------
+Shaper Item
+Corrupted""",
+        """Item Class: Stackable Currency
+Rarity: Currency
+Divine Orb
+--------
+Stack Size: 7/20""",
+        """Rarity: Unique
+Shavronne's Wrappings
+Occultist's Vestment
+--------
+Chaos Damage does not bypass Energy Shield""",
+    ]
+
+    items = parser.parse_batch("\n\n".join(blocks))
+
+    assert len(items) == len(blocks)
+    for batched, block in zip(items, blocks):
+        single = parser.parse(block)
+        for field_name in (f.name for f in fields(ParsedItem)):
+            if field_name != "raw_text":
+                assert getattr(batched, field_name) == getattr(single, field_name), field_name
+        assert batched.raw_text == block
+
+    # "Item Class:" of the next item must not leak in as a mod
+    assert not any(mod.startswith("Item Class:") for mod in items[0].explicits)
+    assert items[0].explicits[-1] == "+42% to Fire Resistance"
+
+
+def test_parse_batch_skips_unparseable_blocks():
+    parser = ItemParser()
+
+    items = parser.parse_batch("garbage before\nRarity: Rare\n\nRarity: Normal\nIron Ring")
+
+    assert [item.name for item in items] == ["Iron Ring"]
+
+
+def test_parse_batch_compact_freezes_and_interns_mods():
+    parser = ItemParser()
+    block = "Rarity: Rare\nDoom Visor\nHubris Circlet\n--------\n+42% to Fire Resistance\n"
+
+    first, second = parser.parse_batch(block * 2, compact=True)
+
+    assert first.explicits == ("+42% to Fire Resistance",)
+    assert first.explicits[0] is second.explicits[0]
+    assert isinstance(first.influences, tuple)
+    assert not hasattr(first, "__dict__")
+
+
 # --------------------------------------
 # Cluster Jewel parsing
 # --------------------------------------
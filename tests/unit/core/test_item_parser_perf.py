@@ -47,3 +47,29 @@ def test_item_parser_basic_throughput_smoke():
     # Generous threshold (in seconds) to keep this stable on CI.
     # This primarily guards against O(N^2) mistakes or re-compiling regexes per line.
     assert elapsed < 1.5, f"Parsing {iterations} items took too long: {elapsed:.3f}s"
+
+
+def test_item_parser_batch_throughput_smoke():
+    """parse_batch over a large buffer should stay linear in its size."""
+    parser = ItemParser()
+
+    sample = (
+        "Item Class: Helmets\n"
+        "Rarity: RARE\n"
+        "Doom Visor\n"
+        "Hubris Circlet\n"
+        "--------\n"
+        "Item Level: 86\n"
+        "--------\n"
+        "+95 to maximum Energy Shield\n"
+        "+42% to Fire Resistance\n"
+    )
+    bulk = "\n".join([sample] * 5000)
+
+    start = time.perf_counter()
+    items = parser.parse_batch(bulk)
+    elapsed = time.perf_counter() - start
+
+    assert len(items) == 5000
+    assert items[-1].explicits == ["+95 to maximum Energy Shield", "+42% to Fire Resistance"]
+    assert elapsed < 3.0, f"Batch parsing 5000 items took too long: {elapsed:.3f}s"
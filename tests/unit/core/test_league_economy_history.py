@@ -421,6 +421,81 @@ Settlers;2024-07-26;Mageblood;Heavy Belt;150000.0
         # Should return True (no error, just no data)
         assert result is True
 
+    def test_currency_summary_values(self, service, sample_currency_csv):
+        """Single-pass summary matches the per-currency statistics."""
+        service.import_currency_csv(sample_currency_csv, "Settlers")
+        service._aggregate_currency_summary("Settlers")
+
+        divine = service.get_currency_summary("Settlers", ["Divine Orb"])[0]
+
+        assert divine["start_value"] == 180.5
+        assert divine["end_value"] == 160.0
+        assert divine["min_value"] == 160.0
+        assert divine["max_value"] == 180.5
+        assert divine["avg_value"] == pytest.approx((180.5 + 175.2 + 160.0) / 3)
+        assert divine["data_points"] == 3
+        assert divine["peak_date"].startswith("2024-07-26")
+
+    def test_top_items_ranked_by_average(self, service):
+        """Top items get consecutive ranks by average value."""
+        csv_lines = ["League;Date;Name;BaseType;Value"]
+        for i in range(12):
+            csv_lines.append(f"Settlers;2024-07-{10+i:02d};Mageblood;Heavy Belt;150000.0")
+            csv_lines.append(f"Settlers;2024-07-{10+i:02d};Headhunter;Leather Belt;40000.0")
+        service.import_item_csv("\n".join(csv_lines), "Settlers")
+
+        service._aggregate_top_items("Settlers")
+        items = service.get_top_items_summary("Settlers")
+
+        assert [(i["rank"], i["item_name"]) for i in items] == [(1, "Mageblood"), (2, "Headhunter")]
+
+    def test_ensure_aggregated_on_first_access(self, service, sample_currency_csv):
+        """Summaries are materialised without an explicit aggregate call."""
+        service.import_currency_csv(sample_currency_csv, "Settlers")
+        assert not service.is_league_aggregated("Settlers")
+
+        assert service.ensure_league_aggregated("Settlers") is True
+
+        assert service.is_league_aggregated("Settlers")
+
+    def test_ensure_aggregated_refreshes_after_import(self, service, sample_currency_csv):
+        """New raw rows make the summary stale and it is recomputed."""
+        service.import_currency_csv(sample_currency_csv, "Settlers")
+        service.ensure_league_aggregated("Settlers")
+
+        service.import_currency_csv(
+            "League;Date;Get;Pay;Value;Confidence\nSettlers;2024-08-10;Divine Orb;Chaos Orb;150.0;High\n",
+            "Settlers",
+        )
+        service.ensure_league_aggregated("Settlers")
+
+        divine = service.get_currency_summary("Settlers", ["Divine Orb"])[0]
+        assert divine["end_value"] == 150.0
+        assert divine["data_points"] == 4
+
+    def test_ensure_aggregated_without_data(self, service):
+        """A league without rows has nothing to materialise."""
+        assert service.ensure_league_aggregated("NonExistentLeague") is False
+
+    def test_get_league_overview(self, service, sample_currency_csv):
+        """Overview bundles currencies and the date range."""
+        service.import_currency_csv(sample_currency_csv, "Settlers")
+
+        overview = service.get_league_overview("Settlers", ["Divine Orb"])
+
+        assert overview.league == "Settlers"
+        assert [c["currency_name"] for c in overview.currencies] == ["Divine Orb"]
+        assert overview.top_items == []
+        assert overview.summary["first_date"].startswith("2024-07-26")
+
+    def test_get_league_overview_unknown_league(self, service):
+        """Unknown leagues give an empty overview."""
+        overview = service.get_league_overview("NonExistentLeague")
+
+        assert overview.currencies == []
+        assert overview.top_items == []
+        assert overview.summary is None
+
 
 class TestFetchOperations:
     """Tests for poe.ninja fetch operations (mocked)."""
@@ -9,7 +9,13 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch
 
-from core.logging_setup import setup_logging
+from core.logging_setup import (
+    HotPathLogger,
+    HotPathTrace,
+    parse_level_overrides,
+    setup_logging,
+    shutdown_logging,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -73,3 +79,78 @@ def test_setup_logging_can_be_called_multiple_times_safely(tmp_path):
         # Should still have exactly 2 handlers (old ones removed)
         root_logger = logging.getLogger()
         assert len(root_logger.handlers) == 2
+
+
+def test_setup_logging_queue_mode_writes_on_listener_thread(tmp_path):
+    """Queue mode installs one QueueHandler and the listener writes the file"""
+    from logging.handlers import QueueHandler
+
+    root_logger = logging.getLogger()
+    try:
+        with patch('core.logging_setup.Path.home', return_value=tmp_path):
+            setup_logging(use_queue=True)
+
+        assert len(root_logger.handlers) == 1
+        assert isinstance(root_logger.handlers[0], QueueHandler)
+
+        logging.getLogger("test.queue").info("queued message")
+        shutdown_logging()
+
+        log_text = (tmp_path / ".poe_price_checker" / "app.log").read_text(encoding="utf-8")
+        assert "queued message" in log_text
+    finally:
+        shutdown_logging()
+        root_logger.handlers.clear()
+
+
+def test_setup_logging_applies_level_overrides(tmp_path, monkeypatch):
+    """Per-subsystem overrides come from the argument and the environment"""
+    monkeypatch.setenv("POE_LOG_LEVELS", "test.sub.env=ERROR, bogus")
+    with patch('core.logging_setup.Path.home', return_value=tmp_path):
+        setup_logging(level_overrides={"test.sub.arg": "WARNING", "test.sub.bad": "NOPE"})
+
+    assert logging.getLogger("test.sub.arg").level == logging.WARNING
+    assert logging.getLogger("test.sub.env").level == logging.ERROR
+    assert logging.getLogger("test.sub.bad").level == logging.NOTSET
+
+
+def test_parse_level_overrides_ignores_malformed_entries():
+    assert parse_level_overrides("a=debug,b,=INFO,c = warning") == {"a": "DEBUG", "c": "WARNING"}
+
+
+class TestHotPathLogger:
+    """Sampled per-check records."""
+
+    def test_samples_one_in_n_at_info(self, caplog):
+        hot = HotPathLogger("test.hot.sampled", sample_rate=0.25)
+        caplog.set_level(logging.INFO, logger="test.hot.sampled")
+
+        for n in range(8):
+            trace = hot.trace("check", n=n)
+            trace.add(price=1.0)
+            trace.emit(decision="x")
+
+        records = [r for r in caplog.records if r.name == "test.hot.sampled"]
+        assert [r.fields["n"] for r in records] == [0, 4]
+        assert records[0].event == "check"
+        assert {"price", "decision", "elapsed_ms"} <= set(records[0].fields)
+        assert "decision='x'" in records[0].getMessage()
+
+    def test_unsampled_traces_are_free_when_debug_disabled(self):
+        hot = HotPathLogger("test.hot.quiet", sample_rate=0.5)
+        logging.getLogger("test.hot.quiet").setLevel(logging.INFO)
+
+        hot.trace("check")  # sampled
+        trace = hot.trace("check")
+
+        assert not isinstance(trace, HotPathTrace)
+        trace.add(x=1)
+        trace.emit()
+
+    def test_unsampled_traces_emit_at_debug(self, caplog):
+        hot = HotPathLogger("test.hot.debug", sample_rate=0)
+        caplog.set_level(logging.DEBUG, logger="test.hot.debug")
+
+        hot.trace("check", item="Goldrim").emit()
+
+        assert [r.levelno for r in caplog.records if r.name == "test.hot.debug"] == [logging.DEBUG]
@@ -6,9 +6,11 @@ from pathlib import Path
 from unittest.mock import patch
 
 from core.pob_local_scanner import (
+    DEFAULT_INDEX_PATH,
     LocalBuildInfo,
     PoBLocalScanner,
     get_pob_scanner,
+    read_build_header,
     reset_scanner,
 )
 
@@ -493,6 +495,119 @@ class TestPoBLocalScannerSearch:
         assert results == []
 
 
+# =============================================================================
+# Build Index Tests
+# =============================================================================
+
+
+def _write_build(path: Path, class_name: str, ascendancy: str, level: int, skill: str) -> None:
+    path.write_text(
+        f"""<PathOfBuilding>
+            <Build className="{class_name}" ascendClassName="{ascendancy}"
+                   level="{level}" mainSocketGroup="{skill}"/>
+        </PathOfBuilding>"""
+    )
+
+
+class TestPoBLocalScannerIndex:
+    """Tests for the persistent, incremental build index."""
+
+    @pytest.fixture
+    def builds_folder(self, tmp_path):
+        folder = tmp_path / "Builds"
+        folder.mkdir()
+        _write_build(folder / "Cyclone.xml", "Marauder", "Berserker", 92, "Cyclone")
+        _write_build(folder / "Lacerate.xml", "Duelist", "Champion", 85, "Lacerate")
+        _write_build(folder / "Frostbolt.xml", "Witch", "Occultist", 70, "Frostbolt")
+        return folder
+
+    def test_scan_loads_headers(self, builds_folder):
+        """Scanning reads headers, so builds come back loaded."""
+        scanner = PoBLocalScanner(custom_path=builds_folder)
+        builds = {b.file_name: b for b in scanner.scan_builds()}
+
+        assert builds["Cyclone.xml"]._is_loaded is True
+        assert builds["Cyclone.xml"]._ascendancy == "Berserker"
+        assert builds["Lacerate.xml"]._level == 85
+
+    def test_rescan_only_reads_changed_files(self, builds_folder):
+        """Unchanged files are served from the index; changed/new/deleted are synced."""
+        scanner = PoBLocalScanner(custom_path=builds_folder)
+        scanner.scan_builds()
+
+        _write_build(builds_folder / "Cyclone.xml", "Marauder", "Berserker", 95, "Cyclone of Tumult")
+        _write_build(builds_folder / "New.xml", "Templar", "Hierophant", 80, "Arc")
+        (builds_folder / "Frostbolt.xml").unlink()
+
+        with patch("core.pob_local_scanner.read_build_header", wraps=read_build_header) as reader:
+            builds = {b.file_name: b for b in scanner.scan_builds(force_refresh=True)}
+
+        assert sorted(Path(c.args[0]).name for c in reader.call_args_list) == ["Cyclone.xml", "New.xml"]
+        assert set(builds) == {"Cyclone.xml", "Lacerate.xml", "New.xml"}
+        assert builds["Cyclone.xml"]._level == 95
+
+    def test_index_persists_across_scanners(self, builds_folder, tmp_path):
+        """A new scanner with the same index file reads nothing."""
+        index_path = tmp_path / "index.db"
+        PoBLocalScanner(custom_path=builds_folder, index_path=index_path).scan_builds()
+
+        scanner = PoBLocalScanner(custom_path=builds_folder, index_path=index_path)
+        with patch("core.pob_local_scanner.read_build_header") as reader:
+            builds = scanner.scan_builds()
+
+        reader.assert_not_called()
+        assert len(builds) == 3
+        assert all(b._is_loaded for b in builds)
+
+    def test_query_builds_filters(self, builds_folder):
+        """query_builds filters by class, ascendancy, level and skill."""
+        scanner = PoBLocalScanner(custom_path=builds_folder)
+        scanner.scan_builds()
+
+        with patch("core.pob_local_scanner.os.scandir") as scandir:
+            assert [b.file_name for b in scanner.query_builds(class_name="witch")] == ["Frostbolt.xml"]
+            assert [b.file_name for b in scanner.query_builds(ascendancy="Champion")] == ["Lacerate.xml"]
+            assert {b.file_name for b in scanner.query_builds(min_level=85)} == {"Cyclone.xml", "Lacerate.xml"}
+            assert [b.file_name for b in scanner.query_builds(max_level=80)] == ["Frostbolt.xml"]
+            assert [b.file_name for b in scanner.query_builds(main_skill="cyclone")] == ["Cyclone.xml"]
+            assert len(scanner.query_builds(limit=2)) == 2
+        scandir.assert_not_called()
+
+    def test_unreadable_file_indexed_as_not_loaded(self, builds_folder):
+        """Malformed files are listed but not loaded, and not re-read while unchanged."""
+        (builds_folder / "bad.xml").write_text("not valid xml <><><>")
+        scanner = PoBLocalScanner(custom_path=builds_folder)
+
+        builds = {b.file_name: b for b in scanner.scan_builds()}
+        assert builds["bad.xml"]._is_loaded is False
+
+        with patch("core.pob_local_scanner.read_build_header") as reader:
+            scanner.scan_builds(force_refresh=True)
+        reader.assert_not_called()
+
+    def test_header_read_stops_after_build_element(self, tmp_path):
+        """Only the header is parsed; the rest of the file is never read."""
+        path = tmp_path / "big.xml"
+        path.write_text(
+            '<PathOfBuilding buildName="Big">'
+            '<Build className="Ranger" ascendClassName="Deadeye" level="99" mainSocketGroup="TS"/>'
+            + "<Items>" + "x" * 200_000 + "<broken"
+        )
+
+        header = read_build_header(path)
+
+        assert header["build_name"] == "Big"
+        assert header["ascendancy"] == "Deadeye"
+        assert header["level"] == 99
+
+    def test_singleton_uses_persistent_index(self):
+        """The app-wide scanner persists its index."""
+        try:
+            assert get_pob_scanner()._index_path == DEFAULT_INDEX_PATH
+        finally:
+            reset_scanner()
+
+
 # =============================================================================
 # Singleton Functions Tests
 # =============================================================================
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+import time
 from typing import Any, Iterable, Mapping
 import pytest
 
@@ -8,6 +10,9 @@ from core.price_multi import (
     ExistingServiceAdapter,
     RESULT_COLUMNS,
     PriceSource,
+    SourceLimits,
+    SourceResult,
+    DEFAULT_MAX_WORKERS,
 )
 
 pytestmark = pytest.mark.unit
@@ -67,6 +72,33 @@ class ErrorSource(PriceSource):
         raise RuntimeError("boom")
 
 
+# --------------------------------------------------------
+# Slow source: blocks until released (or a delay passes)
+# --------------------------------------------------------
+
+class SlowSource(PriceSource):
+    """
+    A PriceSource that blocks until ``release`` is set or ``delay`` passes.
+    """
+
+    def __init__(self, name: str = "slow_source", delay: float = 5.0) -> None:
+        self.name = name
+        self.delay = delay
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.calls: list[str] = []
+
+    def check_item(self, item_text: str) -> Iterable[Mapping[str, Any]]:
+        self.calls.append(item_text)
+        self.started.set()
+        self.release.wait(self.delay)
+        return [{"item_name": item_text, "chaos_value": 1}]
+
+
+def _row(name: str) -> dict[str, Any]:
+    return {"item_name": name, "chaos_value": 5, "listing_count": 1}
+
+
 # --------------------------------------------------------
 # Tests
 # --------------------------------------------------------
@@ -173,3 +205,219 @@ def test_multi_source_aggregator_returns_empty_for_blank_input_and_does_not_call
     rows = svc.check_item("   ")
     assert rows == []
     assert source.calls == []
+
+
+def test_multi_source_records_per_source_spans_under_check() -> None:
+    from core.tracing import get_tracer
+
+    svc = MultiSourcePriceService(
+        sources=[FakeSource(name="fast", rows=[]), ErrorSource(name="broken")]
+    )
+    svc.check_item("some amulet")
+
+    stats = svc.get_timing_stats()
+    assert stats["price_source.fast"]["count"] == 1
+    assert stats["price_source.broken"]["errors"] == 1
+
+    trace = get_tracer().recent_traces(1)[0]
+    assert trace["name"] == "multi.check_item"
+    assert {child["name"] for child in trace["children"]} == {"price_source.fast", "price_source.broken"}
+
+
+# --------------------------------------------------------
+# Worker pool, deadlines, concurrency limits, streaming
+# --------------------------------------------------------
+
+def test_pool_is_reused_across_checks() -> None:
+    svc = MultiSourcePriceService(sources=[FakeSource("a", [_row("A")]), FakeSource("b", [_row("B")])])
+    svc.check_item("first")
+    executor = svc._executor
+    threads_before = threading.active_count()
+
+    for i in range(20):
+        svc.check_item(f"item {i}")
+
+    assert svc._executor is executor
+    assert threading.active_count() <= threads_before + svc._max_workers
+    svc.close()
+
+
+def test_sources_are_unlimited_unless_configured() -> None:
+    svc = MultiSourcePriceService(
+        sources=[FakeSource("a", []), FakeSource("b", [])],
+        source_limits={"a": SourceLimits(max_concurrent=3)},
+    )
+    assert svc._max_workers == DEFAULT_MAX_WORKERS
+    assert svc.get_source_limits()["b"] == SourceLimits()
+    assert SourceLimits().max_concurrent is None
+    assert set(svc._slots) == {"a"}
+
+
+def test_concurrent_checks_all_get_rows() -> None:
+    class TimedSource(FakeSource):
+        def check_item(self, item_text: str) -> Iterable[Mapping[str, Any]]:
+            time.sleep(0.05)
+            return [_row(item_text)]
+
+    for limits in (None, {"poe": SourceLimits(max_concurrent=1)}):
+        svc = MultiSourcePriceService(sources=[TimedSource("poe", [])], source_limits=limits)
+        results: dict[int, list[dict[str, Any]]] = {}
+
+        def run(i: int) -> None:
+            results[i] = svc.check_item(f"Divine Orb {i}")
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5.0)
+
+        assert sorted(results) == [0, 1, 2, 3]
+        for i, rows in results.items():
+            assert [r["item_name"] for r in rows] == [f"Divine Orb {i}"]
+        svc.close()
+
+
+def test_slow_source_deadline_bounds_check_latency() -> None:
+    fast = FakeSource("fast", [_row("Fast")])
+    slow = SlowSource("slow")
+    done: list[SourceResult] = []
+    svc = MultiSourcePriceService(
+        sources=[fast, slow], source_limits={"slow": SourceLimits(deadline_s=0.1)}
+    )
+
+    start = time.perf_counter()
+    rows = svc.check_item("ring", on_source_done=done.append)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.0
+    assert [r["source"] for r in rows] == ["fast"]
+    by_source = {r.source: r for r in done}
+    assert by_source["fast"].ok
+    assert by_source["slow"].timed_out
+    assert isinstance(by_source["slow"].error, TimeoutError)
+    slow.release.set()
+    svc.close()
+
+
+def test_call_deadline_caps_source_deadline() -> None:
+    slow = SlowSource("slow")
+    svc = MultiSourcePriceService(sources=[slow], default_limits=SourceLimits(deadline_s=10.0))
+
+    start = time.perf_counter()
+    results = list(svc.iter_check_item("ring", deadline_s=0.1))
+
+    assert time.perf_counter() - start < 1.0
+    assert results[0].timed_out
+    slow.release.set()
+    svc.close()
+
+
+def test_iter_check_item_streams_fast_sources_first() -> None:
+    slow = SlowSource("slow")
+    svc = MultiSourcePriceService(sources=[slow, FakeSource("fast", [_row("Fast")])])
+
+    stream = svc.iter_check_item("ring")
+    start = time.perf_counter()
+    first = next(stream)
+
+    assert first.source == "fast"
+    assert first.rows[0]["item_name"] == "Fast"
+    assert time.perf_counter() - start < 1.0
+    assert not slow.release.is_set()  # slow source still running
+
+    slow.release.set()
+    rest = list(stream)
+    assert [r.source for r in rest] == ["slow"]
+    assert rest[0].ok and rest[0].rows[0]["source"] == "slow"
+    svc.close()
+
+
+def test_failing_source_is_reported_without_delaying_others() -> None:
+    svc = MultiSourcePriceService(sources=[ErrorSource("broken"), FakeSource("fast", [_row("Fast")])])
+
+    results = {r.source: r for r in svc.iter_check_item("ring")}
+
+    assert isinstance(results["broken"].error, RuntimeError)
+    assert results["broken"].rows == []
+    assert results["fast"].ok
+    svc.close()
+
+
+def test_saturated_source_waits_for_a_slot_within_its_deadline() -> None:
+    slow = SlowSource("slow")
+    fast = FakeSource("fast", [_row("Fast")])
+    svc = MultiSourcePriceService(
+        sources=[slow, fast],
+        source_limits={"slow": SourceLimits(max_concurrent=1, deadline_s=0.05)},
+    )
+
+    # First check times out on slow, whose call keeps holding its only slot
+    svc.check_item("first")
+    assert slow.started.wait(1.0)
+
+    done: list[SourceResult] = []
+    start = time.perf_counter()
+    rows = svc.check_item("second", on_source_done=done.append)
+
+    assert time.perf_counter() - start < 0.5
+    assert [r["source"] for r in rows] == ["fast"]
+    waited = next(r for r in done if r.source == "slow")
+    assert waited.timed_out and "no free slot" in str(waited.error)
+    assert slow.calls == ["first"]
+
+    # Once the hung call returns, the next check gets the slot
+    slow.release.set()
+    done.clear()
+    svc.check_item("third", on_source_done=done.append)
+    assert "third" in slow.calls
+    assert next(r for r in done if r.source == "slow").ok
+    svc.close()
+
+
+def test_saturated_source_without_deadline_runs_when_slot_frees() -> None:
+    slow = SlowSource("slow")
+    svc = MultiSourcePriceService(sources=[slow], source_limits={"slow": SourceLimits(max_concurrent=1)})
+    first = threading.Thread(target=svc.check_item, args=("first",))
+    first.start()
+    assert slow.started.wait(1.0)
+
+    threading.Timer(0.1, slow.release.set).start()
+    rows = svc.check_item("second")
+
+    assert [r["item_name"] for r in rows] == ["second"]
+    first.join(5.0)
+    svc.close()
+
+
+def test_timed_out_queued_call_releases_its_slot() -> None:
+    blocker = SlowSource("blocker")
+    queued = FakeSource("queued", [_row("Q")])
+    svc = MultiSourcePriceService(
+        sources=[blocker, queued],
+        max_workers=1,
+        source_limits={"queued": SourceLimits(max_concurrent=1, deadline_s=0.05)},
+        default_limits=SourceLimits(deadline_s=0.05),
+    )
+
+    results = {r.source: r for r in svc.iter_check_item("ring")}
+    assert results["queued"].timed_out
+    assert queued.calls == []
+
+    blocker.release.set()
+    assert svc._slots["queued"].acquire(blocking=False)
+    svc._slots["queued"].release()
+    svc.close()
+
+
+def test_close_shuts_pool_down() -> None:
+    source = FakeSource("a", [_row("A")])
+    with MultiSourcePriceService(sources=[source]) as svc:
+        svc.check_item("ring")
+        executor = svc._executor
+
+    assert svc._executor is None
+    assert executor._shutdown
+    with pytest.raises(RuntimeError):
+        svc.check_item("ring")
+    svc.close()  # idempotent
@@ -3,7 +3,11 @@ Tests for price rankings module.
 """
 from __future__ import annotations
 
+import json
+import sqlite3
 import tempfile
+import threading
+import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -11,6 +15,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from core.price_rankings import (
+    CATEGORIES,
     RankedItem,
     CategoryRanking,
     PriceRankingCache,
@@ -29,10 +34,22 @@ from core.price_rankings import (
     print_ranking,
     print_trending,
 )
+from core.rankings import RankingStore, get_expiry_seconds
 
 pytestmark = pytest.mark.unit
 
 
+def _fill_cache(cache, updated_at, categories=CATEGORIES):
+    """Store an empty ranking for every category, all updated at ``updated_at``."""
+    for key in categories:
+        cache.set_ranking(CategoryRanking(
+            category=key,
+            display_name=key,
+            items=[],
+            updated_at=updated_at.isoformat(),
+        ))
+
+
 class TestRankedItem:
     """Tests for RankedItem dataclass."""
 
@@ -155,15 +172,20 @@ class TestPriceRankingCache:
         assert PriceRankingCache.CATEGORY_TO_API_TYPE["unique_armour"] == "UniqueArmour"
         assert PriceRankingCache.CATEGORY_TO_API_TYPE["divination_cards"] == "DivinationCard"
 
-    def test_cache_file_path_includes_league(self):
+    def test_database_in_cache_dir(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Settlers")
-            assert "settlers" in str(cache._cache_file).lower()
+            assert cache.store.db_path == Path(tmpdir) / "price_rankings.db"
+            assert cache.store.db_path.exists()
 
-    def test_cache_file_path_handles_spaces(self):
+    def test_leagues_stored_separately(self):
         with tempfile.TemporaryDirectory() as tmpdir:
-            cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Keepers of the Flame")
-            assert "keepers_of_the_flame" in str(cache._cache_file).lower()
+            settlers = PriceRankingCache(cache_dir=Path(tmpdir), league="Settlers")
+            keepers = PriceRankingCache(cache_dir=Path(tmpdir), league="Keepers of the Flame")
+            settlers.set_ranking(CategoryRanking(category="currency", display_name="Currency"))
+
+            assert settlers.get_ranking("currency") is not None
+            assert keepers.get_ranking("currency") is None
 
     def test_is_cache_valid_no_data(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -173,14 +195,21 @@ class TestPriceRankingCache:
     def test_is_cache_valid_fresh_data(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
-            cache._cache_metadata["last_updated"] = datetime.now(timezone.utc).isoformat()
+            _fill_cache(cache, datetime.now(timezone.utc))
             assert cache.is_cache_valid() is True
 
+    def test_is_cache_valid_needs_every_category(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
+            _fill_cache(cache, datetime.now(timezone.utc), [k for k in CATEGORIES if k != "vials"])
+            assert cache.is_cache_valid() is False
+            assert cache.get_stale_categories(list(CATEGORIES)) == ["vials"]
+
     def test_is_cache_valid_expired_data(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
             old_time = datetime.now(timezone.utc) - timedelta(days=CACHE_EXPIRY_DAYS + 1)
-            cache._cache_metadata["last_updated"] = old_time.isoformat()
+            _fill_cache(cache, old_time)
             assert cache.is_cache_valid() is False
 
     def test_get_cache_age_days(self):
@@ -192,7 +221,8 @@ class TestPriceRankingCache:
 
             # 2 days old
             old_time = datetime.now(timezone.utc) - timedelta(days=2)
-            cache._cache_metadata["last_updated"] = old_time.isoformat()
+            _fill_cache(cache, old_time, ["currency"])
+            _fill_cache(cache, datetime.now(timezone.utc), ["scarabs"])
             age = cache.get_cache_age_days()
             assert age is not None
             assert 1.9 < age < 2.1
@@ -209,29 +239,73 @@ class TestPriceRankingCache:
                 items=items,
                 updated_at=datetime.now(timezone.utc).isoformat(),
             )
-            cache._rankings["currency"] = ranking
-            cache._save_cache()
+            cache.set_ranking(ranking)
 
             # Create new cache instance and verify load
             cache2 = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
-            assert "currency" in cache2._rankings
-            assert cache2._rankings["currency"].items[0].name == "Test Item"
+            assert "currency" in cache2.get_all_rankings()
+            assert cache2.get_ranking("currency").items[0].name == "Test Item"
+            assert cache2.get_ranking("currency").updated_at == ranking.updated_at
+
+    def test_set_ranking_replaces_items(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
+            for names in (["A", "B", "C"], ["D"]):
+                cache.set_ranking(CategoryRanking(
+                    category="currency",
+                    display_name="Currency",
+                    items=[RankedItem(rank=i, name=n, chaos_value=1.0) for i, n in enumerate(names, start=1)],
+                ))
+
+            assert [item.name for item in cache.get_ranking("currency").items] == ["D"]
+
+    def test_imports_legacy_json_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            legacy = Path(tmpdir) / "price_rankings_keepers_of_the_flame.json"
+            ranking = CategoryRanking(
+                category="currency",
+                display_name="Currency",
+                items=[RankedItem(rank=1, name="Divine Orb", chaos_value=180.0, rarity="currency")],
+                updated_at=datetime.now(timezone.utc).isoformat(),
+            )
+            legacy.write_text(json.dumps({"metadata": {}, "rankings": [ranking.to_dict()]}))
+
+            cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Keepers of the Flame")
+
+            assert cache.get_ranking("currency").items[0].rarity == "currency"
+            assert cache.is_cache_valid("currency") is True
+            assert not legacy.exists()
 
     def test_clear_cache(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
 
             # Add data
-            cache._rankings["test"] = CategoryRanking(
+            cache.set_ranking(CategoryRanking(
                 category="test", display_name="Test", items=[]
-            )
-            cache._save_cache()
-            assert cache._cache_file.exists()
+            ))
+            assert cache.get_all_rankings()
 
             # Clear
             cache.clear_cache()
-            assert len(cache._rankings) == 0
-            assert not cache._cache_file.exists()
+            assert cache.get_all_rankings() == {}
+
+    def test_context_manager_closes_owned_store(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with PriceRankingCache(cache_dir=Path(tmpdir), league="Standard") as cache:
+                cache.set_ranking(CategoryRanking(category="test", display_name="Test", items=[]))
+
+            with pytest.raises(sqlite3.ProgrammingError):
+                cache.store.conn.execute("SELECT 1")
+
+    def test_close_leaves_shared_store_open(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = RankingStore(Path(tmpdir) / "rankings.db")
+            with PriceRankingCache(league="Standard", store=store):
+                pass
+
+            assert store.conn.execute("SELECT 1").fetchone()[0] == 1
+            store.close()
 
 
 class TestTop20Calculator:
@@ -326,12 +400,12 @@ class TestTop20Calculator:
 
             # Populate cache with fresh data
             items = [RankedItem(rank=1, name="Cached", chaos_value=100.0)]
-            cache._rankings["currency"] = CategoryRanking(
+            cache.set_ranking(CategoryRanking(
                 category="currency",
                 display_name="Currency",
                 items=items,
                 updated_at=datetime.now(timezone.utc).isoformat(),
-            )
+            ))
 
             # Refresh without force - should use cache
             ranking = calculator.refresh_category("currency", force=False)
@@ -415,38 +489,47 @@ class TestCacheExpiry:
 
             # Set cache to 12 hours old (should be valid)
             twelve_hours_ago = datetime.now(timezone.utc) - timedelta(hours=12)
-            cache._cache_metadata["last_updated"] = twelve_hours_ago.isoformat()
+            _fill_cache(cache, twelve_hours_ago, ["scarabs"])
 
             # Should be valid at 12 hours
-            assert cache.is_cache_valid() is True
+            assert cache.is_cache_valid("scarabs") is True
 
             # Set to 2 days old (should be expired)
             two_days_ago = datetime.now(timezone.utc) - timedelta(days=2)
-            cache._cache_metadata["last_updated"] = two_days_ago.isoformat()
+            _fill_cache(cache, two_days_ago, ["scarabs"])
 
             # Should be expired
-            assert cache.is_cache_valid() is False
+            assert cache.is_cache_valid("scarabs") is False
+
+    def test_currency_expires_sooner(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
+            _fill_cache(cache, datetime.now(timezone.utc) - timedelta(hours=8), ["currency", "scarabs"])
+
+            assert get_expiry_seconds("currency") < get_expiry_seconds("scarabs")
+            assert cache.is_cache_valid("currency") is False
+            assert cache.is_cache_valid("scarabs") is True
 
     def test_category_specific_expiry(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
 
             # Add fresh currency ranking
-            cache._rankings["currency"] = CategoryRanking(
+            cache.set_ranking(CategoryRanking(
                 category="currency",
                 display_name="Currency",
                 items=[],
                 updated_at=datetime.now(timezone.utc).isoformat(),
-            )
+            ))
 
             # Add stale scarabs ranking
             old_time = datetime.now(timezone.utc) - timedelta(days=10)
-            cache._rankings["scarabs"] = CategoryRanking(
+            cache.set_ranking(CategoryRanking(
                 category="scarabs",
                 display_name="Scarabs",
                 items=[],
                 updated_at=old_time.isoformat(),
-            )
+            ))
 
             # Currency should be valid, scarabs should not
             assert cache.is_cache_valid("currency") is True
@@ -787,32 +870,34 @@ class TestCacheEdgeCases:
     """Tests for edge cases in cache operations."""
 
     def test_load_cache_invalid_json(self):
-        """Loading invalid JSON clears cache."""
+        """An unreadable legacy JSON file is ignored."""
         with tempfile.TemporaryDirectory() as tmpdir:
             cache_dir = Path(tmpdir)
             cache_file = cache_dir / "price_rankings_standard.json"
             cache_file.write_text("{ invalid json")
 
             cache = PriceRankingCache(cache_dir=cache_dir, league="Standard")
-            assert len(cache._rankings) == 0
+            assert len(cache.get_all_rankings()) == 0
 
     def test_is_cache_valid_invalid_timestamp(self):
         """Invalid timestamp returns False."""
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
-            cache._cache_metadata["last_updated"] = "not-a-valid-timestamp"
-            assert cache.is_cache_valid() is False
+            cache.set_ranking(CategoryRanking(
+                category="currency", display_name="Currency", updated_at="not-a-valid-timestamp"
+            ))
+            assert cache.is_cache_valid("currency") is False
 
     def test_is_cache_valid_category_no_updated_at(self):
         """Category without updated_at returns False."""
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
-            cache._rankings["test"] = CategoryRanking(
+            cache.set_ranking(CategoryRanking(
                 category="test",
                 display_name="Test",
                 items=[],
                 updated_at=None,
-            )
+            ))
             assert cache.is_cache_valid("test") is False
 
     def test_is_cache_valid_nonexistent_category(self):
@@ -825,7 +910,7 @@ class TestCacheEdgeCases:
         """Invalid timestamp returns None for age."""
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
-            cache._cache_metadata["last_updated"] = "invalid"
+            cache.set_ranking(CategoryRanking(category="currency", display_name="Currency", updated_at="invalid"))
             assert cache.get_cache_age_days() is None
 
     def test_get_ranking_nonexistent(self):
@@ -856,13 +941,13 @@ class TestTop20CalculatorEdgeCases:
         """refresh_all skips refresh when cache is valid."""
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
-            cache._cache_metadata["last_updated"] = datetime.now(timezone.utc).isoformat()
-            cache._rankings["currency"] = CategoryRanking(
+            _fill_cache(cache, datetime.now(timezone.utc))
+            cache.set_ranking(CategoryRanking(
                 category="currency",
                 display_name="Currency",
                 items=[RankedItem(rank=1, name="Test", chaos_value=100.0)],
                 updated_at=datetime.now(timezone.utc).isoformat(),
-            )
+            ))
 
             calculator = Top20Calculator(cache, poe_ninja_api=mock_api)
             result = calculator.refresh_all(force=False)
@@ -879,7 +964,7 @@ class TestTop20CalculatorEdgeCases:
 
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
-            cache._cache_metadata["last_updated"] = datetime.now(timezone.utc).isoformat()
+            _fill_cache(cache, datetime.now(timezone.utc))
 
             calculator = Top20Calculator(cache, poe_ninja_api=mock_api)
             result = calculator.refresh_all(force=True)
@@ -951,7 +1036,7 @@ class TestTop20CalculatorEdgeCases:
             calculator = Top20Calculator(cache, poe_ninja_api=mock_api)
 
             calculator.refresh_slot("helmet", force=True)
-            assert "slot_helmet" in cache._rankings
+            assert cache.get_ranking("slot_helmet").items[0].name == "Test Helmet"
 
     def test_currency_zero_divine_rate(self, mock_api):
         """Currency fetch handles zero divine rate."""
@@ -1246,21 +1331,26 @@ class TestCategoryConstants:
 class TestAdditionalEdgeCases:
     """Additional edge case tests for better coverage."""
 
-    def test_save_cache_exception(self):
-        """Test _save_cache handles write errors gracefully."""
+    def test_set_ranking_failure_keeps_previous(self):
+        """A failed save leaves the previous ranking intact."""
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
-            cache._rankings["test"] = CategoryRanking(
+            cache.set_ranking(CategoryRanking(
                 category="test",
                 display_name="Test",
                 items=[RankedItem(rank=1, name="Item", chaos_value=100.0)],
-            )
+            ))
 
-            # Make cache file path invalid by making it a directory
-            cache._cache_file.mkdir(parents=True, exist_ok=True)
+            # Duplicate ranks violate the primary key part-way through the insert
+            bad = CategoryRanking(
+                category="test",
+                display_name="Test",
+                items=[RankedItem(rank=1, name="A", chaos_value=1.0), RankedItem(rank=1, name="B", chaos_value=1.0)],
+            )
+            with pytest.raises(sqlite3.IntegrityError):
+                cache.set_ranking(bad)
 
-            # This should not raise, just log error
-            cache._save_cache()
+            assert [item.name for item in cache.get_ranking("test").items] == ["Item"]
 
     def test_api_lazy_loading(self):
         """Test API is lazy loaded on first access."""
@@ -1285,12 +1375,12 @@ class TestAdditionalEdgeCases:
 
             # Add valid cached ranking for slot
             slot_key = "slot_helmet"
-            cache._rankings[slot_key] = CategoryRanking(
+            cache.set_ranking(CategoryRanking(
                 category=slot_key,
                 display_name="Helmets",
                 items=[RankedItem(rank=1, name="Cached Helmet", chaos_value=50.0)],
                 updated_at=datetime.now(timezone.utc).isoformat(),
-            )
+            ))
 
             calculator = Top20Calculator(cache, poe_ninja_api=mock_api)
             result = calculator.refresh_slot("helmet", force=False)
@@ -1307,14 +1397,14 @@ class TestAdditionalEdgeCases:
             cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
 
             # Set valid cache with known age
-            twelve_hours_ago = datetime.now(timezone.utc) - timedelta(hours=12)
-            cache._cache_metadata["last_updated"] = twelve_hours_ago.isoformat()
-            cache._rankings["currency"] = CategoryRanking(
+            three_hours_ago = datetime.now(timezone.utc) - timedelta(hours=3)
+            _fill_cache(cache, three_hours_ago)
+            cache.set_ranking(CategoryRanking(
                 category="currency",
                 display_name="Currency",
                 items=[RankedItem(rank=1, name="Test", chaos_value=100.0)],
-                updated_at=twelve_hours_ago.isoformat(),
-            )
+                updated_at=three_hours_ago.isoformat(),
+            ))
 
             calculator = Top20Calculator(cache, poe_ninja_api=mock_api)
             result = calculator.refresh_all(force=False)
@@ -1355,3 +1445,124 @@ class TestAdditionalEdgeCases:
         assert ranking.display_name == ""
         assert ranking.items == []
         assert ranking.updated_at is None
+
+
+class TestParallelRefresh:
+    """Tests for concurrent category refreshes."""
+
+    DELAY = 0.2
+
+    @pytest.fixture
+    def slow_api(self):
+        """Mock API where every overview request takes DELAY seconds."""
+        api = MagicMock()
+        api.ensure_divine_rate.return_value = 180.0
+        in_flight = {"now": 0, "max": 0}
+        lock = threading.Lock()
+
+        def slow(result):
+            def call(*args, **kwargs):
+                with lock:
+                    in_flight["now"] += 1
+                    in_flight["max"] = max(in_flight["max"], in_flight["now"])
+                time.sleep(self.DELAY)
+                with lock:
+                    in_flight["now"] -= 1
+                return result
+            return call
+
+        api.get_currency_overview.side_effect = slow(
+            {"lines": [{"currencyTypeName": "Divine Orb", "chaosEquivalent": 180.0}]}
+        )
+        api._get_item_overview.side_effect = slow(
+            {"lines": [{"name": "Mageblood", "chaosValue": 90000.0, "itemType": "Belt"}]}
+        )
+        api.in_flight = in_flight
+        return api
+
+    def test_refresh_all_takes_about_one_category(self, slow_api):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
+            calculator = Top20Calculator(cache, poe_ninja_api=slow_api)
+
+            start = time.perf_counter()
+            result = calculator.refresh_all(force=True)
+            elapsed = time.perf_counter() - start
+
+            assert set(result) == set(CATEGORIES)
+            # Serially this would be len(CATEGORIES) * DELAY (2.8s)
+            assert elapsed < self.DELAY * 4
+            assert slow_api.in_flight["max"] > 1
+            slow_api.ensure_divine_rate.assert_called_once()
+
+    def test_refresh_all_only_fetches_stale_categories(self, slow_api):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
+            _fill_cache(cache, datetime.now(timezone.utc), [k for k in CATEGORIES if k != "currency"])
+            calculator = Top20Calculator(cache, poe_ninja_api=slow_api)
+
+            result = calculator.refresh_all()
+
+            slow_api.get_currency_overview.assert_called_once()
+            slow_api._get_item_overview.assert_not_called()
+            assert result["currency"].items[0].name == "Divine Orb"
+            assert set(result) == set(CATEGORIES)
+
+    def test_refresh_all_slots_in_parallel(self, slow_api):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
+            calculator = Top20Calculator(cache, poe_ninja_api=slow_api)
+
+            start = time.perf_counter()
+            result = calculator.refresh_all_slots(force=True)
+            elapsed = time.perf_counter() - start
+
+            assert "slot_belt" in result
+            assert elapsed < self.DELAY * 4
+
+    def test_failed_category_does_not_block_others(self, slow_api):
+        slow_api.get_currency_overview.side_effect = RuntimeError("boom")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard")
+            calculator = Top20Calculator(cache, poe_ninja_api=slow_api)
+
+            result = calculator.refresh_categories(["currency", "scarabs"], force=True)
+
+            assert list(result) == ["scarabs"]
+            assert cache.get_ranking("scarabs") is not None
+
+
+class TestSharedRankingStore:
+    """Cache and history sharing one database."""
+
+    def test_cache_and_history_share_store(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = RankingStore(Path(tmpdir) / "rankings.db")
+            cache = PriceRankingCache(cache_dir=Path(tmpdir), league="Standard", store=store)
+            history = PriceRankingHistory(store=store)
+            ranking = CategoryRanking(
+                category="currency",
+                display_name="Currency",
+                items=[RankedItem(rank=1, name="Divine Orb", chaos_value=180.0)],
+                updated_at=datetime.now(timezone.utc).isoformat(),
+            )
+
+            cache.set_ranking(ranking)
+            history.save_snapshot(ranking, "Standard")
+            history.close()
+            cache.close()
+
+            # Neither closed the shared connection
+            assert history.get_category_snapshot("Standard", "currency").items[0].name == "Divine Orb"
+            assert cache.get_ranking("currency").items[0].name == "Divine Orb"
+            assert not (Path(tmpdir) / "price_rankings.db").exists()
+            store.close()
+
+    def test_default_paths_match(self):
+        with patch.object(Path, 'home', return_value=Path(tempfile.mkdtemp())):
+            cache = PriceRankingCache(league="Standard")
+            history = PriceRankingHistory()
+            assert cache.store.db_path == history.db_path
+            history.close()
+            cache.close()
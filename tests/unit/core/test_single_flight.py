@@ -0,0 +1,98 @@
+"""Tests for core/single_flight.py."""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from core.single_flight import SingleFlight
+
+pytestmark = pytest.mark.unit
+
+
+def _run_concurrently(flights: SingleFlight, key, fn, count: int):
+    """
+    Start ``count`` callers for ``key`` without waiting for them; returns
+    (threads, results, errors). Use _wait_for_waiters() to sync.
+    """
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flights.do(key, fn))
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def _wait_for_waiters(flights: SingleFlight, shared: int) -> None:
+    deadline = time.monotonic() + 5
+    while flights.stats()["shared"] < shared and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert flights.stats()["shared"] >= shared, "callers did not join the in-flight call"
+
+
+# =============================================================================
+# SingleFlight
+# =============================================================================
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_execution(self):
+        flights = SingleFlight()
+        release = threading.Event()
+        executions = []
+
+        def work():
+            executions.append(1)
+            release.wait(timeout=5)
+            return {"value": 42}
+
+        threads, results, errors = _run_concurrently(flights, "key", work, 6)
+        _wait_for_waiters(flights, 5)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(executions) == 1
+        assert errors == []
+        assert len(results) == 6
+        assert all(result is results[0] for result in results)
+        assert flights.stats() == {"executed": 1, "shared": 5, "in_flight": 0}
+
+    def test_error_propagates_to_every_waiter(self):
+        flights = SingleFlight()
+        release = threading.Event()
+
+        def work():
+            release.wait(timeout=5)
+            raise ValueError("upstream down")
+
+        threads, results, errors = _run_concurrently(flights, "key", work, 3)
+        _wait_for_waiters(flights, 2)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert results == []
+        assert len(errors) == 3
+        assert all(isinstance(error, ValueError) for error in errors)
+
+    def test_completed_calls_are_not_cached(self):
+        flights = SingleFlight()
+        counter = iter(range(10))
+
+        assert flights.do("key", lambda: next(counter)) == 0
+        assert flights.do("key", lambda: next(counter)) == 1
+        assert flights.in_flight() == 0
+
+    def test_different_keys_run_independently(self):
+        flights = SingleFlight()
+        assert flights.do("a", lambda: "A") == "A"
+        assert flights.do("b", lambda: "B") == "B"
+        assert flights.stats()["executed"] == 2
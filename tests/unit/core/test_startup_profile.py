@@ -0,0 +1,95 @@
+"""Tests for core/startup_profile.py."""
+from __future__ import annotations
+
+import importlib
+import sys
+import textwrap
+
+import pytest
+
+from core.startup_profile import StartupProfiler
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def fake_package(tmp_path, monkeypatch):
+    """A throwaway package: parent imports child, child imports nothing."""
+    pkg = tmp_path / "startup_fake_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("from startup_fake_pkg import child\n")
+    (pkg / "child.py").write_text(textwrap.dedent("""
+        import time
+        time.sleep(0.02)
+        VALUE = 42
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "startup_fake_pkg"
+    for name in [m for m in sys.modules if m.startswith("startup_fake_pkg")]:
+        del sys.modules[name]
+
+
+# =============================================================================
+# Import timing
+# =============================================================================
+
+
+class TestImportTimer:
+    def test_records_cumulative_and_self_time(self, fake_package):
+        profiler = StartupProfiler()
+        profiler.install_import_timer()
+        try:
+            module = importlib.import_module(fake_package)
+        finally:
+            profiler.uninstall_import_timer()
+
+        assert module.child.VALUE == 42
+        timings = {t.name: t for t in profiler.imports()}
+        parent = timings["startup_fake_pkg"]
+        child = timings["startup_fake_pkg.child"]
+        assert child.cumulative_ms >= 15
+        assert parent.cumulative_ms >= child.cumulative_ms
+        # The sleep belongs to the child, not the parent's self time
+        assert parent.self_ms < child.self_ms
+        assert profiler.package_totals()["startup_fake_pkg"] >= 15
+
+    def test_uninstall_removes_hook(self, fake_package):
+        profiler = StartupProfiler()
+        profiler.install_import_timer()
+        profiler.install_import_timer()  # idempotent
+        profiler.uninstall_import_timer()
+
+        importlib.import_module(fake_package)
+
+        assert profiler.imports() == []
+        assert not any(type(f).__name__ == "_TimingFinder" for f in sys.meta_path)
+
+
+# =============================================================================
+# Phases and report
+# =============================================================================
+
+
+class TestPhasesAndReport:
+    def test_phases_and_marks_in_report(self, fake_package):
+        profiler = StartupProfiler()
+        profiler.install_import_timer()
+        with profiler.phase("app_context"):
+            importlib.import_module(fake_package)
+        profiler.uninstall_import_timer()
+        interactive = profiler.mark("interactive")
+
+        assert [name for name, _ in profiler.phases()] == ["app_context"]
+        assert interactive >= profiler.phases()[0][1]
+
+        report = profiler.report(limit=5, packages=["startup_fake_pkg"])
+        assert "app_context" in report
+        assert "@ interactive" in report
+        assert "startup_fake_pkg.child" in report
+
+    def test_phase_recorded_on_error(self):
+        profiler = StartupProfiler()
+        with pytest.raises(RuntimeError):
+            with profiler.phase("boom"):
+                raise RuntimeError("x")
+        assert profiler.phases()[0][0] == "boom"
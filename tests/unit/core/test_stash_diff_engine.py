@@ -1,7 +1,10 @@
 """Tests for stash_diff_engine.py - Stash snapshot comparison for loot detection."""
 
+import threading
+import time
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
+from unittest.mock import patch
 
 from core.stash_diff_engine import (
     ItemFingerprint,
@@ -694,6 +697,175 @@ class TestStashDiffEngineChildTabs:
         assert len(diff.added_items) == 1
 
 
+def _snapshot(*tabs: MockStashTab) -> MockStashSnapshot:
+    return MockStashSnapshot(account_name="test", league="Settlers", tabs=list(tabs))
+
+
+def _tab(tab_id: str, items: List[Dict[str, Any]], name: Optional[str] = None) -> MockStashTab:
+    return MockStashTab(id=tab_id, name=name or tab_id, index=0, type="NormalStash", items=items)
+
+
+class TestStashDiffEngineIncremental:
+    """Tests for per-tab change detection and id keying."""
+
+    def test_unchanged_tab_is_not_fingerprinted(self):
+        """Tabs with identical raw items are skipped in the after pass."""
+        dump = [{"id": f"i{n}", "typeLine": "Chaos Orb", "x": n, "y": 0, "frameType": 5} for n in range(50)]
+        loot = [{"id": "a1", "typeLine": "Divine Orb", "x": 0, "y": 0, "frameType": 5}]
+        engine = StashDiffEngine()
+        engine.set_before_snapshot(_snapshot(_tab("dump", dump), _tab("loot", [])))
+
+        with patch.object(ItemFingerprint, "from_item", wraps=ItemFingerprint.from_item) as spy:
+            diff = engine.compute_diff(_snapshot(_tab("dump", [dict(i) for i in dump]), _tab("loot", loot)))
+
+        assert spy.call_count == 1
+        assert diff.added_items == loot
+        assert engine.get_stats()["tabs_skipped"] == 1
+
+    def test_identical_items_tracked_by_id(self):
+        """A second identical item with a new id counts as added."""
+        ring = {"id": "r1", "typeLine": "Iron Ring", "x": 0, "y": 0, "frameType": 0}
+        twin = dict(ring, id="r2", x=1)
+        engine = StashDiffEngine()
+        engine.set_before_snapshot(_snapshot(_tab("t", [ring])))
+
+        diff = engine.compute_diff(_snapshot(_tab("t", [ring, twin])))
+
+        assert diff.added_items == [twin]
+        assert diff.after_total_items == 2
+
+    def test_moved_item_with_same_id_is_not_loot(self):
+        """Moving an item within a tab is not reported as a change."""
+        item = {"id": "u1", "name": "Goldrim", "typeLine": "Leather Cap", "x": 0, "y": 0, "frameType": 3}
+        engine = StashDiffEngine()
+        engine.set_before_snapshot(_snapshot(_tab("t", [item])))
+
+        diff = engine.compute_diff(_snapshot(_tab("t", [dict(item, x=5, y=3)])))
+
+        assert not diff.has_changes
+
+    def test_stack_change_by_id(self):
+        """Stack size changes are detected for id-keyed items."""
+        before = {"id": "c1", "typeLine": "Chaos Orb", "stackSize": 10, "x": 0, "y": 0, "frameType": 5}
+        engine = StashDiffEngine()
+        engine.set_before_snapshot(_snapshot(_tab("t", [before])))
+
+        diff = engine.compute_diff(_snapshot(_tab("t", [dict(before, stackSize=25)])))
+
+        assert len(diff.stack_changes) == 1
+        assert diff.stack_changes[0].delta == 15
+
+    def test_removed_tab_reports_removed_items(self):
+        """Items in a tab missing from the after snapshot are removed."""
+        item = {"id": "x1", "typeLine": "Iron Ring", "x": 0, "y": 0, "frameType": 0}
+        engine = StashDiffEngine()
+        engine.set_before_snapshot(_snapshot(_tab("t", [item]), _tab("u", [])))
+
+        diff = engine.compute_diff(_snapshot(_tab("u", [])))
+
+        assert diff.removed_items == [item]
+
+    def test_advance_carries_after_state_forward(self):
+        """With advance=True the next diff is against the previous after snapshot."""
+        first = {"id": "d1", "typeLine": "Divine Orb", "x": 0, "y": 0, "frameType": 5}
+        second = {"id": "d2", "typeLine": "Exalted Orb", "x": 1, "y": 0, "frameType": 5}
+        after_one = _snapshot(_tab("t", [first]))
+        engine = StashDiffEngine()
+        engine.set_before_snapshot(_snapshot(_tab("t", [])))
+
+        diff_one = engine.compute_diff(after_one, advance=True)
+        with patch.object(ItemFingerprint, "from_item", wraps=ItemFingerprint.from_item) as spy:
+            diff_two = engine.compute_diff(_snapshot(_tab("t", [first, second])), advance=True)
+
+        assert engine.before_snapshot is not after_one
+        assert diff_one.added_items == [first]
+        assert diff_two.added_items == [second]
+        assert spy.call_count == 1  # first was reused by id
+
+    def test_without_advance_before_is_unchanged(self):
+        """Default compute_diff leaves the before snapshot in place."""
+        before = _snapshot(_tab("t", []))
+        engine = StashDiffEngine()
+        engine.set_before_snapshot(before)
+
+        engine.compute_diff(_snapshot(_tab("t", [{"id": "a", "typeLine": "Chaos Orb", "x": 0, "y": 0}])))
+
+        assert engine.before_snapshot is before
+
+    def test_mod_count_change_without_id_refingerprints_tab(self):
+        """The signature notices a changed item even when it has no id."""
+        item = {"name": "Doom Loop", "typeLine": "Vaal Regalia", "x": 0, "y": 0, "frameType": 2,
+                "explicitMods": ["+100 to maximum Life"]}
+        engine = StashDiffEngine()
+        engine.set_before_snapshot(_snapshot(_tab("t", [item])))
+
+        diff = engine.compute_diff(_snapshot(_tab("t", [dict(item, explicitMods=["+100 to maximum Life", "+4 Str"])])))
+
+        assert engine.get_stats()["tabs_fingerprinted"] == 2
+        assert len(diff.added_items) == len(diff.removed_items) == 1
+
+    def test_unchanged_tabs_cost_less_than_fingerprinting_them(self):
+        """Skipping nine unchanged tabs is cheaper than fingerprinting them."""
+        def rare(tab: int, n: int) -> Dict[str, Any]:
+            return {
+                "id": f"{tab}-{n:05d}-0123456789abcdef", "name": "Doom Loop", "typeLine": "Vaal Regalia",
+                "x": n % 12, "y": n // 12, "frameType": 2, "ilvl": 84,
+                "explicitMods": ["+100 to maximum Life", "+40% to Fire Resistance", "+30% to Cold Resistance"],
+                "implicitMods": ["+1 to Level of Socketed Gems"],
+                "sockets": [{"group": 0, "sColour": "R"}] * 6,
+            }
+
+        tabs = {t: [rare(t, n) for n in range(1000)] for t in range(10)}
+        engine = StashDiffEngine()
+        engine.set_before_snapshot(_snapshot(*(_tab(f"t{t}", items) for t, items in tabs.items())))
+        after = _snapshot(*(
+            _tab(f"t{t}", [dict(i) for i in items] + ([rare(t, 1000)] if t == 0 else []))
+            for t, items in tabs.items()
+        ))
+
+        def best_of(runs: int, fn) -> float:
+            times = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                fn()
+                times.append(time.perf_counter() - start)
+            return min(times)
+
+        diff_time = best_of(3, lambda: engine.compute_diff(after))
+        fingerprint_time = best_of(3, lambda: [
+            ItemFingerprint.from_item(item, f"t{t}") for t in range(1, 10) for item in tabs[t]
+        ])
+
+        assert len(engine.compute_diff(after).added_items) == 1
+        assert diff_time < fingerprint_time
+
+    def test_concurrent_diffs_share_state_safely(self):
+        """Diffs from the GUI and worker threads see whole per-tab states."""
+        items = [{"id": f"c{n}", "typeLine": "Chaos Orb", "stackSize": 1, "x": n, "y": 0, "frameType": 5} for n in range(200)]
+        grown = [dict(i, stackSize=2) for i in items]
+        engine = StashDiffEngine()
+        engine.set_before_snapshot(_snapshot(_tab("t", items)))
+        errors: List[Exception] = []
+
+        def run(snapshot: MockStashSnapshot) -> None:
+            try:
+                for _ in range(25):
+                    diff = engine.compute_diff(snapshot, advance=True)
+                    assert len(diff.stack_changes) in (0, 200)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(_snapshot(_tab("t", tab)),)) for tab in (items, grown) * 2]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        assert not errors
+        stats = engine.get_stats()
+        assert stats["tabs_skipped"] + stats["tabs_fingerprinted"] == 1 + 4 * 25
+
+
 # =============================================================================
 # Utility Function Tests
 # =============================================================================
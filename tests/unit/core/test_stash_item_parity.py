@@ -0,0 +1,372 @@
+"""
+Golden tests: stash API items must parse and price like their clipboard text.
+
+Each fixture pairs a recorded stash API item with the clipboard text of the
+same item (property lines such as Armour or gem tags, which neither path
+models, left out). ParsedItem.from_stash_item() must produce what
+ItemParser.parse() produces from the text, and
+PriceService.check_parsed_item() must return the rows check_item() does.
+"""
+from __future__ import annotations
+
+from dataclasses import fields
+
+import pytest
+
+from core.game_version import GameVersion
+from core.item_parser import ItemParser, ParsedItem
+from core.pricing import ItemPriceCache, PriceService
+
+pytestmark = pytest.mark.unit
+
+
+STASH_FIXTURES = {
+    "rare_crafted_fractured": (
+        {
+            "verified": False, "w": 2, "h": 3, "icon": "https://web.poecdn.com/Art/2DItems/Armours/BodyArmours/BodyInt1A.png",
+            "league": "Settlers", "id": "5c1b2a", "name": "Dusk Shroud", "typeLine": "Vaal Regalia",
+            "baseType": "Vaal Regalia", "identified": True, "ilvl": 86, "frameType": 2, "x": 0, "y": 0,
+            "fractured": True,
+            "influences": {"shaper": True},
+            "sockets": [
+                {"group": 0, "attr": "S", "sColour": "R"},
+                {"group": 0, "attr": "D", "sColour": "G"},
+                {"group": 0, "attr": "I", "sColour": "B"},
+                {"group": 1, "attr": "I", "sColour": "B"},
+                {"group": 1, "attr": "I", "sColour": "B"},
+            ],
+            "properties": [
+                {"name": "Quality", "values": [["+20%", 1]], "displayMode": 0, "type": 6},
+                {"name": "Energy Shield", "values": [["412", 1]], "displayMode": 0, "type": 18},
+            ],
+            "requirements": [
+                {"name": "Level", "values": [["68", 0]], "displayMode": 0, "type": 62},
+                {"name": "Int", "values": [["194", 0]], "displayMode": 1, "type": 65},
+            ],
+            "fracturedMods": ["+98 to maximum Energy Shield"],
+            "explicitMods": ["+112 to maximum Life", "+43% to Cold Resistance"],
+            "craftedMods": ["+29% to Fire Resistance"],
+        },
+        """Item Class: Body Armours
+Rarity: Rare
+Dusk Shroud
+Vaal Regalia
+--------
+Quality: +20% (augmented)
+--------
+Requirements:
+Level: 68
+Int: 194
+--------
+Sockets: R-G-B B-B
+--------
+Item Level: 86
+--------
++98 to maximum Energy Shield (fractured)
++112 to maximum Life
++43% to Cold Resistance
++29% to Fire Resistance (crafted)
+--------
+Fractured Item
+--------
+Shaper Item""",
+    ),
+    "unique_corrupted": (
+        {
+            "icon": "https://web.poecdn.com/Art/2DItems/Belts/Headhunter.png", "league": "Settlers",
+            "id": "9e77c0", "name": "Headhunter", "typeLine": "Leather Belt", "baseType": "Leather Belt",
+            "identified": True, "ilvl": 85, "frameType": 3, "x": 2, "y": 0, "corrupted": True,
+            "requirements": [{"name": "Level", "values": [["40", 0]], "displayMode": 0, "type": 62}],
+            "implicitMods": ["+36 to maximum Life"],
+            "explicitMods": [
+                "+52 to Strength",
+                "+48 to Dexterity",
+                "+55 to maximum Life",
+                "When you Kill a Rare monster, you gain its Modifiers for 60 seconds",
+            ],
+        },
+        """Item Class: Belts
+Rarity: Unique
+Headhunter
+Leather Belt
+--------
+Requirements:
+Level: 40
+--------
+Item Level: 85
+--------
++36 to maximum Life (implicit)
+--------
++52 to Strength
++48 to Dexterity
++55 to maximum Life
+When you Kill a Rare monster, you gain its Modifiers for 60 seconds
+--------
+Corrupted""",
+    ),
+    "currency_stack": (
+        {
+            "icon": "https://web.poecdn.com/Art/2DItems/Currency/CurrencyModValues.png", "league": "Settlers",
+            "id": "d1v1ne", "name": "", "typeLine": "Divine Orb", "baseType": "Divine Orb",
+            "identified": True, "ilvl": 0, "frameType": 5, "x": 4, "y": 0,
+            "stackSize": 7, "maxStackSize": 20,
+            "properties": [{"name": "Stack Size", "values": [["7/20", 0]], "displayMode": 0, "type": 32}],
+            "explicitMods": ["Randomises the numeric values of the random modifiers on an item"],
+        },
+        """Item Class: Stackable Currency
+Rarity: Currency
+Divine Orb
+--------
+Stack Size: 7/20
+--------
+Randomises the numeric values of the random modifiers on an item""",
+    ),
+    "gem_level_quality": (
+        {
+            "icon": "https://web.poecdn.com/Art/2DItems/Gems/VaalGems/VaalGrace.png", "league": "Settlers",
+            "id": "g3m", "name": "", "typeLine": "Vaal Grace", "baseType": "Vaal Grace",
+            "identified": True, "ilvl": 0, "frameType": 4, "x": 5, "y": 0, "corrupted": True,
+            "properties": [
+                {"name": "Vaal, Aura, Spell, AoE, Duration", "values": [], "displayMode": 0},
+                {"name": "Level", "values": [["21 (Max)", 0]], "displayMode": 0, "type": 5},
+                {"name": "Quality", "values": [["+23%", 1]], "displayMode": 0, "type": 6},
+            ],
+            "requirements": [
+                {"name": "Level", "values": [["72", 0]], "displayMode": 0},
+                {"name": "Dex", "values": [["111", 0]], "displayMode": 1},
+            ],
+        },
+        """Item Class: Skill Gems
+Rarity: Gem
+Vaal Grace
+--------
+Level: 21 (Max)
+Quality: +23% (augmented)
+--------
+Requirements:
+Level: 72
+Dex: 111
+--------
+Corrupted""",
+    ),
+    "divination_card": (
+        {
+            "icon": "https://web.poecdn.com/Art/2DItems/Divination/InventoryIcon.png", "league": "Settlers",
+            "id": "d0c", "name": "", "typeLine": "The Doctor", "baseType": "The Doctor",
+            "identified": True, "ilvl": 0, "frameType": 6, "x": 6, "y": 0,
+            "stackSize": 3, "maxStackSize": 8,
+            "properties": [{"name": "Stack Size", "values": [["3/8", 0]], "displayMode": 0}],
+        },
+        """Item Class: Divination Cards
+Rarity: Divination Card
+The Doctor
+--------
+Stack Size: 3/8""",
+    ),
+    "cluster_jewel": (
+        {
+            "icon": "https://web.poecdn.com/Art/2DItems/Jewels/NewGemBase3.png", "league": "Settlers",
+            "id": "c1u", "name": "Rune Hold", "typeLine": "Large Cluster Jewel", "baseType": "Large Cluster Jewel",
+            "identified": True, "ilvl": 84, "frameType": 2, "x": 7, "y": 0,
+            "enchantMods": [
+                "Adds 8 Passive Skills",
+                "2 Added Passive Skills are Jewel Sockets",
+                "Added Small Passive Skills grant: 12% increased Fire Damage",
+            ],
+            "explicitMods": [
+                "1 Added Passive Skill is Burning Bright",
+                "1 Added Passive Skill is Smoking Remains",
+                "Added Small Passive Skills also grant: +5 to Strength",
+            ],
+        },
+        """Item Class: Jewels
+Rarity: Rare
+Rune Hold
+Large Cluster Jewel
+--------
+Item Level: 84
+--------
+Adds 8 Passive Skills (enchant)
+2 Added Passive Skills are Jewel Sockets (enchant)
+Added Small Passive Skills grant: 12% increased Fire Damage (enchant)
+--------
+1 Added Passive Skill is Burning Bright
+1 Added Passive Skill is Smoking Remains
+Added Small Passive Skills also grant: +5 to Strength""",
+    ),
+    "poe2_rune_sockets": (
+        {
+            "icon": "https://web.poecdn.com/gen/image/Armours/BodyArmours/Basetypes/BodyStr3.png", "league": "Standard",
+            "id": "p2r", "name": "Havoc Shell", "typeLine": "Expert Plate Armour", "baseType": "Expert Plate Armour",
+            "identified": True, "ilvl": 79, "frameType": 2, "x": 0, "y": 3,
+            "sockets": [{"group": 0, "type": "rune"}, {"group": 1, "type": "rune"}],
+            "properties": [{"name": "[Quality]", "values": [["+10%", 1]], "displayMode": 0, "type": 6}],
+            "requirements": [
+                {"name": "Level", "values": [["65", 0]], "displayMode": 0, "type": 62},
+                {"name": "[Strength|Str]", "values": [["121", 0]], "displayMode": 1, "type": 63},
+            ],
+            "runeMods": ["+12% to Fire Resistance"],
+            "explicitMods": ["+89 to maximum Life", "+31% to Lightning Resistance"],
+        },
+        """Item Class: Body Armours
+Rarity: Rare
+Havoc Shell
+Expert Plate Armour
+--------
+Quality: +10% (augmented)
+--------
+Requirements:
+Level: 65
+Str: 121
+--------
+Sockets: S S
+--------
+Item Level: 79
+--------
++12% to Fire Resistance (rune)
+--------
++89 to maximum Life
++31% to Lightning Resistance""",
+    ),
+}
+
+# Fields the two paths legitimately fill differently (see _assert_parity)
+NOT_COMPARED = {"raw_text", "rarity", "base_type", "influences", "_rare_evaluation", "_unique_evaluation"}
+
+
+def _normalized_rarity(item: ParsedItem) -> str:
+    # The clipboard parser keeps the first word, upper-cased ("DIVINATION")
+    return (item.rarity or "").upper().split()[0]
+
+
+def _assert_parity(from_api: ParsedItem, from_text: ParsedItem) -> None:
+    for name in (f.name for f in fields(ParsedItem)):
+        if name not in NOT_COMPARED:
+            assert getattr(from_api, name) == getattr(from_text, name), name
+
+    assert _normalized_rarity(from_api) == _normalized_rarity(from_text)
+    assert sorted(from_api.influences) == sorted(from_text.influences)
+    # Nameless items (currency, gems, cards) have no base line on the
+    # clipboard; the API still gives their base type
+    if from_text.base_type is not None:
+        assert from_api.base_type == from_text.base_type
+    assert from_api.get_display_name() == from_text.get_display_name()
+
+
+@pytest.mark.parametrize("fixture_id", sorted(STASH_FIXTURES))
+def test_from_stash_item_matches_clipboard_parse(fixture_id):
+    api_item, text = STASH_FIXTURES[fixture_id]
+
+    from_text = ItemParser().parse(text)
+    from_api = ParsedItem.from_stash_item(api_item)
+
+    assert from_text is not None
+    _assert_parity(from_api, from_text)
+
+
+def test_parity_holds_for_compacted_items():
+    api_item, text = STASH_FIXTURES["rare_crafted_fractured"]
+
+    from_api = ParsedItem.from_stash_item(api_item).compact()
+    from_text = ItemParser().parse(text)
+
+    assert list(from_api.explicits) == from_text.explicits
+    assert from_api.explicits[0] == "+98 to maximum Energy Shield (fractured)"
+    assert from_api.explicits[-1] == "+29% to Fire Resistance (crafted)"
+
+
+# --------------------------------------------
+# Pricing parity
+# --------------------------------------------
+
+class FakeConfig:
+    current_game = GameVersion.POE1.value
+    league = "Settlers"
+    divine_rate = None
+    auto_detect_league = False
+    item_cache_enabled = True
+    games = {"poe1": {"league": "Settlers", "divine_chaos_rate": None}}
+
+
+class FakeDB:
+    def __init__(self):
+        self.check_rows = []
+
+    def create_price_check(self, game_version, league, item_name, item_base_type, source, query_hash):
+        self.check_rows.append(item_name)
+        return len(self.check_rows)
+
+    def add_price_quotes_batch(self, check_id, rows):
+        pass
+
+    def get_latest_price_stats_for_item(self, game_version, league, item_name, days=None):
+        return None
+
+
+class RecordingPoeNinja:
+    """
+    Prices by lookup arguments, recording every call.
+
+    Rarity is recorded by its first word: poe.ninja treats "DIVINATION"
+    (clipboard) and "DIVINATION CARD" (stash API) the same.
+    """
+
+    divine_chaos_rate = 200.0
+
+    def __init__(self):
+        self.calls = []
+
+    def get_currency_price(self, item_name):
+        self.calls.append(("currency", item_name))
+        return (200.0, "poe.ninja") if item_name == "Divine Orb" else (0.0, "not found")
+
+    def find_item_price(self, item_name, base_type, rarity, gem_level, gem_quality, corrupted):
+        rarity = rarity.split()[0]
+        self.calls.append(("item", item_name, rarity, gem_level, gem_quality, corrupted))
+        if rarity == "UNIQUE" and item_name.startswith("Headhunter"):
+            return {"chaosValue": 9000.0, "count": 25}
+        if rarity == "GEM" and gem_level == 21 and gem_quality == 23:
+            return {"chaosValue": 110.0, "count": 8}
+        if rarity == "DIVINATION":
+            return {"chaosValue": 1100.0, "count": 40}
+        return None
+
+
+def _service(poe_ninja):
+    return PriceService(
+        config=FakeConfig(),
+        parser=ItemParser(),
+        db=FakeDB(),
+        poe_ninja=poe_ninja,
+        trade_source=None,
+        cache=ItemPriceCache(),
+    )
+
+
+@pytest.mark.parametrize("fixture_id", sorted(STASH_FIXTURES))
+def test_check_parsed_item_prices_like_check_item(fixture_id):
+    api_item, text = STASH_FIXTURES[fixture_id]
+    text_ninja, api_ninja = RecordingPoeNinja(), RecordingPoeNinja()
+    text_service, api_service = _service(text_ninja), _service(api_ninja)
+
+    text_rows = text_service.check_item(text)
+    api_rows = api_service.check_parsed_item(ParsedItem.from_stash_item(api_item))
+
+    assert api_rows == text_rows
+    assert api_ninja.calls == text_ninja.calls
+    assert api_service.db.check_rows == text_service.db.check_rows
+
+
+def test_check_parsed_item_uses_cache_without_parser():
+    api_item, _ = STASH_FIXTURES["unique_corrupted"]
+    ninja = RecordingPoeNinja()
+    service = _service(ninja)
+    service.parser = None  # the parsed path must never parse text
+
+    first = service.check_parsed_item(ParsedItem.from_stash_item(api_item))
+    second = service.check_parsed_item(ParsedItem.from_stash_item(api_item))
+
+    assert first == second
+    assert float(first[0]["chaos_value"]) == 9000.0
+    assert len(ninja.calls) == 1
+    assert service.check_parsed_item(None) == []
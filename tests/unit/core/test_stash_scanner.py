@@ -401,6 +401,8 @@ class TestItemParsing:
         assert item.ilvl == 86
         assert item.identified is True
         assert item.corrupted is False
+        assert item.parsed.name == "Doom Crown"
+        assert item.parsed.item_level == 86
 
     @patch('core.stash_scanner.requests.get')
     def test_parse_item_maps_frame_types_correctly(self, mock_get, mock_oauth_client):
@@ -744,7 +746,7 @@ class TestScanAndPrice:
 
         # Setup mock price service
         mock_price_service = Mock()
-        mock_price_service.check_item.side_effect = [
+        mock_price_service.check_parsed_item.side_effect = [
             [{"chaos_value": 1.0, "divine_value": 0.0, "source": "poe_ninja"}],
             [{"chaos_value": 200.0, "divine_value": 1.0, "source": "poe_ninja"}],
         ]
@@ -781,7 +783,7 @@ class TestScanAndPrice:
 
         # Price service raises error
         mock_price_service = Mock()
-        mock_price_service.check_item.side_effect = Exception("Price API error")
+        mock_price_service.check_parsed_item.side_effect = Exception("Price API error")
 
         scanner = StashScanner(mock_oauth_client)
 
@@ -815,7 +817,7 @@ class TestScanAndPrice:
 
         # Price service returns empty list
         mock_price_service = Mock()
-        mock_price_service.check_item.return_value = []
+        mock_price_service.check_parsed_item.return_value = []
 
         scanner = StashScanner(mock_oauth_client)
         # Items with 0 value should be filtered out with min_chaos_value=1.0
@@ -848,7 +850,7 @@ class TestScanAndPrice:
 
         # Price service returns None values
         mock_price_service = Mock()
-        mock_price_service.check_item.return_value = [
+        mock_price_service.check_parsed_item.return_value = [
             {"chaos_value": None, "divine_value": None, "source": "poe_ninja"}
         ]
 
@@ -883,7 +885,7 @@ class TestScanAndPrice:
         mock_get.side_effect = [account_response, tabs_response, items_response]
 
         mock_price_service = Mock()
-        mock_price_service.check_item.side_effect = [
+        mock_price_service.check_parsed_item.side_effect = [
             [{"chaos_value": 100.0, "divine_value": 0.5, "source": "poe_ninja"}],
             [{"chaos_value": 50.0, "divine_value": 0.25, "source": "poe_ninja"}],
         ]
@@ -899,6 +901,73 @@ class TestScanAndPrice:
         assert tab.total_value_chaos == 150.0
         assert tab.total_value_divine == 0.75
 
+    @patch('core.stash_scanner.requests.get')
+    def test_scan_and_price_checks_identical_items_once(self, mock_get, mock_oauth_client):
+        """Identical items in a tab should share one parsed-item price check."""
+        account_response = Mock()
+        account_response.json.return_value = {"name": "TestAccount"}
+        account_response.raise_for_status = Mock()
+
+        tabs_response = Mock()
+        tabs_response.json.return_value = {
+            "tabs": [{"i": 0, "n": "Cards", "type": "DivinationCardStash"}]
+        }
+        tabs_response.raise_for_status = Mock()
+
+        card = {"name": "", "typeLine": "The Doctor", "frameType": 6, "stackSize": 1, "maxStackSize": 8, "icon": ""}
+        items_response = Mock()
+        items_response.json.return_value = {
+            "items": [dict(card, x=i) for i in range(3)]
+        }
+        items_response.raise_for_status = Mock()
+
+        mock_get.side_effect = [account_response, tabs_response, items_response]
+
+        mock_price_service = Mock()
+        mock_price_service.check_parsed_item.return_value = [
+            {"chaos_value": "900.0", "divine_value": "4.50", "source": "poe.ninja"}
+        ]
+
+        scanner = StashScanner(mock_oauth_client)
+        valuable = scanner.scan_and_price(mock_price_service, min_chaos_value=1.0)
+
+        assert len(valuable) == 3
+        assert mock_price_service.check_parsed_item.call_count == 1
+        parsed = mock_price_service.check_parsed_item.call_args[0][0]
+        assert parsed.name == "The Doctor"
+        assert parsed.max_stack_size == 8
+        mock_price_service.check_item.assert_not_called()
+        assert valuable[0][0].total_value_chaos == 2700.0
+
+    @patch('core.stash_scanner.requests.get')
+    def test_price_tab_falls_back_to_text_without_parsed_data(self, mock_get, mock_oauth_client):
+        """Items built without parsed data should be priced from built text."""
+        account_response = Mock()
+        account_response.json.return_value = {"name": "TestAccount"}
+        account_response.raise_for_status = Mock()
+        mock_get.return_value = account_response
+
+        scanner = StashScanner(mock_oauth_client)
+        item = StashItem(
+            name="", type_line="Chaos Orb", rarity="CURRENCY",
+            stash_tab_name="Tab", stash_tab_index=0,
+            position_x=0, position_y=0, ilvl=0,
+            identified=True, corrupted=False, icon="",
+        )
+        tab = StashTab(name="Tab", index=0, tab_type="NormalStash", items=[item])
+
+        mock_price_service = Mock()
+        mock_price_service.check_item.return_value = [
+            {"chaos_value": 1.0, "divine_value": 0.0, "source": "poe.ninja"}
+        ]
+
+        scanner._price_tab(tab, mock_price_service)
+
+        mock_price_service.check_item.assert_called_once_with(scanner._build_item_text(item))
+        mock_price_service.check_parsed_item.assert_not_called()
+        assert item.chaos_value == 1.0
+        assert tab.total_value_chaos == 1.0
+
 
 # -------------------------
 # StashItem __str__ Tests
@@ -645,6 +645,26 @@ class TestStashValuator:
         assert priced.sockets == "RGB-WW"
         assert priced.links == 3
 
+    def test_price_item_shares_repeated_strings(self, valuator, mock_ninja_client):
+        """Repeated names and icons are interned and items carry no __dict__."""
+        valuator.price_db = None
+
+        mock_tab = Mock()
+        mock_tab.name = "Test"
+        mock_tab.index = 0
+
+        first, second = (
+            valuator._price_item(
+                {"frameType": 5, "typeLine": "".join(["Divine ", "Orb"]), "icon": "".join(["https://", "icon"])},
+                mock_tab,
+            )
+            for _ in range(2)
+        )
+
+        assert first.type_line is second.type_line
+        assert first.icon is second.icon
+        assert not hasattr(first, "__dict__")
+
     def test_valuate_tab(self, valuator, mock_ninja_client):
         """Valuate a tab with multiple items."""
         # Setup price database
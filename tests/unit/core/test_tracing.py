@@ -0,0 +1,188 @@
+"""Tests for core/tracing.py."""
+from __future__ import annotations
+
+import contextvars
+import threading
+
+import pytest
+
+from core.tracing import StageStats, Tracer, current_span, get_tracer, reset_tracer, span, traced
+
+pytestmark = pytest.mark.unit
+
+
+# =============================================================================
+# Spans
+# =============================================================================
+
+
+class TestSpans:
+    def test_nested_spans_build_tree(self):
+        tracer = Tracer()
+
+        with tracer.span("outer", item="Goldrim") as outer:
+            with tracer.span("inner.a"):
+                pass
+            with tracer.span("inner.b") as inner:
+                inner.set(rows=3)
+
+        assert [child.name for child in outer.children] == ["inner.a", "inner.b"]
+        trace = tracer.recent_traces(1)[0]
+        assert trace["name"] == "outer"
+        assert trace["attrs"] == {"item": "Goldrim"}
+        assert trace["children"][1]["attrs"] == {"rows": 3}
+
+    def test_error_is_recorded_and_reraised(self):
+        tracer = Tracer()
+
+        with pytest.raises(ValueError):
+            with tracer.span("boom"):
+                raise ValueError("bad")
+
+        stats = tracer.stage_stats()["boom"]
+        assert stats["count"] == 1
+        assert stats["errors"] == 1
+
+    def test_current_span_restored_after_exit(self):
+        tracer = Tracer()
+        assert current_span() is None
+        with tracer.span("outer") as outer:
+            assert current_span() is outer
+            with tracer.span("inner"):
+                pass
+            assert current_span() is outer
+        assert current_span() is None
+
+    def test_leaf_root_spans_are_not_kept_as_traces(self):
+        tracer = Tracer()
+        with tracer.span("db.Query"):
+            pass
+        assert tracer.recent_traces() == []
+        assert tracer.stage_stats()["db.Query"]["count"] == 1
+
+    def test_copied_context_nests_worker_spans(self):
+        tracer = Tracer()
+
+        def work():
+            with tracer.span("worker"):
+                pass
+
+        with tracer.span("parent") as parent:
+            thread = threading.Thread(target=contextvars.copy_context().run, args=(work,))
+            thread.start()
+            thread.join()
+
+        assert [child.name for child in parent.children] == ["worker"]
+
+    def test_children_are_capped(self, monkeypatch):
+        monkeypatch.setattr("core.tracing.MAX_CHILDREN", 2)
+        tracer = Tracer()
+        with tracer.span("outer") as outer:
+            for _ in range(5):
+                with tracer.span("leaf"):
+                    pass
+        assert len(outer.children) == 2
+        assert outer.dropped_children == 3
+        assert tracer.stage_stats()["leaf"]["count"] == 5
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = Tracer(enabled=False)
+        with tracer.span("x"):
+            pass
+        assert tracer.stage_stats() == {}
+
+
+# =============================================================================
+# Stats
+# =============================================================================
+
+
+class TestStageStats:
+    def test_percentiles_over_window(self):
+        tracer = Tracer(window=100)
+        stats = tracer._stages.setdefault("stage", StageStats(100))
+        for ms in range(1, 101):
+            stats.add(float(ms), error=False)
+
+        snap = tracer.stage_stats()["stage"]
+
+        assert snap["p50_ms"] == 50.0
+        assert snap["p95_ms"] == 95.0
+        assert snap["p99_ms"] == 99.0
+        assert snap["max_ms"] == 100.0
+        assert snap["window"] == 100
+
+    def test_window_rolls_but_counters_accumulate(self):
+        tracer = Tracer(window=3)
+        for _ in range(5):
+            with tracer.span("s"):
+                pass
+        snap = tracer.stage_stats()["s"]
+        assert snap["count"] == 5
+        assert snap["window"] == 3
+
+    def test_prefix_filter_and_reset(self):
+        tracer = Tracer()
+        with tracer.span("pricing.parse"):
+            pass
+        with tracer.span("http.poe.ninja"):
+            pass
+
+        assert list(tracer.stage_stats("pricing.")) == ["pricing.parse"]
+        tracer.reset()
+        assert tracer.stage_stats() == {}
+
+    def test_slowest_traces_sorted(self):
+        tracer = Tracer()
+        for name in ("a", "b"):
+            with tracer.span(name) as root:
+                with tracer.span("child"):
+                    pass
+            root.duration_ms = 5.0 if name == "a" else 1.0
+        assert [t["name"] for t in tracer.recent_traces(slowest=True)] == ["a", "b"]
+        assert [t["name"] for t in tracer.recent_traces()] == ["b", "a"]
+
+
+# =============================================================================
+# Profiling
+# =============================================================================
+
+
+class TestProfiling:
+    def test_profile_captured_only_while_enabled(self, tmp_path):
+        tracer = Tracer()
+        assert tracer.profile_report() == ""
+
+        tracer.set_profiling(True)
+        with tracer.span("check"):
+            sum(range(1000))
+        report = tracer.profile_report(limit=5)
+        tracer.set_profiling(False)
+
+        assert "function calls" in report
+        assert not tracer.profiling
+        assert tracer.dump_profile(tmp_path / "x.prof") is False
+
+    def test_env_var_enables_profiling(self, monkeypatch):
+        monkeypatch.setenv("POE_PROFILE", "1")
+        assert Tracer().profiling
+
+
+# =============================================================================
+# Module helpers
+# =============================================================================
+
+
+class TestModuleHelpers:
+    def test_span_and_traced_use_shared_tracer(self):
+        @traced("helpers.fn")
+        def fn(x):
+            return x * 2
+
+        with span("helpers.outer"):
+            assert fn(2) == 4
+
+        stats = get_tracer().stage_stats("helpers.")
+        assert set(stats) == {"helpers.fn", "helpers.outer"}
+        reset_tracer()
+        assert get_tracer().stage_stats("helpers.") == {}
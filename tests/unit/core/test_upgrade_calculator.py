@@ -1,9 +1,12 @@
 """Tests for core/upgrade_calculator.py - Upgrade impact calculation."""
 
+import numpy as np
 import pytest
 
 from core.upgrade_calculator import (
+    STAT_COLUMNS,
     ItemStats,
+    ModPatternMatcher,
     UpgradeImpact,
     ResistanceGaps,
     ItemStatExtractor,
@@ -393,3 +396,106 @@ class TestUpgradeCalculatorWithoutBuildStats:
         impact = calculator.calculate_upgrade(new_mods, current_mods)
 
         assert len(impact.losses) >= 1
+
+
+# =============================================================================
+# Batch Scoring Tests
+# =============================================================================
+
+
+CANDIDATE_MODS = [
+    ["+100 to maximum Life", "+40% to Fire Resistance"],
+    ["+12% to all Elemental Resistances", "+30 to Strength"],
+    ["+80 to maximum Energy Shield", "+25% to Chaos Resistance"],
+    ["+20 to all Attributes", "+35% to Cold Resistance", "unmatched mod"],
+    [],
+]
+
+
+class TestModPatternMatcher:
+    """Tests for ModPatternMatcher."""
+
+    def test_first_match_wins(self):
+        matcher = ModPatternMatcher({"compound": r"\+(\d+) to Strength and", "simple": r"\+(\d+) to Strength"})
+        assert matcher.match("+10 to Strength and Dexterity") == ("compound", 10.0)
+        assert matcher.match("+10 to Strength") == ("simple", 10.0)
+
+    def test_no_match_returns_none(self):
+        matcher = ModPatternMatcher(ItemStatExtractor.PATTERNS)
+        assert matcher.match("Adds 1 to 5 Physical Damage") is None
+
+    def test_cache_is_bounded(self):
+        matcher = ModPatternMatcher({"life": r"\+(\d+) to maximum Life"})
+        matcher.MAX_CACHE_SIZE = 3
+        for i in range(10):
+            assert matcher.match(f"+{i} to maximum Life") == ("life", float(i))
+        assert len(matcher._cache) <= 3
+
+
+class TestBatchExtraction:
+    """Tests for vector/matrix extraction."""
+
+    def test_vector_matches_extract(self):
+        extractor = ItemStatExtractor()
+        for mods in CANDIDATE_MODS:
+            expected = extractor.extract(mods).to_vector()
+            np.testing.assert_array_equal(extractor.extract_vector(mods), expected)
+
+    def test_matrix_shape(self):
+        matrix = ItemStatExtractor().extract_matrix(CANDIDATE_MODS)
+        assert matrix.shape == (len(CANDIDATE_MODS), len(STAT_COLUMNS))
+
+    def test_vector_round_trip(self):
+        stats = ItemStats(flat_life=50, fire_res=30, strength=10)
+        assert ItemStats.from_vector(stats.to_vector()) == stats
+
+
+class TestCalculateUpgradesBatch:
+    """Batch scoring must agree with calculate_upgrade."""
+
+    @pytest.fixture(params=["gaps", "capped", "es_build", "no_stats"])
+    def calculator(self, request):
+        if request.param == "no_stats":
+            return UpgradeCalculator()
+        if request.param == "gaps":
+            stats = BuildStats(life_inc=150.0, armour_inc=100.0, cold_overcap=-10.0, chaos_res=30.0)
+        elif request.param == "capped":
+            stats = BuildStats(life_inc=100.0, fire_overcap=20.0, cold_overcap=10.0,
+                               lightning_overcap=5.0, chaos_res=75.0)
+        else:
+            stats = BuildStats(total_es=6000, es_inc=200.0, lightning_overcap=-30.0)
+        return UpgradeCalculator(stats)
+
+    @pytest.mark.parametrize("current", [None, ["+60 to maximum Life", "+30% to Cold Resistance"]])
+    def test_parity_with_scalar(self, calculator, current):
+        batch = calculator.calculate_upgrades_batch(CANDIDATE_MODS, current)
+
+        assert len(batch) == len(CANDIDATE_MODS)
+        for i, mods in enumerate(CANDIDATE_MODS):
+            expected = calculator.calculate_upgrade(mods, current)
+            actual = batch.impact(i)
+            assert actual.upgrade_score == pytest.approx(expected.upgrade_score)
+            assert actual.effective_life_delta == pytest.approx(expected.effective_life_delta)
+            assert actual.effective_es_delta == pytest.approx(expected.effective_es_delta)
+            assert actual.cold_res_gap_covered == pytest.approx(expected.cold_res_gap_covered)
+            assert actual.lightning_res_gap_covered == pytest.approx(expected.lightning_res_gap_covered)
+            assert actual.chaos_res_gap_covered == pytest.approx(expected.chaos_res_gap_covered)
+            assert actual.improvements == expected.improvements
+            assert actual.losses == expected.losses
+            assert (actual.is_upgrade, actual.is_sidegrade, actual.is_downgrade) == (
+                expected.is_upgrade, expected.is_sidegrade, expected.is_downgrade
+            )
+
+    def test_ranked_indices(self, calculator):
+        batch = calculator.calculate_upgrades_batch(CANDIDATE_MODS)
+        ranked = batch.ranked_indices()
+        scores = batch.upgrade_scores[ranked]
+        assert list(scores) == sorted(scores, reverse=True)
+
+    def test_delta_column(self, calculator):
+        batch = calculator.calculate_upgrades_batch(CANDIDATE_MODS, ["+50 to maximum Life"])
+        np.testing.assert_array_equal(batch.delta("flat_life"), [50, -50, -50, -50, -50])
+
+    def test_empty_batch(self, calculator):
+        batch = calculator.calculate_upgrades_batch([])
+        assert len(batch) == 0
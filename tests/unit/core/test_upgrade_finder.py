@@ -416,6 +416,43 @@ class TestUpgradeFinderService:
         assert candidate.total_score > 0
         assert candidate.upgrade_impact is not None
 
+    def test_score_candidates_batch_matches_individual(self, mock_character_manager, sample_build_stats):
+        """Batch scoring ranks and scores like per-candidate scoring."""
+        service = UpgradeFinderService(mock_character_manager)
+
+        build_stats = BuildStats.from_pob_stats(sample_build_stats)
+        from core.upgrade_calculator import UpgradeCalculator
+        upgrade_calc = UpgradeCalculator(build_stats)
+
+        def make_candidates():
+            return [
+                UpgradeCandidate(name="Cheap", base_type="Helm", item_level=80,
+                                 explicit_mods=["+40 to maximum Life"], price_chaos=10),
+                UpgradeCandidate(name="Good", base_type="Helm", item_level=84,
+                                 explicit_mods=["+100 to maximum Life", "+40% to Cold Resistance"],
+                                 price_chaos=200),
+                UpgradeCandidate(name="Bad", base_type="Helm", item_level=70, explicit_mods=[]),
+            ]
+
+        current_mods = ["+70 to maximum Life"]
+        kept = service._score_candidates(
+            candidates=make_candidates(),
+            current_mods=current_mods,
+            upgrade_calculator=upgrade_calc,
+            dps_calculator=None,
+            max_results=2,
+        )
+
+        expected = make_candidates()
+        for candidate in expected:
+            service._score_candidate(candidate, current_mods, upgrade_calc, None)
+        expected.sort(key=lambda c: c.total_score, reverse=True)
+
+        assert [c.name for c in kept] == [c.name for c in expected[:2]]
+        for got, want in zip(kept, expected):
+            assert got.total_score == pytest.approx(want.total_score)
+            assert got.upgrade_impact.improvements == want.upgrade_impact.improvements
+
 
 class TestBisToPoBSlotMapping:
     """Tests for slot name mapping."""
@@ -918,3 +955,160 @@ class TestFactoryFunction:
         assert isinstance(service, UpgradeFinderService)
         assert service.league == "Settlers"
         assert service.character_manager is mock_manager
+
+
+class TestConcurrentUpgradeSearch:
+    """Tests for concurrent slot searches with shared listings."""
+
+    LISTING = {
+        "id": "listing1",
+        "item": {
+            "name": "Storm Loop",
+            "typeLine": "Ruby Ring",
+            "ilvl": 84,
+            "explicitMods": ["+70 to maximum Life", "+40% to Fire Resistance"],
+            "implicitMods": [],
+        },
+        "listing": {"price": {"amount": 20, "currency": "chaos"}},
+    }
+
+    def test_slots_run_concurrently(self, mock_character_manager, sample_profile):
+        """Slow trade searches for different slots should overlap."""
+        import threading
+        import time
+
+        mock_character_manager.get_profile.return_value = sample_profile
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def slow_search(query, max_results):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            return (None, [])
+
+        with patch('data_sources.pricing.trade_api.TradeApiSource') as mock_api:
+            mock_api.return_value._search.side_effect = slow_search
+
+            service = UpgradeFinderService(mock_character_manager, max_workers=4)
+            result = service.find_upgrades(
+                "TestCharacter",
+                budget_chaos=500,
+                slots=["Helmet", "Gloves", "Boots", "Belt"],
+            )
+
+        assert active["peak"] > 1
+        assert list(result.slot_results) == ["Helmet", "Gloves", "Boots", "Belt"]
+        # One shared trade source for the whole run
+        assert mock_api.call_count == 1
+
+    def test_streams_each_slot_result(self, mock_character_manager, sample_profile):
+        """on_slot_result should be called once per slot."""
+        mock_character_manager.get_profile.return_value = sample_profile
+        streamed = []
+
+        with patch('data_sources.pricing.trade_api.TradeApiSource') as mock_api:
+            mock_api.return_value._search.return_value = (None, [])
+
+            service = UpgradeFinderService(mock_character_manager)
+            service.find_upgrades(
+                "TestCharacter",
+                budget_chaos=500,
+                slots=["Helmet", "Gloves", "Amulet"],
+                on_slot_result=streamed.append,
+            )
+
+        assert sorted(r.slot for r in streamed) == ["Amulet", "Gloves", "Helmet"]
+        assert all(isinstance(r, SlotUpgradeResult) for r in streamed)
+
+    def test_callback_error_does_not_abort_search(
+        self, mock_character_manager, sample_profile
+    ):
+        """A failing on_slot_result callback should not lose slot results."""
+        mock_character_manager.get_profile.return_value = sample_profile
+
+        def bad_callback(slot_result):
+            raise RuntimeError("UI gone")
+
+        with patch('data_sources.pricing.trade_api.TradeApiSource') as mock_api:
+            mock_api.return_value._search.return_value = (None, [])
+
+            service = UpgradeFinderService(mock_character_manager)
+            result = service.find_upgrades(
+                "TestCharacter",
+                budget_chaos=500,
+                slots=["Helmet", "Gloves"],
+                on_slot_result=bad_callback,
+            )
+
+        assert set(result.slot_results) == {"Helmet", "Gloves"}
+
+    def test_ring_slots_share_listings(self, mock_character_manager, sample_profile):
+        """Ring 1 and Ring 2 build the same query and should share one search."""
+        mock_character_manager.get_profile.return_value = sample_profile
+
+        with patch('data_sources.pricing.trade_api.TradeApiSource') as mock_api:
+            source = mock_api.return_value
+            source._search.return_value = ("search1", ["listing1"])
+            source._fetch_listings.return_value = [self.LISTING]
+
+            service = UpgradeFinderService(mock_character_manager)
+            result = service.find_upgrades(
+                "TestCharacter",
+                budget_chaos=500,
+                slots=["Ring 1", "Ring 2"],
+            )
+
+        assert source._search.call_count == 1
+        assert source._fetch_listings.call_count == 1
+        ring1 = result.slot_results["Ring 1"]
+        ring2 = result.slot_results["Ring 2"]
+        assert ring1.error is None and ring2.error is None
+        assert len(ring1.candidates) == len(ring2.candidates) == 1
+        # Each slot scores its own candidate objects
+        assert ring1.candidates[0] is not ring2.candidates[0]
+        assert result.total_candidates == 2
+
+    def test_trade_source_paces_requests_with_client_limiter(
+        self, mock_character_manager, sample_profile
+    ):
+        """The finder adds no limiter of its own; the trade source paces requests."""
+        mock_character_manager.get_profile.return_value = sample_profile
+
+        with patch('data_sources.pricing.trade_api.TradeApiSource') as mock_api:
+            mock_api.return_value._search.return_value = (None, [])
+
+            service = UpgradeFinderService(mock_character_manager)
+            service.find_upgrades("TestCharacter", budget_chaos=500, slots=["Helmet", "Gloves"])
+
+        mock_api.assert_called_once_with(league="Standard", pace_requests=True)
+
+    def test_injected_trade_source_is_reused(self, mock_character_manager, sample_profile):
+        """A trade source passed in (e.g. the app's) serves every run."""
+        mock_character_manager.get_profile.return_value = sample_profile
+        source = Mock()
+        source._search.return_value = (None, [])
+
+        with patch('data_sources.pricing.trade_api.TradeApiSource') as mock_api:
+            service = UpgradeFinderService(mock_character_manager, trade_source=source)
+            service.find_upgrades("TestCharacter", budget_chaos=500, slots=["Helmet"])
+            service.find_upgrades("TestCharacter", budget_chaos=500, slots=["Helmet"])
+
+        mock_api.assert_not_called()
+        assert source._search.call_count == 2
+
+    def test_shared_state_cleared_after_run(self, mock_character_manager, sample_profile):
+        """Listings should not be reused across separate runs."""
+        mock_character_manager.get_profile.return_value = sample_profile
+
+        with patch('data_sources.pricing.trade_api.TradeApiSource') as mock_api:
+            mock_api.return_value._search.return_value = (None, [])
+
+            service = UpgradeFinderService(mock_character_manager)
+            service.find_upgrades("TestCharacter", budget_chaos=500, slots=["Helmet"])
+            service.find_upgrades("TestCharacter", budget_chaos=500, slots=["Helmet"])
+
+            assert mock_api.return_value._search.call_count == 2
@@ -0,0 +1,249 @@
+"""Tests for the AI response cache and the caching/replay client wrapper."""
+
+import time
+
+import pytest
+
+from core.result import Ok, Err
+from data_sources.ai import create_ai_client
+from data_sources.ai.base_ai_client import BaseAIClient, AIResponse
+from data_sources.ai.response_cache import (
+    AIResponseCache,
+    CachingAIClient,
+    get_ai_response_cache,
+    make_cache_key,
+    reset_ai_response_cache,
+)
+
+
+class FakeClient(BaseAIClient):
+    """Provider client that counts calls and answers from a script."""
+
+    def __init__(self, api_key: str = "key", max_tokens: int = 500, fail: bool = False):
+        super().__init__(api_key=api_key, max_tokens=max_tokens)
+        self._model = "fake-model"
+        self.calls = 0
+        self.fail = fail
+        self.closed = False
+
+    @property
+    def provider_name(self) -> str:
+        return "fake"
+
+    def complete(self, prompt, system_prompt=None):
+        self.calls += 1
+        if self.fail:
+            return Err("provider down")
+        return Ok(AIResponse(
+            content=f"answer {self.calls}: {prompt}",
+            model=self._model,
+            tokens_used=42,
+            provider=self.provider_name,
+        ))
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def cache():
+    cache = AIResponseCache(":memory:", ttl_seconds=3600, max_entries=50)
+    yield cache
+    cache.close()
+
+
+# =============================================================================
+# Cache keys
+# =============================================================================
+
+
+class TestMakeCacheKey:
+
+    def test_whitespace_and_line_endings_hash_equal(self):
+        a, _ = make_cache_key("claude", "m", "Item\r\nLine  \n", "sys")
+        b, _ = make_cache_key("claude", "m", "Item\nLine", "sys ")
+        assert a == b
+
+    def test_identity_fields_change_key(self):
+        base, _ = make_cache_key("claude", "m", "prompt", "sys", {"max_tokens": 500})
+        assert make_cache_key("openai", "m", "prompt", "sys", {"max_tokens": 500})[0] != base
+        assert make_cache_key("claude", "m2", "prompt", "sys", {"max_tokens": 500})[0] != base
+        assert make_cache_key("claude", "m", "prompt", "other", {"max_tokens": 500})[0] != base
+        assert make_cache_key("claude", "m", "prompt", "sys", {"max_tokens": 800})[0] != base
+
+    def test_prompt_hash_ignores_provider(self):
+        _, h1 = make_cache_key("claude", "m", "prompt")
+        _, h2 = make_cache_key("groq", "x", "prompt")
+        assert h1 == h2
+
+
+# =============================================================================
+# CachingAIClient
+# =============================================================================
+
+
+class TestCachingAIClient:
+
+    def test_miss_then_hit(self, cache):
+        inner = FakeClient()
+        client = CachingAIClient(inner, cache)
+
+        first = client.complete("Analyze this", "sys").unwrap()
+        second = client.complete("Analyze this", "sys").unwrap()
+
+        assert inner.calls == 1
+        assert first.metadata["cache"] == "miss"
+        assert not first.from_cache
+        assert second.from_cache
+        assert second.metadata["cache"] == "hit"
+        assert second.content == first.content
+        assert second.tokens_used == 42
+        assert second.provider == "fake"
+        assert cache.hits == 1
+
+    def test_errors_are_not_cached(self, cache):
+        inner = FakeClient(fail=True)
+        client = CachingAIClient(inner, cache)
+
+        assert client.complete("p").is_err()
+        assert client.complete("p").is_err()
+        assert inner.calls == 2
+        assert cache.size == 0
+
+    def test_stale_entries_are_refetched(self, cache):
+        inner = FakeClient()
+        client = CachingAIClient(inner, cache)
+        client.complete("p")
+
+        cache.ttl_seconds = 0
+        time.sleep(0.01)
+        result = client.complete("p").unwrap()
+
+        assert inner.calls == 2
+        assert not result.from_cache
+
+    def test_purge_expired(self, cache):
+        CachingAIClient(FakeClient(), cache).complete("p")
+        cache.ttl_seconds = 0
+        time.sleep(0.01)
+        assert cache.purge_expired() == 1
+        assert cache.size == 0
+
+    def test_size_cap_evicts_least_recently_used(self):
+        cache = AIResponseCache(":memory:", max_entries=2)
+        inner = FakeClient()
+        client = CachingAIClient(inner, cache)
+        client.complete("a")
+        time.sleep(0.01)
+        client.complete("b")
+        time.sleep(0.01)
+        client.complete("a")  # touch "a" so "b" is the LRU entry
+        time.sleep(0.01)
+        client.complete("c")
+
+        assert cache.size == 2
+        assert client.complete("a").unwrap().from_cache
+        assert not client.complete("b").unwrap().from_cache
+        cache.close()
+
+    def test_record_mode_always_calls_provider(self, cache):
+        inner = FakeClient()
+        client = CachingAIClient(inner, cache, mode="record")
+
+        client.complete("p")
+        result = client.complete("p").unwrap()
+
+        assert inner.calls == 2
+        assert result.metadata["cache"] == "record"
+        assert cache.size == 1
+
+    def test_replay_miss_is_error_without_calling_provider(self, cache):
+        inner = FakeClient()
+        client = CachingAIClient(inner, cache, mode="replay")
+
+        result = client.complete("never recorded")
+
+        assert result.is_err()
+        assert "No recorded" in result.error
+        assert inner.calls == 0
+
+    def test_replay_needs_no_credentials(self, cache):
+        assert CachingAIClient(FakeClient(api_key=""), cache, mode="replay").is_configured()
+        assert not CachingAIClient(FakeClient(api_key=""), cache).is_configured()
+
+    def test_max_tokens_is_part_of_key(self, cache):
+        CachingAIClient(FakeClient(max_tokens=500), cache).complete("p")
+        other = FakeClient(max_tokens=1000)
+        assert not CachingAIClient(other, cache).complete("p").unwrap().from_cache
+        assert other.calls == 1
+
+    def test_invalid_mode(self, cache):
+        with pytest.raises(ValueError):
+            CachingAIClient(FakeClient(), cache, mode="bogus")
+
+    def test_close_closes_wrapped_client_only(self, cache):
+        inner = FakeClient()
+        CachingAIClient(inner, cache).close()
+        assert inner.closed
+        assert cache.size == 0  # cache connection still usable
+
+
+# =============================================================================
+# Transcripts
+# =============================================================================
+
+
+class TestTranscripts:
+
+    def test_record_save_load_replay(self, tmp_path):
+        recorder_cache = AIResponseCache(tmp_path / "record.db")
+        recorder = CachingAIClient(FakeClient(), recorder_cache, mode="record")
+        recorded = recorder.complete("What is this worth?", "You are a PoE expert").unwrap()
+
+        transcript = tmp_path / "transcript.json"
+        assert recorder_cache.save_transcript(transcript) == 1
+        recorder_cache.close()
+
+        replay_cache = AIResponseCache(tmp_path / "replay.db", ttl_seconds=1)
+        assert replay_cache.load_transcript(transcript) == 1
+        offline = FakeClient(api_key="")
+        replayer = CachingAIClient(offline, replay_cache, mode="replay")
+
+        replayed = replayer.complete("What is this worth?", "You are a PoE expert").unwrap()
+
+        assert replayed.content == recorded.content
+        assert replayed.metadata["cache"] == "replay"
+        assert offline.calls == 0
+        replay_cache.close()
+
+
+# =============================================================================
+# Factory and singleton
+# =============================================================================
+
+
+class TestCreateAIClientCache:
+
+    def test_wraps_when_cache_given(self, cache):
+        client = create_ai_client("claude", api_key="k", cache=cache, cache_mode="replay")
+        assert isinstance(client, CachingAIClient)
+        assert client.provider_name == "claude"
+        assert client.mode == "replay"
+        client.close()
+
+    def test_plain_client_without_cache(self):
+        client = create_ai_client("claude", api_key="k")
+        assert not isinstance(client, CachingAIClient)
+        client.close()
+
+
+class TestGlobalCache:
+
+    def test_get_returns_same_instance(self, tmp_path):
+        reset_ai_response_cache()
+        try:
+            first = get_ai_response_cache(db_path=tmp_path / "ai.db")
+            assert get_ai_response_cache() is first
+            assert (tmp_path / "ai.db").exists()
+        finally:
+            reset_ai_response_cache()
@@ -122,6 +122,19 @@ class TestDivineRate:
             api._divine_rate_expiry = 0.0
             return api
 
+    def test_set_league_drops_old_league_rate_and_index(self, api):
+        """Switching league forces the rate and currency index to refetch."""
+        api.divine_chaos_rate = 150.0
+        api._divine_rate_expiry = time.time() + 3600
+        api._currency_index = {"divine orb": {"chaosEquivalent": 150.0}}
+
+        api.set_league("Keepers")
+
+        assert api.league == "Keepers"
+        assert api.divine_chaos_rate == 0.0
+        assert api._divine_rate_expiry == 0.0
+        assert api._currency_index == {}
+
     def test_refresh_divine_rate_success(self, api):
         """Should extract divine rate from currency overview."""
         api.get_currency_overview = Mock(return_value={
@@ -629,6 +629,38 @@ class TestBaseAPIClientCaching:
         # Should make two requests (different params)
         assert mock_request.call_count == 2
 
+    def test_concurrent_cache_misses_share_one_request(self):
+        """Threads missing the same key together should trigger one request."""
+        release = threading.Event()
+        calls = []
+
+        def slow_request(*args, **kwargs):
+            calls.append(kwargs["url"])
+            release.wait(timeout=5)
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {"data": "value"}
+            return response
+
+        client = DummyAPIClient(base_url="https://api.example.com", rate_limit=1000)
+        client.session.request = slow_request
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.get('/overview', params={"type": "Oil"})))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        while client._inflight.stats()["shared"] < 4:
+            time.sleep(0.005)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(calls) == 1
+        assert results == [{"data": "value"}] * 5
+
     def test_clear_cache_removes_all_cached_responses(self):
         """Should clear all cached responses."""
         client = DummyAPIClient(base_url="https://api.example.com")
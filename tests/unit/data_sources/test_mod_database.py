@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 
 import pytest
 
-from data_sources.mod_database import ModDatabase
+from data_sources.mod_database import ModDatabase, stat_template
 
 
 class TestModDatabase:
@@ -464,3 +464,159 @@ class TestModDatabaseItems:
         names = {r["name"] for r in results}
         assert "Polished Breach Scarab" in names
         assert "Gilded Ambush Scarab" in names
+
+
+class TestStatTemplate:
+    """Tests for stat_template()."""
+
+    def test_ranges_and_numbers_become_hash(self):
+        assert stat_template("+(80-89) to maximum Life") == "+# to maximum Life"
+        assert stat_template("+92 to maximum Life") == "+# to maximum Life"
+        assert stat_template("Adds (1-2) to (30-40) Fire Damage") == "Adds # to # Fire Damage"
+        assert stat_template("(0.5-1)% of Damage Leeched") == "#% of Damage Leeched"
+
+    def test_unwraps_wiki_links(self):
+        assert stat_template("+(10-20) to [[Life|maximum Life]]") == "+# to maximum Life"
+
+    def test_none(self):
+        assert stat_template(None) is None
+
+
+class TestModDatabaseSearch:
+    """Tests for the FTS5 search indexes."""
+
+    @pytest.fixture
+    def mods(self):
+        return [
+            {"id": "life1", "name": "Hale", "stat_text_raw": "+(10-19) to maximum Life",
+             "generation_type": 6, "tier_text": "Tier 3"},
+            {"id": "life2", "name": "Virile", "stat_text_raw": "+(80-89) to maximum Life",
+             "generation_type": 6, "tier_text": "Tier 1"},
+            {"id": "mana1", "name": "of the Lizard", "stat_text_raw": "(5-10)% increased maximum Mana",
+             "generation_type": 7},
+            {"id": "fire1", "name": "Scorching", "stat_text_raw": "Adds (1-2) to (3-4) Fire Damage",
+             "generation_type": 6},
+            {"id": "es1", "name": "Shining", "stat_text": "+(5-8) to maximum [[Energy Shield]]",
+             "generation_type": 6},
+        ]
+
+    @pytest.fixture
+    def items(self):
+        return [
+            {"name": "Kaom's Heart", "base_item": "Glorious Plate", "item_class": "Body Armour", "rarity": "Unique"},
+            {"name": "Kaom's Primacy", "base_item": "Wyrmbone Rapier", "item_class": "Thrusting One Hand Sword",
+             "rarity": "Unique"},
+            {"name": "Lioneye's Glare", "base_item": "Imperial Bow", "item_class": "Bow", "rarity": "Unique"},
+            {"name": "Polished Breach Scarab", "item_class": "Map Fragment"},
+        ]
+
+    @pytest.fixture
+    def db(self, tmp_path, mods, items):
+        db = ModDatabase(db_path=tmp_path / "mods.db")
+        db.insert_mods(mods)
+        db.insert_items(items)
+        yield db
+        db.close()
+
+    @pytest.fixture
+    def like_db(self, tmp_path, mods, items):
+        db = ModDatabase(db_path=tmp_path / "like.db", use_fts=False)
+        db.insert_mods(mods)
+        db.insert_items(items)
+        yield db
+        db.close()
+
+    def test_fts_enabled_by_default(self, db):
+        assert db.fts_enabled is True
+
+    def test_search_mods_matches_rolled_text(self, db):
+        results = db.search("+92 to maximum Life")
+
+        assert {r["id"] for r in results} == {"life1", "life2"}
+        assert all("score" in r for r in results)
+
+    def test_search_mods_prefix(self, db):
+        assert [r["id"] for r in db.search("increased max")] == ["mana1"]
+
+    def test_search_mods_wiki_markup_stat_text(self, db):
+        assert [r["id"] for r in db.search("energy shield")] == ["es1"]
+
+    def test_search_ranks_stat_text_above_name(self, db):
+        db.insert_mods([{"id": "named", "name": "Life", "stat_text_raw": "+(1-2) to Strength"}])
+
+        results = db.search("life")
+
+        assert results[-1]["id"] == "named"
+
+    def test_search_items(self, db):
+        results = db.search("kaom", kind="item")
+
+        assert {r["name"] for r in results} == {"Kaom's Heart", "Kaom's Primacy"}
+
+    def test_search_items_name_ranks_above_base(self, db):
+        db.insert_items([{"name": "Bow Breaker", "item_class": "Mace"}])
+
+        results = db.search("bow", kind="item")
+
+        assert results[0]["name"] == "Bow Breaker"
+
+    def test_search_limit(self, db):
+        assert len(db.search("maximum", limit=1)) == 1
+
+    def test_search_empty_query(self, db):
+        assert db.search("  +% ") == []
+
+    def test_search_unknown_kind(self, db):
+        with pytest.raises(ValueError):
+            db.search("life", kind="gem")
+
+    def test_search_without_fts(self, like_db):
+        assert {r["id"] for r in like_db.search("maximum life")} == {"life1", "life2"}
+        assert [r["name"] for r in like_db.search("lioneye", kind="item")] == ["Lioneye's Glare"]
+
+    def test_index_follows_replace_and_delete(self, db):
+        db.insert_mods([{"id": "life1", "name": "Hale", "stat_text_raw": "+(10-19) to Armour"}])
+        db.conn.execute("DELETE FROM mods WHERE id = 'life2'")
+        db.conn.commit()
+
+        assert db.search("maximum life") == []
+        assert [r["id"] for r in db.search("armour")] == ["life1"]
+        assert db.conn.execute("SELECT COUNT(*) FROM mods_fts").fetchone()[0] == db.get_mod_count()
+
+    def test_index_built_for_existing_database(self, tmp_path, mods):
+        path = tmp_path / "old.db"
+        with ModDatabase(db_path=path, use_fts=False) as old:
+            old.conn.executescript("DROP TABLE IF EXISTS mods_fts; DROP TABLE IF EXISTS items_fts;")
+            old.insert_mods(mods)
+
+        with ModDatabase(db_path=path) as upgraded:
+            assert {r["id"] for r in upgraded.search("maximum life")} == {"life1", "life2"}
+
+    @pytest.mark.parametrize("pattern", [
+        "%maximum Life%",
+        "%imum Life",
+        "+(80%",
+        "Adds%Fire%",
+        "%to maximum%",
+        "%Energy Shield%",
+        "%",
+        "%nothing here%",
+    ])
+    def test_find_mods_by_stat_text_matches_like_scan(self, db, like_db, pattern):
+        fts_ids = [r["id"] for r in db.find_mods_by_stat_text(pattern)]
+
+        assert fts_ids == [r["id"] for r in like_db.find_mods_by_stat_text(pattern)]
+
+    def test_find_mods_by_stat_text_generation_type_with_fts(self, db):
+        results = db.find_mods_by_stat_text("%maximum%", generation_type=7)
+
+        assert [r["id"] for r in results] == ["mana1"]
+
+    @pytest.mark.parametrize("pattern", ["%Kaom%", "Kaom's%", "%Heart", "%"])
+    def test_search_items_matches_like_scan(self, db, like_db, pattern):
+        fts_names = [r["name"] for r in db.search_items(pattern)]
+
+        assert fts_names == [r["name"] for r in like_db.search_items(pattern)]
+
+    def test_get_scarabs_matches_like_scan(self, db, like_db):
+        assert [r["name"] for r in db.get_scarabs()] == [r["name"] for r in like_db.get_scarabs()]
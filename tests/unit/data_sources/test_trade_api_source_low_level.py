@@ -201,3 +201,37 @@ def test_check_parsed_item_happy_path_search_and_fetch_normalized() -> None:
     assert isinstance(get_params, dict | type(None))
     if isinstance(get_params, dict):
         assert get_params.get("query") == "search123"
+
+
+def test_paced_source_waits_on_client_limiter_per_request() -> None:
+    """Every search and every fetch batch waits on the client's rate limiter."""
+    from unittest.mock import Mock
+
+    from data_sources.pricing.trade_cache import TradeCache
+
+    session = FakeSession()
+    events: list[str] = []
+    client = Mock(league="Crucible")
+    client.rate_limiter.wait_if_needed.side_effect = lambda: events.append("wait")
+    src = TradeApiSource(
+        client=client,
+        league="Crucible",
+        logger=logging.getLogger("test.trade.low"),
+        session=session,
+        trade_cache=TradeCache(),
+        pace_requests=True,
+    )
+    result_ids = [f"id{i}" for i in range(25)]
+    session.enqueue_post(FakeResponse(json_data={"id": "search123", "result": result_ids}))
+    for _ in range(3):
+        session.enqueue_get(FakeResponse(json_data={"result": []}))
+
+    original_post, original_get = session.post, session.get
+    session.post = lambda *a, **k: (events.append("post"), original_post(*a, **k))[1]  # type: ignore[method-assign]
+    session.get = lambda *a, **k: (events.append("get"), original_get(*a, **k))[1]  # type: ignore[method-assign]
+
+    search_id, ids = src._search({"query": {"type": "Ring"}}, max_results=25)
+    src._fetch_listings(search_id, ids)
+
+    # One wait ahead of the search and of each of the three 10-id fetch batches
+    assert events == ["wait", "post", "wait", "get", "wait", "get", "wait", "get"]
@@ -0,0 +1,153 @@
+"""Tests for data_sources/pricing/trade_cache.py and its use by TradeApiSource."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List
+
+import pytest
+
+from data_sources.pricing.trade_api import TradeApiSource
+from data_sources.pricing.trade_cache import (
+    TradeCache,
+    canonical_query_hash,
+    clear_trade_cache,
+    get_trade_cache,
+)
+
+pytestmark = pytest.mark.unit
+
+BASE = "https://www.pathofexile.com/api/trade"
+
+
+class FakeResponse:
+    def __init__(self, json_data: Dict[str, Any]):
+        self.status_code = 200
+        self._json_data = json_data
+        self.text = ""
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> Dict[str, Any]:
+        return self._json_data
+
+
+class RecordingSession:
+    """Serves search results and listings for any requested IDs."""
+
+    def __init__(self, result_ids: List[str]):
+        self.result_ids = result_ids
+        self.post_calls: List[Dict[str, Any]] = []
+        self.fetched_ids: List[List[str]] = []
+
+    def post(self, url: str, json: Dict[str, Any], timeout: int = 15) -> FakeResponse:
+        self.post_calls.append(json)
+        return FakeResponse({"id": f"search-{len(self.post_calls)}", "result": self.result_ids})
+
+    def get(self, url: str, params: Dict[str, Any] | None = None, timeout: int = 15) -> FakeResponse:
+        ids = url.rsplit("/", 1)[-1].split(",")
+        self.fetched_ids.append(ids)
+        return FakeResponse({
+            "result": [
+                {"id": i, "listing": {"price": {"amount": 1, "currency": "chaos"}}, "item": {}}
+                for i in ids
+            ]
+        })
+
+
+def make_source(session: RecordingSession, cache: TradeCache | None = None) -> TradeApiSource:
+    return TradeApiSource(
+        league="Settlers",
+        logger=logging.getLogger("test.trade.cache"),
+        session=session,
+        trade_cache=cache or TradeCache(),
+    )
+
+
+class TestCanonicalQueryHash:
+    def test_key_order_does_not_matter(self):
+        a = {"query": {"type": "Ring", "status": {"option": "online"}}, "sort": {"price": "asc"}}
+        b = {"sort": {"price": "asc"}, "query": {"status": {"option": "online"}, "type": "Ring"}}
+        assert canonical_query_hash(BASE, "Settlers", a) == canonical_query_hash(BASE, "Settlers", b)
+
+    def test_league_and_endpoint_scope_key(self):
+        q = {"query": {"type": "Ring"}}
+        key = canonical_query_hash(BASE, "Settlers", q)
+        assert key != canonical_query_hash(BASE, "Standard", q)
+        assert key != canonical_query_hash(BASE + "2", "Settlers", q)
+
+
+class TestTradeCache:
+    def test_search_round_trip(self):
+        cache = TradeCache()
+        q = {"query": {"type": "Ring"}}
+        assert cache.get_search(BASE, "Settlers", q) is None
+
+        cache.put_search(BASE, "Settlers", q, "abc", ["1", "2"])
+
+        assert cache.get_search(BASE, "Settlers", q) == ("abc", ["1", "2"])
+
+    def test_get_listings_splits_cached_and_missing(self):
+        cache = TradeCache()
+        cache.put_listings(BASE, [{"id": "a"}, {"id": "c"}, {"no_id": True}])
+
+        cached, missing = cache.get_listings(BASE, ["a", "b", "c", "d"])
+
+        assert set(cached) == {"a", "c"}
+        assert missing == ["b", "d"]
+
+    def test_expired_search_is_miss(self):
+        cache = TradeCache(search_ttl=-1)
+        q = {"query": {"type": "Ring"}}
+        cache.put_search(BASE, "Settlers", q, "abc", ["1"])
+        assert cache.get_search(BASE, "Settlers", q) is None
+
+    def test_shared_instance_and_clear(self):
+        cache = get_trade_cache()
+        assert get_trade_cache() is cache
+        cache.put_listings(BASE, [{"id": "a"}])
+        clear_trade_cache()
+        assert cache.get_listings(BASE, ["a"]) == ({}, ["a"])
+
+
+class TestTradeApiSourceCaching:
+    def test_identical_query_reuses_search(self):
+        session = RecordingSession(["1", "2", "3"])
+        src = make_source(session)
+        query = src._build_query(type("Item", (), {"name": "Goldrim", "base_type": "Leather Cap"})())
+
+        first = src._search(query, max_results=3)
+        second = src._search(dict(reversed(list(query.items()))), max_results=2)
+
+        assert len(session.post_calls) == 1
+        assert first == ("search-1", ["1", "2", "3"])
+        assert second == ("search-1", ["1", "2"])
+
+    def test_fetch_only_requests_missing_ids(self):
+        session = RecordingSession([])
+        src = make_source(session)
+
+        src._fetch_listings("s1", ["1", "2"])
+        listings = src._fetch_listings("s2", ["2", "3", "1"])
+
+        assert session.fetched_ids == [["1", "2"], ["3"]]
+        assert [listing["id"] for listing in listings] == ["2", "3", "1"]
+
+    def test_fully_cached_fetch_makes_no_request(self):
+        session = RecordingSession([])
+        src = make_source(session)
+        src._fetch_listings("s1", ["1", "2"])
+
+        src._fetch_listings("s1", ["1", "2"])
+
+        assert len(session.fetched_ids) == 1
+
+    def test_sources_share_cache(self):
+        cache = TradeCache()
+        session = RecordingSession(["1"])
+        query = {"query": {"type": "Leather Cap"}}
+
+        make_source(session, cache)._search(query, max_results=5)
+        make_source(session, cache)._search(query, max_results=5)
+
+        assert len(session.post_calls) == 1
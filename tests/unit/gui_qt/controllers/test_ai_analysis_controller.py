@@ -48,6 +48,8 @@ class MockConfig:
         self.ai_custom_prompt = ""
         self.ollama_host = "http://localhost:11434"
         self.ollama_model = "deepseek-r1:14b"
+        self.ai_response_cache_enabled = False
+        self.ai_response_cache_ttl_hours = 168
 
     def has_ai_configured(self) -> bool:
         return self._has_ai
@@ -224,6 +226,24 @@ class TestAIAnalysisControllerAnalyze:
 
         assert result is True
 
+    def test_analyze_passes_response_cache_when_enabled(self, controller, mock_config):
+        """analyze_item hands the shared response cache to the worker."""
+        mock_config.ai_response_cache_enabled = True
+        sentinel = object()
+        with patch('gui_qt.workers.ai_analysis_worker.AIAnalysisWorker') as worker_cls, \
+                patch('data_sources.ai.get_ai_response_cache', return_value=sentinel) as get_cache:
+            controller.analyze_item("item text", [])
+
+        assert worker_cls.call_args.kwargs["response_cache"] is sentinel
+        get_cache.assert_called_once_with(ttl_seconds=168 * 3600)
+
+    def test_analyze_without_response_cache_when_disabled(self, controller):
+        """analyze_item passes no cache when caching is disabled."""
+        with patch('gui_qt.workers.ai_analysis_worker.AIAnalysisWorker') as worker_cls:
+            controller.analyze_item("item text", [])
+
+        assert worker_cls.call_args.kwargs["response_cache"] is None
+
 
 # =============================================================================
 # Cancel Tests
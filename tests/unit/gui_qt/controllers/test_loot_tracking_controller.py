@@ -279,6 +279,36 @@ class TestLootTrackingControllerSession:
 
         mock_save.assert_called_once_with(mock_session)
 
+    def test_save_session_to_db_queues_on_persistence(self, controller, mock_session):
+        """Should hand the ended session to the background persistence service."""
+        controller._persistence = MagicMock()
+
+        controller._save_session_to_db(mock_session)
+
+        controller._persistence.save_session.assert_called_once_with(mock_session)
+        controller._ctx.db.conn.cursor.assert_not_called()
+
+    def test_map_complete_persists_progress(self, controller, mock_session):
+        """Should write map runs incrementally as they complete."""
+        controller._persistence = MagicMock()
+        with patch.object(type(controller._session_manager), 'current_session',
+                          new_callable=PropertyMock, return_value=mock_session):
+            controller._on_map_complete(MagicMock(map_name="Strand"))
+
+        controller._persistence.record_progress.assert_called_once_with(mock_session)
+
+    def test_load_session_history_uses_paged_query(self, controller):
+        """Should read one page of history through the database."""
+        controller._persistence = MagicMock()
+        controller._ctx.db.get_loot_session_history.return_value = [{"id": "s1"}]
+
+        result = controller.load_session_history(limit=10, offset=20)
+
+        assert result == [{"id": "s1"}]
+        controller._ctx.db.get_loot_session_history.assert_called_once_with(
+            league="Settlers", limit=10, offset=20
+        )
+
     def test_get_current_session(self, controller, mock_session):
         """Should return current session from manager."""
         # Mock the session manager's current_session property
@@ -416,6 +446,18 @@ class TestLootTrackingControllerSnapshotResults:
 
         mock_diff.assert_called_once_with(mock_snapshot)
 
+    def test_diff_result_carries_after_snapshot_forward(self, controller, mock_snapshot):
+        """The after snapshot becomes the baseline for the next map run."""
+        after = MagicMock()
+        controller._before_snapshot = mock_snapshot
+
+        with patch('gui_qt.controllers.loot_tracking_controller.StashDiffWorker') as mock_cls:
+            controller._compute_diff(after)
+        controller._on_diff_result(MagicMock(has_changes=False))
+
+        assert mock_cls.call_args.kwargs["engine"] is controller._diff_engine
+        assert controller._before_snapshot is after
+
     def test_on_snapshot_result_emits_completed(self, controller, mock_snapshot):
         """Should emit snapshot_completed with item count."""
         controller._pending_snapshot_type = "before"
@@ -170,6 +170,48 @@ class TestPriceCheckController:
         assert data.evaluation is None
         mock_rare_evaluator.evaluate.assert_not_called()
 
+    def test_check_price_streams_source_results(self, mock_parser):
+        """on_source_done sees each source's rows before check_price returns."""
+        import threading
+
+        from core.price_multi import MultiSourcePriceService, SourceLimits
+
+        release = threading.Event()
+
+        class FastSource:
+            name = "fast"
+
+            def check_item(self, item_text):
+                return [{"item_name": item_text, "chaos_value": 5}]
+
+        class HungSource:
+            name = "slow"
+
+            def check_item(self, item_text):
+                release.wait(5)
+                return [{"item_name": item_text, "chaos_value": 1}]
+
+        service = MultiSourcePriceService(
+            sources=[FastSource(), HungSource()],
+            default_limits=SourceLimits(deadline_s=0.2),
+        )
+        controller = PriceCheckController(parser=mock_parser, price_service=service)
+        seen = []
+        try:
+            result = controller.check_price("Item text", on_source_done=seen.append)
+        finally:
+            release.set()
+            service.close()
+
+        assert result.is_ok()
+        assert [(r.source, r.timed_out) for r in seen] == [("fast", False), ("slow", True)]
+        assert result.unwrap().result_count == 1
+
+    def test_check_price_without_callback_keeps_plain_call(self, controller, mock_price_service):
+        """Services without streaming support are called as before."""
+        controller.check_price("Item text")
+
+        mock_price_service.check_item.assert_called_once_with("Item text")
 
 class TestFormatResults:
     """Tests for result formatting."""
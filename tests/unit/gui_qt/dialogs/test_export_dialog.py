@@ -0,0 +1,100 @@
+"""Tests for ExportDialog."""
+
+import gzip
+import json
+from unittest.mock import MagicMock, patch
+
+from core.database import Database
+
+
+def _make_ctx(tmp_path, rows: int) -> MagicMock:
+    db = Database(tmp_path / "export.db")
+    db.conn.executemany(
+        "INSERT INTO sales (item_name, listed_price_chaos, listed_at, sold_at) VALUES (?, ?, ?, ?)",
+        ((f"Item {i}", float(i), "2025-01-01", f"2025-01-02T{i % 24:02d}:00") for i in range(rows)),
+    )
+    db.conn.commit()
+    ctx = MagicMock()
+    ctx.db = db
+    return ctx
+
+
+def _make_dialog(qtbot, ctx):
+    from gui_qt.dialogs.export_dialog import ExportDialog
+
+    dialog = ExportDialog(ctx)
+    qtbot.addWidget(dialog)
+    return dialog
+
+
+def _select(combo, key) -> None:
+    combo.setCurrentIndex(combo.findData(key))
+
+
+class TestExportDialog:
+    """Tests for the streaming export dialog."""
+
+    def test_offers_jsonl_and_gzip(self, qtbot, tmp_path):
+        dialog = _make_dialog(qtbot, _make_ctx(tmp_path, 0))
+
+        assert dialog._format_combo.findData("jsonl") >= 0
+        assert dialog._compress_check.isChecked() is False
+
+    def test_export_runs_in_worker(self, qtbot, tmp_path):
+        dialog = _make_dialog(qtbot, _make_ctx(tmp_path, 50))
+        _select(dialog._format_combo, "jsonl")
+        dialog._compress_check.setChecked(True)
+        target = tmp_path / "sales"
+
+        with patch("gui_qt.dialogs.export_dialog.QFileDialog.getSaveFileName", return_value=(str(target), "")), \
+                patch("gui_qt.dialogs.export_dialog.QMessageBox") as message_box:
+            dialog._do_export()
+            qtbot.waitUntil(lambda: message_box.information.called, timeout=5000)
+
+        with gzip.open(tmp_path / "sales.jsonl.gz", "rt", encoding="utf-8") as f:
+            assert len([json.loads(line) for line in f]) == 50
+
+    def test_cancel_then_resume(self, qtbot, tmp_path):
+        dialog = _make_dialog(qtbot, _make_ctx(tmp_path, 30))
+        _select(dialog._format_combo, "csv")
+        service = dialog._get_export_service()
+        original = service.export_stream
+
+        def cancel_after_first_chunk(*args, **kwargs):
+            kwargs["chunk_size"] = 10
+            if kwargs["offset"] == 0:
+                report = kwargs["progress"]
+
+                def progress(update):
+                    report(update)
+                    dialog._worker.cancel()
+                kwargs["progress"] = progress
+            return original(*args, **kwargs)
+
+        service.export_stream = cancel_after_first_chunk
+
+        with patch("gui_qt.dialogs.export_dialog.QFileDialog.getSaveFileName",
+                   return_value=(str(tmp_path / "s.csv"), "")), \
+                patch("gui_qt.dialogs.export_dialog.QMessageBox") as message_box:
+            dialog._do_export()
+            qtbot.waitUntil(lambda: dialog._resume is not None, timeout=5000)
+            assert dialog._export_btn.text() == "Resume"
+            assert dialog._resume["offset"] == 10
+            assert dialog._resume["resume_after"] is not None
+            assert not message_box.information.called
+
+            dialog._do_export()
+            qtbot.waitUntil(lambda: message_box.information.called, timeout=5000)
+
+        lines = (tmp_path / "s.csv").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 31  # header + every row once
+
+    def test_changing_options_clears_resume(self, qtbot, tmp_path):
+        dialog = _make_dialog(qtbot, _make_ctx(tmp_path, 0))
+        dialog._resume = {"offset": 10}
+        dialog._export_btn.setText("Resume")
+
+        _select(dialog._format_combo, "jsonl")
+
+        assert dialog._resume is None
+        assert dialog._export_btn.text() == "Export..."
@@ -281,6 +281,7 @@ class TestUpgradeFinderDialogSearch:
         dialog._start_search()
 
         assert not dialog.progress_bar.isHidden()
+        mock_worker.slot_finished.connect.assert_called_once_with(dialog._on_slot_finished)
 
 
 # =============================================================================
@@ -408,6 +409,46 @@ class TestUpgradeFinderDialogResults:
         assert "10" in dialog.summary_label.text()  # total_candidates
         assert "500" in dialog.summary_label.text()  # budget
 
+    @patch('gui_qt.dialogs.upgrade_finder_dialog.UpgradeFinderService')
+    def test_slot_finished_adds_rows_as_slots_complete(
+        self, mock_service_cls, qtbot, mock_character_manager, mock_candidate
+    ):
+        """Each finished slot should show up in the table before the search ends."""
+        from core.upgrade_finder import SlotUpgradeResult, UpgradeFinderResult
+
+        dialog = UpgradeFinderDialog(character_manager=mock_character_manager)
+        qtbot.addWidget(dialog)
+        dialog._current_result = UpgradeFinderResult(profile_name="Build1", budget_chaos=500)
+
+        better = MagicMock()
+        better.name = "Better Boots"
+        better.price_display = "1 divine"
+        better.total_score = 90.0
+        better.upgrade_impact = None
+
+        dialog._on_slot_finished(SlotUpgradeResult(slot="Helmet", current_item=None, candidates=[mock_candidate]))
+        assert dialog.results_table.rowCount() == 1
+        assert "1 slots so far" in dialog.summary_label.text()
+
+        dialog._on_slot_finished(SlotUpgradeResult(slot="Boots", current_item=None, candidates=[better]))
+        assert dialog.results_table.rowCount() == 2
+        assert dialog.results_table.item(0, 1).text() == "Better Boots"
+        assert "2 potential upgrades in 2 slots" in dialog.summary_label.text()
+
+    @patch('gui_qt.dialogs.upgrade_finder_dialog.UpgradeFinderService')
+    def test_slot_finished_without_search_is_ignored(
+        self, mock_service_cls, qtbot, mock_character_manager, mock_candidate
+    ):
+        """A slot result arriving with no search in progress should not touch the table."""
+        from core.upgrade_finder import SlotUpgradeResult
+
+        dialog = UpgradeFinderDialog(character_manager=mock_character_manager)
+        qtbot.addWidget(dialog)
+
+        dialog._on_slot_finished(SlotUpgradeResult(slot="Helmet", current_item=None, candidates=[mock_candidate]))
+
+        assert dialog.results_table.rowCount() == 0
+
     @patch('gui_qt.dialogs.upgrade_finder_dialog.UpgradeFinderService')
     def test_show_no_results(
         self, mock_service_cls, qtbot, mock_character_manager
@@ -0,0 +1,89 @@
+"""Tests for gui_qt/services/clipboard_service.py - Qt clipboard integration."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from gui_qt.services.clipboard_service import ClipboardService, QtClipboardSource
+
+pytestmark = pytest.mark.unit
+
+
+ITEM_TEXT = """Item Class: Boots
+Rarity: Rare
+Gale Stride
+Sorcerer Boots
+--------
+Item Level: 86"""
+
+
+class FakeClipboard:
+    """Stands in for QClipboard with a connectable dataChanged."""
+
+    def __init__(self):
+        self._text = ""
+        self.dataChanged = MagicMock()
+        self._slots = []
+        self.dataChanged.connect.side_effect = self._slots.append
+        self.dataChanged.disconnect.side_effect = self._slots.remove
+
+    def text(self):
+        return self._text
+
+    def setText(self, text):
+        self._text = text
+        for slot in list(self._slots):
+            slot()
+
+
+@pytest.fixture
+def mock_ctx():
+    ctx = MagicMock()
+    ctx.config.data = {}
+    return ctx
+
+
+class TestQtClipboardSource:
+    def test_pushes_on_data_changed(self):
+        clipboard = FakeClipboard()
+        source = QtClipboardSource(clipboard)
+        received = []
+
+        assert source.start(received.append) is True
+        clipboard.setText("hello")
+        source.stop()
+        clipboard.setText("ignored")
+
+        assert received == ["hello"]
+
+    def test_start_twice_returns_false(self):
+        source = QtClipboardSource(FakeClipboard())
+        assert source.start(lambda t: None) is True
+        assert source.start(lambda t: None) is False
+
+    def test_uses_application_clipboard(self, qapp):
+        source = QtClipboardSource()
+        source._get_clipboard().setText("from qt")
+        assert source.read() == "from qt"
+
+
+class TestAutoDetection:
+    def test_item_copied_emitted(self, mock_ctx, qapp, monkeypatch):
+        clipboard = FakeClipboard()
+        monkeypatch.setattr(
+            "gui_qt.services.clipboard_service.QGuiApplication.clipboard",
+            lambda: clipboard,
+        )
+        service = ClipboardService(mock_ctx)
+        emitted = []
+        service.item_copied.connect(emitted.append)
+
+        assert service.start_auto_detection() is True
+        assert service.is_auto_detecting is True
+
+        clipboard.setText("plain text")
+        clipboard.setText(ITEM_TEXT)
+
+        service.stop_auto_detection()
+        assert service.is_auto_detecting is False
+        assert emitted == [ITEM_TEXT]
@@ -228,6 +228,27 @@ class TestPriceCheckerWindowPriceCheck:
                     window_with_mock_panel._mock_panel.set_results.assert_called_once_with(mock_data.formatted_rows)
                     assert window_with_mock_panel._check_in_progress is False
 
+    def test_do_price_check_reports_each_source(self, window_with_mock_panel):
+        """_do_price_check shows each source's outcome as it finishes."""
+        from core.price_multi import SourceResult
+
+        statuses = []
+
+        def check_price(item_text, on_source_done=None):
+            on_source_done(SourceResult("poe.ninja", rows=[{}, {}]))
+            statuses.append(window_with_mock_panel.status_bar.currentMessage())
+            on_source_done(SourceResult("suggested_undercut", error=TimeoutError(), timed_out=True))
+            statuses.append(window_with_mock_panel.status_bar.currentMessage())
+            return Err("stop")
+
+        with patch.object(window_with_mock_panel._price_controller, 'check_price', side_effect=check_price):
+            window_with_mock_panel._do_price_check("test item", 0)
+
+        assert statuses == [
+            "Checking price... poe.ninja: 2 result(s)",
+            "Checking price... suggested_undercut timed out",
+        ]
+
     def test_do_price_check_with_rare_evaluation(self, window_with_mock_panel):
         """_do_price_check uses unified verdict for rare items."""
         mock_data = MagicMock()
@@ -6,6 +6,10 @@ These tests verify that all PyQt6 GUI components can be imported successfully.
 
 from __future__ import annotations
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
 pytestmark = pytest.mark.unit
@@ -67,6 +71,36 @@ def test_gui_qt_dialogs_imports():
     assert RecordSaleDialog is not None
 
 
+def test_gui_qt_packages_import_lazily():
+    """Importing a package or a light widget must not load every window."""
+    code = (
+        "import sys\n"
+        "import gui_qt.windows, gui_qt.dialogs\n"
+        "from gui_qt.widgets.loading_screen import LoadingScreen\n"
+        "heavy = ['gui_qt.main_window', 'gui_qt.windows.recent_sales_window',\n"
+        "         'gui_qt.dialogs.record_sale_dialog', 'gui_qt.widgets.item_inspector']\n"
+        "print([m for m in heavy if m in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[3],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_gui_qt_lazy_package_unknown_attribute():
+    """Unknown names still raise AttributeError."""
+    import gui_qt.windows
+
+    with pytest.raises(AttributeError):
+        gui_qt.windows.NoSuchWindow  # noqa: B018
+    assert "RecentSalesWindow" in dir(gui_qt.windows)
+
+
 def test_color_functions():
     """Test color utility functions."""
     from gui_qt.styles import get_rarity_color, get_value_color, COLORS
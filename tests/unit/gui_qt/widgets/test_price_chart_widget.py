@@ -82,6 +82,18 @@ class TestPriceChartWidgetWithMatplotlib:
         widget.set_time_range(0)  # All time
         assert widget.get_current_days() == 0
 
+    @pytest.mark.unit
+    def test_plot_width_tracks_canvas(self, qapp):
+        """Test plot width follows the canvas size (used to cap chart points)."""
+        from gui_qt.widgets.price_chart_widget import PriceChartWidget
+        widget = PriceChartWidget()
+        widget.canvas.resize(1200, 400)
+        wide = widget.plot_width()
+        widget.canvas.resize(400, 400)
+
+        assert wide >= 100
+        assert widget.plot_width() < wide
+
     @pytest.mark.unit
     def test_clear(self, qapp):
         """Test clearing the chart."""
@@ -335,6 +335,15 @@ class TestToastManager:
 
         assert toast.width() <= 400
 
+    def test_dismissed_toast_is_removed(self, manager, qtbot):
+        """A toast leaves the list once its fade out finishes."""
+        toast = manager.show_toast("Test")
+
+        with qtbot.waitSignal(toast.dismissed, timeout=1000):
+            toast._fade_out()
+
+        assert toast not in manager._toasts
+
     def test_remove_toast(self, manager, qtbot):
         """_remove_toast removes toast from list."""
         toast = manager.show_toast("Test")
@@ -344,6 +353,22 @@ class TestToastManager:
 
         assert len(manager._toasts) == initial_count - 1
 
+    def test_parent_destroyed_with_toasts(self, qtbot):
+        """Deleting the parent while toasts are showing is safe."""
+        parent = QWidget()
+        parent.resize(800, 600)
+        parent.show()
+        manager = ToastManager(parent)
+        manager.info("Toast 1")
+        manager.info("Toast 2")
+
+        parent.deleteLater()
+        qtbot.wait(50)
+
+        assert manager._toasts == []
+        assert manager._parent is None
+        assert manager.info("After") is None
+
     def test_remove_toast_not_in_list(self, manager, parent_widget, qtbot):
         """_remove_toast handles toast not in list."""
         other_toast = ToastNotification("Other", parent=parent_widget)
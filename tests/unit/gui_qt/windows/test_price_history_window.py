@@ -11,6 +11,7 @@ from gui_qt.windows.price_history_window import (
     TRACKED_CURRENCIES,
     CURRENCY_SHORT_NAMES,
 )
+from core.economy import LeagueEconomyOverview
 
 
 # =============================================================================
@@ -311,12 +312,12 @@ class TestPriceHistoryWindowInit:
             assert window._uniques_table is not None
             assert window._uniques_model is not None
 
-    def test_init_creates_aggregate_button(self, qtbot, mock_ctx):
-        """Aggregate button is created."""
+    def test_init_has_no_aggregate_button(self, qtbot, mock_ctx):
+        """Summaries are materialised on demand; there's no manual step."""
         with patch('gui_qt.windows.price_history_window.apply_window_icon'):
             window = PriceHistoryWindow(mock_ctx)
             qtbot.addWidget(window)
-            assert window._aggregate_btn is not None
+            assert not hasattr(window, "_aggregate_btn")
 
 
 class TestPriceHistoryWindowLeagues:
@@ -348,73 +349,68 @@ class TestPriceHistoryWindowLeagues:
                 assert window._league_combo.currentText() == "Settlers"
 
 
-class TestPriceHistoryWindowAggregation:
-    """Tests for aggregation functionality."""
+class TestPriceHistoryWindowDataLoading:
+    """Tests for data loading."""
 
-    def test_aggregate_button_click(self, qtbot, mock_ctx):
-        """Aggregate button triggers aggregation."""
+    def test_on_league_changed_loads_overview_in_worker(self, qtbot, mock_ctx):
+        """Changing league loads the overview off the UI thread."""
         with patch('gui_qt.windows.price_history_window.apply_window_icon'):
             window = PriceHistoryWindow(mock_ctx)
             qtbot.addWidget(window)
 
-            # Mock the economy service
             mock_service = MagicMock()
-            mock_service.aggregate_league.return_value = True
-            mock_service.is_league_aggregated.return_value = True
-            mock_service.get_currency_summary.return_value = []
-            mock_service.get_top_items_summary.return_value = []
-            mock_service.get_league_summary.return_value = {}
+            mock_service.get_league_overview.return_value = LeagueEconomyOverview(
+                league="Affliction",
+                currencies=[{
+                    "currency_name": "Divine Orb",
+                    "avg_value": 150.0,
+                    "min_value": 100.0,
+                    "max_value": 200.0,
+                    "start_value": 100.0,
+                    "end_value": 180.0,
+                    "data_points": 30,
+                }],
+                top_items=[{"rank": 1, "item_name": "Mageblood", "avg_value": 5000.0}],
+                summary={"first_date": "2023-12-08T00:00:00", "last_date": "2024-04-01T00:00:00"},
+            )
 
             with patch.object(window, '_get_economy_service', return_value=mock_service):
-                window._league_combo.setCurrentText("Settlers")
-                window._on_aggregate_clicked()
-
-                mock_service.aggregate_league.assert_called_once()
-
-    def test_aggregate_button_disabled_during_aggregation(self, qtbot, mock_ctx):
-        """Button is disabled during aggregation."""
+                window._league_combo.addItem("Affliction")
+                window._league_combo.setCurrentText("Affliction")
+                qtbot.waitUntil(lambda: window._currency_model.rowCount() == 1, timeout=5000)
+
+            mock_service.get_league_overview.assert_called_with(
+                "Affliction", TRACKED_CURRENCIES, top_items_limit=10
+            )
+            assert window._uniques_model.rowCount() == 1
+            assert window._stats_label.text() == "2023-12-08 to 2024-04-01"
+
+    def test_stale_league_result_ignored(self, qtbot, mock_ctx):
+        """A result for a league that is no longer selected is dropped."""
         with patch('gui_qt.windows.price_history_window.apply_window_icon'):
             window = PriceHistoryWindow(mock_ctx)
             qtbot.addWidget(window)
+            window._currency_model.set_data([])
 
-            # Create slow mock service
-            mock_service = MagicMock()
-
-            def slow_aggregate(*args, **kwargs):
-                # Check button is disabled
-                assert not window._aggregate_btn.isEnabled()
-                return True
+            overview = LeagueEconomyOverview(
+                league="Old League",
+                currencies=[{"currency_name": "Divine Orb", "avg_value": 1.0}],
+            )
+            window._on_league_summary_loaded("Old League", overview)
 
-            mock_service.aggregate_league.side_effect = slow_aggregate
-            mock_service.is_league_aggregated.return_value = True
-            mock_service.get_currency_summary.return_value = []
-            mock_service.get_top_items_summary.return_value = []
-            mock_service.get_league_summary.return_value = {}
-
-            with patch.object(window, '_get_economy_service', return_value=mock_service):
-                window._league_combo.setCurrentText("Settlers")
-                window._on_aggregate_clicked()
+            assert window._currency_model.rowCount() == 0
 
-
-class TestPriceHistoryWindowDataLoading:
-    """Tests for data loading."""
-
-    def test_on_league_changed_loads_data(self, qtbot, mock_ctx):
-        """Changing league loads new data."""
+    def test_load_error_clears_tables(self, qtbot, mock_ctx):
+        """A failed load clears the tables and says so."""
         with patch('gui_qt.windows.price_history_window.apply_window_icon'):
             window = PriceHistoryWindow(mock_ctx)
             qtbot.addWidget(window)
+            window._currency_model.set_data([{"currency_name": "Divine Orb"}])
 
-            mock_service = MagicMock()
-            mock_service.is_league_aggregated.return_value = False
-
-            with patch.object(window, '_get_economy_service', return_value=mock_service):
-                with patch.object(window, '_load_currency_data_raw') as mock_load_currency:
-                    with patch.object(window, '_load_uniques_data_raw') as mock_load_uniques:
-                        window._on_league_changed("Affliction")
+            window._on_league_summary_error(window._league_combo.currentText(), "boom")
 
-                        mock_load_currency.assert_called_once()
-                        mock_load_uniques.assert_called_once()
+            assert window._currency_model.rowCount() == 0
+            assert window._stats_label.text() == "Failed to load data"
 
     def test_empty_league_does_nothing(self, qtbot, mock_ctx):
         """Empty league string does nothing."""
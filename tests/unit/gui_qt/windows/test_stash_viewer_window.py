@@ -13,6 +13,7 @@ from gui_qt.windows.stash_viewer_window import (
     StashItemDetailsDialog,
     StashViewerWindow,
 )
+from gui_qt.stash_viewer.models import ItemViewIndex
 
 
 # =============================================================================
@@ -460,6 +461,133 @@ class TestItemTableModelGetItem:
         assert item is None
 
 
+def _priced(name: str, total: float, **kwargs) -> PricedItem:
+    return PricedItem(
+        name=name, type_line=name, base_type=name, item_class="Currency",
+        unit_price=total, total_price=total, **kwargs,
+    )
+
+
+class TestItemViewIndex:
+    """Tests for the cached filter/sort index behind ItemTableModel."""
+
+    def test_filters_and_sorts(self):
+        items = [_priced("Chaos Orb", 1.0), _priced("Divine Orb", 150.0), _priced("Goldrim", 5.0)]
+        view = ItemViewIndex()
+        view.set_items(items)
+
+        view.sort(lambda item: item.total_price, descending=True)
+        assert [view.item_at(r).name for r in range(len(view))] == ["Divine Orb", "Goldrim", "Chaos Orb"]
+
+        view.set_min_value(2.0)
+        view.set_search_text("  ORB ")
+        assert [view.item_at(r).name for r in range(len(view))] == ["Divine Orb"]
+
+        view.sort(None)
+        view.set_min_value(0.0)
+        assert [view.item_at(r).name for r in range(len(view))] == ["Chaos Orb", "Divine Orb"]
+        assert view.item_at(5) is None
+
+    def test_narrowing_search_filters_current_rows(self):
+        """Extending the search text only re-checks rows that already matched."""
+        items = [_priced("Chaos Orb", 1.0), _priced("Orb of Alteration", 1.0), _priced("Goldrim", 1.0)]
+        view = ItemViewIndex()
+        view.set_items(items)
+
+        view.set_search_text("o")
+        assert len(view) == 3
+        view.set_search_text("orb")
+        assert len(view) == 2
+        view.set_search_text("orb of")
+        assert [view.item_at(r).name for r in range(len(view))] == ["Orb of Alteration"]
+        view.set_search_text("gold")  # not a refinement: start over
+        assert [view.item_at(r).name for r in range(len(view))] == ["Goldrim"]
+
+    def test_index_is_not_rebuilt_on_read(self):
+        """rowCount()/data() read the cached index; items aren't revisited."""
+        model = ItemTableModel()
+        model.set_items([_priced("Chaos Orb", 1.0), _priced("Divine Orb", 150.0)])
+
+        with patch.object(ItemViewIndex, "_refilter") as refilter:
+            for _ in range(10):
+                model.rowCount()
+                model.data(model.index(1, 1), Qt.ItemDataRole.DisplayRole)
+        refilter.assert_not_called()
+
+
+class TestItemTableModelSort:
+    """Tests for header sorting."""
+
+    @staticmethod
+    def _names(model):
+        return [model.get_item(r).name for r in range(model.rowCount())]
+
+    def test_sort_by_column(self):
+        model = ItemTableModel()
+        model.set_items([
+            _priced("Goldrim", 5.0, rarity="Unique"),
+            _priced("Chaos Orb", 1.0, rarity="Currency"),
+            _priced("Divine Orb", 150.0, rarity="Currency"),
+        ])
+
+        model.sort(4, Qt.SortOrder.DescendingOrder)  # total_price
+        assert self._names(model) == ["Divine Orb", "Goldrim", "Chaos Orb"]
+
+        model.sort(1, Qt.SortOrder.AscendingOrder)  # display_name
+        assert self._names(model) == ["Chaos Orb", "Divine Orb", "Goldrim"]
+
+        model.sort(-1)  # unsorted
+        assert self._names(model) == ["Goldrim", "Chaos Orb", "Divine Orb"]
+
+    def test_sort_survives_new_items_and_filters(self):
+        model = ItemTableModel()
+        model.sort(4, Qt.SortOrder.AscendingOrder)
+
+        model.set_items([_priced("Divine Orb", 150.0), _priced("Chaos Orb", 1.0), _priced("Exalted Orb", 12.0)])
+        model.set_min_value(2.0)
+
+        assert self._names(model) == ["Exalted Orb", "Divine Orb"]
+
+    def test_sort_by_verdict_puts_keep_first_descending(self):
+        model = ItemTableModel()
+        model.set_items([
+            _priced("Vendor Rare", 0.0, rarity="Rare", price_source=PriceSource.RARE_EVALUATED, eval_tier="vendor"),
+            _priced("Keeper", 0.0, rarity="Rare", price_source=PriceSource.RARE_EVALUATED, eval_tier="excellent"),
+        ])
+
+        model.sort(0, Qt.SortOrder.DescendingOrder)
+
+        assert self._names(model) == ["Keeper", "Vendor Rare"]
+
+
+class TestItemTableModelPerformance:
+    """Cell access must not depend on how many items the tab holds."""
+
+    @staticmethod
+    def _read_cells(model, reads: int) -> float:
+        import time
+
+        start = time.perf_counter()
+        for i in range(reads):
+            model.data(model.index(i % 40, 1 + i % 6), Qt.ItemDataRole.DisplayRole)
+        return time.perf_counter() - start
+
+    def test_cell_access_constant_time_at_50k(self):
+        small, large = ItemTableModel(), ItemTableModel()
+        small.set_items([_priced(f"Orb {i}", float(i % 100)) for i in range(500)])
+        large.set_items([_priced(f"Orb {i}", float(i % 100)) for i in range(50_000)])
+        for model in (small, large):
+            model.set_min_value(10.0)
+            model.set_search_text("orb")
+            self._read_cells(model, 200)  # warm up
+
+        small_time = self._read_cells(small, 4000)
+        large_time = self._read_cells(large, 4000)
+
+        # 100x the items; generous bound keeps this stable on CI
+        assert large_time < small_time * 3 + 0.05
+
+
 # =============================================================================
 # StashItemDetailsDialog Tests
 # =============================================================================
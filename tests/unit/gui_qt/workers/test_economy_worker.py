@@ -0,0 +1,43 @@
+"""Tests for LeagueSummaryWorker."""
+
+from unittest.mock import MagicMock
+
+from core.economy import LeagueEconomyOverview
+from gui_qt.workers.economy_worker import LeagueSummaryWorker
+
+
+class TestLeagueSummaryWorker:
+    """Tests for LeagueSummaryWorker."""
+
+    def test_execute_loads_overview(self):
+        service = MagicMock()
+        service.get_league_overview.return_value = LeagueEconomyOverview(league="Settlers")
+        worker = LeagueSummaryWorker(service, "Settlers", ["Divine Orb"], top_items_limit=5)
+
+        result = worker._execute()
+
+        assert result.league == "Settlers"
+        service.get_league_overview.assert_called_once_with("Settlers", ["Divine Orb"], top_items_limit=5)
+        assert worker.league == "Settlers"
+
+    def test_emits_result(self, qtbot):
+        service = MagicMock()
+        service.get_league_overview.return_value = LeagueEconomyOverview(league="Settlers")
+        worker = LeagueSummaryWorker(service, "Settlers")
+
+        with qtbot.waitSignal(worker.result, timeout=2000) as blocker:
+            worker.start()
+        worker.wait()
+
+        assert blocker.args[0].league == "Settlers"
+
+    def test_emits_error(self, qtbot):
+        service = MagicMock()
+        service.get_league_overview.side_effect = RuntimeError("database locked")
+        worker = LeagueSummaryWorker(service, "Settlers")
+
+        with qtbot.waitSignal(worker.error, timeout=2000) as blocker:
+            worker.start()
+        worker.wait()
+
+        assert "database locked" in blocker.args[0]
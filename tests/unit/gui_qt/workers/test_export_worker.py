@@ -0,0 +1,86 @@
+"""Tests for ExportWorker."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from core.services.export_service import ExportProgress, ExportResult
+from gui_qt.workers.export_worker import ExportWorker
+
+
+def _streaming_service(chunks: int = 3, rows_per_chunk: int = 10):
+    """Mock ExportService whose export_stream reports progress per chunk."""
+    service = MagicMock()
+    total = chunks * rows_per_chunk
+
+    def export_stream(data_type, fmt, file_path, days=None, *, offset=0, progress=None, should_cancel=None, **kwargs):
+        written = 0
+        for _ in range(chunks):
+            if should_cancel and should_cancel():
+                return ExportResult(success=False, file_path=file_path, record_count=written,
+                                    error="Cancelled", cancelled=True, next_offset=offset + written)
+            written += rows_per_chunk
+            progress(ExportProgress(written, offset + written, total))
+        return ExportResult(success=True, file_path=file_path, record_count=written, next_offset=offset + written)
+
+    service.export_stream.side_effect = export_stream
+    return service
+
+
+class TestExportWorker:
+    """Tests for ExportWorker."""
+
+    def test_has_progress_signal(self):
+        worker = ExportWorker(MagicMock(), "sales", "jsonl", Path("x.jsonl"))
+        assert hasattr(worker, "progress")
+        assert hasattr(worker, "result")
+
+    def test_passes_arguments_to_service(self):
+        service = _streaming_service()
+        worker = ExportWorker(
+            service, "rankings", "csv", Path("r.csv"), days=7, compress=True, offset=5,
+            resume_after=[5], category="currency",
+        )
+
+        worker._execute()
+
+        args, kwargs = service.export_stream.call_args
+        assert args == ("rankings", "csv", Path("r.csv"), 7)
+        assert kwargs["compress"] is True
+        assert kwargs["offset"] == 5
+        assert kwargs["resume_after"] == [5]
+        assert kwargs["category"] == "currency"
+
+    def test_emits_progress_and_result(self, qtbot):
+        worker = ExportWorker(_streaming_service(), "sales", "jsonl", Path("s.jsonl"))
+        updates = []
+        worker.progress.connect(lambda done, total: updates.append((done, total)))
+
+        with qtbot.waitSignal(worker.result, timeout=2000) as blocker:
+            worker.start()
+        worker.wait()
+
+        assert blocker.args[0].record_count == 30
+        assert updates == [(10, 30), (20, 30), (30, 30)]
+
+    def test_service_error_emits_error(self, qtbot):
+        service = MagicMock()
+        service.export_stream.return_value = ExportResult(success=False, error="disk full")
+        worker = ExportWorker(service, "sales", "csv", Path("s.csv"))
+
+        with qtbot.waitSignal(worker.error, timeout=2000) as blocker:
+            worker.start()
+        worker.wait()
+
+        assert blocker.args[0] == "disk full"
+
+    def test_cancel_stops_between_chunks(self):
+        worker = ExportWorker(_streaming_service(chunks=5), "sales", "jsonl", Path("s.jsonl"))
+        results = []
+        worker.result.connect(results.append)
+        worker.progress.connect(lambda done, _total: worker.cancel() if done == 20 else None)
+
+        worker.run()
+
+        assert results == []
+        assert worker.last_result.cancelled is True
+        assert worker.last_result.next_offset == 20
@@ -30,6 +30,7 @@ def mock_poe_ninja_api():
 def mock_cache():
     """Create mock PriceRankingCache."""
     cache = MagicMock()
+    cache.__enter__.return_value = cache
     cache.is_cache_valid.return_value = False
     cache.get_cache_age_days.return_value = 1.5
     return cache
@@ -113,6 +114,7 @@ class TestRankingsWorkerExecution:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = True
         mock_cache.get_cache_age_days.return_value = 0.5
         mock_cache_class.return_value = mock_cache
@@ -140,6 +142,7 @@ class TestRankingsWorkerExecution:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = False
         mock_cache_class.return_value = mock_cache
 
@@ -176,6 +179,7 @@ class TestRankingsWorkerExecution:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = True
         mock_cache.get_cache_age_days.return_value = 0.5
         mock_cache_class.return_value = mock_cache
@@ -207,6 +211,7 @@ class TestRankingsWorkerSignals:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = True
         mock_cache.get_cache_age_days.return_value = 0.5
         mock_cache_class.return_value = mock_cache
@@ -240,6 +245,7 @@ class TestRankingsWorkerSignals:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = True
         mock_cache.get_cache_age_days.return_value = 1.2
         mock_cache_class.return_value = mock_cache
@@ -304,6 +310,7 @@ class TestRankingsWorkerCancellation:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = False
         mock_cache_class.return_value = mock_cache
 
@@ -336,6 +343,7 @@ class TestRankingsWorkerStatusUpdates:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = True
         mock_cache.get_cache_age_days.return_value = 0.5
         mock_cache_class.return_value = mock_cache
@@ -356,6 +364,7 @@ class TestRankingsWorkerStatusUpdates:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = True
         mock_cache.get_cache_age_days.return_value = 0.8
         mock_cache_class.return_value = mock_cache
@@ -380,6 +389,7 @@ class TestRankingsWorkerStatusUpdates:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = False
         mock_cache_class.return_value = mock_cache
 
@@ -411,6 +421,7 @@ class TestRankingsWorkerStatusUpdates:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = False
         mock_cache_class.return_value = mock_cache
 
@@ -441,6 +452,7 @@ class TestRankingsWorkerStatusUpdates:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = False
         mock_cache_class.return_value = mock_cache
 
@@ -511,6 +523,7 @@ class TestRankingsWorkerErrorHandling:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = False
         mock_cache_class.return_value = mock_cache
 
@@ -523,6 +536,7 @@ class TestRankingsWorkerErrorHandling:
 
         error_msg, _ = blocker.args
         assert "Calculation failed" in error_msg
+        mock_cache.__exit__.assert_called_once()
 
 
 class TestRankingsWorkerReturnValues:
@@ -539,6 +553,7 @@ class TestRankingsWorkerReturnValues:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = True
         mock_cache.get_cache_age_days.return_value = 0.5
         mock_cache_class.return_value = mock_cache
@@ -560,6 +575,7 @@ class TestRankingsWorkerReturnValues:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = False
         mock_cache_class.return_value = mock_cache
 
@@ -594,6 +610,7 @@ class TestRankingsWorkerReturnValues:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = False
         mock_cache_class.return_value = mock_cache
 
@@ -625,6 +642,7 @@ class TestRankingsWorkerHistoryDatabase:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = False
         mock_cache_class.return_value = mock_cache
 
@@ -655,6 +673,7 @@ class TestRankingsWorkerHistoryDatabase:
         mock_api_class.return_value = mock_api
 
         mock_cache = MagicMock()
+        mock_cache.__enter__.return_value = mock_cache
         mock_cache.is_cache_valid.return_value = False
         mock_cache_class.return_value = mock_cache
 